@@ -1,9 +1,10 @@
 # CS Analysis Tool by Pascal Reiß
-# Version 1.0.2
+# Version 1.0.3
 
 # basic python libary imports
 import os
 import tkinter as tk
+from tkinter import ttk
 
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
@@ -22,6 +23,9 @@ import sem_scale_bar as sem
 import esem_scale_bar as esem
 import tem_scale_bar as tem
 
+# import of the stage instrumentation (profiling of the evaluations)
+from instrumentation import enable_profiling, disable_profiling, is_profiling_enabled
+
 
 
 
@@ -46,6 +50,8 @@ class User_Interface :
                 tkinter.OptionMenu: dropdown Menu with all imported Analysis tools in this program
             - self.active_program_frame
                 tkinter.Frame: is returned by a Analysis tool class object via the function toolobject.get_gui_frame (e.g. Electrodeposition_Analysis.get_gui_frame)
+            - self.profiling_variable
+                tkinter.StringVar: string variable ("0" or "1"), which keeps track if the evaluations are profiled (see instrumentation.py)
 
             expected argument datatyp:
             - gui_program_dictionary : dict
@@ -103,10 +109,31 @@ class User_Interface :
         run_program_button = tk.Button(self.programs_frame, text = "Select Method", command = self.select_programm)
         run_program_button.grid(column = 0, row = 2, padx = 5, pady = 5)
 
+        """ create a tkinter.ttk.Checkbutton, which enables/disables the profiling of all evaluations
+            if enabled each tool saves the wall time, CPU time and memory of each stage (load, compute, plot, save, ...) per file
+            as Profile_*.txt (summary table) and Profile_*.json (Chrome trace) in its evaluation folder (see instrumentation.py)
+            default state: False (or True if the environment variable CS_ANALYSIS_PROFILE is set)
+        """
+        self.profiling_variable = tk.StringVar(value = "1" if is_profiling_enabled() else "0")
+
+        profiling_checkbox = ttk.Checkbutton(master = self.programs_frame, text = "profile evaluations",
+            variable = self.profiling_variable, command = self.change_profiling_settings)
+        profiling_checkbox.grid(column = 0, row = 3, padx = 5, pady = 5)
 
 
 
 
+
+    def change_profiling_settings(self) :
+        """ enables or disables the profiling of all evaluations depending on the state of self.profiling_variable
+            function is executed after tkinter.ttk.Checkbutton event (see function self.__init__)
+        """
+        if self.profiling_variable.get() == "1" :
+            enable_profiling()
+        else :
+            disable_profiling()
+
+
     def select_programm(self) :
         """ gets the selected program in the self.program_menu
             function is executed after tkinter.Button event (see function self.__init__)
@@ -181,4 +208,7 @@ update list:
 Version 1.0.2 (28.03.2022)
 
 - added update list 
+
+Version 1.0.3 (19.10.2026)
+- added checkbox "profile evaluations", which records the stages of each evaluation (see instrumentation.py)
 """
\ No newline at end of file
@@ -0,0 +1,320 @@
+""" Band Fitting of Infrared Spectra
+    Version 1.0.0
+
+    fits the bands (minima) of normalized infrared spectra with a sum of Lorentzian, Gaussian or pseudo-Voigt profiles:
+        y = offset - Σ depth_k g((x - center_k) / fwhm_k)
+    - lorentzian : g(u) = 1 / (1 + 4 u²)
+    - gaussian : g(u) = exp(-4 ln2 u²)
+    - pseudo_voigt : g(u) = η lorentzian + (1 - η) gaussian (fixed mixing η)
+
+    the fits are seeded with the local minima of the spectrum (same criterion as Infrared_Analysis.get_local_min_pos), minima closer
+    than min_separation are merged into the deepest one
+    the parameters are fitted by the Levenberg-Marquardt algorithm with analytic Jacobians, depth and fwhm are fitted on a
+    logarithmic scale, so they stay positive, centers and fwhms are kept within the measured range of wave numbers
+    the spectra are fitted in parallel on a pool of worker processes
+
+    usage:
+        bands = fit_spectra({sample_name : (wave_numbers, normalized_intensity)}, model = "lorentzian", workers = 4)
+        # pandas.DataFrame with one row per band: Sample, Band, Center, FWHM, Depth, Area, RMS Residual
+
+    usage (from the folder of CS_Analysis_Tool.py):
+        python band_fitting.py "D:\\OPUS" --model pseudo_voigt --output "D:\\OPUS\\Band_Fit.txt"
+"""
+
+import os
+import argparse
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+
+
+models = ["lorentzian", "gaussian", "pseudo_voigt"]
+
+columns = ["Sample", "Band", "Center (cm^-1)", "FWHM (cm^-1)", "Depth (a.u.)", "Area (a.u. cm^-1)", "RMS Residual (a.u.)"]
+
+ln2 = np.log(2)
+
+
+def get_profiles(model, s, fwhm, eta = 0.5) :
+    """ returns the profiles g and their derivatives dg/dcenter and dg/dfwhm (numpy.ndarray, points x bands)
+
+        expected argument datatypes:
+        - model : string ("lorentzian", "gaussian" or "pseudo_voigt")
+        - s : numpy.ndarray (points x bands, x - center)
+        - fwhm : numpy.ndarray (bands)
+        - eta : float (lorentzian fraction of the pseudo-Voigt profile)
+    """
+    s2 = s**2 / fwhm**2
+
+    if model == "lorentzian" or model == "pseudo_voigt" :
+        lorentzian = 1 / (1 + 4 * s2)
+        lorentzian_dc = 8 * lorentzian**2 * s / fwhm**2
+        lorentzian_dw = 8 * lorentzian**2 * s2 / fwhm
+
+    if model == "gaussian" or model == "pseudo_voigt" :
+        gaussian = np.exp(-4 * ln2 * s2)
+        gaussian_dc = 8 * ln2 * gaussian * s / fwhm**2
+        gaussian_dw = 8 * ln2 * gaussian * s2 / fwhm
+
+    if model == "lorentzian" :
+        return lorentzian, lorentzian_dc, lorentzian_dw
+
+    if model == "gaussian" :
+        return gaussian, gaussian_dc, gaussian_dw
+
+    return (eta * lorentzian + (1 - eta) * gaussian, eta * lorentzian_dc + (1 - eta) * gaussian_dc,
+            eta * lorentzian_dw + (1 - eta) * gaussian_dw)
+
+
+def get_areas(model, depths, fwhms, eta = 0.5) :
+    """ returns the areas (numpy.ndarray) of the bands: π/2 depth fwhm (lorentzian), sqrt(π / (4 ln2)) depth fwhm (gaussian)
+    """
+    lorentzian = np.pi / 2 * depths * fwhms
+    gaussian = np.sqrt(np.pi / (4 * ln2)) * depths * fwhms
+
+    return {"lorentzian" : lorentzian, "gaussian" : gaussian, "pseudo_voigt" : eta * lorentzian + (1 - eta) * gaussian}[model]
+
+
+def get_band_seeds(wave_numbers, intensity, local_min_threshold = 0.4, min_separation = 20, max_bands = 30) :
+    """ returns the start values (centers, fwhms, depths and offset) of the bands from the local minima of a normalized spectrum
+        a local minimum is at most local_min_threshold and not higher than both neighbors (see Infrared_Analysis.get_local_min_pos)
+        the fwhm is the width at half depth between the minimum and the offset (95th percentile of the intensity)
+
+        expected argument datatypes:
+        - wave_numbers, intensity : numpy.ndarray
+        - local_min_threshold : float (between 0 and 1)
+        - min_separation : float (minima closer than min_separation in cm^-1 are merged into the deepest one)
+        - max_bands : int (only the deepest max_bands minima are used)
+    """
+    center = intensity[1:-1]
+    minima = np.nonzero((center <= local_min_threshold) & (center <= intensity[:-2]) & (center <= intensity[2:]))[0] + 1
+
+    offset = np.percentile(intensity, 95)
+    spacing = abs(wave_numbers[-1] - wave_numbers[0]) / (len(wave_numbers) - 1)
+
+    seeds = []
+
+    for index in minima[np.argsort(intensity[minima])] :
+        if len(seeds) == max_bands :
+            break
+
+        if any(abs(wave_numbers[index] - wave_numbers[seed]) < min_separation for seed in seeds) :
+            continue
+
+        seeds.append(index)
+
+    seeds = np.array(sorted(seeds), dtype = int)
+
+    depths = np.maximum(offset - intensity[seeds], 10**-3)
+    fwhms = np.empty(len(seeds))
+
+    for k, index in enumerate(seeds) :
+        above = intensity > intensity[index] + depths[k] / 2
+
+        left = np.nonzero(above[:index])[0]
+        right = np.nonzero(above[index:])[0]
+
+        width = ((index - left[-1]) if len(left) > 0 else 1) + (right[0] if len(right) > 0 else 1)
+        fwhms[k] = max(width * spacing, 2 * spacing)
+
+    return wave_numbers[seeds], fwhms, depths, offset
+
+
+def fit_bands(wave_numbers, intensity, centers, fwhms, depths, offset, model = "lorentzian", eta = 0.5, max_iterations = 200, tolerance = 10**-8) :
+    """ fits the bands by the Levenberg-Marquardt algorithm with analytic Jacobian
+        parameters: offset, then center, log(fwhm) and log(depth) of each band
+
+        expected argument datatypes:
+        - wave_numbers, intensity : numpy.ndarray
+        - centers, fwhms, depths : numpy.ndarray (start values of each band)
+        - offset : float (start value)
+        - model : string ("lorentzian", "gaussian" or "pseudo_voigt")
+        - eta : float (lorentzian fraction of the pseudo-Voigt profile)
+        - max_iterations : int
+        - tolerance : float (the fit stops if the relative decrease of the sum of squared residuals is below tolerance)
+
+        returns the fitted centers, fwhms, depths (numpy.ndarray), offset and RMS of the residuals (float)
+    """
+    if model not in models :
+        raise ValueError(f"unknown model {model}, expected one of {models}")
+
+    x = np.asarray(wave_numbers, dtype = np.float64)
+    y = np.asarray(intensity, dtype = np.float64)
+
+    n_bands = len(centers)
+
+    def unpack(parameters) :
+        bands = parameters[1:].reshape(n_bands, 3)
+        return parameters[0], bands[:, 0], np.exp(bands[:, 1]), np.exp(bands[:, 2])
+
+    def get_residuals_and_jacobian(parameters) :
+        offset, centers, fwhms, depths = unpack(parameters)
+
+        g, g_dc, g_dw = get_profiles(model, x[:, np.newaxis] - centers, fwhms, eta)
+
+        residuals = y - offset + g @ depths
+
+        """ Jacobian of the model (offset - Σ depth g) with respect to the parameters, chain rule for the logarithmic fwhm and depth
+        """
+        jacobian = np.empty((len(x), 1 + 3 * n_bands))
+        jacobian[:, 0] = 1
+        jacobian[:, 1::3] = -depths * g_dc
+        jacobian[:, 2::3] = -depths * g_dw * fwhms
+        jacobian[:, 3::3] = -depths * g
+
+        return residuals, jacobian
+
+    parameters = np.concatenate([[offset], np.column_stack([centers, np.log(fwhms), np.log(depths)]).ravel()])
+
+    """ bounds of the parameters: centers within the wave numbers, fwhm between the point spacing and the range of the wave numbers
+    """
+    spacing = np.ptp(x) / (len(x) - 1)
+
+    lower = np.concatenate([[-np.inf], np.tile([x.min(), np.log(spacing), np.log(10**-6)], n_bands)])
+    upper = np.concatenate([[np.inf], np.tile([x.max(), np.log(np.ptp(x)), np.inf], n_bands)])
+
+    parameters = np.clip(parameters, lower, upper)
+
+    residuals, jacobian = get_residuals_and_jacobian(parameters)
+    cost = residuals @ residuals
+
+    damping = 10**-3
+
+    for iteration in range(max_iterations) :
+        hessian = jacobian.T @ jacobian
+        gradient = jacobian.T @ residuals
+
+        scale = np.diag(hessian).copy()
+        scale[scale == 0] = 1
+
+        while True :
+            try :
+                step = np.linalg.solve(hessian + damping * np.diag(scale), gradient)
+            except np.linalg.LinAlgError :
+                step = None
+
+            if step is not None :
+                new_parameters = np.clip(parameters + step, lower, upper)
+
+                with np.errstate(over = "ignore", invalid = "ignore") :
+                    new_residuals, new_jacobian = get_residuals_and_jacobian(new_parameters)
+                    new_cost = new_residuals @ new_residuals
+
+                if np.isfinite(new_cost) and new_cost < cost :
+                    break
+
+            damping *= 10
+
+            if damping > 10**10 :
+                break
+
+        if damping > 10**10 :
+            break
+
+        decrease = (cost - new_cost) / cost if cost > 0 else 0
+
+        parameters, residuals, jacobian, cost = new_parameters, new_residuals, new_jacobian, new_cost
+        damping = max(damping / 10, 10**-10)
+
+        if decrease < tolerance :
+            break
+
+    offset, centers, fwhms, depths = unpack(parameters)
+
+    return centers, fwhms, depths, offset, np.sqrt(cost / len(y))
+
+
+def fit_spectrum(sample_name, wave_numbers, intensity, model = "lorentzian", eta = 0.5, local_min_threshold = 0.4, min_separation = 20,
+                 max_bands = 30) :
+    """ seeds and fits the bands of one normalized spectrum (see functions get_band_seeds and fit_bands)
+        returns pandas.DataFrame with one row per band (see columns), empty if the spectrum has no local minima
+    """
+    wave_numbers = np.asarray(wave_numbers, dtype = np.float64)
+    intensity = np.asarray(intensity, dtype = np.float64)
+
+    centers, fwhms, depths, offset = get_band_seeds(wave_numbers, intensity, local_min_threshold, min_separation, max_bands)
+
+    if len(centers) == 0 :
+        return pd.DataFrame(columns = columns)
+
+    centers, fwhms, depths, offset, rms = fit_bands(wave_numbers, intensity, centers, fwhms, depths, offset, model, eta)
+
+    order = np.argsort(centers)
+
+    return pd.DataFrame(dict(zip(columns, [sample_name, np.arange(1, len(centers) + 1), centers[order], fwhms[order], depths[order],
+                                           get_areas(model, depths, fwhms, eta)[order], rms])))
+
+
+def fit_spectrum_task(arguments) :
+    """ fit_spectrum with a tuple of arguments (required for ProcessPoolExecutor.map)
+    """
+    sample_name, wave_numbers, intensity, settings = arguments
+
+    return fit_spectrum(sample_name, wave_numbers, intensity, **settings)
+
+
+def fit_spectra(spectra, model = "lorentzian", workers = 4, **settings) :
+    """ fits the bands of all spectra, on a pool of worker processes if workers > 1
+
+        expected argument datatypes:
+        - spectra : dict (contains a tuple of the wave numbers and the normalized intensity (numpy.ndarray/pandas.Series) as value and the
+          sample_name as key)
+        - model : string ("lorentzian", "gaussian" or "pseudo_voigt")
+        - workers : int (1: fitted in this process, e.g. in the worker processes of watch_folder.py)
+        - settings : eta, local_min_threshold, min_separation and max_bands (see function fit_spectrum)
+
+        returns pandas.DataFrame with one row per band of each sample (see columns)
+    """
+    settings["model"] = model
+
+    tasks = [(sample_name, np.asarray(wave_numbers, dtype = np.float64), np.asarray(intensity, dtype = np.float64), settings)
+             for sample_name, (wave_numbers, intensity) in spectra.items()]
+
+    if workers <= 1 or len(tasks) <= 1 :
+        tables = [fit_spectrum_task(task) for task in tasks]
+    else :
+        with ProcessPoolExecutor(max_workers = workers) as executor :
+            tables = list(executor.map(fit_spectrum_task, tasks, chunksize = max(1, len(tasks) // (4 * workers))))
+
+    tables = [table for table in tables if len(table) > 0]
+
+    if len(tables) == 0 :
+        return pd.DataFrame(columns = columns)
+
+    return pd.concat(tables, ignore_index = True)
+
+
+
+if __name__ == "__main__" :
+    from spectral_cube import load_spectrum, get_sample_name
+
+    parser = argparse.ArgumentParser(description = "fits the bands of all .dpt spectra of a folder and saves one row per band")
+    parser.add_argument("folder", help = "folder with .dpt files (including subfolders)")
+    parser.add_argument("--output", required = True, help = "path of the band table (txt)")
+    parser.add_argument("--model", choices = models, default = "lorentzian")
+    parser.add_argument("--threshold", type = float, default = 0.4, help = "local minimum threshold of the normalized intensity (default 0.4)")
+    parser.add_argument("--workers", type = int, default = 4, help = "number of worker processes (default 4)")
+
+    args = parser.parse_args()
+
+    file_paths = sorted(os.path.join(root, file) for root, _, files in os.walk(args.folder) for file in files if file.endswith(".dpt"))
+
+    spectra = {}
+
+    for file_path in file_paths :
+        wave_numbers, intensity = load_spectrum(file_path)
+        spectra[get_sample_name(file_path)] = (wave_numbers, (intensity - intensity.min()) / (intensity.max() - intensity.min()))
+
+    bands = fit_spectra(spectra, model = args.model, workers = args.workers, local_min_threshold = args.threshold)
+    bands.to_csv(args.output, sep = ";", index = None)
+
+    print(f"{len(bands)} bands of {len(spectra)} spectra saved in {args.output}")
+
+
+
+""" update list:
+
+Version 1.0.0 (19.10.2026)
+- multi-peak Lorentzian, Gaussian and pseudo-Voigt band fits seeded from the local minima, Levenberg-Marquardt with analytic
+  Jacobians, spectra fitted in parallel on a process pool
+"""
@@ -0,0 +1,185 @@
+""" Baseline Correction of Spectra (AsLS and arPLS)
+    Version 1.0.0
+
+    smooth baselines z of spectra y by penalized least squares with weights w:
+        (W + λ Dᵀ D) z = W y      (D: second differences, W: diagonal matrix of w)
+    - AsLS (asymmetric least squares): w = p for points above the baseline, 1 - p for points below
+    - arPLS (asymmetrically reweighted penalized least squares): logistic weights from the mean and standard deviation of the
+      negative residuals (Baek et al., Analyst 140, 2015, 250-257)
+
+    the matrix W + λ Dᵀ D is pentadiagonal, it is solved by a banded LDLᵀ factorization in O(n) per iteration (no dense O(n³) solver)
+    the recursion runs once along the wave numbers and is vectorized across all spectra of a batch (spectra of the same length),
+    so thousands of spectra are corrected together
+
+    the baseline lies below the peaks, for spectra with bands as minima (transmittance) the negative spectrum is corrected
+
+    usage:
+        baselines = get_arpls_baseline(intensities) # intensities: numpy.ndarray (spectra x wave numbers)
+        corrected_intensities = intensities - baselines
+"""
+
+import numpy as np
+
+
+def get_penalty_bands(n, lam) :
+    """ returns the main diagonal, first and second off-diagonal of λ Dᵀ D (D: second difference matrix, n x n)
+        main diagonal: λ [1, 5, 6, ..., 6, 5, 1], first off-diagonal: λ [-2, -4, ..., -4, -2], second off-diagonal: λ [1, ..., 1]
+    """
+    main = np.full(n, 6.0)
+    main[[0, -1]] = 1
+    main[[1, -2]] = 5
+
+    first = np.full(n - 1, -4.0)
+    first[[0, -1]] = -2
+
+    second = np.ones(n - 2)
+
+    return lam * main, lam * first, lam * second
+
+
+def solve_pentadiagonal(main, first, second, b) :
+    """ solves the symmetric positive definite pentadiagonal systems A x = b of a batch of spectra by the LDLᵀ factorization
+        A = L D Lᵀ with the unit lower triangular L (bands l1, l2) and diagonal D:
+            l2_i = a_(i,i-2) / D_(i-2)
+            l1_i = (a_(i,i-1) - l2_i l1_(i-1) D_(i-2)) / D_(i-1)
+            D_i = a_(i,i) - l1_i² D_(i-1) - l2_i² D_(i-2)
+        followed by forward and backward substitution
+
+        expected argument datatypes:
+        - main : numpy.ndarray (n x spectra, main diagonal of each system)
+        - first, second : numpy.ndarray (n - 1 and n - 2, off-diagonals shared by all systems)
+        - b : numpy.ndarray (n x spectra)
+
+        returns x : numpy.ndarray (n x spectra)
+    """
+    n = len(main)
+
+    D = np.empty_like(main)
+    l1 = np.zeros_like(main)
+    l2 = np.zeros_like(main)
+    y = np.empty_like(b)
+
+    D[0] = main[0]
+    y[0] = b[0]
+
+    l1[1] = first[0] / D[0]
+    D[1] = main[1] - l1[1]**2 * D[0]
+    y[1] = b[1] - l1[1] * y[0]
+
+    """ since l2_i D_(i-2) = a_(i,i-2) is the same for all systems:
+        l1_i D_(i-1) = a_(i,i-1) - a_(i,i-2) l1_(i-1) and l2_i² D_(i-2) = a_(i,i-2)² / D_(i-2)
+    """
+    for i in range(2, n) :
+        numerator = first[i - 1] - second[i - 2] * l1[i - 1]
+
+        l2[i] = second[i - 2] / D[i - 2]
+        l1[i] = numerator / D[i - 1]
+        D[i] = main[i] - l1[i] * numerator - second[i - 2] * l2[i]
+        y[i] = b[i] - l1[i] * y[i - 1] - l2[i] * y[i - 2]
+
+    x = y / D
+
+    x[n - 2] -= l1[n - 1] * x[n - 1]
+
+    for i in range(n - 3, -1, -1) :
+        x[i] -= l1[i + 1] * x[i + 1] + l2[i + 2] * x[i + 2]
+
+    return x
+
+
+def get_asls_baseline(intensities, lam = 10**5, p = 0.01, n_iterations = 10) :
+    """ returns the AsLS baselines (numpy.ndarray, spectra x wave numbers) of a batch of spectra
+        the iteration stops if the weights of no spectrum changed
+
+        expected argument datatypes:
+        - intensities : numpy.ndarray (spectra x wave numbers, or a single spectrum)
+        - lam : int/float (smoothness of the baseline, larger is smoother)
+        - p : float (weight of points above the baseline, between 0 and 1)
+        - n_iterations : int (maximum number of iterations)
+    """
+    y = np.array(intensities, dtype = np.float64, ndmin = 2).T # wave numbers x spectra, row i of all spectra is contiguous
+
+    main, first, second = get_penalty_bands(len(y), lam)
+
+    w = np.ones_like(y)
+    z = np.empty_like(y)
+
+    """ only the spectra, whose weights changed in the last iteration, are solved again
+    """
+    active = np.ones(y.shape[1], dtype = bool)
+
+    for iteration in range(n_iterations) :
+        z[:, active] = solve_pentadiagonal(w[:, active] + main[:, np.newaxis], first, second, w[:, active] * y[:, active])
+
+        w_new = np.where(y[:, active] > z[:, active], p, 1 - p)
+
+        changed = np.any(w_new != w[:, active], axis = 0)
+
+        w[:, active] = w_new
+        active[active] = changed
+
+        if not active.any() :
+            break
+
+    return z.T.reshape(np.shape(intensities))
+
+
+def get_arpls_baseline(intensities, lam = 10**5, ratio = 10**-3, n_iterations = 50) :
+    """ returns the arPLS baselines (numpy.ndarray, spectra x wave numbers) of a batch of spectra
+        weights: w = 1 / (1 + exp(2 (d - (2 s - m)) / s)) with the residuals d = y - z and the mean m and standard deviation s
+        of the negative residuals of each spectrum
+        the weights of a spectrum are kept once their relative change is below ratio, the iteration stops if all spectra converged
+
+        expected argument datatypes:
+        - intensities : numpy.ndarray (spectra x wave numbers, or a single spectrum)
+        - lam : int/float (smoothness of the baseline, larger is smoother)
+        - ratio : float (convergence criterion)
+        - n_iterations : int (maximum number of iterations)
+    """
+    y = np.array(intensities, dtype = np.float64, ndmin = 2).T
+
+    main, first, second = get_penalty_bands(len(y), lam)
+
+    w = np.ones_like(y)
+    z = np.empty_like(y)
+
+    """ only the spectra, whose weights did not converge yet, are solved again
+    """
+    active = np.ones(y.shape[1], dtype = bool)
+
+    for iteration in range(n_iterations) :
+        w_active = w[:, active]
+
+        z[:, active] = solve_pentadiagonal(w_active + main[:, np.newaxis], first, second, w_active * y[:, active])
+
+        d = y[:, active] - z[:, active]
+        negative = d < 0
+
+        n_negative = np.maximum(negative.sum(axis = 0), 1)
+        m = np.where(negative, d, 0).sum(axis = 0) / n_negative
+        s = np.sqrt(np.where(negative, (d - m)**2, 0).sum(axis = 0) / n_negative)
+        s[s == 0] = np.finfo(float).eps
+
+        with np.errstate(over = "ignore") :
+            w_new = 1 / (1 + np.exp(2 * (d - (2 * s - m)) / s))
+
+        change = np.linalg.norm(w_new - w_active, axis = 0) / np.linalg.norm(w_active, axis = 0)
+
+        w[:, active] = w_new
+        active[active] = change >= ratio
+
+        if not active.any() :
+            break
+
+    return z.T.reshape(np.shape(intensities))
+
+
+baseline_methods = {"asls" : get_asls_baseline, "arpls" : get_arpls_baseline}
+
+
+
+""" update list:
+
+Version 1.0.0 (19.10.2026)
+- AsLS and arPLS baselines with a banded LDLᵀ solver of the pentadiagonal system, vectorized across a batch of spectra
+"""
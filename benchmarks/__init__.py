@@ -0,0 +1,5 @@
+""" Benchmark Suite for the CS Analysis Tool
+
+    - benchmarks.data_generators: synthetic raw data files in the formats of every analysis tool
+    - benchmarks.run_benchmarks: times the load, compute, plot and save stages of every tool and stores the results as JSON
+"""
@@ -0,0 +1,288 @@
+""" Synthetic Raw Data Generators for the Benchmark Suite
+    Version 1.0.0
+
+    every generator writes a file in the same format as the real raw data files of the respective tool
+    (NOVA exports separated by ';', OPUS .dpt spectra separated by tabs, SEM TIFF images with embedded meta data)
+    large files are written in chunks, so even files with 10⁸ data points never have to fit into memory at once
+"""
+
+import os
+import numpy as np
+import pandas as pd
+
+
+chunk_size = 10**6 # number of data points written at once
+
+
+def write_chunked_file(file_path, n_points, get_chunk, sep = ";", header = True, float_format = None) :
+    """ writes a file with n_points rows in chunks of chunk_size rows
+        get_chunk(start, stop) has to return a pandas.DataFrame with the rows start to stop (stop excluded)
+        the header is only written with the first chunk (if header is True)
+
+        expected argument datatypes:
+        - file_path : string
+        - n_points : int
+        - get_chunk : function
+        - sep : string
+        - header : boolean
+        - float_format : string/None
+    """
+    with open(file_path, "w", encoding = "utf-8", newline = "") as file :
+        for start in range(0, n_points, chunk_size) :
+            stop = min(start + chunk_size, n_points)
+
+            chunk = get_chunk(start, stop)
+
+            chunk.to_csv(file, sep = sep, index = None, header = header and start == 0, float_format = float_format, lineterminator = "\r\n")
+
+
+def get_rng(seed, start) :
+    """ returns a numpy random generator, which yields the same numbers for the same chunk independent of the chunk order
+    """
+    return np.random.default_rng([seed, start])
+
+
+def write_tafel_file(file_path, n_points, seed = 0) :
+    """ writes a linear sweep voltammetry (water splitting) file as used by Tafel_Analysis
+        the current rises exponentially (Tafel slope 120 mV/dec) and passes the current density threshold of 10 mA/cm²
+        columns: Potential applied (V);Time (s);WE(1).Current (A);WE(1).Potential (V);Index;Current range
+    """
+    step = 0.8 / n_points # potential range 0 V to 0.8 V vs Ag|AgCl
+
+    def get_chunk(start, stop) :
+        rng = get_rng(seed, start)
+        index = np.arange(start, stop)
+
+        potential_applied = (index + 1) * step
+        current = 1e-5 * 10**((potential_applied - 0.3) / 0.12) - 2e-4 * np.exp(-potential_applied / 0.02)
+        current += rng.normal(0, 2e-6, len(index))
+
+        chunk = pd.DataFrame()
+        chunk["Potential applied (V)"] = potential_applied
+        chunk["Time (s)"] = 5.97 + index * step / 0.01 # scan rate 10 mV/s
+        chunk["WE(1).Current (A)"] = current
+        chunk["WE(1).Potential (V)"] = potential_applied + rng.normal(0, 2e-4, len(index))
+        chunk["Index"] = index + 1
+        chunk["Current range"] = "100 mA"
+
+        return chunk
+
+    write_chunked_file(file_path, n_points, get_chunk)
+
+
+def write_levich_series(folder, sample_name, n_points, rpm_values = (100, 250, 400, 550, 700, 850, 1000), seed = 0) :
+    """ writes one rotating disc electrode measurement for each rpm value as used by Levich_Analysis
+        the limiting current scales with the square root of the rotation rate (Levich equation)
+        the file names end with _{rpm}rpm.txt, so the automatic RPM recognition of Levich_Analysis works
+
+        returns the file_paths : list
+    """
+    file_paths = []
+
+    step = 1.6 / n_points # potential range 0 V to 1.6 V vs Ag|AgCl
+
+    for rpm in rpm_values :
+        rotation_rate = (2 * np.pi) / 60 * rpm
+
+        limiting_current = 1e-5 * np.sqrt(rotation_rate)
+
+        def get_chunk(start, stop) :
+            rng = get_rng(seed + rpm, start)
+            index = np.arange(start, stop)
+
+            potential_applied = (index + 1) * step
+            current = limiting_current / (1 + np.exp(-(potential_applied - 0.6) / 0.05)) + 1e-8
+            current += rng.normal(0, 1e-8, len(index))
+
+            chunk = pd.DataFrame()
+            chunk["Potential applied (V)"] = potential_applied
+            chunk["Time (s)"] = 2032.17 + index * step / 0.1 # scan rate 100 mV/s
+            chunk["WE(1).Current (A)"] = current
+            chunk["WE(1).Potential (V)"] = potential_applied + rng.normal(0, 2e-4, len(index))
+            chunk["Index"] = index + 1
+            chunk["Current range"] = "100 µA"
+
+            return chunk
+
+        file_path = os.path.join(folder, f"{sample_name}_{rpm}rpm.txt")
+
+        write_chunked_file(file_path, n_points, get_chunk)
+
+        file_paths.append(file_path)
+
+    return file_paths
+
+
+def write_cyclovoltammetry_file(file_path, n_points, points_per_scan = 2000, seed = 0) :
+    """ writes a cyclic voltammetry file as used by Cyclovoltammetry_Analysis
+        each scan is a triangular sweep from 0 V to 1 V and back, the current contains a capacitive part and a redox couple
+        the charges Q+ and Q- are constant for each scan (as in the NOVA export)
+        columns: Potential applied (V);WE(1).Current (A);WE(1).Potential (V);Scan;Index;Q+;Q-;Current range
+    """
+    half = points_per_scan // 2
+
+    def get_chunk(start, stop) :
+        rng = get_rng(seed, start)
+        index = np.arange(start, stop)
+
+        position = index % points_per_scan
+        forward = position < half
+
+        potential_applied = np.where(forward, position / half, 2 - position / half)
+
+        capacitive_current = np.where(forward, 2e-6, -2e-6)
+        anodic_peak = 2e-5 * np.exp(-((potential_applied - 0.45) / 0.05)**2) * forward
+        cathodic_peak = -2e-5 * np.exp(-((potential_applied - 0.35) / 0.05)**2) * ~forward
+
+        current = capacitive_current + anodic_peak + cathodic_peak + rng.normal(0, 2e-7, len(index))
+
+        chunk = pd.DataFrame()
+        chunk["Potential applied (V)"] = potential_applied
+        chunk["WE(1).Current (A)"] = current
+        chunk["WE(1).Potential (V)"] = potential_applied + rng.normal(0, 2e-4, len(index))
+        chunk["Scan"] = index // points_per_scan + 1
+        chunk["Index"] = position + 1
+        chunk["Q+"] = 0.257
+        chunk["Q-"] = -0.0096
+        chunk["Current range"] = "10 µA"
+
+        return chunk
+
+    write_chunked_file(file_path, n_points, get_chunk)
+
+
+def write_electrodeposition_file(file_path, n_points, seed = 0) :
+    """ writes a chronopotentiometry file (constant current of -500 µA) as used by Electrodeposition_Analysis
+        columns: Time (s);WE(1).Potential (V);Corrected time (s);Index;WE(1).Current (A);Current range
+    """
+    def get_chunk(start, stop) :
+        rng = get_rng(seed, start)
+        index = np.arange(start, stop)
+
+        corrected_time = index * 1.0 # one data point per second
+
+        chunk = pd.DataFrame()
+        chunk["Time (s)"] = 3.496 + corrected_time
+        chunk["WE(1).Potential (V)"] = -0.947 - 0.05 * (1 - np.exp(-corrected_time / 200)) + rng.normal(0, 5e-4, len(index))
+        chunk["Corrected time (s)"] = corrected_time
+        chunk["Index"] = index + 1
+        chunk["WE(1).Current (A)"] = -5e-4 + rng.normal(0, 2e-7, len(index))
+        chunk["Current range"] = "1 mA"
+
+        return chunk
+
+    write_chunked_file(file_path, n_points, get_chunk)
+
+
+def write_dpt_file(file_path, n_points, seed = 0) :
+    """ writes an OPUS .dpt infrared spectrum as used by Infrared_Analysis
+        the wave numbers are descending from 4000 cm⁻¹ to 400 cm⁻¹ (as exported by OPUS), the values are separated by tabs
+        the spectrum contains a sloping baseline and the carbonate/hydroxide bands as Lorentzian absorption bands
+    """
+    bands = [(3400, 200, 0.15), (1400, 60, 0.4), (1070, 15, 0.1), (830, 10, 0.2), (740, 12, 0.1)] # (position, width, depth)
+
+    step = 3600 / max(n_points - 1, 1)
+
+    def get_chunk(start, stop) :
+        rng = get_rng(seed, start)
+        index = np.arange(start, stop)
+
+        wave_number = 4000 - index * step
+
+        intensity = 1.0 + 5e-5 * wave_number / 100 + rng.normal(0, 1e-3, len(index))
+        for position, width, depth in bands :
+            intensity -= depth / (1 + ((wave_number - position) / (width / 2))**2)
+
+        chunk = pd.DataFrame()
+        chunk["wave_number"] = wave_number
+        chunk["intensity"] = intensity
+
+        return chunk
+
+    write_chunked_file(file_path, n_points, get_chunk, sep = "\t", header = False, float_format = "%.5f")
+
+
+def write_sem_tif(file_path, resolution = (1024, 768), pixel_size = 2.5, seed = 0) :
+    """ writes a SEM image as TIFF file with embedded meta data as used by SEM_Image_Tool
+        the meta data is stored as text in the TIFF tag 34118 (as done by the Zeiss SEM software) and contains
+        - Pixel Size = * nm
+        - Store resolution = * * *
+        the lower part of the image contains a white box (like the data bar of the SEM), which is cut off by the tool
+
+        expected argument datatypes:
+        - file_path : string
+        - resolution : tuple (int, int), only (1024, 768) and (2048, 1536) are known by SEM_Image_Tool
+        - pixel_size : float (nm)
+    """
+    from PIL import Image, TiffImagePlugin
+
+    rng = np.random.default_rng(seed)
+    width, height = resolution
+
+    """ blurred noise as particles with a white data bar at the lower edge
+    """
+    image = rng.normal(100, 30, (height, width))
+    for _ in range(50) :
+        x, y, radius = rng.integers(0, width), rng.integers(0, height), rng.integers(5, 50)
+        yy, xx = np.ogrid[:height, :width]
+        image[(xx - x)**2 + (yy - y)**2 < radius**2] += 80
+
+    image[int(height * 0.9):, :] = 255
+
+    image = Image.fromarray(np.clip(image, 0, 255).astype(np.uint8))
+
+    metadata = "\r\n".join([
+        "AP_PIXEL_SIZE",
+        f"Pixel Size = {pixel_size} nm",
+        "AP_STORE_RESOLUTION",
+        f"Store resolution = {width} * {height}",
+        "DP_DETECTOR_CHANNEL",
+        "Signal A = InLens",
+        ]) + "\r\n"
+
+    tiffinfo = TiffImagePlugin.ImageFileDirectory_v2()
+    tiffinfo[34118] = metadata
+    tiffinfo.tagtype[34118] = 2 # ASCII
+
+    image.save(file_path, tiffinfo = tiffinfo)
+
+
+def generate_benchmark_data(folder, scale, seed = 0) :
+    """ generates all raw data files for one scale (number of data points per tool) in folder
+        already existing files are reused, since generating files with 10⁷ or more data points takes a while
+        the Levich series distributes the data points over 7 rpm values
+        the SEM image has a fixed resolution (1024 * 768 or 2048 * 1536 for scales of at least 2048 * 1536 pixels)
+
+        returns dict with the program_name of each tool as key and a list of file_paths as value
+    """
+    if not os.path.exists(folder) :
+        os.makedirs(folder)
+
+    scale = int(scale)
+
+    file_paths = {}
+
+    def get_path(file_name, writer, *args) :
+        file_path = os.path.join(folder, file_name)
+        if not os.path.exists(file_path) :
+            writer(file_path, *args)
+        return file_path
+
+    file_paths["Tafel Analysis"] = [get_path(f"Tafel_{scale}_WS_LS.txt", write_tafel_file, scale, seed)]
+
+    levich_folder = os.path.join(folder, f"Levich_{scale}")
+    if not os.path.exists(levich_folder) :
+        os.makedirs(levich_folder)
+        write_levich_series(levich_folder, f"Levich_{scale}", max(scale // 7, 10), seed = seed)
+    file_paths["Levich Analysis"] = sorted(os.path.join(levich_folder, file) for file in os.listdir(levich_folder))
+
+    file_paths["Cyclovoltammetry Analysis"] = [get_path(f"CV_{scale}_CV.txt", write_cyclovoltammetry_file, scale, 2000, seed)]
+
+    file_paths["Electrodeposition Analysis"] = [get_path(f"ED_{scale}_CP.txt", write_electrodeposition_file, scale, seed)]
+
+    file_paths["Infrared Analysis"] = [get_path(f"IR_{scale}.dpt", write_dpt_file, scale, seed)]
+
+    resolution = (2048, 1536) if scale >= 2048 * 1536 else (1024, 768)
+    file_paths["SEM Scale Bar Tool"] = [get_path(f"SEM_{resolution[0]}x{resolution[1]}.tif", write_sem_tif, resolution, 2.5, seed)]
+
+    return file_paths
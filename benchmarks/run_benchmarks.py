@@ -0,0 +1,362 @@
+""" Benchmark Suite for the CS Analysis Tool
+    Version 1.0.5
+
+    runs the evaluation of every analysis tool headlessly (matplotlib Agg backend, no tkinter window) on synthetic raw data files
+    of increasing size and stores the timings as JSON file
+    the tools are driven through their own entry points (run_evaluation, run_headless_evaluation, run_headless_fits), so the timings
+    include everything the tools do (dataflow graph, batch table, results store, sidecars, figures), the time of each stage is taken
+    from the stage records of the tools (see instrumentation.py)
+    the outputs are written into a temporary folder and the results store into a temporary database
+    the JSON files contain the versions of all tools, so regressions between versions can be found by comparing two files
+
+    usage (from the folder of CS_Analysis_Tool.py):
+        python -m benchmarks.run_benchmarks --scales 1e3 1e4 1e5 1e6
+        python -m benchmarks.run_benchmarks --compare benchmarks/results/old.json benchmarks/results/new.json
+"""
+
+import os
+import sys
+import json
+import glob
+import time
+import codecs
+import argparse
+import platform
+import subprocess
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+
+import matplotlib
+matplotlib.use("Agg") # headless, has to be set before pyplot is imported by the tools
+
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+
+import levich as la
+import tafel as ta
+import electrodeposition as ed
+import infrared as ir
+import cyclovoltammetry as cv
+import sem_scale_bar as sem
+import results_store
+
+from instrumentation import collect_stages
+
+from benchmarks.data_generators import generate_benchmark_data
+
+
+class Benchmark_Skipped(Exception) :
+    """ raised by a benchmark function if the tool can not run on this system (stored as "skipped" in the results)
+    """
+
+
+@contextmanager
+def isolated_results_store(output_folder) :
+    """ the results of the tools are stored in a temporary database in the output_folder instead of the results store of the User
+    """
+    previous_store = results_store.results_store
+    results_store.results_store = results_store.Results_Store(os.path.join(output_folder, "results.sqlite"))
+
+    try :
+        yield
+    finally :
+        results_store.results_store.close()
+        results_store.results_store = previous_store
+
+
+def remove_stray_files(output_folder) :
+    """ the tools join the evaluation folder and file names with a backslash (Windows), on other systems the files are therefore
+        created next to the output_folder with the name "{output_folder}\\{file_name}" and have to be removed separately
+    """
+    if os.sep != "\\" :
+        for file_path in glob.glob(glob.escape(output_folder) + "\\*") :
+            os.remove(file_path)
+
+
+def get_tool(tool_class, output_folder, **attributes) :
+    """ returns a tool object, which saves its outputs in the output_folder, with the given attributes set
+    """
+    tool = tool_class()
+    tool.path_evaluation_folder = output_folder
+
+    for attribute, value in attributes.items() :
+        setattr(tool, attribute, value)
+
+    return tool
+
+
+def benchmark_tafel(file_paths, output_folder) :
+    """ Tafel_Analysis.run_headless_evaluation of each file (default resistance, figure saved) followed by the Tafel fit of the sample
+        (run_headless_fits as replayed by replay_fits.py) in the range 100 mV below the overpotential at the current density threshold
+    """
+    tool = get_tool(ta.Tafel_Analysis, output_folder, save_figures = True)
+
+    for file_path in file_paths :
+        results = tool.run_headless_evaluation(file_path)
+
+        overpotential_SHE = results["overpotential_SHE"]
+        tool.run_headless_fits([file_path], {"fit_range" : [overpotential_SHE - 0.1, overpotential_SHE], "resistance" : tool.default_resistance})
+
+
+def benchmark_levich(file_paths, output_folder) :
+    """ Levich_Analysis.run_headless_fits of the rpm series (rpm values from the file names, Levich and Koutecky-Levich fit at 0.8 V)
+    """
+    tool = get_tool(la.Levich_Analysis, output_folder)
+
+    tool.run_headless_fits(file_paths, {"levich_potentials" : [0.8], "koutecky_potentials" : [0.8]})
+
+
+def benchmark_cyclovoltammetry(file_paths, output_folder) :
+    """ Cyclovoltammetry_Analysis.run_evaluation (batch table, overlay figure saved)
+    """
+    tool = get_tool(cv.Cyclovoltammetry_Analysis, output_folder, file_paths = tuple(file_paths), save_figures = True)
+
+    tool.run_evaluation()
+
+
+def benchmark_electrodeposition(file_paths, output_folder) :
+    """ Electrodeposition_Analysis.run_evaluation (batch table, figure saved)
+    """
+    tool = get_tool(ed.Electrodeposition_Analysis, output_folder, file_paths = tuple(file_paths), save_figures = True)
+
+    tool.run_evaluation()
+
+
+def benchmark_infrared(file_paths, output_folder) :
+    """ Infrared_Analysis.run_headless_evaluation of each spectrum with the automatic local minima determination enabled (figure saved)
+    """
+    tool = get_tool(ir.Infrared_Analysis, output_folder, local_min_setting = True, save_figures = True)
+
+    for file_path in file_paths :
+        tool.run_headless_evaluation(file_path)
+
+
+def benchmark_sem(file_paths, output_folder) :
+    """ SEM_Image_Tool.run_headless_evaluation of each image
+        the metadata of the images is read with the Windows code page "ANSI", the tool is skipped on systems without it
+    """
+    try :
+        codecs.lookup("ANSI")
+    except LookupError :
+        raise Benchmark_Skipped("encoding ANSI of the SEM metadata is only available on Windows")
+
+    tool = get_tool(sem.SEM_Image_Tool, output_folder)
+
+    for file_path in file_paths :
+        tool.run_headless_evaluation(file_path)
+
+    plt.close(tool.fig)
+
+
+benchmark_functions = {"Tafel Analysis" : benchmark_tafel,
+                       "Levich Analysis" : benchmark_levich,
+                       "Cyclovoltammetry Analysis" : benchmark_cyclovoltammetry,
+                       "Electrodeposition Analysis" : benchmark_electrodeposition,
+                       "Infrared Analysis" : benchmark_infrared,
+                       "SEM Scale Bar Tool" : benchmark_sem,
+                       }
+
+
+def run_benchmark(program_name, file_paths) :
+    """ runs the benchmark function of the tool in a temporary output folder with a temporary results store
+
+        returns the wall time (s) of the whole run and the summed wall time (s) of each top level stage recorded by the tool
+        (nested stages are part of their enclosing stage)
+    """
+    with tempfile.TemporaryDirectory() as output_folder :
+        try :
+            with isolated_results_store(output_folder), collect_stages() as records :
+                start = time.perf_counter()
+                benchmark_functions[program_name](file_paths, output_folder)
+                total = time.perf_counter() - start
+        finally :
+            plt.close("all")
+            remove_stray_files(output_folder)
+
+    timings = {}
+    for record in records :
+        if record["depth"] == 0 :
+            timings[record["stage"]] = timings.get(record["stage"], 0) + record["wall_s"]
+
+    return total, timings
+
+
+def get_tool_versions() :
+    """ returns a dict with the program_name of each tool as key and the version from the module docstring as value
+    """
+    versions = {}
+
+    for program_name, module in [("Tafel Analysis", ta), ("Levich Analysis", la), ("Cyclovoltammetry Analysis", cv),
+        ("Electrodeposition Analysis", ed), ("Infrared Analysis", ir), ("SEM Scale Bar Tool", sem)] :
+
+        version = "unknown"
+        for line in (module.__doc__ or "").splitlines() :
+            if "Version" in line :
+                version = line.split("Version")[1].strip()
+                break
+
+        versions[program_name] = version
+
+    return versions
+
+
+def get_git_commit() :
+    """ returns the current git commit of the program folder (None if git is not available)
+    """
+    try :
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], cwd = os.path.dirname(os.path.dirname(os.path.realpath(__file__))),
+            stderr = subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError) :
+        return None
+
+
+def run_benchmarks(scales, data_folder, tools = None, repeats = 1) :
+    """ generates the raw data for each scale and times each stage of each tool
+        the minimum of all repeats is stored for each stage and the total (least disturbed by other processes)
+        a failing tool does not stop the benchmark, its error is stored in the results instead
+        (tools which can not run on this system are stored as skipped)
+
+        returns dict with the benchmark results (can be stored as JSON)
+    """
+    tools = tools if tools else list(benchmark_functions.keys())
+
+    results = {"created" : datetime.now().isoformat(timespec = "seconds"),
+               "git_commit" : get_git_commit(),
+               "python" : platform.python_version(),
+               "platform" : platform.platform(),
+               "numpy" : np.__version__,
+               "pandas" : pd.__version__,
+               "matplotlib" : matplotlib.__version__,
+               "tool_versions" : get_tool_versions(),
+               "results" : [],
+               }
+
+    for scale in scales :
+        scale = int(float(scale))
+
+        file_paths = generate_benchmark_data(data_folder, scale)
+
+        for program_name in tools :
+            result = {"tool" : program_name, "scale" : scale, "stages" : {}, "total" : None, "error" : None, "skipped" : None}
+
+            try :
+                repeat_timings = [run_benchmark(program_name, file_paths[program_name]) for _ in range(repeats)]
+
+                stage_names = list(dict.fromkeys(stage for _, timings in repeat_timings for stage in timings))
+
+                result["stages"] = {stage : min(timings.get(stage, 0) for _, timings in repeat_timings) for stage in stage_names}
+                result["total"] = min(total for total, _ in repeat_timings)
+
+            except Benchmark_Skipped as reason :
+                result["skipped"] = str(reason)
+
+            except Exception as error :
+                result["error"] = repr(error)
+
+            results["results"].append(result)
+
+            if result["skipped"] is not None :
+                print(f"{program_name:<28} {scale:>10}  skipped: {result['skipped']}")
+            elif result["error"] is not None :
+                print(f"{program_name:<28} {scale:>10}  {result['error']}")
+            else :
+                print(f"{program_name:<28} {scale:>10}  total {result['total']:8.3f} s  " + \
+                    "  ".join(f"{stage} {seconds:.3f} s" for stage, seconds in result["stages"].items()))
+
+    return results
+
+
+def save_results(results, results_folder) :
+    """ saves the benchmark results as JSON file in results_folder
+        file name: benchmark_YYYY-MM-DD_HH-MM-SS.json
+
+        returns the file_path : string
+    """
+    if not os.path.exists(results_folder) :
+        os.makedirs(results_folder)
+
+    file_path = os.path.join(results_folder, f"benchmark_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.json")
+
+    with open(file_path, "w", encoding = "utf-8") as file :
+        json.dump(results, file, indent = 2, ensure_ascii = False)
+
+    return file_path
+
+
+def compare_results(old_file_path, new_file_path) :
+    """ compares two benchmark JSON files
+        returns a pandas.DataFrame with the time of each stage in both files and the ratio new/old (> 1 means slower)
+    """
+    rows = {}
+
+    for key, file_path in [("old", old_file_path), ("new", new_file_path)] :
+        with open(file_path, encoding = "utf-8") as file :
+            results = json.load(file)
+
+        for result in results["results"] :
+            if result["error"] is not None or result.get("skipped") is not None :
+                continue
+            for stage, seconds in list(result["stages"].items()) + [("total", result["total"])] :
+                rows.setdefault((result["tool"], result["scale"], stage), {})[key] = seconds
+
+    comparison = pd.DataFrame.from_dict(rows, orient = "index")
+    comparison.index.names = ["tool", "scale", "stage"]
+
+    for column in ["old", "new"] :
+        if column not in comparison :
+            comparison[column] = np.nan
+
+    comparison["ratio"] = comparison["new"] / comparison["old"]
+
+    return comparison.sort_index()
+
+
+if __name__ == "__main__" :
+
+    path_this_program = os.path.dirname(os.path.realpath(__file__))
+
+    parser = argparse.ArgumentParser(description = "Benchmark the evaluation stages of all analysis tools.")
+    parser.add_argument("--scales", nargs = "+", default = ["1e3", "1e4", "1e5", "1e6"], help = "number of data points per tool (up to 1e8)")
+    parser.add_argument("--tools", nargs = "+", default = None, choices = list(benchmark_functions.keys()))
+    parser.add_argument("--repeats", type = int, default = 1)
+    parser.add_argument("--data-folder", default = os.path.join(path_this_program, "data"))
+    parser.add_argument("--results-folder", default = os.path.join(path_this_program, "results"))
+    parser.add_argument("--compare", nargs = 2, metavar = ("OLD_JSON", "NEW_JSON"), help = "compare two benchmark result files instead")
+
+    arguments = parser.parse_args()
+
+    if arguments.compare :
+        with pd.option_context("display.max_rows", None, "display.width", 200) :
+            print(compare_results(*arguments.compare))
+        sys.exit()
+
+    results = run_benchmarks(arguments.scales, arguments.data_folder, arguments.tools, arguments.repeats)
+
+    print(f"Results saved in {save_results(results, arguments.results_folder)}")
+
+
+
+""" update list:
+
+Version 1.0.0 (19.10.2026)
+- benchmark of the load, compute, plot and save stages of the Tafel, Levich, Cyclovoltammetry, Electrodeposition, Infrared and SEM tools
+
+Version 1.0.1 (19.10.2026)
+- Levich benchmark uses Levich_Sample (levich.py Version 1.0.8)
+
+Version 1.0.2 (19.10.2026)
+- Tafel benchmark includes the bootstrap confidence intervals (tafel.py Version 1.0.9)
+
+Version 1.0.3 (19.10.2026)
+- Tafel benchmark includes the Theil-Sen fit (tafel.py Version 1.0.10)
+
+Version 1.0.4 (19.10.2026)
+- Infrared benchmark reads the .dpt files by read_dpt (infrared.py Version 1.0.15)
+
+Version 1.0.5 (19.10.2026)
+- the benchmarks drive the evaluation functions of the tools instead of copies of their pipelines, the stage timings are taken from
+  the stage records of the tools (instrumentation.py), outputs and results store are written into a temporary folder
+- SEM Scale Bar Tool is skipped on systems without the encoding ANSI
+"""
\ No newline at end of file
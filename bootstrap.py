@@ -0,0 +1,113 @@
+""" Bootstrap Confidence Intervals for Linear Fits
+    Version 1.0.0
+
+    confidence intervals of the slope and intersect of linear fits (Tafel fit, Levich fit, Koutecky-Levich fit) by resampling the
+    data points of the fit window with replacement
+    all replicates are drawn as one index matrix (replicates x data points) and their least squares fits are calculated at once
+    with numpy (no python loop per replicate), large fit windows are processed in chunks of replicates to limit the memory
+
+    usage:
+        slopes, intersects = bootstrap_linear_fit(data_fit["overpotential"], data_fit["log_current_density"])
+        slope_ci_low, slope_ci_high = get_confidence_interval(slopes)
+"""
+
+import numpy as np
+
+
+n_replicates = 2000 # default number of bootstrap replicates
+confidence = 0.95 # default confidence level of the intervals
+max_chunk_size = 4 * 10**6 # maximum number of resampled data points in memory at once
+
+
+def get_bootstrap_indices(n_points, n_replicates, rng) :
+    """ returns the index matrix (numpy.ndarray, n_replicates x n_points) of the resampled data points
+        each row contains n_points indices drawn with replacement
+
+        expected argument datatypes:
+        - n_points, n_replicates : int
+        - rng : numpy.random.Generator
+    """
+    return rng.integers(0, n_points, size = (n_replicates, n_points))
+
+
+def bootstrap_linear_fit(x, y, n_replicates = n_replicates, seed = None) :
+    """ returns the slopes and intersects (numpy.ndarray, one value per replicate) of the linear least squares fits of n_replicates
+        bootstrap replicates of the data points (x, y)
+        replicates, which only contain a single x value, can not be fitted and are NaN
+
+        slope = Σ (x - x̄) y / Σ (x - x̄)²
+        intersect = ȳ - slope * x̄
+        the data is centered before resampling, so the sums stay numerically stable for large offsets (e.g. reciprocal currents)
+
+        expected argument datatypes:
+        - x, y : list/numpy.ndarray/pandas.Series
+        - n_replicates : int
+        - seed : int/None (seed of the random generator for reproducible intervals)
+    """
+    x = np.asarray(x, dtype = np.float64)
+    y = np.asarray(y, dtype = np.float64)
+
+    n_points = len(x)
+
+    x_mean, y_mean = x.mean(), y.mean()
+    x, y = x - x_mean, y - y_mean
+
+    rng = np.random.default_rng(seed)
+
+    slopes = np.empty(n_replicates)
+    intersects = np.empty(n_replicates)
+
+    chunk_size = max(1, max_chunk_size // max(n_points, 1))
+
+    for start in range(0, n_replicates, chunk_size) :
+        stop = min(start + chunk_size, n_replicates)
+
+        indices = get_bootstrap_indices(n_points, stop - start, rng)
+
+        x_resampled = x[indices]
+        y_resampled = y[indices]
+
+        x_resampled_mean = x_resampled.mean(axis = 1)
+        y_resampled_mean = y_resampled.mean(axis = 1)
+
+        x_resampled -= x_resampled_mean[:, np.newaxis]
+
+        sum_xx = np.einsum("ij,ij->i", x_resampled, x_resampled)
+        sum_xy = np.einsum("ij,ij->i", x_resampled, y_resampled)
+
+        with np.errstate(divide = "ignore", invalid = "ignore") :
+            slopes[start:stop] = np.where(sum_xx > 0, sum_xy / sum_xx, np.nan)
+
+        intersects[start:stop] = y_resampled_mean - slopes[start:stop] * x_resampled_mean
+
+    """ undo the centering: y - ȳ = slope * (x - x̄) + intersect_centered
+    """
+    intersects += y_mean - slopes * x_mean
+
+    return slopes, intersects
+
+
+def get_confidence_interval(values, confidence = confidence) :
+    """ returns the lower and upper limit of the percentile confidence interval of the bootstrap replicates values
+        NaN replicates are ignored, (NaN, NaN) is returned if all replicates are NaN
+
+        expected argument datatypes:
+        - values : numpy.ndarray
+        - confidence : float (between 0 and 1)
+    """
+    if np.all(np.isnan(values)) :
+        return np.nan, np.nan
+
+    tail = (1 - confidence) / 2 * 100
+
+    low, high = np.nanpercentile(values, [tail, 100 - tail])
+
+    return low, high
+
+
+
+""" update list:
+
+Version 1.0.0 (19.10.2026)
+- bootstrap confidence intervals of linear fits with all replicates fitted at once
+"""
@@ -1,5 +1,5 @@
 """ Cyclovoltammetry Analysis Tool by Pascal Reiß
-    Version 1.0.4
+    Version 1.0.12
 """
 
 import os
@@ -11,6 +11,14 @@ from tkinter import filedialog
 from datetime import datetime
 import matplotlib.pyplot as plt
 
+from plot_decimation import plot_decimated
+from instrumentation import stage, save_profile
+from results_store import store_results
+from batch_table import Batch_Table
+from smoothing import savgol_filter
+from scan_rate_series import analyze_scan_rate_series, get_scan_rate_from_sample_name
+from curve_overlay import plot_curve_overlay
+
 
 class Cyclovoltammetry_Analysis :
 
@@ -18,12 +26,26 @@ class Cyclovoltammetry_Analysis :
         """ initiate Cyclovoltammetry_Analysis with the following attributes:
             - self.area_electrode
                 (int/float: contains the area of the electrode in cm²)
+            - self.smoothing_window and self.smoothing_order
+                (int: window (odd number of data points, 0 : no smoothing) and polynomial order of the Savitzky-Golay smoothing of the
+                current density used for the peak search of the summary (see smoothing.py), default setting: 0 and 3)
+            - self.capacitance_potential
+                (int/float/None: applied potential in V vs Ag|AgCl of the capacitive currents of the scan rate analysis,
+                None : middle of the potential range of each file, default setting: None)
+            - self.specific_capacitance
+                (int/float: specific capacitance in mF/cm² used for the ECSA of the scan rate analysis, default setting: 0.04)
             - self.file_paths
                 (tuple: contains the file_paths of the raw data files)
             - self.path_evaluation_folder
                 (string: contains the path of the evaluation folder)
             - self.save_figures
                 (boolean: contains the state if created figures shall be saved automatically)
+            - self.save_sample_files
+                (boolean: contains the state if the processed data of each sample shall be saved as separate txt file
+                in addition to the batch table of the evaluation (see batch_table.py))
+            - self.overlay_curves
+                (boolean: contains the state if all curves are drawn as one LineCollection colored by the scan rate (or the order of the files)
+                with a colorbar instead of one line and legend entry per sample (see curve_overlay.py), default setting: False)
             - self.program_frame
                 (tkinter.Frame: is an object required if the program is run in an GUI application)
             - self.feedback_label
@@ -34,6 +56,8 @@ class Cyclovoltammetry_Analysis :
         self.reset_attributes()
 
         self.save_figures = False
+        self.save_sample_files = False
+        self.overlay_curves = False
 
         self.program_frame = None
 
@@ -46,6 +70,12 @@ class Cyclovoltammetry_Analysis :
         """
         self.area_electrode = 1 # in cm²
 
+        self.smoothing_window = 0
+        self.smoothing_order = 3
+
+        self.capacitance_potential = None # in V
+        self.specific_capacitance = 0.04 # in mF/cm²
+
         self.file_paths = ()
 
         """ create evaluation folder to save evaluated data and figures (if it does not exist yet)
@@ -91,6 +121,131 @@ class Cyclovoltammetry_Analysis :
             self.feedback_label.config(text = "Please Select Your Raw Data Files First.")
 
 
+    def get_parameters(self) :
+        """ returns the parameters of the evaluation as dict (saved with the results in the results store)
+        """
+        return {"area_electrode" : self.area_electrode, "smoothing_window" : self.smoothing_window,
+                "capacitance_potential" : self.capacitance_potential, "specific_capacitance" : self.specific_capacitance}
+
+
+    def get_summary(self, data) :
+        """ returns the summary of a cyclovoltammetry as dict:
+            - anodic and cathodic peak current density (mA/cm²) and their potentials (V vs Ag|AgCl) of all scans
+            - number of scans
+            - charges Q+ and Q- of the last scan (C)
+
+            if self.smoothing_window > 0, the peaks are searched in the smoothed current density (Savitzky-Golay, see smoothing.py),
+            so single noisy data points are not taken as peak
+
+            expected argument datatype:
+            - data : pandas.DataFrame (columns potential_we, current_density, Scan, Q+, Q-)
+        """
+        current_density = data["current_density"]
+
+        if self.smoothing_window > 0 :
+            current_density = pd.Series(savgol_filter(current_density, self.smoothing_window, self.smoothing_order), index = data.index)
+
+        idx_anodic = current_density.idxmax()
+        idx_cathodic = current_density.idxmin()
+
+        summary = {"anodic_peak_current_density" : current_density.at[idx_anodic],
+                   "anodic_peak_potential" : data.at[idx_anodic, "potential_we"],
+                   "cathodic_peak_current_density" : current_density.at[idx_cathodic],
+                   "cathodic_peak_potential" : data.at[idx_cathodic, "potential_we"],
+                   "number_of_scans" : data["Scan"].nunique(),
+                   "charge_positive" : data["Q+"].iloc[-1],
+                   "charge_negative" : data["Q-"].iloc[-1],
+                   }
+
+        return summary
+
+
+    def process_file(self, file_path, batch_table = None) :
+        """ opens the raw data file, calculates the current density and saves the processed data in the evaluation folder
+            the summary of the file (see self.get_summary) is saved in the results store
+            used by self.run_evaluation and self.run_headless_evaluation
+
+            if a batch_table is given, the processed data is added to it and only saved as separate txt file if self.save_sample_files is True
+
+            expected argument datatype:
+            - file_path : string
+            - batch_table : Batch_Table/None
+
+            returns sample_name : string, data : pandas.DataFrame (columns current, potential_we, current_density)
+        """
+        """ get the sample_name from the file_path
+        """
+        file_name = os.path.basename(file_path)
+        sample_name = file_name.split(".txt")[0]
+
+        """ open the files and rename columns
+            calculate the current density (mA/cm²) by the formular:
+             current density = current / area electrode
+        """
+        with stage("load", file = sample_name, program = self.program_name) :
+            data = pd.read_csv(file_path, delimiter = ";")
+
+        with stage("compute", file = sample_name, program = self.program_name) :
+            data.rename(
+                {"WE(1).Current (A)" : "current", 
+                "WE(1).Potential (V)" : "potential_we"},
+                inplace = True, axis = 1)
+
+            data["current_density"] = data["current"] * 1000 / self.area_electrode
+
+            summary = self.get_summary(data)
+
+        with stage("store", file = sample_name, program = self.program_name) :
+            store_results(self, sample_name, summary, file_paths = [file_path])
+
+        """ drop unnecassary columns and save data DataFrame in evaluation folder 
+        """
+        with stage("save", file = sample_name, program = self.program_name) :
+            for column in ["Potential applied (V)", "Scan", "Index", "Q+", "Q-", "Current range"] :
+                data.drop(column, axis = 1, inplace = True)
+
+            if batch_table != None :
+                batch_table.add_sample(sample_name, data.set_axis(["Current (A)", "Potential WE (V)", "Current Density (mA/cm²)"], axis = 1),
+                    "Potential WE (V)")
+
+            if batch_table == None or self.save_sample_files :
+                data.to_csv(f"{self.path_evaluation_folder}\{sample_name}.txt", sep = ";", index = None, 
+                    header = ["Current (A)", "Potential WE (V)", "Current Density (mA/cm²)"])
+
+        return sample_name, data
+
+
+    def run_headless_evaluation(self, file_path) :
+        """ evaluates a single file without GUI and without showing a figure (used by watch_folder.py)
+            the processed data is saved in the evaluation folder, the figure only if self.save_figures is True
+
+            expected argument datatype:
+            - file_path : string
+
+            returns dict with the sample_name and the program_name
+        """
+        sample_name, data = self.process_file(file_path)
+
+        if self.save_figures :
+            with stage("plot", file = sample_name, program = self.program_name) :
+                fig, ax = plt.subplots()
+
+                plot_decimated(ax, data["potential_we"], data["current_density"], label = sample_name)
+
+                ax.set_xlabel("$E_{WE}$ vs Ag|AgCl [V]")
+                ax.set_ylabel("j [mA/cm²)")
+                ax.legend(loc = "upper left", fontsize = 8)
+
+            with stage("save_figure", file = sample_name, program = self.program_name) :
+                fig.savefig(f"{self.path_evaluation_folder}\{sample_name}.jpg")
+
+            plt.close(fig)
+
+        save_profile(self.path_evaluation_folder, self.program_name)
+
+        return {"program_name" : self.program_name, "sample_name" : sample_name}
+
+
     def run_evaluation(self) :
         """ does the actual evaluation if files were selected in the firs place
         """
@@ -100,46 +255,55 @@ class Cyclovoltammetry_Analysis :
                 self.feedback_label.config(text = "Evaluation in Progress.")
 
             """ create a figure and axis
+                create the batch table, which collects the processed data of all samples in one file (see batch_table.py)
                 loop through each selected file in self.file_paths individually
             """
             fig, ax = plt.subplots()
 
-            for file_path in self.file_paths :
-                """ get the sample_name from the file_path
-                """
-                file_name = os.path.basename(file_path)
-                sample_name = file_name.split(".txt")[0]
+            batch_table = Batch_Table(self.path_evaluation_folder, "Cyclovoltammetry")
 
-                """ open the files and rename columns
-                    calculate the current density (mA/cm²) by the formular:
-                     current density = current / area electrode
-                """
-                data = pd.read_csv(file_path, delimiter = ";")
+            curves = {}
 
-                data.rename(
-                    {"WE(1).Current (A)" : "current", 
-                    "WE(1).Potential (V)" : "potential_we"},
-                    inplace = True, axis = 1)
+            for file_path in self.file_paths :
+                """ open, process and add the data of the file to the batch table (see function self.process_file)
+                """
+                sample_name, data = self.process_file(file_path, batch_table)
 
-                data["current_density"] = data["current"] * 1000 / self.area_electrode
                 """ plot the current density vs potential
+                    the plotted data is decimated for the axis width (min/max per pixel), the saved data keeps the full resolution
+                    if self.overlay_curves is True, the curves are collected and drawn at once after the loop
                 """ 
-                ax.plot(data["potential_we"], data["current_density"], label = sample_name)
-                
-                """ drop unnecassary columns and save data DataFrame in evaluation folder 
-                """
-                for column in ["Potential applied (V)", "Scan", "Index", "Q+", "Q-", "Current range"] :
-                    data.drop(column, axis = 1, inplace = True)
+                if self.overlay_curves :
+                    curves[sample_name] = (data["potential_we"].to_numpy(), data["current_density"].to_numpy())
+                    continue
 
-                data.to_csv(f"{self.path_evaluation_folder}\{sample_name}.txt", sep = ";", index = None, 
-                    header = ["Current (A)", "Potential WE (V)", "Current Density (mA/cm²)"])
+                with stage("plot", file = sample_name, program = self.program_name) :
+                    plot_decimated(ax, data["potential_we"], data["current_density"], label = sample_name)
+
+            with stage("save_batch", program = self.program_name) :
+                batch_table.save()
+
+            """ draw all curves as one LineCollection (see curve_overlay.py)
+                colored by the scan rate if all file names contain it (e.g. NiFe_1_50mVs.txt), otherwise by the order of the files
+            """
+            if self.overlay_curves and len(curves) > 0 :
+                scan_rates = [get_scan_rate_from_sample_name(sample_name) for sample_name in curves]
+
+                if None in scan_rates :
+                    values, label = np.arange(1, len(curves) + 1), "Sample Number"
+                else :
+                    values, label = np.array(scan_rates), "v [mV/s]"
+
+                with stage("plot", program = self.program_name) :
+                    plot_curve_overlay(ax, [x for x, y in curves.values()], [y for x, y in curves.values()], values = values, label = label)
 
             """ add legend, x and y axis label
             """
             ax.set_xlabel("$E_{WE}$ vs Ag|AgCl [V]")
             ax.set_ylabel("j [mA/cm²)")
 
-            ax.legend(loc = "upper left", fontsize = 8)
+            if not self.overlay_curves :
+                ax.legend(loc = "upper left", fontsize = 8)
 
             """ automatically save figure if self.save_figures state True
                 program counts all figures in the evaluation order and adds the count at the end of the file name
@@ -152,16 +316,67 @@ class Cyclovoltammetry_Analysis :
                     if ".jpg" in file :
                         count += 1
 
-                fig.savefig(f"{self.path_evaluation_folder}\Cyclovoltammetry_{count}.jpg")
+                with stage("save_figure", program = self.program_name) :
+                    fig.savefig(f"{self.path_evaluation_folder}\Cyclovoltammetry_{count}.jpg")
 
             """ evaluation finished
+                the recorded stages are saved in the evaluation folder if profiling is enabled (see instrumentation.py)
             """
+            save_profile(self.path_evaluation_folder, self.program_name)
+
             if self.feedback_label != None :
                 self.feedback_label.config(text = "Evaluation Finished.")
 
             plt.show()
 
 
+    def run_scan_rate_analysis(self) :
+        """ evaluates the selected files as scan rate series (see scan_rate_series.py): capacitive currents and charges of each cycle,
+            double-layer capacitance, ECSA and roughness factor of each electrode
+            the scan rate is taken from the end of the file names (e.g. NiFe_1_50mVs.txt), the files of an electrode share the rest of the name
+
+            the cycles and fits are saved as Scan_Rate_Series_{count}_Cycles.txt and Scan_Rate_Series_{count}_Fits.txt,
+            the fit of each electrode is saved in the results store
+        """
+        if len(self.file_paths) == 0 :
+            if self.feedback_label != None :
+                self.feedback_label.config(text = "Please Select Your Raw Data Files First.")
+            return
+
+        with stage("scan_rate_analysis", program = self.program_name) :
+            cycles, fits = analyze_scan_rate_series(self.file_paths, self.capacitance_potential,
+                specific_capacitance = self.specific_capacitance, area_electrode = self.area_electrode)
+
+        if len(fits) == 0 :
+            if self.feedback_label != None :
+                self.feedback_label.config(text = "No Scan Rates Found. Please Name Your Files *_50mVs.txt.")
+            return
+
+        files_in_directory = os.listdir(self.path_evaluation_folder)
+
+        count = 0
+        for file in files_in_directory :
+            if "Scan_Rate_Series" in file and "_Fits.txt" in file :
+                count += 1
+
+        with stage("save", program = self.program_name) :
+            cycles.to_csv(f"{self.path_evaluation_folder}\Scan_Rate_Series_{count}_Cycles.txt", sep = ";", index = None)
+            fits.to_csv(f"{self.path_evaluation_folder}\Scan_Rate_Series_{count}_Fits.txt", sep = ";", index = None)
+
+        with stage("store", program = self.program_name) :
+            for fit in fits.to_dict("records") :
+                samples = set(cycles.loc[cycles["Electrode"] == fit["Electrode"], "Sample"])
+                file_paths = [file_path for file_path in self.file_paths if os.path.basename(file_path).split(".txt")[0] in samples]
+
+                store_results(self, fit["Electrode"], {"double_layer_capacitance" : fit["C_dl (mF)"], "ecsa" : fit["ECSA (cm²)"],
+                    "roughness_factor" : fit["Roughness Factor"]}, file_paths = file_paths)
+
+        save_profile(self.path_evaluation_folder, self.program_name)
+
+        if self.feedback_label != None :
+            self.feedback_label.config(text = f"Scan Rate Analysis of {len(fits)} Electrodes Finished.")
+
+
     def get_gui_frame(self, master) :
         """ returns a tkinter.Frame to a master window (tkinter.Tk)
             this frame needs to contain all necassyry widgets/functions required for the evalution
@@ -211,6 +426,30 @@ class Cyclovoltammetry_Analysis :
             variable = save_figures_variable, command = change_figure_saving_settings)
         save_figures_checkbox.grid(row = 3, column = 0, padx = 5, pady = 5)
 
+        """ create a tkinter.ttk.Checkbutton, which contains the state of the self.save_sample_files
+            it controls if the processed data of each sample is saved as separate txt file in addition to the batch table
+            default state: False
+        """
+        def change_sample_file_settings() :
+            self.save_sample_files = save_sample_files_variable.get() == "1"
+
+        save_sample_files_variable = tk.StringVar(value = "0")
+        save_sample_files_checkbox = ttk.Checkbutton(master = control_frame, text = "save each sample as separate file",
+            variable = save_sample_files_variable, command = change_sample_file_settings)
+        save_sample_files_checkbox.grid(row = 4, column = 0, padx = 5, pady = 5)
+
+        """ create a tkinter.ttk.Checkbutton, which contains the state of the self.overlay_curves
+            it controls if all curves are drawn as one LineCollection with a colorbar (fast for hundreds of samples)
+            default state: False
+        """
+        def change_overlay_settings() :
+            self.overlay_curves = overlay_curves_variable.get() == "1"
+
+        overlay_curves_variable = tk.StringVar(value = "0")
+        overlay_curves_checkbox = ttk.Checkbutton(master = control_frame, text = "overlay curves (one collection, colorbar)",
+            variable = overlay_curves_variable, command = change_overlay_settings)
+        overlay_curves_checkbox.grid(row = 4, column = 1, padx = 5, pady = 5)
+
         """ create a tkinter.Entry for changing area electrode by User Input 
             valid inputs are int/float
             create a tkinter.Button for User to enter his/her entries for the new changed area of the electrode
@@ -237,6 +476,58 @@ class Cyclovoltammetry_Analysis :
         change_area_electrode_button = tk.Button(master = control_frame, text = "Change Area Electrode (cm²)", command = change_area_electrode)
         change_area_electrode_button.grid(row = 2, column = 0, padx = 5, pady = 5)
 
+        """ create a tkinter.Entry for changing the window of the Savitzky-Golay smoothing (odd number of data points, 0 : no smoothing)
+            of the peak search by User Input
+        """
+        def change_smoothing_window() :
+            entry = change_smoothing_window_entry.get()
+
+            if entry != "" :
+                try :
+                    entry = int(entry)
+                except ValueError :
+                    entry = -1
+
+                if entry == 0 or (entry > self.smoothing_order and entry % 2 == 1) :
+                    self.smoothing_window = entry
+                    self.feedback_label.config(text = f"Set Smoothing Window to {self.smoothing_window}")
+                else :
+                    self.feedback_label.config(text = f"Please Enter 0 or an Odd Smoothing Window Larger Than {self.smoothing_order}.")
+
+        change_smoothing_window_entry = tk.Entry(master = control_frame)
+        change_smoothing_window_entry.grid(row = 1, column = 1, padx = 5, pady = 5)
+
+        change_smoothing_window_button = tk.Button(master = control_frame, text = "Change Smoothing Window (points)", command = change_smoothing_window)
+        change_smoothing_window_button.grid(row = 2, column = 1, padx = 5, pady = 5)
+
+        """ create a tkinter.Entry for changing the potential of the capacitive currents of the scan rate analysis by User Input
+            valid inputs are int/float (V vs Ag|AgCl) or an empty entry (middle of the potential range of each file)
+            create a tkinter.Button, which starts the scan rate analysis (see self.run_scan_rate_analysis)
+        """
+        def change_capacitance_potential() :
+            entry = change_capacitance_potential_entry.get().replace(",", ".")
+
+            if entry == "" :
+                self.capacitance_potential = None
+                self.feedback_label.config(text = "Set Capacitance Potential to the Middle of the Potential Range")
+                return
+
+            try :
+                self.capacitance_potential = float(entry)
+                self.feedback_label.config(text = f"Set Capacitance Potential to {self.capacitance_potential} V")
+            except ValueError :
+                self.feedback_label.config(text = "Changing Capacitance Potential Failed. Please Enter a valid Input.")
+
+        change_capacitance_potential_entry = tk.Entry(master = control_frame)
+        change_capacitance_potential_entry.grid(row = 1, column = 2, padx = 5, pady = 5)
+
+        change_capacitance_potential_button = tk.Button(master = control_frame, text = "Change Capacitance Potential (V)",
+            command = change_capacitance_potential)
+        change_capacitance_potential_button.grid(row = 2, column = 2, padx = 5, pady = 5)
+
+        scan_rate_analysis_button = tk.Button(master = control_frame, text = "Scan Rate Analysis (C_dl, ECSA)", command = self.run_scan_rate_analysis)
+        scan_rate_analysis_button.grid(row = 3, column = 2, padx = 5, pady = 5)
+
         return self.program_frame
 
 
@@ -269,4 +560,32 @@ Version 1.0.3 (28.03.2022)
 
 Version 1.0.4 (06.04.2022)
 - fixed bug were tkinter.StringVar values werent saved if the program was imported
+
+Version 1.0.5 (19.10.2026)
+- plotted curves are decimated (min/max per pixel) for the axis width and re-decimated on zoom, saved data keeps the full resolution
+
+Version 1.0.6 (19.10.2026)
+- load, compute, plot and save stages of each file are recorded if profiling is enabled (instrumentation.py)
+
+Version 1.0.7 (19.10.2026)
+- added run_headless_evaluation for the evaluation of single files without GUI (used by watch_folder.py)
+- loading, processing and saving of a file moved to process_file
+
+Version 1.0.8 (19.10.2026)
+- summary of each file (peak current densities and potentials, number of scans, charges) saved in the results store (see results_store.py)
+
+Version 1.0.9 (19.10.2026)
+- processed data of all samples saved in one long-format batch table (see batch_table.py), separate txt files per sample
+  only if "save each sample as separate file" is checked (headless evaluations still save the txt file of the sample)
+
+Version 1.0.10 (19.10.2026)
+- optional Savitzky-Golay smoothing (see smoothing.py) of the current density for the peak search of the summary
+
+Version 1.0.11 (19.10.2026)
+- scan rate analysis of the selected files (see scan_rate_series.py): capacitive currents and charges of each cycle,
+  double-layer capacitance, ECSA and roughness factor of each electrode (button Scan Rate Analysis)
+
+Version 1.0.12 (19.10.2026)
+- optional overlay of all curves as one LineCollection (see curve_overlay.py) colored by the scan rate or the order of the files
+  with a colorbar instead of one line and legend entry per sample (checkbox "overlay curves")
 """
\ No newline at end of file
@@ -0,0 +1,156 @@
+""" Dataflow Graph of Derived Quantities
+    Version 1.0.1
+
+    small dependency graph for the derived quantities of a sample (e.g. E_vs_Ag -> E_vs_SHE -> overpotential)
+    every node is calculated by a function of its inputs (parameters or other nodes) and only calculated when it is requested
+    changing a parameter only invalidates the nodes downstream of the parameter, all other nodes keep their values
+    listeners (e.g. functions updating artists of a figure) are only called if one of the nodes they depend on was invalidated
+
+    usage:
+        graph = Dataflow_Graph()
+        graph.add_parameter("pH", 13)
+        graph.add_parameter("E_vs_Ag", data["E_vs_Ag"])
+        graph.add_node("E_vs_SHE", lambda E_vs_Ag, pH : E_vs_Ag + 0.059 * pH + 0.205, ["E_vs_Ag", "pH"])
+        graph.add_listener(["E_vs_SHE"], lambda graph : artist.set_data(graph.get("E_vs_SHE"), ...))
+
+        graph.set_parameter("pH", 14) # invalidates E_vs_SHE
+        graph.update() # recalculates E_vs_SHE and calls the listener
+"""
+
+import numpy as np
+
+
+class Dataflow_Graph :
+
+    def __init__(self) :
+        """ initiate Dataflow_Graph class object with the following attributes:
+            - self.values
+                (dict: contains the current values of all parameters and all calculated nodes with their name as key
+                invalidated nodes are removed and calculated again when requested)
+            - self.nodes
+                (dict: contains the function and the names of the inputs (tuple) of each node with the name of the node as key)
+            - self.dependents
+                (dict: contains a set of the names of all nodes, which directly use a parameter/node, with the name of the
+                parameter/node as key)
+            - self.listeners
+                (list: contains tuples (set of node names, function) of all listeners)
+            - self.invalidated
+                (set: contains the names of all parameters/nodes, which changed since the last call of self.update)
+        """
+        self.values = {}
+        self.nodes = {}
+        self.dependents = {}
+        self.listeners = []
+        self.invalidated = set()
+
+
+    def add_parameter(self, name, value) :
+        """ adds a parameter (input value, which is not calculated by the graph)
+        """
+        self.values[name] = value
+        self.dependents.setdefault(name, set())
+
+
+    def add_node(self, name, function, inputs) :
+        """ adds a node, which is calculated by function(*values of inputs)
+            all inputs have to be added before the node
+
+            expected argument datatypes:
+            - name : string
+            - function : function
+            - inputs : list (names of parameters/nodes)
+        """
+        for input_name in inputs :
+            if input_name not in self.dependents :
+                raise KeyError(f"Input {input_name} of node {name} does not exist.")
+
+            self.dependents[input_name].add(name)
+
+        self.nodes[name] = (function, tuple(inputs))
+        self.dependents.setdefault(name, set())
+
+
+    def add_listener(self, names, function) :
+        """ adds a listener, function(graph) is called by self.update if one of the parameters/nodes names was invalidated
+        """
+        self.listeners.append((set(names), function))
+
+
+    def get(self, name) :
+        """ returns the value of a parameter/node, invalidated nodes (and their invalidated inputs) are calculated again
+        """
+        if name not in self.values :
+            function, inputs = self.nodes[name]
+            self.values[name] = function(*[self.get(input_name) for input_name in inputs])
+
+        return self.values[name]
+
+
+    def get_downstream(self, name) :
+        """ returns the set of the names of all nodes, which depend directly or indirectly on the parameter/node name
+        """
+        downstream = set()
+        stack = [name]
+
+        while len(stack) > 0 :
+            for dependent in self.dependents[stack.pop()] :
+                if dependent not in downstream :
+                    downstream.add(dependent)
+                    stack.append(dependent)
+
+        return downstream
+
+
+    def set_parameter(self, name, value) :
+        """ changes the value of a parameter and invalidates all nodes downstream of the parameter
+            nothing is invalidated if the value did not change
+
+            returns the set of the names of the invalidated nodes
+        """
+        if name in self.values and np.array_equal(self.values[name], value) :
+            return set()
+
+        self.values[name] = value
+
+        downstream = self.get_downstream(name)
+
+        for node in downstream :
+            self.values.pop(node, None)
+
+        self.invalidated |= downstream | {name}
+
+        return downstream
+
+
+    def update(self) :
+        """ calls all listeners, which depend on an invalidated parameter/node, the listeners request the new values by self.get
+            so only the invalidated nodes used by the listeners are calculated
+
+            returns the number of called listeners
+            if a listener raises an exception, the invalidated nodes are kept, so all listeners are called again by the next update
+        """
+        invalidated, self.invalidated = self.invalidated, set()
+
+        count = 0
+
+        try :
+            for names, function in self.listeners :
+                if len(names & invalidated) > 0 :
+                    function(self)
+                    count += 1
+        except Exception :
+            self.invalidated |= invalidated
+            raise
+
+        return count
+
+
+
+""" update list:
+
+Version 1.0.0 (19.10.2026)
+- dataflow graph with lazy calculation of nodes, invalidation of the downstream nodes of changed parameters and listeners
+
+Version 1.0.1 (19.10.2026)
+- invalidated nodes are kept if a listener raises an exception, the remaining listeners were skipped for good before
+"""
\ No newline at end of file
@@ -1,5 +1,5 @@
 """ Electrodeposition Analysis Tool by Pascal Reiß
-    Version 1.0.3
+    Version 1.0.8
 """
 
 import tkinter as tk
@@ -11,6 +11,11 @@ import matplotlib.pyplot as plt
 import os
 from datetime import datetime
 
+from plot_decimation import scatter_decimated
+from instrumentation import stage, save_profile
+from results_store import store_results
+from batch_table import Batch_Table
+
 class Electrodeposition_Analysis :
     
     
@@ -27,6 +32,10 @@ class Electrodeposition_Analysis :
             - self.save_figures (boolean: contains info if User wants to save a figure created during the evaluation
                 default setting : False
                 can be changed in the User Interface)
+            - self.save_sample_files (boolean: contains info if User wants to save the processed data of each sample as separate txt file
+                in addition to the batch table of the evaluation (see batch_table.py)
+                default setting : False
+                can be changed in the User Interface)
         """
 
         self.program_name = "Electrodeposition Analysis"
@@ -41,6 +50,8 @@ class Electrodeposition_Analysis :
 
         self.save_figures = False
 
+        self.save_sample_files = False
+
         """ create evaluation folder to save evaluated data and figures (if it does not exist yet)
             created folder is at */Evaluation/Electrodepostion Analysis/**
              * path of this program
@@ -73,6 +84,100 @@ class Electrodeposition_Analysis :
         return seconds / 60
 
 
+    def get_parameters(self) :
+        """ returns the parameters of the evaluation as dict (saved with the results in the results store)
+        """
+        return {"area_electrode" : self.area_electrode}
+
+
+    def process_file(self, file_path, batch_table = None) :
+        """ opens the raw data file, converts the time in min, calculates the mean current density and saves the relevant data in the evaluation folder
+            the current density (mA/cm²), the mean potential (V) and the deposition time (min) are saved in the results store
+            used by self.run_evaluation and self.run_headless_evaluation
+
+            if a batch_table is given, the relevant data is added to it and only saved as separate txt file if self.save_sample_files is True
+
+            expected argument datatype:
+            - file_path : string
+            - batch_table : Batch_Table/None
+
+            returns sample_name : string, data : pandas.DataFrame, current_density : float (A/cm²)
+        """
+        """ get name of sample from file name 
+        """
+        file_name = os.path.basename(file_path)
+        sample_name = file_name.split(".txt")[0]
+
+        """ opening actual raw data 
+        """
+        with stage("load", file = sample_name, program = self.program_name) :
+            data = pd.read_csv(file_path, delimiter = ";")
+
+        """ conversion of time in min and calculation of the mean current for the current density calculation 
+        """
+        with stage("compute", file = sample_name, program = self.program_name) :
+            data["Time_(min)"] = self.get_seconds_in_min(data["Corrected time (s)"])
+
+            mean_current = np.mean(data["WE(1).Current (A)"])
+
+            current_density = mean_current / self.area_electrode
+
+        """ create a new DataFrame containg only the relevant data and save those 
+        """
+        with stage("save", file = sample_name, program = self.program_name) :
+            data_save = pd.DataFrame()
+
+            data_save["Time_(min)"] = data["Time_(min)"]
+            data_save["Current_(A)"] = data["WE(1).Current (A)"]
+            data_save["Potential_(V)"] = data["WE(1).Potential (V)"]
+
+            if batch_table != None :
+                batch_table.add_sample(sample_name, data_save, "Time_(min)")
+
+            if batch_table == None or self.save_sample_files :
+                data_save.to_csv(f"{self.path_evaluation_folder}\{file_name}", header = data_save.columns, index = None, sep = ";")
+
+        with stage("store", file = sample_name, program = self.program_name) :
+            store_results(self, sample_name, {"current_density" : current_density * 1000,
+                                              "mean_potential" : np.mean(data["WE(1).Potential (V)"]),
+                                              "deposition_time" : data["Time_(min)"].iloc[-1]},
+                file_paths = [file_path])
+
+        return sample_name, data, current_density
+
+
+    def run_headless_evaluation(self, file_path) :
+        """ evaluates a single file without GUI and without showing a figure (used by watch_folder.py)
+            the processed data is saved in the evaluation folder, the figure only if self.save_figures is True
+
+            expected argument datatype:
+            - file_path : string
+
+            returns dict with the sample_name, the program_name and the mean current density (mA/cm²)
+        """
+        sample_name, data, current_density = self.process_file(file_path)
+
+        if self.save_figures :
+            with stage("plot", file = sample_name, program = self.program_name) :
+                fig, ax = plt.subplots()
+
+                scatter_decimated(ax, data["Time_(min)"], data["WE(1).Potential (V)"], \
+                    label = f"{sample_name} " + "$j_{dep}$" + f" = {round(current_density * 1000, 3)} mA/cm²", marker = "x")
+
+                ax.legend(loc = "lower left", fontsize = 10)
+                ax.set_xlabel("Time [min]")
+                ax.set_ylabel("$E_{WE}$ vs Ag|AgCl [V]")
+
+            with stage("save_figure", file = sample_name, program = self.program_name) :
+                fig.savefig(f"{self.path_evaluation_folder}\{sample_name}.jpg")
+
+            plt.close(fig)
+
+        save_profile(self.path_evaluation_folder, self.program_name)
+
+        return {"program_name" : self.program_name, "sample_name" : sample_name, "current_density" : float(current_density * 1000)}
+
+
     def run_evaluation(self) :
         """ does the actually evaluation of the selected data
             does only trigger if files were selected in the first place """
@@ -85,45 +190,27 @@ class Electrodeposition_Analysis :
 
             current_density_label = "$j_{dep}$" # set up string for y-axis label of plot
 
-            """ loop through each file individually 
+            """ create the batch table, which collects the relevant data of all samples in one file (see batch_table.py)
+                loop through each file individually 
             """
+            batch_table = Batch_Table(self.path_evaluation_folder, "Electrodeposition")
 
             for file_path in self.file_paths :
 
-                """ get name of sample from file name 
+                """ open, process and add the data of the file to the batch table (see function self.process_file)
                 """
-
-                file_name = os.path.basename(file_path)
-                sample_name = file_name.split(".txt")[0]
-
-                """ opening actual raw data 
-                """
-
-                data = pd.read_csv(file_path, delimiter = ";")
-
-                """ conversion of time in min and calculation of the mean current for the current density calculation 
-                """
-                data["Time_(min)"] = self.get_seconds_in_min(data["Corrected time (s)"])
-
-                mean_current = np.mean(data["WE(1).Current (A)"])
-
-                current_density = mean_current / self.area_electrode
+                sample_name, data, current_density = self.process_file(file_path, batch_table)
 
                 """ plot data as scatter plot with x as marker 
+                    the plotted data is decimated for the axis width (min/max per pixel), the saved data keeps the full resolution
                 """
-                ax.scatter(data["Time_(min)"], data["WE(1).Potential (V)"], \
-                    label = f"{sample_name} {current_density_label} = {round(current_density * 1000, 3)} mA/cm²", marker = "x")
+                with stage("plot", file = sample_name, program = self.program_name) :
+                    scatter_decimated(ax, data["Time_(min)"], data["WE(1).Potential (V)"], \
+                        label = f"{sample_name} {current_density_label} = {round(current_density * 1000, 3)} mA/cm²", marker = "x")
 
-                """ create a new DataFrame containg only the relevant data and save those 
-                """
-                data_save = pd.DataFrame()
-
-                data_save["Time_(min)"] = data["Time_(min)"]
-                data_save["Current_(A)"] = data["WE(1).Current (A)"]
-                data_save["Potential_(V)"] = data["WE(1).Potential (V)"]
-
-                data_save.to_csv(f"{self.path_evaluation_folder}\{file_name}", header = data_save.columns, index = None, sep = ";")
 
+            with stage("save_batch", program = self.program_name) :
+                batch_table.save()
 
             """ finalizing generated plot/figure by adding axis labels and legends
                 save the figure in case User wants to save them """
@@ -140,7 +227,12 @@ class Electrodeposition_Analysis :
                     """
                     if ".jpg" in file :
                         count += 1
-                fig.savefig(f"{self.path_evaluation_folder}\Electrodeposition_{count}.jpg")
+                with stage("save_figure", program = self.program_name) :
+                    fig.savefig(f"{self.path_evaluation_folder}\Electrodeposition_{count}.jpg")
+
+            """ the recorded stages are saved in the evaluation folder if profiling is enabled (see instrumentation.py)
+            """
+            save_profile(self.path_evaluation_folder, self.program_name)
 
             plt.show()
 
@@ -240,6 +332,17 @@ class Electrodeposition_Analysis :
             variable = save_figures_variable, command = change_figure_saving_settings)
         save_figures_checkbox.grid(column = 0, row = 3, padx = 5, pady = 5)
 
+        """ set up a tkinter.StringVar which contains the setting of the tkinter.tkk.Checkbutton
+            this Checkbutton acts as checkbox for saving the data of each sample as separate txt file in addition to the batch table
+        """
+        def change_sample_file_settings() :
+            self.save_sample_files = save_sample_files_variable.get() == "1"
+
+        save_sample_files_variable = tk.StringVar(value = "0")
+        save_sample_files_checkbox = ttk.Checkbutton(self.program_frame, text = "save each sample as separate file",
+            variable = save_sample_files_variable, command = change_sample_file_settings)
+        save_sample_files_checkbox.grid(column = 0, row = 4, padx = 5, pady = 5)
+
 
         return self.program_frame
 
@@ -275,4 +378,21 @@ Version 1.0.2 (28.03.2022)
 
 Version 1.0.3 (06.04.2022)
 - fixed bug were tkinter.StringVar values werent saved if the program was imported
+
+Version 1.0.4 (19.10.2026)
+- plotted data is decimated (min/max per pixel) for the axis width and re-decimated on zoom, saved data keeps the full resolution
+
+Version 1.0.5 (19.10.2026)
+- load, compute, plot and save stages of each file are recorded if profiling is enabled (instrumentation.py)
+
+Version 1.0.6 (19.10.2026)
+- added run_headless_evaluation for the evaluation of single files without GUI (used by watch_folder.py)
+- loading, processing and saving of a file moved to process_file
+
+Version 1.0.7 (19.10.2026)
+- current density, mean potential and deposition time of each file saved in the results store (see results_store.py)
+
+Version 1.0.8 (19.10.2026)
+- relevant data of all samples saved in one long-format batch table (see batch_table.py), separate txt files per sample
+  only if "save each sample as separate file" is checked (headless evaluations still save the txt file of the sample)
 """
\ No newline at end of file
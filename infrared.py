@@ -1,5 +1,5 @@
 """ Infrared Analysis Tool by Pascal Reiß
-    Version 1.0.3
+    Version 1.0.15
 """
 
 import tkinter as tk
@@ -12,6 +12,18 @@ from tkinter import ttk
 from datetime import datetime
 from matplotlib.widgets import SpanSelector
 
+from plot_decimation import plot_decimated
+from instrumentation import stage, save_profile
+from batch_table import Batch_Table
+from spectral_cube import Spectral_Cube
+from spectral_library import Spectral_Library
+from baseline import baseline_methods
+from band_fitting import fit_spectra
+from peak_alignment import align_peaks
+from smoothing import savgol_filter
+from spectral_clustering import cluster_spectra, save_clustering
+from dpt_reader import read_dpt
+
 class Infrared_Analysis :
 
     def __init__(self) :
@@ -19,6 +31,10 @@ class Infrared_Analysis :
             - self.save_figures
                 (boolean: contains the state if the User wants to save the created figures automatically
                 default state: False)
+            - self.save_sample_files
+                (boolean: contains the state if the User wants to save the processed spectrum of each sample as separate txt file
+                in addition to the batch table of the evaluation (see batch_table.py)
+                default state: False)
             - self.file_paths
                 (tuple: contains the file_paths of the selected raw data files by the User)
             - self.local_min_threshold
@@ -36,6 +52,24 @@ class Infrared_Analysis :
                 default state: False)
             - self.local_min_frame
                 (tkinter.Frame: is an object required in the self.program_frame if the User wants to determine the local minima automatically)
+            - self.baseline_setting
+                (boolean: state if the baselines of the spectra shall be corrected before the normalization (see baseline.py)
+                default state: False)
+            - self.baseline_method and self.baseline_lambda
+                (string and float: method ("arpls" or "asls") and smoothness of the baseline correction
+                default setting: "arpls" and 10**5)
+            - self.band_fit_setting
+                (boolean: state if the bands (local minima) of all spectra shall be fitted (see band_fitting.py)
+                default state: False)
+            - self.band_model and self.band_fit_workers
+                (string and int: profile of the bands ("lorentzian", "gaussian" or "pseudo_voigt") and number of worker processes
+                of the band fits, default setting: "lorentzian" and 4)
+            - self.alignment_tolerance
+                (float: maximum gap in cm^-1 between the local minima of different spectra assigned to the same band (see peak_alignment.py)
+                default setting: 4)
+            - self.smoothing_window and self.smoothing_order
+                (int: window (odd number of data points, 0 : no smoothing) and polynomial order of the Savitzky-Golay smoothing of the
+                normalized intensity before the local minima determination (see smoothing.py), default setting: 0 and 3)
         """
 
         """ set up basic attributes required for the Infrared_Analysis
@@ -44,6 +78,8 @@ class Infrared_Analysis :
 
         self.save_figures = False
 
+        self.save_sample_files = False
+
         self.reset_attributes()
 
         self.program_frame = None
@@ -54,6 +90,24 @@ class Infrared_Analysis :
 
         self.local_min_frame = None     
 
+        self.baseline_setting = False
+
+        self.baseline_method = "arpls"
+
+        self.baseline_lambda = 10**5
+
+        self.band_fit_setting = False
+
+        self.band_model = "lorentzian"
+
+        self.band_fit_workers = 4
+
+        self.alignment_tolerance = 4
+
+        self.smoothing_window = 0
+
+        self.smoothing_order = 3
+
 
     def reset_attributes(self) :
         """ resets all atttributes for the Infrared_Analysis class object 
@@ -138,6 +192,60 @@ class Infrared_Analysis :
             variable = save_figures_variable, command = change_figure_saving_settings)
         save_figures_checkbox.grid(row = 1, column = 0, padx = 5, pady = 5)
 
+        """ create a tkinter.tkk.Checkbutton, which contains the state of the self.save_sample_files
+            it controls if the processed spectrum of each sample is saved as separate txt file in addition to the batch table
+            default state: False
+        """
+        def change_sample_file_settings() :
+            self.save_sample_files = save_sample_files_variable.get() == "1"
+
+        save_sample_files_variable = tk.StringVar(value = "0")
+        save_sample_files_checkbox = ttk.Checkbutton(control_frame, text = "save each sample as separate file",
+            variable = save_sample_files_variable, command = change_sample_file_settings)
+        save_sample_files_checkbox.grid(row = 3, column = 0, padx = 5, pady = 5)
+
+        """ create a tkinter.Button, which saves all selected spectra as one spectral cube on a shared wave number grid
+            (see function self.create_spectral_cube)
+        """
+        create_cube_button = tk.Button(master = control_frame, text = "Create Spectral Cube", command = self.create_spectral_cube)
+        create_cube_button.grid(row = 4, column = 0, padx = 5, pady = 5)
+
+        """ create a tkinter.Button, which searches the most similar reference spectra of all selected spectra in a reference library
+            (see function self.search_reference_library)
+        """
+        search_library_button = tk.Button(master = control_frame, text = "Search Reference Library", command = self.search_reference_library)
+        search_library_button.grid(row = 4, column = 1, padx = 5, pady = 5)
+
+        """ create a tkinter.Button, which groups all selected spectra by similarity (randomized PCA and k-means)
+            (see function self.cluster_spectra)
+        """
+        cluster_spectra_button = tk.Button(master = control_frame, text = "Cluster Spectra", command = self.cluster_spectra)
+        cluster_spectra_button.grid(row = 4, column = 2, padx = 5, pady = 5)
+
+        """ create a tkinter.tkk.Checkbutton, which contains the state of the self.baseline_setting
+            it controls if the baselines of all spectra are corrected (arPLS) before the normalization
+            default state: False
+        """
+        def change_baseline_settings() :
+            self.baseline_setting = baseline_variable.get() == "1"
+
+        baseline_variable = tk.StringVar(value = "0")
+        baseline_checkbox = ttk.Checkbutton(control_frame, text = "baseline correction (arPLS)",
+            variable = baseline_variable, command = change_baseline_settings)
+        baseline_checkbox.grid(row = 5, column = 0, padx = 5, pady = 5)
+
+        """ create a tkinter.tkk.Checkbutton, which contains the state of the self.band_fit_setting
+            it controls if the bands of all spectra are fitted after the evaluation (see function self.fit_bands)
+            default state: False
+        """
+        def change_band_fit_settings() :
+            self.band_fit_setting = band_fit_variable.get() == "1"
+
+        band_fit_variable = tk.StringVar(value = "0")
+        band_fit_checkbox = ttk.Checkbutton(control_frame, text = "band fitting",
+            variable = band_fit_variable, command = change_band_fit_settings)
+        band_fit_checkbox.grid(row = 5, column = 1, padx = 5, pady = 5)
+
         def change_local_min_settings() :
             settings = {"1" : True, "0" : False, "" : True}
             setting = local_min_variable.get()
@@ -205,6 +313,32 @@ class Infrared_Analysis :
         local_min_button = tk.Button(master = local_min_frame, text = "Enter Treshold", command = set_local_min)
         local_min_button.grid(row = 1, column = 2, padx = 5, pady = 5)
 
+        smoothing_label = tk.Label(local_min_frame, text = f"Smoothing Window: {self.smoothing_window}")
+        smoothing_label.grid(row = 2, column = 0, padx = 5, pady = 5)
+
+        smoothing_entry = tk.Entry(local_min_frame)
+        smoothing_entry.grid(row = 2, column = 1, padx = 5, pady = 5)
+
+        def set_smoothing_window() :
+            entry = smoothing_entry.get()
+
+            if entry != "" :
+                try :
+                    entry = int(entry)
+                except ValueError :
+                    entry = -1
+
+                if entry == 0 or (entry > self.smoothing_order and entry % 2 == 1) :
+                    self.smoothing_window = entry
+
+                    smoothing_label.config(text = f"Smoothing Window: {self.smoothing_window}")
+
+                else :
+                    self.feedback_label.config(text = f"Please Enter 0 or an Odd Smoothing Window Larger Than {self.smoothing_order}.")
+
+        smoothing_button = tk.Button(master = local_min_frame, text = "Enter Smoothing Window", command = set_smoothing_window)
+        smoothing_button.grid(row = 2, column = 2, padx = 5, pady = 5)
+
         return self.program_frame
 
 
@@ -223,6 +357,100 @@ class Infrared_Analysis :
             self.feedback_label.config(text = "Evaluation Can Now Be Started.")
     
 
+    def process_file(self, file_path, batch_table = None, data = None) :
+        """ opens the spectrum, corrects its baseline (if self.baseline_setting is True), normalizes the intensity, determines the local minima
+            (if self.local_min_setting is True) and saves the processed data (and figure if self.save_figures is True) in the evaluation folder
+            used by self.run_evaluation and self.run_headless_evaluation
+
+            if a batch_table is given, the processed data is added to it and only saved as separate txt file if self.save_sample_files is True
+            if data is given, the spectrum was already opened and baseline corrected together with all spectra of the evaluation
+            (see function self.load_spectra)
+
+            expected argument datatype:
+            - file_path : string
+            - batch_table : Batch_Table/None
+            - data : pandas.DataFrame/None
+
+            returns sample_name : string, data : pandas.DataFrame
+        """
+        """ get the sample_name from the file_path
+        """
+        file_name = os.path.basename(file_path)
+        sample_name = file_name.split(".dpt")[0]
+
+        """ open data of sample 
+            get normalized intensity between 0 and 1 
+        """
+        if data is None :
+            data = self.load_spectra([file_path])[sample_name]
+
+        with stage("compute", file = sample_name, program = self.program_name) :
+            data["normalized_intensity"] = self.get_normalized_intensity(data["intensity"])                
+
+        """ determine local minima position if selected the automatic local minma determination 
+        """
+        if self.local_min_setting :
+            with stage("local_minima", file = sample_name, program = self.program_name) :
+                self.get_local_min_pos(data)
+
+        """ plot normalized intenstiy vs wave number in figure if User wants to save the figures automatically
+            invert x axis
+            add x and y axis label 
+        """
+        if self.save_figures :
+
+            with stage("plot", file = sample_name, program = self.program_name) :
+                fig, ax = plt.subplots()
+
+                plot_decimated(ax, data["wave_number"], data["normalized_intensity"])
+                xlim = ax.get_xlim()
+                ax.set_xlim(xlim[1], xlim[0]) # invert x axis
+
+                ax.set_xlabel("Wave Number ($cm^{-1}$)")
+                ax.set_ylabel("Intensity (a.u.)")
+
+                fig.savefig(f"{self.path_evaluation_folder}\{sample_name}.jpg")
+
+                plt.close(fig)
+
+        """ drop column intensity in data DataFrame and save it in the evaluation folder
+        """
+        with stage("save", file = sample_name, program = self.program_name) :
+            data.drop("intensity", axis = 1, inplace = True)
+
+            if self.local_min_setting :
+                header = ["wave_number (cm^-1)", "Normalized Intensity (a.u)", "Local Min"]
+            else :
+                header = ["wave_number (cm^-1)", "Normalized Intensity (a. u.)"]
+
+            if batch_table != None :
+                batch_table.add_sample(sample_name, data.set_axis(header, axis = 1), "wave_number (cm^-1)")
+
+            if batch_table == None or self.save_sample_files :
+                data.to_csv(f"{self.path_evaluation_folder}\{sample_name}.txt", header = header, index = None, sep = ";")
+
+        return sample_name, data
+
+
+    def run_headless_evaluation(self, file_path) :
+        """ evaluates a single spectrum without GUI and without showing a figure (used by watch_folder.py)
+
+            expected argument datatype:
+            - file_path : string
+
+            returns dict with the sample_name and the program_name
+        """
+        sample_name, data = self.process_file(file_path)
+
+        if self.band_fit_setting :
+            bands = self.fit_bands({sample_name : data}, workers = 1)
+            bands.to_csv(f"{self.path_evaluation_folder}\{sample_name}_Bands.txt", sep = ";", index = None)
+
+        save_profile(self.path_evaluation_folder, self.program_name)
+
+        return {"program_name" : self.program_name, "sample_name" : sample_name}
+
+
     def run_evaluation(self) :
         """ does the actual evaluation of the selected data
             does only trigger if files were selected in the first place 
@@ -238,74 +466,70 @@ class Infrared_Analysis :
 
             """ loop through each selected file in self.file_paths
                 process data and save data for later use in datas dictionary as value and sample_name as key
+                the processed data of all samples is saved in one batch table (see batch_table.py)
             """
             datas = {}
-            for file_path in self.file_paths :
-                """ get the sample_name from the file_path
-                """
-                file_name = os.path.basename(file_path)
-                sample_name = file_name.split(".dpt")[0]
+            batch_table = Batch_Table(self.path_evaluation_folder, "Infrared")
 
-                """ open data of sample 
-                    get normalized intensity between 0 and 1 
-                    add data DataFrame to datas dict as value and sample_name as key
+            """ open all spectra first, so the baselines of all spectra are corrected together (see function self.load_spectra)
+            """
+            spectra = self.load_spectra(self.file_paths)
+
+            for file_path in self.file_paths :
+                """ process and add the data of the file to the batch table (see function self.process_file)
                 """
-                data = pd.read_csv(file_path, delimiter = "\t", names = ["wave_number", "intensity"])
+                sample_name = os.path.basename(file_path).split(".dpt")[0]
 
-                data["normalized_intensity"] = self.get_normalized_intensity(data["intensity"])                
+                sample_name, data = self.process_file(file_path, batch_table, spectra[sample_name])
 
                 datas[sample_name] = data
 
-                """ determine local minima position if selected the automatic local minma determination 
-                """
-                if self.local_min_setting :
-                    self.get_local_min_pos(data)
-
-                """ plot normalized intenstiy vs wave number in figure if User wants to save the figures automatically
-                    invert x axis
-                    add x and y axis label 
-                """
-                if self.save_figures :
+            with stage("save_batch", program = self.program_name) :
+                batch_table.save()
 
-                    fig, ax = plt.subplots()
+            """ fit the bands of all spectra on a pool of worker processes and save one row per band of each sample
+            """
+            if self.band_fit_setting :
+                bands = self.fit_bands(datas, workers = self.band_fit_workers)
 
-                    ax.plot(data["wave_number"], data["normalized_intensity"])
-                    xlim = ax.get_xlim()
-                    ax.set_xlim(xlim[1], xlim[0]) # invert x axis
+                count = 0
+                for file in os.listdir(self.path_evaluation_folder) :
+                    if "Band_Fit" in file :
+                        count += 1
 
-                    ax.set_xlabel("Wave Number ($cm^{-1}$)")
-                    ax.set_ylabel("Intensity (a.u.)")
+                bands.to_csv(f"{self.path_evaluation_folder}\Band_Fit_{count}.txt", sep = ";", index = None)
 
-                    fig.savefig(f"{self.path_evaluation_folder}\{sample_name}.jpg")
+            """ align the local minima of all spectra to bands and save the band x sample matrices of the intensities and positions
+            """
+            if self.local_min_setting :
+                intensities, positions = self.align_local_minima(datas)
 
-                    plt.close(fig)
+                count = 0
+                for file in os.listdir(self.path_evaluation_folder) :
+                    if "Band_Alignment" in file :
+                        count += 1
 
-                """ drop column intensity in data DataFrame and save it in the evaluation folder
-                """
-                data.drop("intensity", axis = 1, inplace = True)
+                intensities.to_csv(f"{self.path_evaluation_folder}\Band_Alignment_{count}.txt", sep = ";")
+                positions.to_csv(f"{self.path_evaluation_folder}\Band_Alignment_{count}_Positions.txt", sep = ";")
 
-                if self.local_min_setting :
-                    data.to_csv(f"{self.path_evaluation_folder}\{sample_name}.txt", header = ["wave_number (cm^-1)", "Normalized Intensity (a.u)", "Local Min"], index = None, sep = ";")
-                else :
-                    data.to_csv(f"{self.path_evaluation_folder}\{sample_name}.txt", header = ["wave_number (cm^-1)", "Normalized Intensity (a. u.)"], index = None, sep = ";")
 
+            with stage("plot_summary", program = self.program_name) :
+                fig, ax = plt.subplots()
 
-            fig, ax = plt.subplots()
-
-            for sample_name, data in datas.items() :
-                color = next(ax._get_lines.prop_cycler)['color']
-                ax.plot(data["wave_number"], data["normalized_intensity"], label = sample_name, c = color)
+                for sample_name, data in datas.items() :
+                    color = next(ax._get_lines.prop_cycler)['color']
+                    plot_decimated(ax, data["wave_number"], data["normalized_intensity"], label = sample_name, c = color)
                 
-                if self.local_min_setting :
-                    ax.scatter(data["wave_number"], data["local_min"], marker = "x", s = 10, c = color)
+                    if self.local_min_setting :
+                        ax.scatter(data["wave_number"], data["local_min"], marker = "x", s = 10, c = color)
                 
 
-            xlim = ax.get_xlim()
-            ax.set_xlim(xlim[1], xlim[0]) # invert x axis
+                xlim = ax.get_xlim()
+                ax.set_xlim(xlim[1], xlim[0]) # invert x axis
 
-            ax.set_xlabel("Wave Number ($cm^{-1}$)")
-            ax.set_ylabel("Intensity (a.u.)")
-            ax.legend(loc = "upper left", fontsize = 8)
+                ax.set_xlabel("Wave Number ($cm^{-1}$)")
+                ax.set_ylabel("Intensity (a.u.)")
+                ax.legend(loc = "upper left", fontsize = 8)
 
 
             if self.feedback_label != None :
@@ -322,9 +546,204 @@ class Infrared_Analysis :
                     if "Infrared_Analysis" in file :
                         count += 1
 
-                fig.savefig(f"{self.path_evaluation_folder}\Infrared_Analysis_{count}.jpg")
+                with stage("save_figure", program = self.program_name) :
+                    fig.savefig(f"{self.path_evaluation_folder}\Infrared_Analysis_{count}.jpg")
+
+            """ the recorded stages are saved in the evaluation folder if profiling is enabled (see instrumentation.py)
+            """
+            save_profile(self.path_evaluation_folder, self.program_name)
                 
 
+    def create_spectral_cube(self) :
+        """ resamples all selected spectra onto a shared wave number grid and saves them as one memory-mapped float32 matrix
+            (spectra x wave numbers) with a sidecar index of the sample_names (see spectral_cube.py)
+            the cube is saved as Spectral_Cube_{count}.f32 and Spectral_Cube_{count}.json in the evaluation folder
+            is deployed on tkinter.Button event (create_cube_button (see function self.get_gui_frame))
+
+            returns the Spectral_Cube or None if no files were selected
+        """
+        if len(self.file_paths) == 0 :
+            if self.feedback_label != None :
+                self.feedback_label.config(text = "Please Select Your Raw Data First.")
+            return None
+
+        count = 0
+        for file in os.listdir(self.path_evaluation_folder) :
+            if "Spectral_Cube" in file and ".json" in file :
+                count += 1
+
+        with stage("spectral_cube", program = self.program_name) :
+            cube = Spectral_Cube.create(f"{self.path_evaluation_folder}\Spectral_Cube_{count}", self.file_paths)
+
+        if self.feedback_label != None :
+            self.feedback_label.config(text = f"Spectral Cube Saved As Spectral_Cube_{count} ({len(cube)} Spectra).")
+
+        return cube
+
+
+    def cluster_spectra(self, n_components = 10, n_clusters = 5) :
+        """ groups all selected spectra by similarity: the spectra are saved as spectral cube (see function self.create_spectral_cube),
+            reduced to n_components principal components by a randomized PCA streamed over the cube and the scores are clustered by
+            mini-batch k-means (see spectral_clustering.py)
+            the scores with the cluster labels, the loadings and the explained variance are saved as Spectral_Clustering_{count}_*.txt
+            is deployed on tkinter.Button event (cluster_spectra_button (see function self.get_gui_frame))
+
+            expected argument datatypes:
+            - n_components, n_clusters : int
+
+            returns pandas.DataFrame (Sample, PC1, ..., Cluster) or None if no files were selected
+        """
+        cube = self.create_spectral_cube()
+
+        if cube == None :
+            return None
+
+        with stage("spectral_clustering", program = self.program_name) :
+            scores, loadings, explained_variance = cluster_spectra(cube, n_components, n_clusters)
+
+        count = 0
+        for file in os.listdir(self.path_evaluation_folder) :
+            if "Spectral_Clustering" in file and "_Scores" in file :
+                count += 1
+
+        save_clustering(f"{self.path_evaluation_folder}\Spectral_Clustering_{count}", scores, loadings, explained_variance)
+
+        if self.feedback_label != None :
+            sizes = scores["Cluster"].value_counts().sort_index()
+            self.feedback_label.config(text = "Clusters: " + ", ".join(f"{cluster}: {size} Spectra" for cluster, size in sizes.items()))
+
+        return scores
+
+
+    def search_reference_library(self, library_path = None, k = 5) :
+        """ searches the k most similar reference spectra (e.g. carbonates, hydroxides, oxides) of each selected spectrum in a reference library
+            (see spectral_library.py), all spectra are compared with all references in a single matrix multiply
+            the results are saved as Library_Search_{count}.txt in the evaluation folder
+            is deployed on tkinter.Button event (search_library_button (see function self.get_gui_frame)), the User selects the library file
+
+            expected argument datatypes:
+            - library_path : string/None (path of the library with or without the ending .json)
+            - k : int
+
+            returns pandas.DataFrame (sample_name, rank, reference, similarity) or None if no files or no library were selected
+        """
+        if len(self.file_paths) == 0 :
+            if self.feedback_label != None :
+                self.feedback_label.config(text = "Please Select Your Raw Data First.")
+            return None
+
+        if library_path == None :
+            root = tk.Tk()
+            library_path = filedialog.askopenfilename(parent = root, filetypes = [("Spectral Library", "*.json")])
+            root.destroy()
+
+            if library_path == "" :
+                return None
+
+        library_path = library_path.split(".json")[0]
+
+        with stage("library_search", program = self.program_name) :
+            library = Spectral_Library(library_path)
+            results = library.search_files(self.file_paths, k = k)
+
+        count = 0
+        for file in os.listdir(self.path_evaluation_folder) :
+            if "Library_Search" in file :
+                count += 1
+
+        results.to_csv(f"{self.path_evaluation_folder}\Library_Search_{count}.txt", sep = ";", index = None,
+            header = ["Sample", "Rank", "Reference", "Similarity"])
+
+        if self.feedback_label != None :
+            best_matches = results[results["rank"] == 1]
+            self.feedback_label.config(text = ", ".join(f"{sample_name}: {reference} ({round(similarity, 3)})"
+                for sample_name, reference, similarity in zip(best_matches["sample_name"], best_matches["reference"], best_matches["similarity"])))
+
+        return results
+
+
+    def load_spectra(self, file_paths) :
+        """ opens the spectra of the file_paths (see dpt_reader.py) and corrects their baselines if self.baseline_setting is True
+            the baselines of all spectra with the same number of wave numbers are calculated together in one batch (see baseline.py),
+            since the bands of the spectra are minima, the baseline of the negative intensity is subtracted:
+            intensity = intensity + baseline(-intensity)
+
+            expected argument datatype:
+            - file_paths : list/tuple
+
+            returns dict with the data (pandas.DataFrame, columns wave_number and intensity) as value and the sample_name as key
+        """
+        spectra = {}
+
+        for file_path in file_paths :
+            sample_name = os.path.basename(file_path).split(".dpt")[0]
+
+            with stage("load", file = sample_name, program = self.program_name) :
+                wave_numbers, intensities = read_dpt(file_path)
+                spectra[sample_name] = pd.DataFrame({"wave_number" : wave_numbers, "intensity" : intensities})
+
+        if self.baseline_setting and len(spectra) > 0 :
+
+            with stage("baseline", program = self.program_name) :
+                lengths = {}
+                for sample_name, data in spectra.items() :
+                    lengths.setdefault(len(data), []).append(sample_name)
+
+                for sample_names in lengths.values() :
+                    intensities = np.stack([spectra[sample_name]["intensity"].to_numpy(dtype = np.float64) for sample_name in sample_names])
+
+                    baselines = baseline_methods[self.baseline_method](-intensities, lam = self.baseline_lambda)
+
+                    for sample_name, intensity, baseline in zip(sample_names, intensities, baselines) :
+                        spectra[sample_name]["intensity"] = intensity + baseline
+
+        return spectra
+
+
+    def fit_bands(self, datas, workers = 1) :
+        """ fits the bands of the normalized spectra with self.band_model profiles seeded from the local minima below
+            self.local_min_threshold (see band_fitting.py)
+
+            expected argument datatypes:
+            - datas : dict (contains the processed data (pandas.DataFrame, see function self.process_file) as value and the sample_name as key)
+            - workers : int (number of worker processes, 1: fitted in this process)
+
+            returns pandas.DataFrame with one row per band (Sample, Band, Center, FWHM, Depth, Area, RMS Residual)
+        """
+        with stage("band_fit", program = self.program_name) :
+            spectra = {sample_name : (data["wave_number"], data["normalized_intensity"]) for sample_name, data in datas.items()}
+
+            return fit_spectra(spectra, model = self.band_model, workers = workers, local_min_threshold = self.local_min_threshold)
+
+
+    def align_local_minima(self, datas) :
+        """ matches the local minima of all spectra to bands, local minima of different spectra within self.alignment_tolerance
+            belong to the same band (see peak_alignment.py)
+
+            expected argument datatype:
+            - datas : dict (contains the processed data (pandas.DataFrame) with the column local_min as value and the sample_name as key)
+
+            returns the band x sample matrices (pandas.DataFrame) of the normalized intensities and the wave numbers of the local minima
+        """
+        with stage("peak_alignment", program = self.program_name) :
+            sample_names, positions, intensities = [], [], []
+
+            for sample_name, data in datas.items() :
+                if "local_min" not in data :
+                    continue
+
+                local_minima = data[data["local_min"].notna()]
+
+                sample_names += [sample_name] * len(local_minima)
+                positions.append(local_minima["wave_number"].to_numpy(dtype = np.float64))
+                intensities.append(local_minima["local_min"].to_numpy(dtype = np.float64))
+
+            positions = np.concatenate(positions) if len(positions) > 0 else []
+            intensities = np.concatenate(intensities) if len(intensities) > 0 else []
+
+            return align_peaks(sample_names, positions, intensities, tolerance = self.alignment_tolerance)
+
+
     def get_normalized_intensity(self, intensity) :
         """ returns an normalized data set between 0 and 1 by the formular
             intensity = (intensity - min-intensity) / (max-intensity - min-intensity)
@@ -341,24 +760,26 @@ class Infrared_Analysis :
     def get_local_min_pos(self, data) :
         """ searches for local minima in the column normalized_intensity from the data DataFrame by comparing each position with its direct neighbor if it
             represents an local minima
+            the normalized intensity at the local minima is saved in the column local_min (NaN at all other positions)
+
+            if self.smoothing_window > 0 the minima are searched in the smoothed normalized intensity (Savitzky-Golay, see smoothing.py),
+            so noise does not produce spurious local minima
 
             known issues:
-            - detects every minima position (can by fine tuned by setting right self.local_min_treshold)
+            - detects every minima position (can by fine tuned by setting right self.local_min_treshold and self.smoothing_window)
         """
-        intensity = data["normalized_intensity"]
-
-        count = 0
-
-        for n in range(1, len(intensity) - 1) :
+        intensity = data["normalized_intensity"].to_numpy(dtype = np.float64)
 
-            inte = intensity[n]
+        if self.smoothing_window > 0 :
+            intensity = savgol_filter(intensity, self.smoothing_window, self.smoothing_order)
 
-            if inte <= self.local_min_threshold :
+        center = intensity[1:-1]
 
-                if inte <= intensity[n - 1] and inte <= intensity[n + 1] :
+        local_minima = np.zeros(len(intensity), dtype = bool)
+        local_minima[1:-1] = (center <= self.local_min_threshold) & (center <= intensity[:-2]) & (center <= intensity[2:])
 
-                    data.at[n, "local_min"] = inte
-                    count +=1
+        if local_minima.any() :
+            data["local_min"] = data["normalized_intensity"].where(local_minima)
 
 
 
@@ -387,4 +808,48 @@ Version 1.0.2 (28.03.2022)
 
 Version 1.0.3 (06.04.2022)
 - fixed bug were tkinter.StringVar values werent saved if the program was imported
+
+Version 1.0.4 (19.10.2026)
+- plotted data is decimated (min/max per pixel) for the axis width and re-decimated on zoom, saved data keeps the full resolution
+
+Version 1.0.5 (19.10.2026)
+- load, compute, local minima, plot and save stages of each file are recorded if profiling is enabled (instrumentation.py)
+
+Version 1.0.6 (19.10.2026)
+- added run_headless_evaluation for the evaluation of single files without GUI (used by watch_folder.py)
+- loading, processing and saving of a file moved to process_file
+
+Version 1.0.7 (19.10.2026)
+- processed spectra of all samples saved in one long-format batch table (see batch_table.py), separate txt files per sample
+  only if "save each sample as separate file" is checked (headless evaluations still save the txt file of the sample)
+
+Version 1.0.8 (19.10.2026)
+- added create_spectral_cube: all selected spectra resampled onto a shared wave number grid and saved as one memory-mapped
+  float32 matrix with a sidecar index of the sample_names (see spectral_cube.py)
+
+Version 1.0.9 (19.10.2026)
+- added search_reference_library: top-k most similar reference spectra of all selected spectra (see spectral_library.py)
+
+Version 1.0.10 (19.10.2026)
+- optional baseline correction (arPLS, see baseline.py) before the normalization, the baselines of all spectra of an evaluation
+  are calculated together in one batch after all spectra were opened (see load_spectra)
+
+Version 1.0.11 (19.10.2026)
+- optional band fitting (Lorentzian, Gaussian or pseudo-Voigt, see band_fitting.py) of all spectra seeded from the local minima,
+  fitted on a pool of worker processes and saved as Band_Fit_{count}.txt with one row per band
+
+Version 1.0.12 (19.10.2026)
+- local minima of all spectra aligned to bands (see peak_alignment.py), band x sample matrices of the intensities and positions
+  saved as Band_Alignment_{count}.txt and Band_Alignment_{count}_Positions.txt
+
+Version 1.0.13 (19.10.2026)
+- optional Savitzky-Golay smoothing (see smoothing.py) of the normalized intensity before the local minima determination,
+  get_local_min_pos vectorized
+
+Version 1.0.14 (19.10.2026)
+- added cluster_spectra: randomized PCA streamed over the spectral cube of all selected spectra and mini-batch k-means of the
+  scores (see spectral_clustering.py), scores, loadings and cluster labels saved as Spectral_Clustering_{count}_*.txt
+
+Version 1.0.15 (19.10.2026)
+- .dpt files read by read_dpt (see dpt_reader.py) instead of pandas.read_csv
 """
\ No newline at end of file
@@ -0,0 +1,455 @@
+""" Stage Instrumentation for the Analysis Tools
+    Version 1.0.3
+
+    records wall time, CPU time and memory of each stage (load, compute, fit, plot, save, ...) of an evaluation per file
+    the recorded stages can be saved as a summary table (txt) and as Chrome trace (json, open with chrome://tracing or https://ui.perfetto.dev)
+
+    memory of a stage:
+    - peak_traced_kB : peak python memory of the stage (tracemalloc, only with CS_ANALYSIS_PROFILE=memory), the per-stage peak
+      the peak of tracemalloc is process-wide, so it is only recorded for stages of the main thread (None for stages of other threads,
+      which would reset the peak of each other) and includes the allocations of other threads running at the same time
+    - rss_delta_kB : change of the resident set size (working set on Windows) from the start to the end of the stage
+    - process_peak_rss_kB : peak resident set size of the whole process so far (not of the stage, only grows)
+    the resident set size is read by psutil if it is installed, otherwise from GetProcessMemoryInfo (Windows) or /proc (Linux)
+
+    profiling is disabled by default, it can be enabled by
+    - the environment variable CS_ANALYSIS_PROFILE=1 (CS_ANALYSIS_PROFILE=memory additionally traces the python memory with tracemalloc)
+    - the checkbox "profile evaluations" in CS_Analysis_Tool.py
+    - enable_profiling() in an own program
+
+    if profiling is disabled stage() returns a shared context manager, which does nothing, and decorated functions are called directly
+    (no timer, no record, no allocation)
+
+    usage:
+        with stage("load", file = sample_name) :
+            data = pd.read_csv(file_path, delimiter = ";")
+
+        @profiled("local_minima")
+        def get_local_min_pos(self, data) :
+
+        with collect_stages() as records : # e.g. benchmarks/run_benchmarks.py
+            tool.run_headless_evaluation(file_path)
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+import tracemalloc
+import functools
+from contextlib import nullcontext, contextmanager
+
+import pandas as pd
+
+try :
+    import psutil # optional, resident set size on all systems
+except ImportError :
+    psutil = None
+
+try :
+    import resource # peak RSS of the process without psutil on Unix systems
+except ImportError :
+    resource = None
+
+
+def get_windows_memory_counters() :
+    """ returns the PROCESS_MEMORY_COUNTERS of this process (Windows only, see GetProcessMemoryInfo)
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure) :
+        _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+
+    get_process_memory_info = ctypes.windll.psapi.GetProcessMemoryInfo
+    get_process_memory_info.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESS_MEMORY_COUNTERS), wintypes.DWORD]
+
+    if not get_process_memory_info(ctypes.windll.kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb) :
+        return None
+
+    return counters
+
+
+def get_current_rss() :
+    """ returns the current resident set size (working set on Windows) of the process in kB (None if not available on this system)
+    """
+    if psutil is not None :
+        return psutil.Process().memory_info().rss / 1024
+
+    if os.name == "nt" :
+        counters = get_windows_memory_counters()
+        return counters.WorkingSetSize / 1024 if counters is not None else None
+
+    try :
+        with open("/proc/self/statm") as file :
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024
+    except (OSError, ValueError, AttributeError) :
+        return None
+
+
+def get_process_peak_rss() :
+    """ returns the peak resident set size (peak working set on Windows) of the process since its start in kB
+        (None if not available on this system)
+    """
+    if os.name == "nt" :
+        if psutil is not None :
+            return psutil.Process().memory_info().peak_wset / 1024
+
+        counters = get_windows_memory_counters()
+        return counters.PeakWorkingSetSize / 1024 if counters is not None else None
+
+    if resource is not None :
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024 if sys.platform == "darwin" else peak # bytes on macOS, kB on Linux
+
+    return None
+
+
+class Stage :
+
+    def __init__(self, profiler, name, file, program) :
+        """ context manager, which records one stage for the profiler
+            the record is appended to profiler.records when the stage is finished
+        """
+        self.profiler = profiler
+        self.name = name
+        self.file = file
+        self.program = program
+
+
+    def __enter__(self) :
+        profiler = self.profiler
+        parent = profiler.stack[-1] if len(profiler.stack) > 0 else None
+
+        self.record = {"stage" : self.name,
+                       "file" : self.file if self.file is not None or parent is None else parent["file"],
+                       "program" : self.program if self.program is not None or parent is None else parent["program"],
+                       "depth" : len(profiler.stack),
+                       "thread" : threading.get_ident(),
+                       "peak_traced_kB" : None,
+                       }
+
+        self.rss_start = get_current_rss()
+
+        """ the peak of tracemalloc is process-wide, only the stages of the main thread reset and read it
+        """
+        if profiler.trace_memory and tracemalloc.is_tracing() and threading.current_thread() is threading.main_thread() :
+            self.traced_start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            self.record["child_peak"] = 0
+
+        profiler.stack.append(self.record)
+
+        self.cpu_start = time.process_time()
+        self.wall_start = time.perf_counter()
+
+        return self.record
+
+
+    def __exit__(self, exc_type, exc_value, traceback) :
+        wall = time.perf_counter() - self.wall_start
+        cpu = time.process_time() - self.cpu_start
+
+        profiler = self.profiler
+        profiler.stack.pop()
+
+        self.record["start"] = self.wall_start - profiler.start_time
+        self.record["wall_s"] = wall
+        self.record["cpu_s"] = cpu
+        rss_end = get_current_rss()
+
+        self.record["rss_delta_kB"] = rss_end - self.rss_start if rss_end is not None and self.rss_start is not None else None
+        self.record["process_peak_rss_kB"] = get_process_peak_rss()
+
+        if "child_peak" in self.record :
+            """ the peak of nested stages was reset by the inner stage, so the largest inner peak is kept separately
+            """
+            peak = max(tracemalloc.get_traced_memory()[1] - self.traced_start, self.record.pop("child_peak"))
+            self.record["peak_traced_kB"] = peak / 1024
+
+            if len(profiler.stack) > 0 and "child_peak" in profiler.stack[-1] :
+                profiler.stack[-1]["child_peak"] = max(profiler.stack[-1]["child_peak"], peak)
+
+        with profiler.lock :
+            profiler.records.append(self.record)
+
+            for collector in profiler.collectors :
+                collector.append(self.record)
+
+        return False
+
+
+class Profiler :
+
+    def __init__(self) :
+        """ initiate Profiler class object with the following attributes:
+            - self.enabled
+                (boolean: state if stages are recorded)
+            - self.trace_memory
+                (boolean: state if the python memory is traced with tracemalloc (slows down the evaluation noticeably))
+            - self.started_tracemalloc
+                (boolean: state if tracemalloc was started by self.enable, only then it is stopped by self.disable)
+            - self.records
+                (list: contains a dict for each finished stage (name, file, program, start, wall, cpu, peak memory, depth))
+            - self.stack
+                (list: contains the currently running stages of the calling thread, required for nested stages and to pass the file on
+                to inner stages, each thread has its own stack (threading.local))
+            - self.start_time
+                (float: perf_counter value at which profiling was enabled, start of the Chrome trace)
+            - self.collectors
+                (list: contains the lists of the running collect_stages, each finished record is appended to them as well,
+                so they keep the records after save_profile cleared self.records)
+        """
+        self.enabled = False
+        self.trace_memory = False
+        self.started_tracemalloc = False
+
+        self.records = []
+        self.local = threading.local()
+        self.collectors = []
+
+        self.start_time = time.perf_counter()
+
+        self.lock = threading.Lock()
+
+
+    def enable(self, trace_memory = False) :
+        """ enables the recording of stages
+            if trace_memory is True tracemalloc is started to get the peak python memory of each stage
+        """
+        self.enabled = True
+        self.trace_memory = trace_memory
+
+        self.start_time = time.perf_counter()
+
+        if trace_memory and not tracemalloc.is_tracing() :
+            tracemalloc.start()
+            self.started_tracemalloc = True
+
+
+    def disable(self) :
+        """ disables the recording of stages and stops tracemalloc if it was started by the Profiler
+            (tracemalloc started before, e.g. by python -X tracemalloc, keeps running)
+        """
+        self.enabled = False
+
+        if self.started_tracemalloc and tracemalloc.is_tracing() :
+            tracemalloc.stop()
+
+        self.started_tracemalloc = False
+        self.trace_memory = False
+
+
+    @property
+    def stack(self) :
+        if not hasattr(self.local, "stack") :
+            self.local.stack = []
+
+        return self.local.stack
+
+
+    def clear(self) :
+        self.records = []
+
+
+    def run_stage(self, name, file = None, program = None) :
+        """ returns a context manager, which records the stage name
+            file and program are passed on from the enclosing stage if they are not given
+        """
+        return Stage(self, name, file, program)
+
+
+    def get_summary(self) :
+        """ returns a pandas.DataFrame with one row per program, file and stage
+            columns: calls, wall time (s), cpu time (s), peak traced memory (kB), largest RSS change of a call (kB),
+            peak RSS of the process (kB)
+        """
+        if len(self.records) == 0 :
+            return pd.DataFrame(columns = ["program", "file", "stage", "calls", "wall_s", "cpu_s", "peak_traced_kB", "rss_delta_kB",
+                                           "process_peak_rss_kB"])
+
+        records = pd.DataFrame(self.records)
+        records["file"] = records["file"].fillna("-")
+        records["program"] = records["program"].fillna("-")
+
+        summary = records.groupby(["program", "file", "stage"], sort = False).agg(
+            calls = ("stage", "size"),
+            wall_s = ("wall_s", "sum"),
+            cpu_s = ("cpu_s", "sum"),
+            peak_traced_kB = ("peak_traced_kB", "max"),
+            rss_delta_kB = ("rss_delta_kB", "max"),
+            process_peak_rss_kB = ("process_peak_rss_kB", "max"),
+            ).reset_index()
+
+        return summary
+
+
+    def get_chrome_trace(self) :
+        """ returns the records as dict in the Chrome trace event format (complete events, timestamps in µs)
+        """
+        events = []
+
+        for record in self.records :
+            events.append({"name" : record["stage"],
+                           "cat" : record["program"] or "evaluation",
+                           "ph" : "X",
+                           "ts" : record["start"] * 10**6,
+                           "dur" : record["wall_s"] * 10**6,
+                           "pid" : os.getpid(),
+                           "tid" : record["thread"],
+                           "args" : {"file" : record["file"],
+                                     "cpu_ms" : record["cpu_s"] * 1000,
+                                     "peak_traced_kB" : record["peak_traced_kB"],
+                                     "rss_delta_kB" : record["rss_delta_kB"],
+                                     "process_peak_rss_kB" : record["process_peak_rss_kB"]},
+                           })
+
+        return {"traceEvents" : events, "displayTimeUnit" : "ms"}
+
+
+    def save(self, path_evaluation_folder, program_name) :
+        """ saves the summary table (Profile_{program_name}_{count}.txt) and the Chrome trace (Profile_{program_name}_{count}.json)
+            in the evaluation folder and clears the records afterwards
+            the count is the number of already existing profiles of that program in the evaluation folder
+
+            returns the file_path of the summary table (None if nothing was recorded)
+        """
+        if len(self.records) == 0 :
+            return None
+
+        files_in_directory = os.listdir(path_evaluation_folder)
+
+        count = 0
+        for file in files_in_directory :
+            if f"Profile_{program_name}" in file and ".txt" in file :
+                count += 1
+
+        path = f"{path_evaluation_folder}\Profile_{program_name}_{count}"
+
+        summary = self.get_summary()
+        summary.to_csv(f"{path}.txt", sep = ";", index = None)
+
+        with open(f"{path}.json", "w", encoding = "utf-8") as file :
+            json.dump(self.get_chrome_trace(), file)
+
+        self.clear()
+
+        return f"{path}.txt"
+
+
+
+""" the Profiler used by all tools
+    a disabled profiler returns this shared context manager, so disabled stages cost one attribute lookup
+"""
+profiler = Profiler()
+
+null_stage = nullcontext()
+
+profile_setting = os.environ.get("CS_ANALYSIS_PROFILE", "0").lower()
+
+if profile_setting not in ["", "0", "false", "no", "off"] :
+    profiler.enable(trace_memory = profile_setting == "memory")
+
+
+def enable_profiling(trace_memory = False) :
+    profiler.enable(trace_memory)
+
+
+def disable_profiling() :
+    profiler.disable()
+
+
+def is_profiling_enabled() :
+    return profiler.enabled
+
+
+def stage(name, file = None, program = None) :
+    """ returns a context manager, which records the stage name (for the file and program) if profiling is enabled
+        otherwise the shared null_stage is returned
+    """
+    if not profiler.enabled :
+        return null_stage
+
+    return profiler.run_stage(name, file, program)
+
+
+def profiled(name) :
+    """ decorator, which records each call of the decorated function as stage name if profiling is enabled
+        for methods of the tools the program_name of the tool (self.program_name) is used as program
+    """
+    def decorator(function) :
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs) :
+            if not profiler.enabled :
+                return function(*args, **kwargs)
+
+            program = getattr(args[0], "program_name", None) if len(args) > 0 else None
+
+            with profiler.run_stage(name, program = program) :
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def collect_stages(trace_memory = False) :
+    """ context manager, which returns a list of all records finished in the with-block (also the records saved and cleared
+        by save_profile of the tools), profiling is enabled for the with-block if it was disabled
+    """
+    records = []
+
+    was_enabled = profiler.enabled
+    if not was_enabled :
+        profiler.enable(trace_memory)
+
+    profiler.collectors.append(records)
+
+    try :
+        yield records
+    finally :
+        profiler.collectors.remove(records)
+
+        if not was_enabled :
+            profiler.disable()
+
+
+def save_profile(path_evaluation_folder, program_name) :
+    """ saves the recorded stages of an evaluation in the evaluation folder (see Profiler.save)
+        does nothing if profiling is disabled
+    """
+    if not profiler.enabled :
+        return None
+
+    return profiler.save(path_evaluation_folder, program_name)
+
+
+
+""" update list:
+
+Version 1.0.0 (19.10.2026)
+- stage instrumentation (wall time, CPU time, peak RSS, tracemalloc peak) with summary table and Chrome trace output
+
+Version 1.0.1 (19.10.2026)
+- collect_stages returns all records finished in a with-block, even if the tool saved and cleared them (used by the benchmarks)
+
+Version 1.0.2 (19.10.2026)
+- peak_rss_kB (peak of the whole process, bytes on macOS, missing on Windows) replaced by rss_delta_kB (change of the resident set
+  size during the stage) and process_peak_rss_kB (kB on all systems, Windows by GetProcessMemoryInfo), tracemalloc is the per-stage peak
+- each thread has its own stack of running stages
+
+Version 1.0.3 (19.10.2026)
+- tracemalloc peak only recorded for stages of the main thread (the process-wide peak was reset by stages of other threads)
+- disable only stops tracemalloc if it was started by enable
+- unused import of datetime removed
+"""
\ No newline at end of file
@@ -1,5 +1,5 @@
 """ Levich Analysis Tool by Pascal Reiß
-    Version 1.0.3
+    Version 1.0.13
 """
 
 import tkinter as tk
@@ -12,6 +12,220 @@ import matplotlib.pyplot as plt
 from matplotlib.widgets import SpanSelector
 from datetime import datetime
 
+from plot_decimation import plot_decimated
+from instrumentation import stage, profiled, save_profile
+from results_store import store_results
+from results_table import Results_Table
+from bootstrap import bootstrap_linear_fit, get_confidence_interval
+from replay_fits import save_fit_windows
+
+
+class Levich_Sample :
+    """ compact representation of one sample of a rpm series
+        only the potential and current are kept as contiguous float arrays, the rotation rate is a scalar
+        derived quantities (square root and reciprocal values) are calculated when they are needed
+    """
+
+    __slots__ = ("sample_name", "rpm", "rotation_rate", "potential", "current")
+
+    def __init__(self, sample_name, potential, current, rpm) :
+        """ initiate Levich_Sample class object with the following attributes:
+            - self.sample_name
+                (string)
+            - self.rpm
+                (int/float: rotations per minute)
+            - self.rotation_rate
+                (float: rotation rate ω in rad/s, calculated by the formular ω = 2 * pi / 60 * rpm)
+            - self.potential and self.current
+                (numpy.ndarray: potential (V) and current (A) of the sample as float64 arrays)
+        """
+        self.sample_name = sample_name
+        self.rpm = rpm
+        self.rotation_rate = (2 * np.pi) / 60 * rpm
+
+        self.potential = np.ascontiguousarray(potential, dtype = np.float64)
+        self.current = np.ascontiguousarray(current, dtype = np.float64)
+
+
+    def __len__(self) :
+        return len(self.potential)
+
+
+    @property
+    def sqrt_rotation_rate(self) :
+        return np.sqrt(self.rotation_rate)
+
+
+    @property
+    def reci_sqrt_rotation_rate(self) :
+        return 1 / np.sqrt(self.rotation_rate)
+
+
+    @property
+    def reci_current(self) :
+        return 1 / self.current
+
+
+    def get_index_at_potential(self, potential) :
+        """ returns the index of the first data point with a potential >= potential
+            raises an IndexError if the potential is never reached
+        """
+        reached = self.potential >= potential
+        index = np.argmax(reached)
+
+        if not reached[index] :
+            raise IndexError(f"{potential} V is not reached by {self.sample_name}")
+
+        return index
+
+
+    def get_current_at_potential(self, potential) :
+        return self.current[self.get_index_at_potential(potential)]
+
+
+    def get_currents_at_potentials(self, potentials) :
+        """ returns the current at the first data point with a potential >= potential for each potential (same as get_current_at_potential)
+            the indices of all potentials are found at once by a binary search in the running maximum of the potential
+            NaN is returned for potentials, which are never reached
+
+            expected argument datatype:
+            - potentials : numpy.ndarray
+        """
+        running_maximum = np.maximum.accumulate(self.potential)
+
+        indices = np.searchsorted(running_maximum, potentials, side = "left")
+        reached = indices < len(self.potential)
+
+        currents = np.full(len(potentials), np.nan)
+        currents[reached] = self.current[indices[reached]]
+
+        return currents
+
+
+
+class Potential_Fit_Results :
+    """ growable struct-of-arrays table for the fits of a rpm series at different potentials (Levich or Koutecky-Levich fit)
+        the results of each fit (e.g. slope and intersect) and the fitted data (x and y value of each sample) are kept in preallocated
+        numpy arrays, which double their capacity if they are full, so adding a fit is amortized O(1)
+        the fits are keyed by the potential rounded to mV, a new fit at an already fitted potential replaces the old fit
+        a pandas.DataFrame is only created for saving (see function self.get_data_frame)
+    """
+
+    def __init__(self, result_names, capacity = 8) :
+        """ initiate Potential_Fit_Results class object with the following attributes:
+            - self.result_names
+                (list: contains the names of the results of a fit, e.g. ["levich_slope", "levich_intersect"])
+            - self.keys
+                (dict: contains the row of each fit as value and the potential rounded to mV (string) as key)
+            - self.size
+                (int: number of fits)
+            - self.potentials, self.results, self.x and self.y
+                (numpy.ndarray: potential, results and fitted data of each fit in the rows 0 to self.size)
+
+            expected argument datatypes:
+            - result_names : list
+            - capacity : int (number of fits the arrays are allocated for at the beginning)
+        """
+        self.result_names = list(result_names)
+        self.capacity = capacity
+
+        self.clear()
+
+
+    def clear(self) :
+        self.keys = {}
+        self.size = 0
+
+        self.potentials = np.empty(self.capacity)
+        self.results = np.empty((self.capacity, len(self.result_names)))
+
+        """ the number of samples is known with the first fit
+        """
+        self.x = None
+        self.y = None
+
+
+    def __len__(self) :
+        return self.size
+
+
+    def grow(self) :
+        """ doubles the capacity of all arrays, the existing fits are copied once
+        """
+        capacity = 2 * len(self.potentials)
+
+        for name in ["potentials", "results", "x", "y"] :
+            array = getattr(self, name)
+            new_array = np.empty((capacity, ) + array.shape[1:])
+            new_array[:self.size] = array[:self.size]
+            setattr(self, name, new_array)
+
+
+    def append(self, potential, results, x, y) :
+        """ adds the fit at potential or replaces an existing fit at the same potential (rounded to mV)
+
+            expected argument datatypes:
+            - potential : float (V)
+            - results : list (values in the order of self.result_names)
+            - x, y : list/numpy.ndarray (fitted data, one value per sample)
+        """
+        key = str(round(potential, 3))
+
+        if self.x is None :
+            self.x = np.empty((len(self.potentials), len(x)))
+            self.y = np.empty((len(self.potentials), len(y)))
+
+        if key in self.keys :
+            row = self.keys[key]
+        else :
+            if self.size == len(self.potentials) :
+                self.grow()
+
+            row = self.size
+            self.keys[key] = row
+            self.size += 1
+
+        self.potentials[row] = potential
+        self.results[row] = results
+        self.x[row] = x
+        self.y[row] = y
+
+
+    def items(self) :
+        """ yields the potential (string, rounded to mV) and a dict with the results (result_name as key) of each fit in the order of the fits
+        """
+        for key, row in self.keys.items() :
+            yield key, dict(zip(self.result_names, self.results[row]))
+
+
+    def get_data_frame(self, y_column, x_column, result_columns, result_factors = None) :
+        """ returns a pandas.DataFrame with the fitted data and results of all fits for saving
+            for each fit the columns '{y_column} @ {potential} V', '{x_column} @ {potential} V' and '{result_column} @ {potential} V'
+            are created, the results are only in the first row (the other rows are NaN)
+
+            expected argument datatypes:
+            - y_column, x_column : string
+            - result_columns : list (column names in the order of self.result_names)
+            - result_factors : list/None (factors for the conversion of the results, e.g. 1000 for A in mA)
+        """
+        if self.size == 0 :
+            return pd.DataFrame()
+
+        result_factors = result_factors if result_factors != None else [1] * len(self.result_names)
+
+        padding = np.full(self.x.shape[1] - 1, np.nan)
+
+        columns = {}
+        for key, row in self.keys.items() :
+            columns[f"{y_column} @ {key} V"] = self.y[row]
+            columns[f"{x_column} @ {key} V"] = self.x[row]
+
+            for m, result_column in enumerate(result_columns) :
+                columns[f"{result_column} @ {key} V"] = np.concatenate(([self.results[row, m] * result_factors[m]], padding))
+
+        return pd.DataFrame(columns)
+
+
 
 class Levich_Analysis :
 
@@ -42,9 +256,10 @@ class Levich_Analysis :
             - self.rpm_values
                 (dict: contains the set rpm values for each sample as value and the sample_name as the key)
             - self.results_levich and self.results_koutecky
-                (pandas.DataFrame: contains all evaluated data from the levich and levicht-koutecky fit)
-            - self.data_levich and self.data_koutecky
-                (pandas.DataFrame: contains the data set of each selected potential for the levich and levich-koutecky fit)
+                (Potential_Fit_Results: contains the results and the fitted data of each selected potential for the levich and levich-koutecky fit)
+            - self.area_electrode, self.diffusion_coefficient, self.concentration and self.kinematic_viscosity
+                (float: parameters for the electron transfer number and kinetic current density of the Koutecky-Levich map
+                (see function self.get_koutecky_levich_map), can be changed by User in the GUI)
         """
 
 
@@ -53,6 +268,11 @@ class Levich_Analysis :
         self.program_name = "Levich Analysis"
 
         self.reset_attributes()
+        self.reset_parameters()
+
+        """ constants necassary for the evaluation
+        """
+        self.faraday_constant = 9.649 * 10**4 # in A s/mol
 
         self.change_rpm_button = None
 
@@ -102,15 +322,25 @@ class Levich_Analysis :
         self.rpm_labels, self.rpm_entries = [], []
         self.rpm_values = {}   
 
-        self.data_levich = pd.DataFrame()
-        self.data_koutecky = pd.DataFrame()
+        self.results_levich = Potential_Fit_Results(["levich_slope", "levich_intersect",
+            "levich_slope_ci_low", "levich_slope_ci_high", "levich_intersect_ci_low", "levich_intersect_ci_high"])
+        self.results_koutecky = Potential_Fit_Results(["koutecky_slope", "koutecky_intersect", "on_set_current",
+            "koutecky_slope_ci_low", "koutecky_slope_ci_high", "koutecky_intersect_ci_low", "koutecky_intersect_ci_high",
+            "on_set_current_ci_low", "on_set_current_ci_high"])
+
 
-        self.results_levich = pd.DataFrame(index = ["levich_slope", "levich_intersect"])
-        self.results_koutecky = pd.DataFrame(index = ["koutecky_slope", "koutecky_intersect", "on_set_current"]) 
+    def reset_parameters(self) :
+        """ resets all parameters of the Koutecky-Levich map to their default values (oxygen reduction in 0.1 M KOH on a 5 mm disc electrode)
+        """
+        self.area_electrode = 0.196 # in cm²
+        self.diffusion_coefficient = 1.9 * 10**-5 # in cm²/s
+        self.concentration = 1.2 * 10**-6 # in mol/cm³
+        self.kinematic_viscosity = 0.01 # in cm²/s
 
 
+    @profiled("save_levich_results")
     def save_levich_results(self) :
-        """ saves the self.data_levich DataFrame if User desires to save the evaluated data
+        """ saves the data and results of all Levich fits (self.results_levich) if User desires to save the evaluated data
             is deployed on tkinter.Button event (save_levich_button (see function get_evaluation frame in self.run_evaluation))
             it loops through all files in the evaluation folder and counts the existing Levich_Results files
             the new file is saved with the count at the end of the file_name
@@ -123,11 +353,16 @@ class Levich_Analysis :
             if "Levich_Results" in file :
                 count += 1
         
-        self.data_levich.to_csv(f"{self.path_evaluation_folder}\Levich_Results_{count}.txt", sep = ";", header = self.data_levich.columns, index = None)
+        data_levich = self.results_levich.get_data_frame("Current (A)", "Root of Rotation Rate ((rad/s)^0.5)",
+            ["Levich Slope (A/(rad/s)^0.5)", "Levich Intersect (A)", "Levich Slope CI Low (A/(rad/s)^0.5)", "Levich Slope CI High (A/(rad/s)^0.5)",
+             "Levich Intersect CI Low (A)", "Levich Intersect CI High (A)"])
+
+        data_levich.to_csv(f"{self.path_evaluation_folder}\Levich_Results_{count}.txt", sep = ";", header = data_levich.columns, index = None)
 
 
+    @profiled("save_koutecky_results")
     def save_koutecky_results(self) :
-        """ saves the self.data_koutecky DataFrame if User desires to save the evaluated data
+        """ saves the data and results of all Koutecky-Levich fits (self.results_koutecky) if User desires to save the evaluated data
             is deployed on tkinter.Button event (save_koutecky_button (see function get_evaluation frame in self.run_evaluation))
             it loops through all files in the evaluation folder and counts the existing Koutecky_Results files
             the new file is saved with the count at the end of the file_name
@@ -140,7 +375,375 @@ class Levich_Analysis :
             if "Koutecky_Results" in file :
                 count += 1
         
-        self.data_koutecky.to_csv(f"{self.path_evaluation_folder}\Koutecky_Results{count}.txt", sep = ";", header = self.data_koutecky.columns, index = None)
+        data_koutecky = self.results_koutecky.get_data_frame("Reciprocal Current (A^-1)", "Reciprocal Root of Rotation Rate ()",
+            ["Koutecky Slope ()", "Koutecky Intersect (A^-1)", "On Set Current (mA)", "Koutecky Slope CI Low ()", "Koutecky Slope CI High ()",
+             "Koutecky Intersect CI Low (A^-1)", "Koutecky Intersect CI High (A^-1)", "On Set Current CI Low (mA)", "On Set Current CI High (mA)"],
+            result_factors = [1, 1, 1000, 1, 1, 1, 1, 1000, 1000])
+
+        data_koutecky.to_csv(f"{self.path_evaluation_folder}\Koutecky_Results{count}.txt", sep = ";", header = data_koutecky.columns, index = None)
+
+
+    def get_parameters(self) :
+        """ returns the parameters of the evaluation as dict (saved with the results in the results store)
+        """
+        return {"rpm_values" : self.rpm_values,
+                "area_electrode" : self.area_electrode,
+                "diffusion_coefficient" : self.diffusion_coefficient,
+                "concentration" : self.concentration,
+                "kinematic_viscosity" : self.kinematic_viscosity}
+
+
+    def get_shared_potential_grid(self, samples) :
+        """ returns the potentials (numpy.ndarray), which are reached by all samples
+            the grid reaches from the highest starting potential to the lowest final potential of all samples
+            and has as many points as the shortest sample
+
+            expected argument datatype:
+            - samples : list (Levich_Sample)
+        """
+        start = max(sample.potential.min() for sample in samples)
+        stop = min(sample.potential.max() for sample in samples)
+
+        return np.linspace(start, stop, min(len(sample) for sample in samples))
+
+
+    def get_koutecky_levich_map(self, samples, potentials = None) :
+        """ calculates the Koutecky-Levich fit (reciprocal current vs reciprocal square root rotation rate) at every potential of a
+            shared potential grid (see function self.get_shared_potential_grid) in one vectorized least squares calculation
+            the reciprocal currents of all samples form a matrix (samples x potentials), the slope, intersect and R² of every column
+            are calculated at once
+
+            the slopes and intersects are converted into
+            - the electron transfer number n by the Koutecky-Levich equation:
+                1 / j = 1 / j_k + 1 / (B * ω^0.5) with B = 0.62 * n * F * C * D^(2/3) * ν^(-1/6)
+                n = 1 / (0.62 * F * C * D^(2/3) * ν^(-1/6) * |slope| * area electrode)
+            - the kinetic current density j_k = 1 / (intersect * area electrode)
+
+            expected argument datatypes:
+            - samples : list (Levich_Sample, at least two different rpm values)
+            - potentials : numpy.ndarray/None (V, default: shared potential grid of all samples)
+
+            returns pandas.DataFrame with the columns potential (V), koutecky_slope (A^-1 (rad/s)^0.5), koutecky_intersect (A^-1),
+             r_squared, electron_transfer_number and kinetic_current_density (mA/cm²)
+        """
+        samples = list(samples)
+
+        if potentials is None :
+            potentials = self.get_shared_potential_grid(samples)
+
+        with np.errstate(divide = "ignore", invalid = "ignore") :
+            reci_currents = np.empty((len(samples), len(potentials)))
+            for n, sample in enumerate(samples) :
+                reci_currents[n] = 1 / sample.get_currents_at_potentials(potentials)
+
+            reci_sqrt_rotation_rates = np.array([sample.reci_sqrt_rotation_rate for sample in samples])
+
+            """ least squares fit of all columns: 
+                slope = Σ (x - x̄) (y - ȳ) / Σ (x - x̄)²
+                intersect = ȳ - slope * x̄
+                R² = 1 - Σ (y - ŷ)² / Σ (y - ȳ)²
+            """
+            x_centered = reci_sqrt_rotation_rates - reci_sqrt_rotation_rates.mean()
+            y_mean = reci_currents.mean(axis = 0)
+            y_centered = reci_currents - y_mean
+
+            slopes = x_centered @ y_centered / (x_centered @ x_centered)
+            intersects = y_mean - slopes * reci_sqrt_rotation_rates.mean()
+
+            residuals = y_centered - np.outer(x_centered, slopes)
+            r_squared = 1 - (residuals**2).sum(axis = 0) / (y_centered**2).sum(axis = 0)
+
+            levich_constant = 0.62 * self.faraday_constant * self.concentration * self.diffusion_coefficient**(2/3) * self.kinematic_viscosity**(-1/6)
+
+            electron_transfer_numbers = 1 / (levich_constant * np.abs(slopes) * self.area_electrode)
+            kinetic_current_densities = 1000 / (intersects * self.area_electrode)
+
+        koutecky_levich_map = pd.DataFrame()
+        koutecky_levich_map["potential"] = potentials
+        koutecky_levich_map["koutecky_slope"] = slopes
+        koutecky_levich_map["koutecky_intersect"] = intersects
+        koutecky_levich_map["r_squared"] = r_squared
+        koutecky_levich_map["electron_transfer_number"] = electron_transfer_numbers
+        koutecky_levich_map["kinetic_current_density"] = kinetic_current_densities
+
+        return koutecky_levich_map
+
+
+    @profiled("save_koutecky_levich_map")
+    def save_koutecky_levich_map(self, koutecky_levich_map) :
+        """ saves the Koutecky-Levich map (see function self.get_koutecky_levich_map) as txt file in the evaluation folder
+            the file is saved with the count of the existing Koutecky_Levich_Map files at the end of the file_name
+
+            returns the path of the saved file without ending (used for the figure)
+        """
+        files_in_directory = os.listdir(self.path_evaluation_folder)
+
+        count = 0
+
+        for file in files_in_directory :
+            if "Koutecky_Levich_Map" in file and ".txt" in file :
+                count += 1
+
+        path = f"{self.path_evaluation_folder}\Koutecky_Levich_Map_{count}"
+
+        koutecky_levich_map.to_csv(f"{path}.txt", sep = ";", index = None,
+            header = ["Potential (V)", "Koutecky Slope (A^-1 (rad/s)^0.5)", "Koutecky Intersect (A^-1)", "R²",
+                      "Electron Transfer Number", "Kinetic Current Density (mA/cm²)"])
+
+        return path
+
+
+    def get_series_name(self) :
+        """ returns the name of the rpm series for the results store
+            the common beginning of all sample_names (e.g. NiFe_1 for NiFe_1_100rpm, NiFe_1_400rpm, ...) or all sample_names separated
+            by ", " if they have nothing in common
+        """
+        series_name = os.path.commonprefix(self.sample_names).rstrip("_- ")
+
+        if series_name == "" :
+            series_name = ", ".join(self.sample_names)
+
+        return series_name
+
+
+    def get_levich_fit(self, samples, potential) :
+        """ fits the current at the first potential >= potential vs the square root rotation rate of all samples linearly
+            the confidence intervals of the slope and intersect are determined by bootstrap replicates of the samples (see bootstrap.py)
+            used by levich_onselect (see function self.run_evaluation) and self.run_headless_fits
+
+            expected argument datatypes:
+            - samples : list/dict_values (Levich_Sample)
+            - potential : float (V)
+
+            returns results : list (in the order of self.results_levich.result_names), sqrt_rotation_rates : numpy.ndarray,
+            currents : numpy.ndarray
+        """
+        currents = np.array([sample.get_current_at_potential(potential) for sample in samples])
+        sqrt_rotation_rates = np.array([sample.sqrt_rotation_rate for sample in samples])
+
+        with stage("levich_fit", program = self.program_name) :
+            levich_slope, levich_intersect = np.polyfit(sqrt_rotation_rates, currents, 1)
+
+        with stage("bootstrap", program = self.program_name) :
+            slopes, intersects = bootstrap_linear_fit(sqrt_rotation_rates, currents)
+
+            levich_slope_ci = get_confidence_interval(slopes)
+            levich_intersect_ci = get_confidence_interval(intersects)
+
+        return [levich_slope, levich_intersect, *levich_slope_ci, *levich_intersect_ci], sqrt_rotation_rates, currents
+
+
+    def get_koutecky_levich_fit(self, samples, potential) :
+        """ fits the reciprocal current at the first potential >= potential vs the reciprocal square root rotation rate of all samples linearly
+            the on set current is determined by the reciprocal intersect
+            the confidence intervals of the slope, intersect and on set current are determined by bootstrap replicates of the samples (see bootstrap.py)
+            used by koutecky_levich_onselect (see function self.run_evaluation) and self.run_headless_fits
+
+            expected argument datatypes:
+            - samples : list/dict_values (Levich_Sample)
+            - potential : float (V)
+
+            returns results : list (in the order of self.results_koutecky.result_names), reci_sqrt_rotation_rates : numpy.ndarray,
+            reci_currents : numpy.ndarray
+        """
+        reci_currents = np.array([1 / sample.get_current_at_potential(potential) for sample in samples])
+        reci_sqrt_rotation_rates = np.array([sample.reci_sqrt_rotation_rate for sample in samples])
+
+        with stage("koutecky_levich_fit", program = self.program_name) :
+            koutecky_slope, koutecky_intersect = np.polyfit(reci_sqrt_rotation_rates, reci_currents, 1)
+
+        on_set_current = 1 / koutecky_intersect
+
+        with stage("bootstrap", program = self.program_name) :
+            slopes, intersects = bootstrap_linear_fit(reci_sqrt_rotation_rates, reci_currents)
+
+            koutecky_slope_ci = get_confidence_interval(slopes)
+            koutecky_intersect_ci = get_confidence_interval(intersects)
+            on_set_current_ci = get_confidence_interval(1 / intersects)
+
+        return ([koutecky_slope, koutecky_intersect, on_set_current, *koutecky_slope_ci, *koutecky_intersect_ci, *on_set_current_ci],
+                reci_sqrt_rotation_rates, reci_currents)
+
+
+    def save_sidecar(self) :
+        """ saves the potentials of all Levich and Koutecky-Levich fits and the rpm values of the samples as sidecar of the rpm series
+            (see replay_fits.py), so the fits can be replayed without GUI
+            the sidecar is saved again after every fit and cleared plot
+        """
+        fit_windows = {"levich_potentials" : self.results_levich.potentials[:len(self.results_levich)].tolist(),
+                       "koutecky_potentials" : self.results_koutecky.potentials[:len(self.results_koutecky)].tolist(),
+                       "rpm_values" : {sample_name : self.rpm_values[sample_name] for sample_name in self.sample_names}}
+
+        save_fit_windows(self, self.get_series_name(), self.file_paths, fit_windows)
+
+
+    def get_rpm_from_sample_name(self, sample_name) :
+        """ returns the rpm value (int) at the end of the sample_name or None if the automatic rpm recognition failed
+            in order for the automatic rpm value recognintion to work the following format for the file_name has to be chosen:
+            *_100RPM.txt or *_100rpm.txt
+             * name of the sample
+
+            the recognition works by splitting the sample_name at each '_' and using the last fragment/element
+            searching for 'rpm' or 'RPM' in the fragment and splitting it
+            it uses the first fragment and tries to convert it into an int
+
+            let´s use an example: 
+             sample_name = "example_file_100RPM"
+             after the first split: rpm = ["example", "file", "100RPM"]
+             use last fragment/element : rpm = "100RPM"
+             after the second split rpm = ["100"]
+             try to convert first fragment/element into an int
+        """
+        rpm = sample_name.split("_")[-1]
+
+        for keyword in ["rpm", "RPM"] :
+            if keyword in rpm :
+                try :
+                    return int(rpm.split(keyword)[0])
+                except ValueError :
+                    return None
+
+        return None
+
+
+    def process_file(self, file_path, sample_name, rpm) :
+        """ opens the raw data file, calculates the rotation rates and reciprocal currents and saves the processed data in the evaluation folder
+            used by self.run_evaluation and self.run_headless_evaluation
+
+            expected argument datatypes:
+            - file_path : string
+            - sample_name : string
+            - rpm : int/float
+
+            returns sample : Levich_Sample
+        """
+        """ open raw data set, only the potential and current columns are loaded
+        """
+        with stage("load", file = sample_name, program = self.program_name) :
+            data = pd.read_csv(file_path, delimiter = ";", usecols = ["WE(1).Potential (V)", "WE(1).Current (A)"])
+
+        """ create the Levich_Sample, which calculates the rotation rate from rpm by the fomular: 
+            rotation_rate = 2 * pi / 60 * rpm
+            square root and reciprocal values are calculated by the Levich_Sample when required
+        """
+        with stage("compute", file = sample_name, program = self.program_name) :
+            sample = Levich_Sample(sample_name, data["WE(1).Potential (V)"].to_numpy(), data["WE(1).Current (A)"].to_numpy(), rpm)
+
+        """ create a new DataFrame containing the processed data
+            save data_save as a txt file
+        """
+        with stage("save", file = sample_name, program = self.program_name) :
+            data_save = pd.DataFrame()
+            data_save["Potential (V)"] = sample.potential
+            data_save["Current (A)"] = sample.current
+            data_save["Rotation Rate (rad/s)"] = sample.rotation_rate
+            data_save["Root Rotation Rate (rad/s)^0.5"] = sample.sqrt_rotation_rate
+            data_save["Reciproce Root Rotation Rate (rad/s)^-0.5"] = sample.reci_sqrt_rotation_rate
+
+            data_save.to_csv(f"{self.path_evaluation_folder}\{sample_name}.txt", header = data_save.columns, index = None, sep = ";")
+
+
+        return sample
+
+
+    def run_headless_evaluation(self, file_path) :
+        """ processes a single file of a rpm series without GUI and without showing a figure (used by watch_folder.py)
+            the rpm value is taken from self.rpm_values or recognized from the file_name (see function self.get_rpm_from_sample_name)
+            Levich and Koutecky-Levich fits require the whole rpm series and a selected potential and are therefore not part of the headless evaluation
+
+            expected argument datatype:
+            - file_path : string
+
+            returns dict with the sample_name, the program_name and the rpm value
+        """
+        file_name = os.path.basename(file_path)
+        sample_name = file_name.split(".txt")[0]
+
+        rpm = self.rpm_values.get(sample_name, self.get_rpm_from_sample_name(sample_name))
+
+        if rpm == None :
+            raise ValueError(f"automatic RPM recognition failed for {file_name}")
+
+        sample = self.process_file(file_path, sample_name, rpm)
+
+        if self.save_figures :
+            with stage("plot", file = sample_name, program = self.program_name) :
+                fig, ax = plt.subplots()
+
+                plot_decimated(ax, sample.potential, sample.current * 1000, label = sample_name)
+
+                ax.legend(loc = "upper left", fontsize = 8)
+                ax.set_xlabel("Potential vs Ag|AgCl [V]")
+                ax.set_ylabel("Current (mA)")
+
+            with stage("save_figure", file = sample_name, program = self.program_name) :
+                fig.savefig(f"{self.path_evaluation_folder}\\{sample_name}.jpg")
+
+            plt.close(fig)
+
+        save_profile(self.path_evaluation_folder, self.program_name)
+
+        return {"program_name" : self.program_name, "sample_name" : sample_name, "rpm" : rpm}
+
+
+    def run_headless_fits(self, file_paths, fit_windows) :
+        """ evaluates the rpm series of a sidecar (see replay_fits.py) again without GUI with the saved potentials of the Levich and
+            Koutecky-Levich fits, the results are saved as Levich_Results and Koutecky_Results files and in the results store
+            the saved rpm values are used, the rpm value of samples without saved rpm value is recognized from the file_name
+
+            expected argument datatypes:
+            - file_paths : list (all files of the rpm series)
+            - fit_windows : dict (levich_potentials : list, koutecky_potentials : list, rpm_values : dict)
+
+            returns dict with the name of the rpm series, the program_name and the number of Levich and Koutecky-Levich fits
+        """
+        self.file_paths = tuple(file_paths)
+        self.sample_names = [os.path.basename(file_path).split(".txt")[0] for file_path in file_paths]
+        self.rpm_values.update(fit_windows.get("rpm_values", {}))
+
+        self.results_levich.clear()
+        self.results_koutecky.clear()
+
+        samples = []
+
+        for file_path, sample_name in zip(self.file_paths, self.sample_names) :
+            rpm = self.rpm_values.get(sample_name, self.get_rpm_from_sample_name(sample_name))
+
+            if rpm == None :
+                raise ValueError(f"automatic RPM recognition failed for {os.path.basename(file_path)}")
+
+            self.rpm_values[sample_name] = rpm
+
+            samples.append(self.process_file(file_path, sample_name, rpm))
+
+        series_name = self.get_series_name()
+
+        for potential in fit_windows.get("levich_potentials", []) :
+            results, sqrt_rotation_rates, currents = self.get_levich_fit(samples, potential)
+            self.results_levich.append(potential, results, sqrt_rotation_rates, currents)
+
+            with stage("store", program = self.program_name) :
+                store_results(self, series_name, dict(zip(self.results_levich.result_names, results)), file_paths = self.file_paths, potential = potential)
+
+        for potential in fit_windows.get("koutecky_potentials", []) :
+            results, reci_sqrt_rotation_rates, reci_currents = self.get_koutecky_levich_fit(samples, potential)
+            self.results_koutecky.append(potential, results, reci_sqrt_rotation_rates, reci_currents)
+
+            with stage("store", program = self.program_name) :
+                store_results(self, series_name, dict(zip(self.results_koutecky.result_names, results)), file_paths = self.file_paths, potential = potential)
+
+        if len(self.results_levich) > 0 :
+            self.save_levich_results()
+
+        if len(self.results_koutecky) > 0 :
+            self.save_koutecky_results()
+
+        self.save_sidecar()
+
+        save_profile(self.path_evaluation_folder, self.program_name)
+
+        return {"program_name" : self.program_name, "sample_name" : series_name,
+                "levich_fits" : len(self.results_levich), "koutecky_levich_fits" : len(self.results_koutecky)}
 
 
     def run_evaluation(self) :
@@ -163,56 +766,29 @@ class Levich_Analysis :
             for evalution_frame in self.active_evaluation_frames :
                 evalution_frame.grid_forget()
 
+            """ headings of the columns in the results_table
+            """
+            levich_columns = ["Levich Slope (mA/ω)", "Levich Intersect (mA)", "Levich Slope CI (mA/ω)"]
+            koutecky_columns = ["Koutecky Slope", "Koutecky Intersect", "On Set Current (mA)", "Koutecky Slope CI", "On Set Current CI (mA)"]
+
             def get_results_frame() :
-                """ after the execution of a levich or koutecky-levich fit a results_frame is generated, which contains all determined results from those fits
-                    the results are listed in a table with the following format:
-                    - rows: list of the potential selected by User for fit 
-                        (each potential is represented once. the potentials_already_listed dict contains the row as value and the set potential as key
-                        the dict keeps track if a potential was added prior 
-                        the order is that at first the levich results are added and the koutecky afterwards)
-                    - columns: results at that potential 
+                """ creates the results_table (see results_table.py), which lists the results of all fits in a table with the following format:
+                    - rows: potentials selected by User for a fit (each potential is listed once)
+                    - columns: results of the levich and koutecky-levich fit at that potential
+                    the results_table is created once per evaluation, levich_onselect and koutecky_levich_onselect only update the row of their potential
 
                     at first all active results_frame in the self.active_results_frames list are removed from the grid
-                    afterwards a new results_frame is generated with the new available data and added to self.active_results_frames
+                    afterwards the results_table is added to self.active_results_frames
                 """
                 for results_frame in self.active_results_frames :
                     results_frame.grid_forget()
 
-                results_frame = tk.Frame(master = self.program_frame, relief  = "groove", borderwidth =2)
-                results_frame.grid(row = 1, column = 1, padx = 5, pady = 5)
-
-                for n, text in enumerate(["Potential (V)", "Levich Slope (mA/ω)", "Levich Intersect (mA)", "Koutecky Slope", "Koutecky Intersect", "On Set Current (mA)"]) : # EINHEITEN ANFÜGEN
-                    label = tk.Label(master = results_frame, text = text)
-                    label.grid(row = 0, column = n, padx = 5, pady = 5)
-
-                potentials_already_listed = {}
-
-                for n, potential in enumerate(self.results_levich.columns) :
-                    label = tk.Label(master = results_frame, text = potential)
-                    label.grid(row = n + 1, column = 0, padx = 5, pady = 5)
-
-                    potentials_already_listed[potential] = n + 1
-                    for m, index in enumerate(self.results_levich.index) :
-                        result = self.results_levich.at[index, potential] * 1000
-                        label = tk.Label(master = results_frame, text = round(result, 3))
-                        label.grid(row = n + 1, column = m + 1, padx = 5, pady = 5)
-
-                for i, potential in enumerate(self.results_koutecky.columns) :
-                    if potential in potentials_already_listed.keys() :
-                        row = potentials_already_listed[potential]
-                    else :
-                        row = n + i + 2
-                        label = tk.Label(master = results_frame, text = potential)
-                        label.grid(row = row, column = 0, padx = 5, pady = 5)
+                results_table = Results_Table(self.program_frame, "Potential (V)", levich_columns + koutecky_columns)
+                results_table.grid(row = 1, column = 1, padx = 5, pady = 5)
 
-                    for o, index in enumerate(self.results_koutecky.index) :
-                        result = self.results_koutecky.at[index, potential]
-                        if index == "on_set_current" :
-                            result *= 1000
-                        label = tk.Label(master = results_frame, text = round(result, 3))
-                        label.grid(row = row, column = o + 3, padx = 5, pady = 5)
+                self.active_results_frames.append(results_table)
 
-                self.active_results_frames.append(results_frame)
+                return results_table
 
 
             def levich_onselect(xmin, xmax) :   
@@ -223,29 +799,23 @@ class Levich_Analysis :
                     xmax has no further influence on the evalutation
                 """
 
-                """ loop through all dataset and get the first current and square root rotation rate of each sample, which is >= xmin
-                    add those values to corresponding lists
-                """
-                currents, sqrt_rotation_rates = [], []
-                for data in datas.values() :
-                    data = data[data["potential"] >= xmin]
-
-                    currents.append(data["current"].tolist()[0])
-                    sqrt_rotation_rates.append(data["sqrt_rotation_rate"].tolist()[0])    
-
-                """ add isolated currents and square root rotation rate of each sample to a pandas.DataFrame
-                    fit those data linearly and isolate the 
+                """ fit the current at the first potential >= xmin vs the square root rotation rate of all samples (see function self.get_levich_fit)
+                    and isolate the 
                     - levich slope
                     - levich intersect
+                    - confidence intervals of the slope and intersect
+
+                    add the isolated currents and square root rotation rates of each sample to a pandas.DataFrame
                 """
+                levich_results, sqrt_rotation_rates, currents = self.get_levich_fit(datas.values(), xmin)
+
+                levich_slope, levich_intersect = levich_results[0], levich_results[1]
+                levich_slope_ci = tuple(levich_results[2:4])
+
                 data_levich = pd.DataFrame()
                 data_levich["current"] = currents
                 data_levich["sqrt_rotation_rate"] = sqrt_rotation_rates
 
-                levich_fit = np.polyfit(data_levich["sqrt_rotation_rate"], data_levich["current"], 1)
-
-                levich_slope, levich_intersect = levich_fit[0], levich_fit[1]
-
                 """ create the Levich fit equation for the plot label 
                     calculate data for the fit to represent it in the plot
                 """
@@ -259,7 +829,7 @@ class Levich_Analysis :
                 data_levich["levich_fit"] = levich_slope * data_levich["sqrt_rotation_rate"] + levich_intersect
 
                 """ add isolated data and data fit to ax[0,1]
-                    add data to self.data_levich DataFrame for saving later
+                    add results and data to self.results_levich for saving later
                 """
 
                 ax[0,1].scatter(data_levich["sqrt_rotation_rate"], data_levich["current"] * 1000, label = levich_label, marker = "x")
@@ -267,16 +837,18 @@ class Levich_Analysis :
 
                 ax[0,1].legend(fontsize = 7, loc = "upper left")
 
-                self.results_levich[str(round(xmin, 3))] = [levich_slope, levich_intersect]
+                self.results_levich.append(xmin, levich_results, sqrt_rotation_rates, currents)
 
-                self.data_levich[f"Current (A) @ {round(xmin, 3)} V"] = data_levich["current"]
-                self.data_levich[f"Root of Rotation Rate ((rad/s)^0.5) @ {round(xmin, 3)} V"] = data_levich["sqrt_rotation_rate"]
-                self.data_levich[f"Levich Slope (A/(rad/s)^0.5) @ {round(xmin, 3)} V"] = [levich_slope] + [np.nan] * (len(data_levich) - 1)
-                self.data_levich[f"Levich Intersect (A) @ {round(xmin, 3)} V"] = [levich_intersect] + [np.nan] * (len(data_levich) - 1)
+                with stage("store", program = self.program_name) :
+                    store_results(self, self.get_series_name(), dict(zip(self.results_levich.result_names, levich_results)),
+                        file_paths = self.file_paths, potential = xmin)
+
+                self.save_sidecar()
 
                 """ display results obtained Levich fit in GUI
                 """
-                get_results_frame()
+                results_table.set_cells(str(round(xmin, 3)), dict(zip(levich_columns,
+                    [levich_slope * 1000, levich_intersect * 1000, (levich_slope_ci[0] * 1000, levich_slope_ci[1] * 1000)])))
 
 
             def koutecky_levich_onselect(xmin, xmax) :
@@ -287,33 +859,24 @@ class Levich_Analysis :
                     xmax has no further influence on the evalutation
                 """     
 
-                """ loop through all datasets and get the first reciprocal current and reciprocal square root roation rate of each sample, which is >= xmin
-                    add those values to corresponding lists
-                """           
-                reci_currents, reci_sqrt_rotation_rates = [], []
-                for data in datas.values() :
-                    data = data[data["potential"] >= xmin]
-
-                    reci_currents.append(data["reci_current"].tolist()[0])
-                    reci_sqrt_rotation_rates.append(data["reci_sqrt_rotation_rate"].tolist()[0])
-                
-                """ add isolated reciprocal currents and reciprocal sqaure root rotation rates of each sample to a pandas.DataFrame
-                    fit those data linearly and isolate the
+                """ fit the reciprocal current at the first potential >= xmin vs the reciprocal square root rotation rate of all samples
+                    (see function self.get_koutecky_levich_fit) and isolate the
                     - koutecky-levich slope
                     - koutecky-levich intersect
+                    - on set current (reciprocal kotekcy-levich intersect)
+                    - confidence intervals of the slope, intersect and on set current
 
-                    determine the on set current by the reciprocal kotekcy-levich intersect
+                    add the isolated reciprocal currents and reciprocal sqaure root rotation rates of each sample to a pandas.DataFrame
                 """
+                koutecky_results, reci_sqrt_rotation_rates, reci_currents = self.get_koutecky_levich_fit(datas.values(), xmin)
+
+                koutecky_slope, koutecky_intersect, on_set_current = koutecky_results[0], koutecky_results[1], koutecky_results[2]
+                koutecky_slope_ci, on_set_current_ci = tuple(koutecky_results[3:5]), tuple(koutecky_results[7:9])
+
                 data_koutecky = pd.DataFrame()
                 data_koutecky["reci_current"] = reci_currents
                 data_koutecky["reci_sqrt_rotation_rate"] = reci_sqrt_rotation_rates
 
-                koutecky_fit = np.polyfit(data_koutecky["reci_sqrt_rotation_rate"], data_koutecky["reci_current"], 1)
-
-                koutecky_slope, koutecky_intersect = koutecky_fit[0], koutecky_fit[1]
-
-                on_set_current = 1 / koutecky_intersect
-
                 """ create the koutecky-levich-fit equation for the plot label
                     calculate data for the fit to represent it in the plot
                 """
@@ -327,23 +890,65 @@ class Levich_Analysis :
                 data_koutecky["koutecky_fit"] = koutecky_slope * data_koutecky["reci_sqrt_rotation_rate"] + koutecky_intersect
 
                 """ add isolated data and data fit to ax[1,0]
-                    add data to self.data_koutecky DataFrame for saving later
+                    add results and data to self.results_koutecky for saving later
                 """
                 ax[1,1].scatter(data_koutecky["reci_sqrt_rotation_rate"], data_koutecky["reci_current"], marker = "x", s = 10, label = koutecky_label)
                 ax[1,1].plot(data_koutecky["reci_sqrt_rotation_rate"], data_koutecky["koutecky_fit"], ls = "--")
                 ax[1,1].legend(fontsize = 8, loc = "upper left")
 
-                self.results_koutecky[str(round(xmin, 3))] = [koutecky_slope, koutecky_intersect, on_set_current]
+                self.results_koutecky.append(xmin, koutecky_results, reci_sqrt_rotation_rates, reci_currents)
+
+                with stage("store", program = self.program_name) :
+                    store_results(self, self.get_series_name(), dict(zip(self.results_koutecky.result_names, koutecky_results)),
+                        file_paths = self.file_paths, potential = xmin)
+
+                self.save_sidecar()
 
-                self.data_koutecky[f"Reciprocal Current (A^-1) @ {round(xmin, 3)} V"] = data_koutecky["reci_current"]
-                self.data_koutecky[f"Reciprocal Root of Rotation Rate () @ {round(xmin, 3)} V"] = data_koutecky["reci_sqrt_rotation_rate"]
-                self.data_koutecky[f"Koutecky Slope () @ {round(xmin, 3)} V"] = [koutecky_slope] + [np.nan] * (len(self.data_koutecky) - 1)
-                self.data_koutecky[f"Koutecky Intersect (A^-1) @ {round(xmin, 3)} V"] = [koutecky_intersect]+ [np.nan] * (len(self.data_koutecky) - 1)
-                self.data_koutecky[f"On Set Current (mA) @ {round(xmin, 3)} V"] = [round((on_set_current * 1000), 3)] + [np.nan] * (len(self.data_koutecky) - 1)
-                
                 """ display results obtained by Koutecky-Levich fit in GUI
                 """
-                get_results_frame()
+                results_table.set_cells(str(round(xmin, 3)), dict(zip(koutecky_columns, [koutecky_slope, koutecky_intersect, on_set_current * 1000,
+                    koutecky_slope_ci, (on_set_current_ci[0] * 1000, on_set_current_ci[1] * 1000)])))
+
+
+            def get_koutecky_levich_map() :
+                """ calculates the koutecky-levich fit at every potential reached by all samples (see function self.get_koutecky_levich_map)
+                    the map is saved in the evaluation folder and displayed in a new figure:
+                    - ax_map[0] : electron transfer number vs potential
+                    - ax_map[1] : kinetic current density vs potential
+                    - ax_map[2] : R² of the fits vs potential
+                """
+                if len(set(sample.rpm for sample in datas.values())) < 2 :
+                    self.feedback_label.config(text = "The Koutecky-Levich map requires at least two different RPM values.")
+                    return
+
+                with stage("koutecky_levich_map", program = self.program_name) :
+                    koutecky_levich_map = self.get_koutecky_levich_map(datas.values())
+
+                path = self.save_koutecky_levich_map(koutecky_levich_map)
+
+                with stage("plot", program = self.program_name) :
+                    fig_map, ax_map = plt.subplots(3, 1, sharex = True)
+
+                    ax_map[0].plot(koutecky_levich_map["potential"], koutecky_levich_map["electron_transfer_number"])
+                    ax_map[0].set_ylabel("n")
+
+                    ax_map[1].plot(koutecky_levich_map["potential"], koutecky_levich_map["kinetic_current_density"])
+                    ax_map[1].set_ylabel("$j_k$ (mA/cm²)")
+
+                    ax_map[2].plot(koutecky_levich_map["potential"], koutecky_levich_map["r_squared"])
+                    ax_map[2].set_ylabel("R²")
+                    ax_map[2].set_xlabel("Potential vs Ag|AgCl [V]")
+
+                    ax_map[0].set_title(f"D = {self.diffusion_coefficient} cm²/s, C = {self.concentration} mol/cm³, " + 
+                        f"ν = {self.kinematic_viscosity} cm²/s, A = {self.area_electrode} cm²", fontsize = 8)
+
+                if self.save_figures :
+                    with stage("save_figure", program = self.program_name) :
+                        fig_map.savefig(f"{path}.jpg")
+
+                self.feedback_label.config(text = f"Koutecky-Levich map saved as {os.path.basename(path)}.txt")
+
+                plt.show()
 
 
             def get_evaluation_frame() :
@@ -375,9 +980,12 @@ class Levich_Analysis :
                                 multiple positions can be entered by seperation with ;
                             - clear_levich_plot and clear_koutecky_plot:
                                 clears levich plot ax[0,1] and koutecky plot ax[1,1] (removes existing fits and title)
-                                clears the self.results_levich and self.results_koutecky DataFrame´s
+                                clears the results and data of the fits in self.results_levich and self.results_koutecky
                             - self.save_levich_results and self.save_koutecky_results:
-                                saves the existing version of the self.results_levich and self.results_koutecky DataFrame´s to txt file
+                                saves the existing fits of self.results_levich and self.results_koutecky to txt file
+                            - get_koutecky_levich_map:
+                                calculates the koutecky-levich fit at every potential (see function self.get_koutecky_levich_map)
+                                and displays the electron transfer number, kinetic current density and R² in a new figure
                 """
                 evalution_frame = tk.Frame(master = self.program_frame, relief = "groove", borderwidth = 2)
                 evalution_frame.grid(row = 0, column = 1, padx = 5, pady = 5)
@@ -444,23 +1052,29 @@ class Levich_Analysis :
 
                 def clear_levich_plot() :
                     """ clears the levich plot ax[0,1] (removes existing fits and title)
-                        clears the self.result_levich DataFrame
+                        clears the results and data of all Levich fits (self.results_levich)
                     """
                     ax[0,1].clear()
                     ax[0,1].set_xlabel("$ω^{0.5}$ (rad/s$)^{0.5}$")
                     ax[0,1].set_ylabel("Current (mA)")
 
-                    self.results_levich = pd.DataFrame(index = ["levich_slope", "levich_intersect"])
+                    self.results_levich.clear()
+                    results_table.clear_columns(levich_columns)
+
+                    self.save_sidecar()
 
                 def clear_koutecky_plot() :
                     """ clears the koutecky-levich plot ax[1,1] (removes existing fits and title)
-                        clears the self.result_levich DataFrame
+                        clears the results and data of all Koutecky-Levich fits (self.results_koutecky)
                     """
                     ax[1,1].clear()
                     ax[1,1].set_xlabel("$ω^{-0.5}$ (rad/s$)^{-0.5}$")
                     ax[1,1].set_ylabel("Reciprocal Current (A$)^{-1}$")
 
-                    self.results_koutecky = pd.DataFrame(index = ["koutecky_slope", "koutecky_intersect", "on_set_current"])
+                    self.results_koutecky.clear()
+                    results_table.clear_columns(koutecky_columns)
+
+                    self.save_sidecar()
 
                 clear_levich_button = tk.Button(master = levich_frame, text = "Clear Levich Plot", command = clear_levich_plot)
                 clear_levich_button.grid(row = 0, column = 3, padx = 5, pady = 5)
@@ -474,17 +1088,20 @@ class Levich_Analysis :
                 save_koutecky_button = tk.Button(master = koutecky_frame, text = "Save Koutecky Results", command = self.save_koutecky_results)
                 save_koutecky_button.grid(row = 0, column = 4, padx = 5, pady = 5)
 
-                """ get an results_frame for the evalution_frame
-                    append the evalution_frame to the self.active_evaluation_frames list """
-                get_results_frame()
+                koutecky_map_button = tk.Button(master = koutecky_frame, text = "Koutecky-Levich Map", command = get_koutecky_levich_map)
+                koutecky_map_button.grid(row = 1, column = 0, columnspan = 5, padx = 5, pady = 5)
 
+                """ append the evalution_frame to the self.active_evaluation_frames list
+                """
                 self.active_evaluation_frames.append(evalution_frame)
 
             """ create a frame, which acts as a control panel for the evaluation 
             """
             get_evaluation_frame()
 
-            """ create a datas dic with the data of each sample as value and the sample name as key
+            results_table = get_results_frame()
+
+            """ create a datas dic with the Levich_Sample of each sample as value and the sample name as key
 
                 create the figure for the evaluation wíth two rows and two columns
                 - ax[0,0] (upper left) and ax[1,0] (lower left) display the same current vs potential 
@@ -502,44 +1119,17 @@ class Levich_Analysis :
                 sample_name = self.sample_names[n]
                 rpm = self.rpm_values[sample_name]
 
-                """ open raw data set and rename columns
+                """ open, process and save the data of the sample (see function self.process_file)
                 """
-                data = pd.read_csv(file_path, delimiter = ";")
-                data.rename(columns = {"WE(1).Potential (V)":"potential", "WE(1).Current (A)" :"current"}, inplace = True)
+                sample = self.process_file(file_path, sample_name, rpm)
 
                 """ plot current (in mA) vs potential (V) in ax[0,0] and ax[1,0]
                 """
-                ax[0,0].plot(data["potential"], data["current"] * 1000, label = sample_name)
-                ax[1,0].plot(data["potential"], data["current"] * 1000)
+                with stage("plot", file = sample_name, program = self.program_name) :
+                    plot_decimated(ax[0,0], sample.potential, sample.current * 1000, label = sample_name)
+                    plot_decimated(ax[1,0], sample.potential, sample.current * 1000)
 
-                """ calculate rotation rate from rpm by the fomular: 
-                    rotation_rate = 2 * pi / (60 * rpm) 
-                    calculate square root of the rotation rate
-
-                    calculate reciprocal current and reciprocal square root rotation rate
-                """
-                rotation_rate = (2 * np.pi) / 60 * rpm
-                data["rotation_rate"] = [rotation_rate] * len(data)
-                data["sqrt_rotation_rate"] = np.sqrt(data["rotation_rate"])
-
-                data["reci_current"] = 1 / data["current"]
-                data["reci_sqrt_rotation_rate"] = 1 / data["sqrt_rotation_rate"]
-
-                """ create a new DataFrame containing the processed data
-                    save data_save as a txt file
-
-                    append data to datas dictionary as value and use the sample_name as key
-                """
-                data_save = pd.DataFrame()
-                data_save["Potential (V)"] = data["potential"]
-                data_save["Current (A)"] = data["current"]
-                data_save["Rotation Rate (rad/s)"] = data["rotation_rate"]
-                data_save["Root Rotation Rate (rad/s)^0.5"] = data["sqrt_rotation_rate"]
-                data_save["Reciproce Root Rotation Rate (rad/s)^-0.5"] = data["reci_sqrt_rotation_rate"]
-
-                data_save.to_csv(f"{self.path_evaluation_folder}\{sample_name}.txt", header = data_save.columns, index = None, sep = ";")
-
-                datas[sample_name] = data
+                datas[sample_name] = sample
 
             """ add title, legend, x and y axis label to axis in figure
             """
@@ -592,7 +1182,13 @@ class Levich_Analysis :
                 for file in files_in_directory :
                     if ".jpg" in file :
                         count += 1
-                fig.savefig(f"{self.path_evaluation_folder}\Levich_{count}.jpg")
+                with stage("save_figure", program = self.program_name) :
+                    fig.savefig(f"{self.path_evaluation_folder}\Levich_{count}.jpg")
+
+            """ the recorded stages are saved in the evaluation folder if profiling is enabled (see instrumentation.py)
+                results saved with the buttons after closing the figure are recorded in the next profile
+            """
+            save_profile(self.path_evaluation_folder, self.program_name)
 
 
         elif len(self.file_paths) == 0 :
@@ -713,43 +1309,12 @@ class Levich_Analysis :
 
                 sample_label = tk.Label(master = sample_rpm_frame, text = f"{sample_name}")
                 sample_label.grid(row = n + 1, column = 0, padx = 5, pady = 5)
-                """ try to find a rpm value at the end the sample_name
-                    in order for the automatic rpm value recognintion to work the following format for the file_name has to be chosen:
-                    *_100RPM.txt or *_100rpm.txt
-                     * name of the sample
-
-                    the recognition works by splitting the sample_name at each '_' and using the last fragment/element
-                    searching for 'rpm' or 'RPM' in the fragment and splitting it
-                    it uses the first fragment and tries to convert it into an int
+                """ try to find a rpm value at the end the sample_name (see function self.get_rpm_from_sample_name)
                     if that mechanism fails an Error Feedback is given back
-
-                    let´s use an example: 
-                     sample_name = "example_file_100RPM"
-                     after the first split: rpm = ["example", "file", "100RPM"]
-                     use last fragment/element : rpm = "100RPM"
-                     after the second split rpm = ["100"]
-                     try to convert first fragment/element into an int
                 """
-                rpm = sample_name.split("_")[-1]
-                if "rpm" in rpm :
-                    rpm = rpm.split("rpm")[0]
-
-                    try :
-                        rpm = int(rpm)
-                    except ValueError :
-                        count += 1
-                        rpm = "automatic RPM recognition failed"
+                rpm = self.get_rpm_from_sample_name(sample_name)
 
-                elif "RPM" in rpm :
-                    rpm = rpm.split("RPM")[0]
-
-                    try :
-                        rpm = int(rpm)
-                    except ValueError :
-                        count += 1
-                        rpm = "automatic RPM recognition failed"
-
-                else :
+                if rpm == None :
                     count += 1
                     rpm = "automatic RPM recognition failed"
 
@@ -837,6 +1402,59 @@ class Levich_Analysis :
             variable = save_figures_variable, command = change_figure_saving_settings)
         save_figures_checkbox.grid(row = 1, column = 0, padx = 5, pady = 5)
 
+        """ create a tkinter.Button, which opens a window for changing the parameters of the Koutecky-Levich map
+            for each parameter the window contains a tkinter.Label with the name, a tkinter.Label with the current value,
+            a tkinter.Entry and a tkinter.Button for changing the value
+            all parameters accept a int/float as an input, decimals can be entered by . or ,
+        """
+        def open_change_parameter_window() :
+            root = tk.Tk()
+            root.title("Change Parameters")
+
+            parameter_feedback_label = tk.Label(master = root, text = "Please Change Parameters for the Koutecky-Levich Map.", font = ("Arial", 10))
+            parameter_feedback_label.grid(row = 0, column = 0, columnspan = 3, padx = 5, pady = 5)
+
+            value_labels = {}
+
+            def change_parameter(attribute, name, entry) :
+                value = entry.get().replace(",", ".")
+
+                try :
+                    setattr(self, attribute, float(value))
+                    parameter_feedback_label.config(text = f"Successful conversion of {name}")
+                    value_labels[attribute].config(text = f"{getattr(self, attribute)}")
+                except ValueError :
+                    parameter_feedback_label.config(text = f"Failed conversion of {name}")
+
+            def reset_parameters() :
+                self.reset_parameters()
+
+                for attribute, label in value_labels.items() :
+                    label.config(text = f"{getattr(self, attribute)}")
+
+                parameter_feedback_label.config(text = "Parameters have been changed to Default.")
+
+            reset_parameters_button = tk.Button(master = root, text = "Reset to Default", command = reset_parameters)
+            reset_parameters_button.grid(row = 0, column = 3, padx = 5, pady = 5)
+
+            for n, (attribute, name) in enumerate([("area_electrode", "Area Electrode (cm²)"), ("diffusion_coefficient", "Diffusion Coefficient (cm²/s)"),
+                                                   ("concentration", "Concentration (mol/cm³)"), ("kinematic_viscosity", "Kinematic Viscosity (cm²/s)")]) :
+                label = tk.Label(master = root, text = name)
+                label.grid(row = n + 1, column = 0, padx = 5, pady = 5)
+
+                value_labels[attribute] = tk.Label(master = root, text = f"{getattr(self, attribute)}")
+                value_labels[attribute].grid(row = n + 1, column = 1, padx = 5, pady = 5)
+
+                entry = tk.Entry(master = root)
+                entry.grid(row = n + 1, column = 2, padx = 5, pady = 5)
+
+                button = tk.Button(master = root, text = f"Change {name.split(' (')[0]}",
+                    command = lambda attribute = attribute, name = name, entry = entry : change_parameter(attribute, name, entry))
+                button.grid(row = n + 1, column = 3, padx = 5, pady = 5)
+
+        change_parameters_button = tk.Button(master = control_frame, text = "Change Parameters", command = open_change_parameter_window)
+        change_parameters_button.grid(row = 1, column = 1, padx = 5, pady = 5)
+
         return self.program_frame
 
 
@@ -864,4 +1482,39 @@ Version 1.0.2 (28.03.2022)
 
 Version 1.0.3 (06.04.2022)
 - fixed bug were tkinter.StringVar values werent saved if the program was imported
+
+Version 1.0.4 (19.10.2026)
+- plotted data is decimated (min/max per pixel) for the axis width and re-decimated on zoom, saved data keeps the full resolution
+
+Version 1.0.5 (19.10.2026)
+- load, compute, fit, plot and save stages of each file are recorded if profiling is enabled (instrumentation.py)
+
+Version 1.0.6 (19.10.2026)
+- added run_headless_evaluation for the evaluation of single files without GUI (used by watch_folder.py)
+- loading, processing and saving of a file moved to process_file, automatic rpm recognition to get_rpm_from_sample_name
+
+Version 1.0.7 (19.10.2026)
+- results of each Levich and Koutecky-Levich fit saved in the results store (see results_store.py)
+
+Version 1.0.8 (19.10.2026)
+- samples kept as Levich_Sample (potential and current arrays, scalar rotation rate) instead of DataFrames with constant and derived columns
+- only the potential and current columns are loaded from the raw data files
+
+Version 1.0.9 (19.10.2026)
+- results and data of the Levich and Koutecky-Levich fits collected in Potential_Fit_Results (growable arrays) instead of DataFrames growing column by column
+- DataFrame of the fits is only created for saving, clearing a plot also clears the fits saved afterwards
+
+Version 1.0.10 (19.10.2026)
+- results of the fits displayed in a Results_Table (see results_table.py), which only updates the row of the fitted potential
+
+Version 1.0.11 (19.10.2026)
+- Koutecky-Levich map: Koutecky-Levich fit at every potential reached by all samples in one vectorized least squares calculation
+  with electron transfer number, kinetic current density and R² (parameters area electrode, D, C and ν can be changed in the GUI)
+
+Version 1.0.12 (19.10.2026)
+- 95 % bootstrap confidence intervals of the Levich and Koutecky-Levich slopes, intersects and on set currents (see bootstrap.py)
+
+Version 1.0.13 (19.10.2026)
+- potentials of the Levich and Koutecky-Levich fits and rpm values saved as sidecar json of the rpm series keyed by the hash of
+  the raw data files (see replay_fits.py), fits moved to get_levich_fit and get_koutecky_levich_fit, added run_headless_fits
 """
\ No newline at end of file
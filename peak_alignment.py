@@ -0,0 +1,88 @@
+""" Peak Alignment of Infrared Spectra
+    Version 1.0.0
+
+    matches the band positions (local minima or fitted band centers) of all spectra of an evaluation, so a band (e.g. a carbonate band)
+    can be tracked across a series of samples without manual matching
+
+    all positions are sorted once (O(n log n)) and merged into the same band while the gap to the next position is at most tolerance,
+    a new band starts at each larger gap
+    if a sample has several positions in one band (e.g. noise on a broad band), only the lowest intensity (deepest minimum) is kept
+
+    the result is a band x sample matrix of the intensities (NaN if the band is missing in a sample) and of the positions,
+    each band is labeled with the median position of its members
+
+    usage:
+        intensities, positions = align_peaks(sample_names, positions, intensities, tolerance = 4)
+        intensities.loc[:, "NiFe_1"] # intensities of all bands of a sample
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def align_peaks(sample_names, positions, intensities, tolerance = 4, min_samples = 1) :
+    """ returns the band x sample matrices (pandas.DataFrame) of the intensities and the positions of the aligned bands
+        the index is the median position of each band, the columns are the sample_names in the order of their first occurrence
+
+        expected argument datatypes:
+        - sample_names, positions, intensities : list/numpy.ndarray (one entry per peak, long format)
+        - tolerance : float (maximum gap in cm^-1 between neighboring positions of the same band)
+        - min_samples : int (bands found in fewer samples are dropped)
+    """
+    sample_names = np.asarray(sample_names, dtype = object)
+    positions = np.asarray(positions, dtype = np.float64)
+    intensities = np.asarray(intensities, dtype = np.float64)
+
+    samples, sample_index = np.unique(sample_names, return_inverse = True)
+
+    """ keep the order of the first occurrence of the samples (order of the evaluation)
+    """
+    first_occurrence = np.full(len(samples), len(sample_names))
+    np.minimum.at(first_occurrence, sample_index, np.arange(len(sample_names)))
+    sample_order = np.argsort(first_occurrence)
+
+    if len(positions) == 0 :
+        empty = pd.DataFrame(columns = samples[sample_order], dtype = np.float64)
+        return empty, empty.copy()
+
+    """ sorted merge: a new band starts where the gap to the previous position is larger than tolerance
+    """
+    order = np.argsort(positions, kind = "stable")
+    sorted_positions = positions[order]
+
+    bands = np.empty(len(positions), dtype = np.int64)
+    bands[order] = np.concatenate([[0], np.cumsum(np.diff(sorted_positions) > tolerance)])
+
+    """ deepest peak of each sample in each band: sort by band, sample and intensity and keep the first of each (band, sample)
+    """
+    peaks = np.lexsort((intensities, sample_index, bands))
+    keep = np.concatenate([[True], (np.diff(bands[peaks]) != 0) | (np.diff(sample_index[peaks]) != 0)])
+    peaks = peaks[keep]
+
+    n_bands = bands.max() + 1
+
+    intensity_matrix = np.full((n_bands, len(samples)), np.nan)
+    position_matrix = np.full((n_bands, len(samples)), np.nan)
+
+    intensity_matrix[bands[peaks], sample_index[peaks]] = intensities[peaks]
+    position_matrix[bands[peaks], sample_index[peaks]] = positions[peaks]
+
+    band_positions = np.nanmedian(position_matrix, axis = 1)
+
+    found = np.sum(~np.isnan(position_matrix), axis = 1) >= min_samples
+
+    index = pd.Index(np.round(band_positions[found], 1), name = "Band (cm^-1)")
+    columns = samples[sample_order]
+
+    intensity_matrix = pd.DataFrame(intensity_matrix[found][:, sample_order], index = index, columns = columns)
+    position_matrix = pd.DataFrame(position_matrix[found][:, sample_order], index = index, columns = columns)
+
+    return intensity_matrix, position_matrix
+
+
+
+""" update list:
+
+Version 1.0.0 (19.10.2026)
+- alignment of band positions across all spectra of an evaluation by a tolerance-based sorted merge (band x sample matrices)
+"""
@@ -0,0 +1,353 @@
+""" Plot Decimation Helper
+    Version 1.0.3
+"""
+
+import numpy as np
+
+
+def get_min_max_indices(y, n_buckets, x = None, xlim = None, groups = None) :
+    """ returns the sorted indices of the data points which have to be drawn to display the line y without visible loss
+        the data set is split in buckets of consecutive data points and from each bucket the first, the last, the minimum and the maximum
+        data point is kept (min/max or M4 decimation)
+        this reproduces the rendered line pixel by pixel since no line between two kept points can leave the drawn envelope
+
+        - without x : n_buckets buckets of the same number of data points (one bucket represents roughly one pixel column for monotonic x)
+        - with x : the range xlim is split into n_buckets pixel columns and each run of consecutive data points in the same column is a bucket,
+          so non-monotonic x (e.g. the loops of a cyclovoltammogram) keeps the extremes of each pass through a column
+        - with groups : a bucket never contains data points of different groups, so many curves stacked into one array
+          (see curve_overlay.py) are decimated in one pass
+        only suitable for connected lines, markers are decimated by get_pixel_cell_indices
+
+        if the data set is not larger than 4 * n_buckets (per group with groups, or 4 * the number of buckets found) no decimation is
+        necessary and all indices are returned
+
+        expected argument datatypes:
+        - y : numpy.ndarray
+        - n_buckets : int
+        - x : numpy.ndarray/None
+        - xlim : tuple/None (limits of the axis, None : range of x)
+        - groups : numpy.ndarray/None (int, ascending group (e.g. curve) of each data point)
+
+        returns indices : numpy.ndarray (int)
+    """
+    n = len(y)
+
+    n_groups = int(groups[-1] - groups[0]) + 1 if groups is not None and n > 0 else 1
+
+    if n_buckets < 1 or n <= 4 * n_buckets * n_groups :
+        return np.arange(n)
+
+    if x is None :
+        buckets = np.arange(n) // int(np.ceil(n / n_buckets))
+    else :
+        if xlim is None :
+            xlim = (np.nanmin(x), np.nanmax(x)) if np.isfinite(x).any() else (0, 1)
+
+        low, high = min(xlim), max(xlim)
+        scale = n_buckets / (high - low) if high > low else 0
+
+        with np.errstate(invalid = "ignore") :
+            columns = np.where(np.isfinite(x), np.clip(np.floor((x - low) * scale), -1, n_buckets), -2)
+
+        buckets = np.concatenate(([0], np.cumsum(np.diff(columns) != 0)))
+
+    if groups is not None :
+        buckets = np.concatenate(([0], np.cumsum((np.diff(buckets) != 0) | (np.diff(groups) != 0))))
+
+    starts = np.flatnonzero(np.concatenate(([True], np.diff(buckets) != 0)))
+
+    if n <= 4 * len(starts) : # at most four data points per bucket on average, e.g. many passes through each column
+        return np.arange(n)
+
+    lengths = np.diff(np.concatenate((starts, [n])))
+
+    indices = [starts, starts + lengths - 1]
+
+    """ minimum and maximum of each bucket in O(n): the first data point of each bucket, which equals the reduced value of its bucket
+        NaN values are replaced by inf/-inf so they are never chosen as min/max (NaN is not drawn anyway)
+    """
+    for reduce, fill in ((np.minimum, np.inf), (np.maximum, -np.inf)) :
+        values = np.where(np.isnan(y), fill, y)
+
+        candidates = np.flatnonzero(values == np.repeat(reduce.reduceat(values, starts), lengths))
+        candidate_buckets = buckets[candidates]
+
+        indices.append(candidates[np.concatenate(([True], np.diff(candidate_buckets) != 0))])
+
+    """ sorted indices without duplicates by a mask (np.unique sorts all kept indices)
+    """
+    keep = np.zeros(n, dtype = bool)
+    for index in indices :
+        keep[index] = True
+
+    return np.flatnonzero(keep)
+
+
+def get_pixel_cell_indices(x, y, xlim, ylim, width, height) :
+    """ returns the sorted indices of the data points which have to be drawn to display the markers x, y without visible loss
+        the axis is split into a grid of width x height cells (about one pixel each) and the first data point of each occupied cell
+        is kept, all other markers of a cell are drawn onto the same pixel anyway
+        (min/max decimation would drop the interior markers of noisy data)
+        data points outside the limits are collected in the border cells, NaN data points are dropped
+
+        expected argument datatypes:
+        - x, y : numpy.ndarray
+        - xlim, ylim : tuple (limits of the axis)
+        - width, height : int (number of cells)
+
+        returns indices : numpy.ndarray (int)
+    """
+    finite = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+
+    if len(finite) <= width or width < 1 or height < 1 :
+        return finite
+
+    cells = []
+    for values, limits, n_cells in ((x, xlim, width), (y, ylim, height)) :
+        low, high = min(limits), max(limits)
+        scale = n_cells / (high - low) if high > low else 0
+
+        cells.append(np.clip(np.floor((values[finite] - low) * scale), -1, n_cells).astype(np.int64) + 1)
+
+    _, first = np.unique(cells[0] * (height + 2) + cells[1], return_index = True)
+
+    return finite[np.sort(first)]
+
+
+def get_visible_indices(x, xlim, groups = None) :
+    """ returns the indices of the data points in the x-range xlim (all indices if xlim is None)
+        the visible range is widened by one data point to each side (within the same group), so lines are drawn up to the edge of the axis
+    """
+    if xlim is None :
+        return np.arange(len(x))
+
+    xmin, xmax = min(xlim), max(xlim)
+
+    in_range = (x >= xmin) & (x <= xmax)
+
+    same_group = True if groups is None else groups[1:] == groups[:-1]
+
+    visible = in_range.copy()
+    visible[:-1] |= in_range[1:] & same_group
+    visible[1:] |= in_range[:-1] & same_group
+
+    return np.flatnonzero(visible)
+
+
+def get_decimated_line_indices(x, y, n_buckets, xlim = None, groups = None) :
+    """ returns the indices of the min/max decimated data points (see get_min_max_indices) of a line for the x-range xlim and the
+        positions in these indices, at which a new visible run of the same group starts (breaks, see get_decimated_line)
+        if xlim is None all data points are taken into account
+
+        expected argument datatypes:
+        - x, y : numpy.ndarray
+        - n_buckets : int
+        - xlim : tuple/None
+        - groups : numpy.ndarray/None (see get_min_max_indices)
+    """
+    visible = get_visible_indices(x, xlim, groups)
+
+    if len(visible) == 0 :
+        return visible, np.array([], dtype = int)
+
+    indices = visible[get_min_max_indices(y[visible], n_buckets, x[visible], xlim, None if groups is None else groups[visible])]
+
+    if len(indices) < 2 or xlim is None :
+        return indices, np.array([], dtype = int)
+
+    """ two consecutive kept indices of the same group belong to different visible runs
+    """
+    run_ids = np.cumsum(np.concatenate(([1], np.diff(visible) > 1)))
+    run_of_index = np.zeros(len(x), dtype = int)
+    run_of_index[visible] = run_ids
+
+    new_run = np.diff(run_of_index[indices]) != 0
+
+    if groups is not None :
+        new_run &= np.diff(groups[indices]) == 0
+
+    return indices, np.flatnonzero(new_run) + 1
+
+
+def get_decimated_line(x, y, n_buckets, xlim = None) :
+    """ returns the min/max decimated x and y data (see get_min_max_indices) of a line for the x-range xlim
+        if xlim is None all data points are taken into account
+
+        separate visible runs (e.g. forward and backward scan of a cyclovoltammogram) are separated by NaN,
+        otherwise matplotlib would connect the end of one run with the start of the next run
+
+        expected argument datatypes:
+        - x, y : numpy.ndarray
+        - n_buckets : int
+        - xlim : tuple/None
+    """
+    indices, breaks = get_decimated_line_indices(x, y, n_buckets, xlim)
+
+    return np.insert(x[indices], breaks, np.nan), np.insert(y[indices], breaks, np.nan)
+
+
+class Decimated_Plot :
+
+    def __init__(self, ax, x, y, kind = "plot", oversampling = 2, **kwargs) :
+        """ initiate Decimated_Plot class object with the following attributes:
+            - self.ax
+                (matplotlib.axes.Axes: axis in which the data is displayed)
+            - self.x and self.y
+                (numpy.ndarray: contain the full resolution data set (is never changed, exported data stays untouched))
+            - self.kind
+                (string: "plot" for a Line2D or "scatter" for a PathCollection)
+            - self.oversampling
+                (int: number of buckets per pixel column (cells per pixel for scatter plots) of the axis, > 1 keeps the plot lossless after
+                resizing the figure)
+            - self.artist
+                (matplotlib artist: the Line2D or PathCollection, which displays the decimated data)
+
+            the data is re-decimated every time the x-axis limits change (zoom/pan) or the figure is resized
+            only the data points visible in the current x-range are taken into account, so zooming in shows the full resolution
+            lines are min/max decimated (see get_min_max_indices), markers keep one data point per pixel cell (see get_pixel_cell_indices)
+            and are re-decimated when the y-axis limits change as well
+
+            expected argument datatypes:
+            - ax : matplotlib.axes.Axes
+            - x, y : pandas.Series/numpy.ndarray/list
+            - kind : string
+            - oversampling : int
+            - kwargs : keywords passed on to ax.plot or ax.scatter
+        """
+        self.ax = ax
+        self.kind = kind
+        self.oversampling = oversampling
+
+        self.x = np.asarray(x, dtype = float)
+        self.y = np.asarray(y, dtype = float)
+
+        x_decimated, y_decimated = self.get_decimated_data(None)
+
+        if self.kind == "scatter" :
+            self.artist = ax.scatter(x_decimated, y_decimated, **kwargs)
+
+            """ the kept marker of a border cell is not necessarily the extreme data point, so the data limits are taken from the full data set
+            """
+            finite = np.isfinite(self.x) & np.isfinite(self.y)
+            if finite.any() :
+                ax.update_datalim(np.column_stack((self.x, self.y))[finite])
+                ax.autoscale_view()
+        else :
+            self.artist = ax.plot(x_decimated, y_decimated, **kwargs)[0]
+
+        """ connect the re-decimation to zoom/pan and resize events
+            lambda functions are used since matplotlib only keeps weak references to bound methods
+        """
+        ax.callbacks.connect("xlim_changed", lambda ax : self.update())
+
+        if self.kind == "scatter" :
+            ax.callbacks.connect("ylim_changed", lambda ax : self.update())
+
+        if ax.figure.canvas is not None :
+            ax.figure.canvas.mpl_connect("resize_event", lambda event : self.update())
+
+
+    def get_number_of_buckets(self) :
+        """ returns the number of buckets depending on the width of the axis in pixel
+        """
+        width = self.ax.bbox.width
+
+        if not np.isfinite(width) or width < 1 :
+            width = 1000
+
+        return int(width * self.oversampling)
+
+
+    def get_number_of_cells(self) :
+        """ returns the number of pixel cells in x and y direction depending on the size of the axis in pixel (scatter plots)
+        """
+        width, height = self.ax.bbox.width, self.ax.bbox.height
+
+        if not np.isfinite(width) or width < 1 or not np.isfinite(height) or height < 1 :
+            width, height = 1000, 1000
+
+        return int(width * self.oversampling), int(height * self.oversampling)
+
+
+    def get_decimated_data(self, xlim) :
+        """ returns the decimated x and y data for the x-range xlim
+            if xlim is None all data points are taken into account
+            lines see get_decimated_line, markers of the visible range (widened by one data point to each side) see get_pixel_cell_indices
+        """
+        if self.kind != "scatter" :
+            return get_decimated_line(self.x, self.y, self.get_number_of_buckets(), xlim)
+
+        indices = get_visible_indices(self.x, xlim)
+
+        if len(indices) == 0 :
+            return np.array([]), np.array([])
+
+        x, y = self.x[indices], self.y[indices]
+
+        if xlim is None :
+            xlim, ylim = (np.nanmin(x), np.nanmax(x)), (np.nanmin(y), np.nanmax(y))
+        else :
+            ylim = self.ax.get_ylim()
+
+        indices = indices[get_pixel_cell_indices(x, y, xlim, ylim, *self.get_number_of_cells())]
+
+        return self.x[indices], self.y[indices]
+
+
+    def update(self) :
+        """ re-decimates the data for the current x-axis limits and updates the artist
+        """
+        x, y = self.get_decimated_data(self.ax.get_xlim())
+
+        if self.kind == "scatter" :
+            self.artist.set_offsets(np.column_stack((x, y)))
+        else :
+            self.artist.set_data(x, y)
+
+
+    def set_data(self, x, y) :
+        """ replaces the full resolution data set and re-decimates it for the current x-axis limits
+            the data limits of the axis are updated, so autoscaling still works after the change
+        """
+        self.x = np.asarray(x, dtype = float)
+        self.y = np.asarray(y, dtype = float)
+
+        self.update()
+
+        self.ax.update_datalim(np.column_stack((self.x, self.y))[np.isfinite(self.x) & np.isfinite(self.y)])
+
+
+def plot_decimated(ax, x, y, **kwargs) :
+    """ replacement for ax.plot(x, y, **kwargs) with min/max decimation for the current axis width
+        returns the Decimated_Plot object, the Line2D can be accessed via Decimated_Plot.artist
+    """
+    return Decimated_Plot(ax, x, y, kind = "plot", **kwargs)
+
+
+def scatter_decimated(ax, x, y, **kwargs) :
+    """ replacement for ax.scatter(x, y, **kwargs) with one marker per pixel cell of the current axis size
+        returns the Decimated_Plot object, the PathCollection can be accessed via Decimated_Plot.artist
+    """
+    return Decimated_Plot(ax, x, y, kind = "scatter", **kwargs)
+
+
+
+""" update list:
+
+Version 1.0.0 (19.10.2026)
+- min/max (M4) decimation for line and scatter plots, re-decimated on zoom/pan and resize
+
+Version 1.0.1 (19.10.2026)
+- scatter plots keep one marker per pixel cell instead of the min/max points of each bucket (interior markers of noisy data were lost)
+- min/max decimation of lines buckets on the pixel columns of x (runs of consecutive data points in the same column), so non-monotonic x
+  (e.g. CV loops) keeps the extremes of each pass through a column
+
+Version 1.0.2 (19.10.2026)
+- visible range and min/max decimation of lines as functions get_visible_indices and get_decimated_line (also used by curve_overlay.py)
+
+Version 1.0.3 (19.10.2026)
+- optional groups (e.g. curve index) in get_min_max_indices, get_visible_indices and get_decimated_line_indices, so many curves
+  stacked into one array are decimated in one vectorized pass
+- no decimation if the data set is not larger than 4 * n_buckets per group or the buckets contain at most four data points on average,
+  duplicates of the kept indices removed by a mask instead of np.unique
+"""
\ No newline at end of file
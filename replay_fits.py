@@ -0,0 +1,269 @@
+""" Fit Window Sidecars and Headless Replay of the Fits
+    Version 1.0.1
+
+    the fit windows selected in the GUI (range of the Tafel Fit, potentials of the Levich and Koutecky-Levich fits) are saved as
+    sidecar json file next to the evaluated data ({sample_name}.{first 8 characters of the input hash}.fit.json in the evaluation
+    folder of the tool, so samples with the same name but different raw data do not overwrite each others sidecar)
+    the sidecar is keyed by the content hash of the input files (see results_store.py), so the raw data is found again even if it
+    was renamed or moved (each file of a rpm series by its own hash)
+
+    sidecar (json):
+        {"program_name" : "Tafel Analysis", "tool_version" : "1.0.13", "sample_name" : "NiFe_1", "input_hash" : "...",
+         "file_paths" : ["D:\\Potentiostat\\NiFe_1.txt"], "file_hashes" : ["..."], "parameters" : {"pH" : 13, ...},
+         "fit_windows" : {"fit_range" : [0.25, 0.35], "resistance" : 2.1}, "timestamp" : "2026-10-19T10:00:00"}
+
+    the replay evaluates all sidecars again without GUI (tool.run_headless_fits) on the worker processes of watch_folder.py,
+    e.g. after a change of a loader or of the parameters
+    if several sidecars exist for the same input files (evaluated on different days) only the latest one is replayed
+
+    usage (from the folder of CS_Analysis_Tool.py):
+        python replay_fits.py
+        python replay_fits.py "Evaluation\\Tafel Analysis" --data-folder "D:\\Potentiostat" --default-parameters
+"""
+
+import os
+import json
+import argparse
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from results_store import get_file_hash, get_input_hash, get_tool_version
+
+
+sidecar_ending = ".fit.json"
+
+
+def save_fit_windows(tool, sample_name, file_paths, fit_windows, parameters = None) :
+    """ saves the fit windows of an evaluation as sidecar json file in the evaluation folder of the tool
+        the parameters are taken from tool.get_parameters() if not given
+
+        expected argument datatypes:
+        - tool : Analysis Tool class object (e.g. Tafel_Analysis)
+        - sample_name : string (sample or rpm series, name of the sidecar file)
+        - file_paths : list/tuple (raw data files)
+        - fit_windows : dict (json serializable, e.g. {"fit_range" : [0.25, 0.35]})
+        - parameters : dict/None
+
+        returns the path of the sidecar
+    """
+    if parameters == None and hasattr(tool, "get_parameters") :
+        parameters = tool.get_parameters()
+
+    sidecar = {"program_name" : tool.program_name,
+               "tool_version" : get_tool_version(tool),
+               "sample_name" : sample_name,
+               "input_hash" : get_input_hash(file_paths),
+               "file_paths" : [os.path.abspath(file_path) for file_path in file_paths],
+               "file_hashes" : [get_file_hash(file_path) for file_path in file_paths],
+               "parameters" : parameters if parameters != None else {},
+               "fit_windows" : fit_windows,
+               "timestamp" : datetime.now().isoformat(timespec = "seconds")}
+
+    path = f"{tool.path_evaluation_folder}\{sample_name}.{sidecar['input_hash'][:8]}{sidecar_ending}"
+
+    with open(path, "w", encoding = "utf-8") as file :
+        json.dump(sidecar, file, indent = 2, default = float)
+
+    return path
+
+
+def load_fit_windows(path) :
+    """ returns the sidecar (dict) saved by save_fit_windows
+    """
+    with open(path, encoding = "utf-8") as file :
+        return json.load(file)
+
+
+def find_sidecars(folders, program_name = None) :
+    """ returns the sidecars (list of dicts, with the key "path") in the folders and their subfolders
+        only the latest sidecar of each program_name and input_hash is returned
+
+        expected argument datatypes:
+        - folders : list (paths)
+        - program_name : string/None (only sidecars of this tool)
+    """
+    sidecars = {}
+
+    for folder in folders :
+        for root, _, files in os.walk(folder) :
+            for file in files :
+                if not file.endswith(sidecar_ending) :
+                    continue
+
+                path = os.path.join(root, file)
+
+                try :
+                    sidecar = load_fit_windows(path)
+                except (OSError, ValueError) as error :
+                    print(f"skipped {path}: {error}")
+                    continue
+
+                if program_name != None and sidecar.get("program_name") != program_name :
+                    continue
+
+                sidecar["path"] = path
+
+                key = (sidecar["program_name"], sidecar["input_hash"])
+
+                if key not in sidecars or sidecar["timestamp"] > sidecars[key]["timestamp"] :
+                    sidecars[key] = sidecar
+
+    return sorted(sidecars.values(), key = lambda sidecar : (sidecar["program_name"], sidecar["sample_name"]))
+
+
+class File_Finder :
+
+    def __init__(self, data_folders) :
+        """ initiate File_Finder class object with the following attributes:
+            - self.data_folders
+                (list: folders, in which moved or renamed raw data files are searched)
+            - self.hashes
+                (dict: contains the path of each file in the data_folders as value with its content hash as key,
+                created at the first search, since hashing all files takes time)
+        """
+        self.data_folders = list(data_folders)
+        self.hashes = None
+
+
+    def get_file_path(self, file_path, file_hash) :
+        """ returns the path of the raw data file with the content hash file_hash or None if it was not found
+            the saved file_path is used if the file still exists and was not changed, otherwise the file is searched in the data_folders
+        """
+        if os.path.exists(file_path) and get_file_hash(file_path) == file_hash :
+            return file_path
+
+        if self.hashes == None :
+            self.hashes = {}
+
+            for folder in self.data_folders :
+                for root, _, files in os.walk(folder) :
+                    for file in files :
+                        path = os.path.join(root, file)
+                        self.hashes.setdefault(get_file_hash(path), path)
+
+        return self.hashes.get(file_hash)
+
+
+    def get_file_paths(self, sidecar) :
+        """ returns the paths of all raw data files of a sidecar or None if one of them was not found
+            for a single file the input_hash is the hash of the file, for several files (rpm series) each file is found by its own hash
+            (file_hashes, the data_folders are hashed only once for all files) and the combined hash is checked
+            sidecars without file_hashes (Version 1.0.0) are only replayed with the saved paths
+        """
+        if len(sidecar["file_paths"]) == 1 :
+            file_path = self.get_file_path(sidecar["file_paths"][0], sidecar["input_hash"])
+            return [file_path] if file_path != None else None
+
+        file_hashes = sidecar.get("file_hashes", [None] * len(sidecar["file_paths"]))
+
+        file_paths = []
+
+        for file_path, file_hash in zip(sidecar["file_paths"], file_hashes) :
+            if file_hash != None :
+                file_path = self.get_file_path(file_path, file_hash)
+            elif not os.path.exists(file_path) :
+                file_path = None
+
+            if file_path == None :
+                return None
+
+            file_paths.append(file_path)
+
+        if get_input_hash(file_paths) != sidecar["input_hash"] :
+            return None
+
+        return file_paths
+
+
+def replay_fit(program_name, file_paths, fit_windows, parameters) :
+    """ evaluates the fits of a sidecar with the tool of program_name in a worker process (see watch_folder.py)
+        returns the dict returned by tool.run_headless_fits
+    """
+    from watch_folder import get_worker_tool
+
+    tool = get_worker_tool(program_name, parameters)
+
+    return tool.run_headless_fits(file_paths, fit_windows)
+
+
+def replay_fits(folders, data_folders = None, program_name = None, default_parameters = False, workers = 2) :
+    """ replays the fits of all sidecars in the folders on a pool of worker processes
+
+        expected argument datatypes:
+        - folders : list (folders with sidecars, e.g. the evaluation folder)
+        - data_folders : list/None (folders, in which moved raw data files are searched by their content hash)
+        - program_name : string/None (only replay the fits of this tool)
+        - default_parameters : boolean (use the default parameters of the tools instead of the saved parameters)
+        - workers : int
+
+        returns the number of replayed and failed sidecars (tuple)
+    """
+    from watch_folder import init_worker
+
+    finder = File_Finder(data_folders if data_folders != None else [])
+
+    sidecars = find_sidecars(folders, program_name)
+
+    replayed, failed = 0, 0
+
+    with ProcessPoolExecutor(max_workers = workers, initializer = init_worker) as executor :
+        futures = {}
+
+        for sidecar in sidecars :
+            file_paths = finder.get_file_paths(sidecar)
+
+            if file_paths == None :
+                print(f"skipped {sidecar['path']}: raw data not found")
+                failed += 1
+                continue
+
+            parameters = {} if default_parameters else sidecar["parameters"]
+
+            future = executor.submit(replay_fit, sidecar["program_name"], file_paths, sidecar["fit_windows"], parameters)
+            futures[future] = sidecar
+
+        for future in as_completed(futures) :
+            sidecar = futures[future]
+
+            try :
+                result = future.result()
+                print(f"replayed {sidecar['program_name']} {sidecar['sample_name']}: {result}")
+                replayed += 1
+            except Exception as error :
+                print(f"failed {sidecar['program_name']} {sidecar['sample_name']}: {error!r}")
+                failed += 1
+
+    return replayed, failed
+
+
+
+if __name__ == "__main__" :
+    path_of_this_program = os.path.dirname(os.path.realpath(__file__))
+
+    parser = argparse.ArgumentParser(description = "evaluates the fits of all saved fit windows (sidecar files) again without GUI")
+    parser.add_argument("folders", nargs = "*", default = [f"{path_of_this_program}\Evaluation"],
+        help = "folders with sidecar files (default: Evaluation)")
+    parser.add_argument("--data-folder", action = "append", default = None, help = "folder, in which moved raw data files are searched")
+    parser.add_argument("--program", default = None, help = "program_name of the tool, e.g. 'Tafel Analysis'")
+    parser.add_argument("--default-parameters", action = "store_true", help = "use the default parameters instead of the saved parameters")
+    parser.add_argument("--workers", type = int, default = 2, help = "number of worker processes (default 2)")
+
+    args = parser.parse_args()
+
+    replayed, failed = replay_fits(args.folders, data_folders = args.data_folder, program_name = args.program,
+        default_parameters = args.default_parameters, workers = args.workers)
+
+    print(f"{replayed} replayed, {failed} failed")
+
+
+
+""" update list:
+
+Version 1.0.0 (19.10.2026)
+- sidecar json files of the fit windows keyed by the content hash of the input files and headless replay on worker processes
+
+Version 1.0.1 (19.10.2026)
+- sidecar named {sample_name}.{input hash prefix}.fit.json, so samples of the same name do not overwrite each other
+- hash of each input file saved in the sidecar, moved files of rpm series are found by their hash (data folders hashed once)
+  instead of a search by file name in all data folders for each missing file
+"""
\ No newline at end of file
@@ -0,0 +1,302 @@
+""" Results Store for the Analysis Tools
+    Version 1.0.0
+
+    saves the results of every evaluation (Tafel slopes, exchange current densities, Levich and Koutecky-Levich slopes,
+    on set currents, deposition current densities, cyclovoltammetry peaks, ...) in one indexed SQLite database
+    (Evaluation/results.sqlite), so results of all samples and all days can be queried at once
+
+    tables:
+    - evaluations : one row per evaluation of a sample
+        (id, program_name, tool_version, sample_name, file_paths, input_hash, parameters (json), timestamp)
+    - results : one row per result value (long format)
+        (evaluation_id, name, value, potential (V, for potential dependent results like Levich fits, otherwise NULL))
+
+    usage in the tools:
+        store_results(self, sample_name, {"tafel_slope" : tafel_slope, ...}, file_paths = [file_path])
+
+    query from the console (from the folder of CS_Analysis_Tool.py):
+        python results_store.py --program "Tafel Analysis" --sample "NiFe%" --result tafel_slope
+"""
+
+import os
+import sys
+import json
+import sqlite3
+import hashlib
+import argparse
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+
+""" hashes of already hashed files
+    key: (file_path, size, modification time), so a changed file is hashed again
+"""
+file_hashes = {}
+
+
+def get_file_hash(file_path) :
+    """ returns the sha256 hash (hex string) of the file content, the file is read in chunks of 1 MB
+        identical raw data files have the same hash independent of their name and location
+
+        expected argument datatype:
+        - file_path : string
+    """
+    stat = os.stat(file_path)
+    key = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+
+    if key not in file_hashes :
+        file_hash = hashlib.sha256()
+
+        with open(file_path, "rb") as file :
+            for chunk in iter(lambda : file.read(2**20), b"") :
+                file_hash.update(chunk)
+
+        file_hashes[key] = file_hash.hexdigest()
+
+    return file_hashes[key]
+
+
+def get_input_hash(file_paths) :
+    """ returns the hash of the input files of an evaluation
+        a single file has its own hash, multiple files (e.g. rpm series of the Levich Analysis) the hash of their sorted hashes
+    """
+    hashes = sorted(get_file_hash(file_path) for file_path in file_paths)
+
+    if len(hashes) == 1 :
+        return hashes[0]
+
+    return hashlib.sha256("".join(hashes).encode()).hexdigest()
+
+
+def get_tool_version(tool) :
+    """ returns the version of a tool (e.g. "1.0.6") from the docstring of its module ("    Version 1.0.6") or None
+    """
+    module = sys.modules.get(type(tool).__module__)
+
+    if module == None or module.__doc__ == None :
+        return None
+
+    for line in module.__doc__.splitlines() :
+        if line.strip().startswith("Version") :
+            return line.strip().split()[1]
+
+    return None
+
+
+def get_default_database_path() :
+    """ returns the path of the database in the evaluation folder: */Evaluation/results.sqlite
+         * path of this program
+    """
+    path_of_this_program = os.path.dirname(os.path.realpath(__file__))
+
+    path_evaluation_folder = f"{path_of_this_program}\Evaluation"
+
+    if not os.path.exists(path_evaluation_folder) :
+        os.mkdir(path_evaluation_folder)
+
+    return f"{path_evaluation_folder}\\results.sqlite"
+
+
+
+class Results_Store :
+
+    def __init__(self, database_path = None) :
+        """ initiate Results_Store class object with the following attributes:
+            - self.database_path
+                (string: path of the SQLite database, default: */Evaluation/results.sqlite)
+            - self.connection
+                (sqlite3.Connection: connection to the database)
+
+            the tables and indices are created if they do not exist yet
+            the database uses write-ahead logging, so the GUI and the worker processes of watch_folder.py can write at the same time
+
+            expected argument datatype:
+            - database_path : string/None
+        """
+        self.database_path = database_path if database_path != None else get_default_database_path()
+
+        self.connection = sqlite3.connect(self.database_path, timeout = 30)
+
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.execute("PRAGMA foreign_keys = ON")
+
+        with self.connection :
+            self.connection.executescript("""
+                CREATE TABLE IF NOT EXISTS evaluations (
+                    id INTEGER PRIMARY KEY,
+                    program_name TEXT NOT NULL,
+                    tool_version TEXT,
+                    sample_name TEXT NOT NULL,
+                    file_paths TEXT,
+                    input_hash TEXT,
+                    parameters TEXT,
+                    timestamp TEXT NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS results (
+                    evaluation_id INTEGER NOT NULL REFERENCES evaluations(id) ON DELETE CASCADE,
+                    name TEXT NOT NULL,
+                    value REAL,
+                    potential REAL
+                );
+
+                CREATE INDEX IF NOT EXISTS evaluations_program_sample ON evaluations (program_name, sample_name);
+                CREATE INDEX IF NOT EXISTS evaluations_sample ON evaluations (sample_name);
+                CREATE INDEX IF NOT EXISTS evaluations_input_hash ON evaluations (input_hash);
+                CREATE INDEX IF NOT EXISTS evaluations_timestamp ON evaluations (timestamp);
+                CREATE INDEX IF NOT EXISTS results_evaluation ON results (evaluation_id);
+                CREATE INDEX IF NOT EXISTS results_name_value ON results (name, value);
+                """)
+
+
+    def add_evaluation(self, program_name, sample_name, results, parameters = None, file_paths = None, tool_version = None, potential = None) :
+        """ adds an evaluation with its results in one transaction and returns the id of the evaluation
+            NaN and None values are skipped (e.g. a Tafel fit, which was not determined)
+
+            expected argument datatypes:
+            - program_name, sample_name : string
+            - results : dict (name of the result as key, int/float as value)
+            - parameters : dict/None (parameters of the evaluation, e.g. area_electrode, pH, resistance)
+            - file_paths : list/None (raw data files, their content hash is saved as input_hash)
+            - tool_version : string/None
+            - potential : float/None (V, potential at which potential dependent results were determined)
+        """
+        file_paths = list(file_paths) if file_paths != None else []
+
+        input_hash = get_input_hash(file_paths) if len(file_paths) > 0 else None
+
+        rows = []
+        for name, value in results.items() :
+            if value == None or not np.isfinite(value) :
+                continue
+            rows.append((name, float(value), potential))
+
+        with self.connection :
+            cursor = self.connection.execute(
+                "INSERT INTO evaluations (program_name, tool_version, sample_name, file_paths, input_hash, parameters, timestamp) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (program_name, tool_version, sample_name, json.dumps([os.path.abspath(file_path) for file_path in file_paths]),
+                 input_hash, json.dumps(parameters if parameters != None else {}, default = float), datetime.now().isoformat(timespec = "seconds")))
+
+            evaluation_id = cursor.lastrowid
+
+            self.connection.executemany("INSERT INTO results (evaluation_id, name, value, potential) VALUES (?, ?, ?, ?)",
+                [(evaluation_id, ) + row for row in rows])
+
+        return evaluation_id
+
+
+    def get_results(self, program_name = None, sample_name = None, result_name = None, since = None, until = None, input_hash = None) :
+        """ returns a pandas.DataFrame with one row per result value (long format) with the columns
+            program_name, tool_version, sample_name, timestamp, input_hash, parameters, name, value, potential
+
+            all arguments are optional filters:
+            - program_name : string
+            - sample_name : string (SQL LIKE pattern, e.g. "NiFe%" for all samples starting with NiFe)
+            - result_name : string (e.g. "tafel_slope")
+            - since, until : string (ISO date/time, e.g. "2026-01-01")
+            - input_hash : string
+        """
+        conditions, arguments = [], []
+
+        for condition, argument in [("e.program_name = ?", program_name), ("e.sample_name LIKE ?", sample_name),
+                                    ("r.name = ?", result_name), ("e.timestamp >= ?", since), ("e.timestamp <= ?", until),
+                                    ("e.input_hash = ?", input_hash)] :
+            if argument != None :
+                conditions.append(condition)
+                arguments.append(argument)
+
+        query = """
+            SELECT e.id AS evaluation_id, e.program_name, e.tool_version, e.sample_name, e.timestamp, e.input_hash, e.parameters,
+                   r.name, r.value, r.potential
+            FROM results r JOIN evaluations e ON e.id = r.evaluation_id
+            """
+
+        if len(conditions) > 0 :
+            query += " WHERE " + " AND ".join(conditions)
+
+        query += " ORDER BY e.timestamp, e.id"
+
+        return pd.read_sql_query(query, self.connection, params = arguments)
+
+
+    def get_evaluations_for_file(self, file_path) :
+        """ returns a pandas.DataFrame with all evaluations of raw data with the same content as file_path (independent of its name)
+        """
+        return pd.read_sql_query("SELECT * FROM evaluations WHERE input_hash = ? ORDER BY timestamp",
+            self.connection, params = [get_file_hash(file_path)])
+
+
+    def close(self) :
+        self.connection.close()
+
+
+
+""" Results_Store of this process, created at the first use (each worker process of watch_folder.py has its own connection)
+"""
+results_store = None
+
+
+def get_results_store() :
+    global results_store
+
+    if results_store == None :
+        results_store = Results_Store()
+
+    return results_store
+
+
+def store_results(tool, sample_name, results, file_paths = None, potential = None, parameters = None) :
+    """ saves the results of an evaluation of a tool in the results store
+        the program_name and version are taken from the tool, the parameters from tool.get_parameters() if not given
+
+        expected argument datatypes:
+        - tool : Analysis Tool class object (e.g. Tafel_Analysis)
+        - sample_name : string
+        - results : dict (name of the result as key, int/float as value)
+        - file_paths : list/None
+        - potential : float/None (V)
+        - parameters : dict/None
+
+        returns the id of the evaluation
+    """
+    if parameters == None and hasattr(tool, "get_parameters") :
+        parameters = tool.get_parameters()
+
+    return get_results_store().add_evaluation(tool.program_name, sample_name, results, parameters = parameters,
+        file_paths = file_paths, tool_version = get_tool_version(tool), potential = potential)
+
+
+
+if __name__ == "__main__" :
+    parser = argparse.ArgumentParser(description = "query the results of all evaluations")
+    parser.add_argument("--database", default = None, help = "path of the database (default: Evaluation/results.sqlite)")
+    parser.add_argument("--program", default = None, help = "program_name of the tool, e.g. 'Tafel Analysis'")
+    parser.add_argument("--sample", default = None, help = "sample name, SQL LIKE pattern (e.g. 'NiFe%%')")
+    parser.add_argument("--result", default = None, help = "name of the result, e.g. tafel_slope")
+    parser.add_argument("--since", default = None, help = "ISO date, e.g. 2026-01-01")
+    parser.add_argument("--until", default = None, help = "ISO date, e.g. 2026-12-31")
+    parser.add_argument("--output", default = None, help = "save the results as txt file (separated by ;)")
+
+    args = parser.parse_args()
+
+    store = Results_Store(args.database)
+    results = store.get_results(program_name = args.program, sample_name = args.sample, result_name = args.result,
+        since = args.since, until = args.until)
+    store.close()
+
+    if args.output != None :
+        results.to_csv(args.output, sep = ";", index = None)
+    else :
+        with pd.option_context("display.max_rows", 200, "display.width", 200) :
+            print(results.drop(columns = ["parameters", "input_hash"]))
+
+
+
+""" update list:
+
+Version 1.0.0 (19.10.2026)
+- SQLite results store (evaluations and results table with indices) with content hash of the input files and query from the console
+"""
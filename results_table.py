@@ -0,0 +1,165 @@
+""" Results Table for the GUI of the Analysis Tools
+    Version 1.0.1
+
+    table based on ttk.Treeview for the results of the tools (rows: samples or potentials, columns: results)
+    rows and cells are updated individually, so a new fit only changes one row instead of recreating a tkinter.Label for each cell
+    the Treeview only draws the visible rows, further rows are reached by the scrollbars
+
+    usage:
+        results_table = Results_Table(self.program_frame, "Potential (V)", ["Levich Slope (mA/ω)", "Levich Intersect (mA)"])
+        results_table.grid(row = 1, column = 1, padx = 5, pady = 5)
+
+        results_table.set_cells("0.8", {"Levich Slope (mA/ω)" : levich_slope * 1000, "Levich Intersect (mA)" : levich_intersect * 1000})
+"""
+
+import numpy as np
+import tkinter as tk
+from tkinter import ttk
+
+
+class Results_Table :
+
+    def __init__(self, master, key_column, columns, height = 10, decimals = 3) :
+        """ initiate Results_Table class object with the following attributes:
+            - self.frame
+                (tkinter.Frame: contains the Treeview and the scrollbars, is set into the grid of master)
+            - self.tree
+                (ttk.Treeview: displays the table)
+            - self.columns
+                (list: contains the key_column and all result columns)
+            - self.rows
+                (dict: contains the unformatted values of each row (list in the order of self.columns) as value and the key of the row as key)
+            - self.decimals
+                (int: number of decimals of displayed numbers)
+
+            expected argument datatypes:
+            - master : tkinter.Frame
+            - key_column : string (heading of the first column, which contains the key of the row, e.g. "Sample" or "Potential (V)")
+            - columns : list (headings of the result columns)
+            - height : int (number of visible rows)
+            - decimals : int
+        """
+        self.columns = [key_column] + list(columns)
+        self.rows = {}
+        self.decimals = decimals
+
+        self.frame = tk.Frame(master = master, relief = "groove", borderwidth = 2)
+
+        self.tree = ttk.Treeview(master = self.frame, columns = self.columns, show = "headings", height = height)
+
+        for column in self.columns :
+            self.tree.heading(column, text = column)
+            self.tree.column(column, width = max(80, 7 * len(column)), anchor = "center", stretch = False)
+
+        scrollbar_y = ttk.Scrollbar(master = self.frame, orient = "vertical", command = self.tree.yview)
+        scrollbar_x = ttk.Scrollbar(master = self.frame, orient = "horizontal", command = self.tree.xview)
+
+        self.tree.configure(yscrollcommand = scrollbar_y.set, xscrollcommand = scrollbar_x.set)
+
+        self.tree.grid(row = 0, column = 0, sticky = "nsew")
+        scrollbar_y.grid(row = 0, column = 1, sticky = "ns")
+        scrollbar_x.grid(row = 1, column = 0, sticky = "ew")
+
+
+    def grid(self, **kwargs) :
+        self.frame.grid(**kwargs)
+
+
+    def grid_forget(self) :
+        self.frame.grid_forget()
+
+
+    def format_value(self, value) :
+        """ returns the value as displayed in the table
+            numbers are rounded to self.decimals, None and NaN are displayed as empty cell
+            tuples (e.g. confidence intervals) are displayed as 'low – high'
+        """
+        if value is None :
+            return ""
+
+        if isinstance(value, tuple) :
+            return " – ".join(str(self.format_value(element)) for element in value)
+
+        if isinstance(value, (int, float, np.number)) :
+            if not np.isfinite(value) :
+                return ""
+            return round(float(value), self.decimals)
+
+        return value
+
+
+    def set_cells(self, key, values) :
+        """ sets the values of the row key, the row is added at the end of the table if it does not exist yet
+            the Treeview item is only updated if a value changed
+
+            expected argument datatypes:
+            - key : string
+            - values : dict (column heading as key)
+        """
+        key = str(key)
+
+        if key not in self.rows :
+            self.rows[key] = [key] + [None] * (len(self.columns) - 1)
+            self.tree.insert("", "end", iid = key, values = [self.format_value(value) for value in self.rows[key]])
+
+        row = self.rows[key]
+
+        changed = False
+        for column, value in values.items() :
+            index = self.columns.index(column)
+            if not (row[index] is value or row[index] == value) :
+                row[index] = value
+                changed = True
+
+        if changed :
+            self.tree.item(key, values = [self.format_value(value) for value in row])
+
+
+    def set_row(self, key, values) :
+        """ sets all result values of the row key
+
+            expected argument datatypes:
+            - key : string
+            - values : list (in the order of the result columns)
+        """
+        self.set_cells(key, dict(zip(self.columns[1:], values)))
+
+
+    def delete_row(self, key) :
+        key = str(key)
+
+        if key in self.rows :
+            del self.rows[key]
+            self.tree.delete(key)
+
+
+    def clear_columns(self, columns) :
+        """ empties the cells of columns in all rows
+            rows without any remaining value are removed from the table
+        """
+        for key in list(self.rows) :
+            row = self.rows[key]
+
+            if all(row[self.columns.index(column)] is None for column in columns) :
+                continue
+
+            self.set_cells(key, {column : None for column in columns})
+
+            if all(value is None for value in row[1:]) :
+                self.delete_row(key)
+
+
+    def clear(self) :
+        self.tree.delete(*self.rows.keys())
+        self.rows = {}
+
+
+
+""" update list:
+
+Version 1.0.0 (19.10.2026)
+- results table based on ttk.Treeview, which updates single rows and cells instead of recreating all tkinter.Labels
+
+Version 1.0.1 (19.10.2026)
+- tuples (e.g. confidence intervals) displayed as 'low – high'
+"""
\ No newline at end of file
@@ -0,0 +1,226 @@
+""" Robust Linear Fit (Theil-Sen)
+    Version 1.0.1
+
+    Theil-Sen estimator for linear fits, which are disturbed by outliers (e.g. gas bubbles near the onset of water splitting)
+    slope = median of the slopes of all pairs of data points, intersect = median of y - slope * x
+
+    the n² pairwise slopes are never calculated:
+    the number of pairwise slopes below a value t equals the number of inversions of the sequence y - t * x (sorted by x),
+    which is counted in O(n log² n) by a vectorized bottom-up merge sort
+    the median slope is found by bisection of t, starting from the quantiles of a random sample of pairwise slopes,
+    until the remaining O(n) slopes of the bracket can be determined exactly
+    data points with NaN or inf (e.g. log10 of a current density <= 0) are ignored
+
+    usage:
+        slope, intersect = theil_sen_fit(data_fit["overpotential"], data_fit["log_current_density"])
+"""
+
+import numpy as np
+
+
+def count_inversions(ranks) :
+    """ returns the number of pairs i < j with ranks[i] > ranks[j]
+        the sequence is sorted by a bottom-up merge sort, in each level the inversions between all neighbouring blocks are counted at once
+        by a binary search of each element of the right block in the (already sorted) left block
+
+        expected argument datatype:
+        - ranks : numpy.ndarray (int, values between 0 and len(ranks) - 1)
+    """
+    n = len(ranks)
+    keys = ranks.astype(np.int64)
+    positions = np.arange(n)
+    spacing = n + 1 # the blocks of different pairs are separated by adding pair * spacing to the keys
+
+    inversions = 0
+    width = 1
+
+    while width < n :
+        blocks = positions // width
+        pairs = blocks // 2
+        is_left = blocks % 2 == 0
+
+        offset_keys = keys + pairs * spacing
+
+        left_keys = offset_keys[is_left] # globally sorted, since each left block is sorted and the offset increases with the pair
+        right_keys = offset_keys[~is_left]
+        right_pairs = pairs[~is_left]
+
+        """ number of elements in the left block of the pair, which are greater than the element of the right block
+        """
+        inversions += int(np.sum(np.searchsorted(left_keys, (right_pairs + 1) * spacing, side = "left")
+                                 - np.searchsorted(left_keys, right_keys, side = "right")))
+
+        """ merge both blocks of each pair
+        """
+        width *= 2
+        keys = np.sort(offset_keys) - (positions // width) * spacing
+
+    return inversions
+
+
+def count_slopes_below(x, y, t) :
+    """ returns the number of pairwise slopes (y_j - y_i) / (x_j - x_i) < t
+        x has to be sorted ascending (for equal x by y ascending), pairs with equal x are never counted
+
+        slope(i, j) < t  <=>  y_j - t * x_j < y_i - t * x_i  for x_j > x_i
+    """
+    residuals = y - t * x
+
+    """ dense ranks, so that equal residuals are no inversion
+    """
+    ranks = np.unique(residuals, return_inverse = True)[1]
+
+    return count_inversions(ranks)
+
+
+def get_slopes_between(x, y, lo, hi) :
+    """ returns all pairwise slopes lo <= slope < hi (sorted)
+        x and y have to be sorted as in count_slopes_below
+
+        sorted by y - lo * x, the points of each pair with lo <= slope < hi are in the wrong order for y - hi * x
+        the insertion sort to y - hi * x swaps exactly these pairs, so it takes O(n + number of slopes) steps
+        and is only used for at most len(x) slopes between lo and hi (see get_kth_slope)
+    """
+    residuals_lo = y - lo * x
+    residuals_hi = (y - hi * x).tolist()
+
+    sequence = np.lexsort((np.arange(len(x)), residuals_lo)).tolist()
+
+    slopes = []
+
+    for position in range(1, len(sequence)) :
+        point = sequence[position]
+        residual = residuals_hi[point]
+
+        while position > 0 and residuals_hi[sequence[position - 1]] > residual :
+            other = sequence[position - 1]
+            slopes.append((y[point] - y[other]) / (x[point] - x[other]))
+
+            sequence[position] = other
+            position -= 1
+
+        sequence[position] = point
+
+    return np.sort(slopes)
+
+
+def get_kth_slope(x, y, k, bracket = None, max_iterations = 100) :
+    """ returns the k-th smallest (0-based) finite pairwise slope
+        the bracket of the slope is narrowed by bisection until it contains at most len(x) slopes, which are then determined exactly
+        if more slopes are (almost) equal, the bisection stops at the resolution of float64 relative to the largest possible slope
+        (or after max_iterations) and the lower end of the bracket is returned (differs less than this resolution from the k-th slope)
+
+        expected argument datatypes:
+        - x, y : numpy.ndarray (sorted as in count_slopes_below)
+        - k : int
+        - bracket : tuple/None (lower and upper start value of the bisection, the full range of possible slopes is used if the
+          bracket does not contain the k-th slope)
+        - max_iterations : int
+    """
+    dx = np.diff(x)
+    min_dx = dx[dx > 0].min()
+    max_slope = (y.max() - y.min()) / min_dx
+
+    """ count_slopes_below(lo) <= k < count_slopes_below(hi)
+    """
+    lo, hi = -max_slope - 1, max_slope + 1
+    resolution = 4 * np.finfo(np.float64).eps * hi
+    count_lo, count_hi = 0, len(x) * (len(x) - 1) // 2
+
+    if bracket != None :
+        count = count_slopes_below(x, y, bracket[0])
+        if count <= k :
+            lo, count_lo = bracket[0], count
+
+        count = count_slopes_below(x, y, bracket[1])
+        if count > k :
+            hi, count_hi = bracket[1], count
+
+    for _ in range(max_iterations) :
+        if count_hi - count_lo <= len(x) or hi - lo <= resolution : # at the resolution limit: many equal slopes
+            break
+
+        middle = (lo + hi) / 2
+
+        count = count_slopes_below(x, y, middle)
+
+        if count <= k :
+            lo, count_lo = middle, count
+        else :
+            hi, count_hi = middle, count
+
+    if count_hi - count_lo > len(x) :
+        return lo
+
+    return get_slopes_between(x, y, lo, hi)[k - count_lo]
+
+
+def theil_sen_fit(x, y, sample_size = None, seed = 0) :
+    """ returns the slope and intersect of the Theil-Sen fit of the data points (x, y)
+        the bisection of the median slope starts from the quantiles of sample_size random pairwise slopes (default 4 * n)
+        pairs with equal x and data points with NaN or inf are ignored
+        raises ValueError if less than two different finite x values remain
+
+        expected argument datatypes:
+        - x, y : list/numpy.ndarray/pandas.Series (at least two different x values)
+        - sample_size : int/None
+        - seed : int/None (seed of the random generator for the sample of slopes, the result does not depend on it)
+    """
+    x = np.asarray(x, dtype = np.float64)
+    y = np.asarray(y, dtype = np.float64)
+
+    finite = np.isfinite(x) & np.isfinite(y)
+    x, y = x[finite], y[finite]
+
+    order = np.lexsort((y, x))
+    x, y = x[order], y[order]
+
+    n = len(x)
+
+    """ number of pairs with a finite slope (pairs with equal x are excluded)
+    """
+    counts = np.unique(x, return_counts = True)[1]
+    n_slopes = n * (n - 1) // 2 - int(np.sum(counts * (counts - 1) // 2))
+
+    if n_slopes == 0 :
+        raise ValueError("Theil-Sen fit requires at least two different finite x values")
+
+    """ bracket of the median slope from the quantiles of a random sample of pairwise slopes
+        the width of the bracket (± 4 standard deviations of the sample quantile) contains the median with high probability
+    """
+    rng = np.random.default_rng(seed)
+    sample_size = sample_size if sample_size != None else 4 * n
+
+    i, j = rng.integers(0, n, size = (2, sample_size))
+    valid = x[i] != x[j]
+    sample_slopes = (y[j[valid]] - y[i[valid]]) / (x[j[valid]] - x[i[valid]])
+
+    bracket = None
+    if len(sample_slopes) > 0 :
+        delta = 4 * 0.5 / np.sqrt(len(sample_slopes))
+        bracket = tuple(np.quantile(sample_slopes, [max(0.5 - delta, 0), min(0.5 + delta, 1)]))
+
+    """ median of all slopes (mean of both middle slopes for an even number of slopes)
+    """
+    k_low, k_high = (n_slopes - 1) // 2, n_slopes // 2
+
+    slope = get_kth_slope(x, y, k_low, bracket)
+    if k_high != k_low :
+        slope = (slope + get_kth_slope(x, y, k_high, bracket)) / 2
+
+    intersect = np.median(y - slope * x)
+
+    return slope, intersect
+
+
+
+""" update list:
+
+Version 1.0.0 (19.10.2026)
+- Theil-Sen fit with O(n log² n) counting of pairwise slopes instead of calculating all n² slopes
+
+Version 1.0.1 (19.10.2026)
+- data points with NaN or inf are ignored (the bisection never ended for NaN in the fit window)
+- bisection stops at the float64 resolution of the slopes or after max_iterations, get_slopes_between is only used for at most
+  len(x) slopes (many equal slopes took O(n²) steps before)
+"""
\ No newline at end of file
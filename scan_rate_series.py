@@ -0,0 +1,284 @@
+""" Scan Rate Series of Cyclic Voltammograms (Double-Layer Capacitance and ECSA)
+    Version 1.0.0
+
+    evaluates series of cyclic voltammograms of the same electrode at different scan rates (usually in a non-faradaic potential window):
+    - capacitive currents of each cycle at a chosen potential: the anodic (increasing potential) and cathodic (decreasing potential)
+      branches of all cycles are searched at once by numpy.searchsorted and interpolated linearly,
+      capacitive current = (i_anodic - i_cathodic) / 2
+    - charge of each cycle by a cumulative trapezoidal integration of the current over time (reset at the start of each cycle),
+      Q+ and Q- are the integrals of the positive and negative current
+    - double-layer capacitance C_dl of each electrode: slope of the capacitive current vs the scan rate (least squares fit of all
+      electrodes in one pass), ECSA = C_dl / specific capacitance and roughness factor = ECSA / area of the electrode
+
+    the scan rate of a file is taken from the end of its name (*_50mVs.txt or *_50mV.txt, in mV/s), the files of the same electrode
+    share the beginning of the name (e.g. NiFe_1 for NiFe_1_10mVs.txt, NiFe_1_20mVs.txt, ...)
+    the time of each data point is taken from the column "Time (s)" if it exists, otherwise from the applied potential and the scan rate
+
+    usage:
+        cycles, fits = analyze_scan_rate_series(file_paths, potential = 0.1)
+
+    usage (from the folder of CS_Analysis_Tool.py):
+        python scan_rate_series.py "D:\\Potentiostat\\Cdl" --potential 0.1 --output "D:\\Potentiostat\\Cdl\\Scan_Rate_Series"
+"""
+
+import os
+import argparse
+import numpy as np
+import pandas as pd
+
+
+columns = ["Potential applied (V)", "WE(1).Current (A)", "Scan", "Time (s)"]
+
+cycle_columns = ["Sample", "Electrode", "Scan Rate (mV/s)", "Cycle", "Anodic Current (A)", "Cathodic Current (A)", "Capacitive Current (A)",
+                 "Q+ (C)", "Q- (C)"]
+
+fit_columns = ["Electrode", "Number of Scan Rates", "C_dl (mF)", "Intercept (A)", "R²", "ECSA (cm²)", "Roughness Factor"]
+
+
+def get_scan_rate_from_sample_name(sample_name) :
+    """ returns the scan rate (float, mV/s) at the end of the sample_name (e.g. NiFe_1_50mVs or NiFe_1_50mV) or None if it was not recognized
+    """
+    fragment = sample_name.split("_")[-1]
+
+    for keyword in ["mVs", "mV/s", "mV"] :
+        if fragment.endswith(keyword) or f"{keyword}-1" in fragment :
+            try :
+                return float(fragment.split(keyword)[0].replace(",", "."))
+            except ValueError :
+                return None
+
+    return None
+
+
+def get_electrode_name(sample_name) :
+    """ returns the sample_name without the scan rate at its end (name of the electrode)
+    """
+    if get_scan_rate_from_sample_name(sample_name) == None :
+        return sample_name
+
+    return "_".join(sample_name.split("_")[:-1])
+
+
+def get_branches(potential_applied) :
+    """ returns a boolean array, which is True for the data points of the anodic branches (increasing potential)
+    """
+    difference = np.diff(potential_applied)
+
+    return np.concatenate([difference, difference[-1:]]) >= 0
+
+
+def get_capacitive_currents(potential_applied, current, scans, potential) :
+    """ returns the cycles (numpy.ndarray) and the anodic and cathodic current of each cycle at the potential (linear interpolation,
+        NaN if a branch does not reach the potential)
+        all branches are searched in one call of numpy.searchsorted: the data points are sorted by the key
+        branch number * span + potential, so the potentials of each branch form a separate ascending block
+
+        expected argument datatypes:
+        - potential_applied, current, scans : numpy.ndarray (data points)
+        - potential : float (V)
+    """
+    cycles, cycle_index = np.unique(scans, return_inverse = True)
+
+    n_branches = 2 * len(cycles)
+    branch = 2 * cycle_index + ~get_branches(potential_applied) # even: anodic, odd: cathodic
+
+    minimum = np.min(potential_applied)
+    span = np.ptp(potential_applied) + 1
+
+    key = branch * span + (potential_applied - minimum)
+
+    order = np.argsort(key, kind = "stable")
+    key, current = key[order], current[order]
+
+    starts = np.searchsorted(key, np.arange(n_branches) * span)
+    ends = np.searchsorted(key, np.arange(1, n_branches + 1) * span)
+
+    targets = np.arange(n_branches) * span + (potential - minimum)
+
+    upper = np.clip(np.searchsorted(key, targets), np.minimum(starts + 1, len(key) - 1), np.maximum(ends - 1, 0))
+    lower = np.maximum(upper - 1, 0)
+
+    valid = (ends - starts >= 2) & (targets >= key[np.minimum(starts, len(key) - 1)]) & (targets <= key[np.maximum(ends - 1, 0)])
+
+    with np.errstate(divide = "ignore", invalid = "ignore") :
+        weight = np.where(key[upper] > key[lower], (targets - key[lower]) / (key[upper] - key[lower]), 0)
+
+    currents = np.where(valid, current[lower] + weight * (current[upper] - current[lower]), np.nan)
+
+    return cycles, currents[0::2], currents[1::2]
+
+
+def get_cumulative_charge(current, scans, time) :
+    """ returns the cumulative charge (numpy.ndarray, C) of each data point since the start of its cycle (trapezoidal rule)
+        and the segment charges (numpy.ndarray, C, data points - 1, 0 for segments between two cycles)
+
+        expected argument datatypes:
+        - current : numpy.ndarray (A)
+        - scans : numpy.ndarray (cycle of each data point)
+        - time : numpy.ndarray (s)
+    """
+    same_cycle = scans[1:] == scans[:-1]
+
+    segments = 0.5 * (current[1:] + current[:-1]) * np.diff(time) * same_cycle
+
+    cumulative = np.concatenate([[0], np.cumsum(segments)])
+
+    """ subtract the cumulative charge at the first data point of each cycle
+    """
+    cycle_starts = np.concatenate([[0], np.nonzero(~same_cycle)[0] + 1])
+    cycle_lengths = np.diff(np.concatenate([cycle_starts, [len(current)]]))
+
+    cumulative -= np.repeat(cumulative[cycle_starts], cycle_lengths)
+
+    return cumulative, segments
+
+
+def get_cycle_charges(current, scans, time) :
+    """ returns the cycles (numpy.ndarray) and the charges Q+ and Q- (numpy.ndarray, C) of the positive and negative current of each cycle
+    """
+    cycles, cycle_index = np.unique(scans, return_inverse = True)
+
+    cumulative, segments = get_cumulative_charge(current, scans, time)
+
+    positive = np.bincount(cycle_index[:-1], weights = np.maximum(segments, 0), minlength = len(cycles))
+    negative = np.bincount(cycle_index[:-1], weights = np.minimum(segments, 0), minlength = len(cycles))
+
+    return cycles, positive, negative
+
+
+def evaluate_cycles(data, sample_name, scan_rate, potential = None) :
+    """ returns the capacitive currents and charges of all cycles of a cyclic voltammogram (pandas.DataFrame, see cycle_columns)
+
+        expected argument datatypes:
+        - data : pandas.DataFrame (columns Potential applied (V), WE(1).Current (A), Scan and optional Time (s))
+        - sample_name : string
+        - scan_rate : float (mV/s)
+        - potential : float/None (V, default: middle of the applied potential range)
+    """
+    potential_applied = data["Potential applied (V)"].to_numpy(dtype = np.float64)
+    current = data["WE(1).Current (A)"].to_numpy(dtype = np.float64)
+    scans = data["Scan"].to_numpy()
+
+    if potential == None :
+        potential = (np.min(potential_applied) + np.max(potential_applied)) / 2
+
+    if "Time (s)" in data :
+        time = data["Time (s)"].to_numpy(dtype = np.float64)
+    else :
+        time = np.concatenate([[0], np.cumsum(np.abs(np.diff(potential_applied)))]) / (scan_rate / 1000)
+
+    cycles, anodic, cathodic = get_capacitive_currents(potential_applied, current, scans, potential)
+    _, positive, negative = get_cycle_charges(current, scans, time)
+
+    return pd.DataFrame(dict(zip(cycle_columns, [sample_name, get_electrode_name(sample_name), scan_rate, cycles, anodic, cathodic,
+                                                 (anodic - cathodic) / 2, positive, negative])))
+
+
+def fit_double_layer_capacitance(cycles, cycle = -1, specific_capacitance = 0.04, area_electrode = 1) :
+    """ fits the capacitive current vs the scan rate of all electrodes at once (sums of the least squares fit by numpy.bincount)
+
+        expected argument datatypes:
+        - cycles : pandas.DataFrame (see function evaluate_cycles)
+        - cycle : int (position of the cycle used of each file, -1: last cycle)
+        - specific_capacitance : float (mF/cm², capacitance of an atomically smooth surface of the material, e.g. 0.04 mF/cm² in alkaline solution)
+        - area_electrode : float (cm², geometric area)
+
+        returns pandas.DataFrame with one row per electrode (see fit_columns)
+    """
+    selected = cycles.groupby("Sample", sort = False).nth(cycle)
+    selected = selected[np.isfinite(selected["Capacitive Current (A)"])]
+
+    electrodes, index = np.unique(selected["Electrode"].to_numpy(dtype = str), return_inverse = True)
+
+    x = selected["Scan Rate (mV/s)"].to_numpy(dtype = np.float64) / 1000 # V/s
+    y = selected["Capacitive Current (A)"].to_numpy(dtype = np.float64)
+
+    n = np.bincount(index, minlength = len(electrodes))
+    sum_x = np.bincount(index, weights = x, minlength = len(electrodes))
+    sum_y = np.bincount(index, weights = y, minlength = len(electrodes))
+    sum_xx = np.bincount(index, weights = x * x, minlength = len(electrodes))
+    sum_xy = np.bincount(index, weights = x * y, minlength = len(electrodes))
+    sum_yy = np.bincount(index, weights = y * y, minlength = len(electrodes))
+
+    with np.errstate(divide = "ignore", invalid = "ignore") :
+        denominator = n * sum_xx - sum_x**2
+        slope = np.where((n >= 2) & (denominator > 0), (n * sum_xy - sum_x * sum_y) / denominator, np.nan) # F
+        intercept = (sum_y - slope * sum_x) / n
+
+        r_squared = (n * sum_xy - sum_x * sum_y)**2 / (denominator * (n * sum_yy - sum_y**2))
+
+    capacitance = slope * 1000 # mF
+    ecsa = capacitance / specific_capacitance
+
+    return pd.DataFrame(dict(zip(fit_columns, [electrodes, n, capacitance, intercept, r_squared, ecsa, ecsa / area_electrode])))
+
+
+def load_cyclovoltammetry(file_path) :
+    """ returns the columns of a cyclic voltammogram required for the scan rate series (see columns)
+    """
+    return pd.read_csv(file_path, delimiter = ";", usecols = lambda column : column in columns)
+
+
+def analyze_scan_rate_series(file_paths, potential = None, scan_rates = None, cycle = -1, specific_capacitance = 0.04, area_electrode = 1) :
+    """ evaluates the cycles of all files and fits the double-layer capacitance of each electrode
+
+        expected argument datatypes:
+        - file_paths : list/tuple
+        - potential : float/None (V vs Ag|AgCl, applied potential, default: middle of the potential range of each file)
+        - scan_rates : dict/None (contains the scan rate in mV/s as value and the file_path as key, default: from the file names)
+        - cycle, specific_capacitance, area_electrode : see function fit_double_layer_capacitance
+
+        returns the cycles (pandas.DataFrame, see cycle_columns) and the fits (pandas.DataFrame, see fit_columns),
+        files without scan rate are skipped
+    """
+    tables = []
+
+    for file_path in file_paths :
+        sample_name = os.path.basename(file_path).split(".txt")[0]
+
+        scan_rate = scan_rates.get(file_path) if scan_rates != None else get_scan_rate_from_sample_name(sample_name)
+
+        if scan_rate == None :
+            print(f"skipped {file_path}: scan rate not recognized (expected *_50mVs.txt)")
+            continue
+
+        tables.append(evaluate_cycles(load_cyclovoltammetry(file_path), sample_name, scan_rate, potential))
+
+    if len(tables) == 0 :
+        return pd.DataFrame(columns = cycle_columns), pd.DataFrame(columns = fit_columns)
+
+    cycles = pd.concat(tables, ignore_index = True)
+
+    return cycles, fit_double_layer_capacitance(cycles, cycle, specific_capacitance, area_electrode)
+
+
+
+if __name__ == "__main__" :
+    parser = argparse.ArgumentParser(description = "double-layer capacitance and ECSA of cyclic voltammograms at different scan rates")
+    parser.add_argument("folder", help = "folder with the cyclic voltammograms (*_<scan rate>mVs.txt, including subfolders)")
+    parser.add_argument("--output", required = True, help = "beginning of the paths of the result files")
+    parser.add_argument("--potential", type = float, default = None, help = "potential of the capacitive currents in V (default: middle of the range)")
+    parser.add_argument("--cycle", type = int, default = -1, help = "cycle used for the fit (default: last cycle)")
+    parser.add_argument("--specific-capacitance", type = float, default = 0.04, help = "specific capacitance in mF/cm² (default 0.04)")
+    parser.add_argument("--area", type = float, default = 1, help = "geometric area of the electrodes in cm² (default 1)")
+
+    args = parser.parse_args()
+
+    file_paths = sorted(os.path.join(root, file) for root, _, files in os.walk(args.folder) for file in files if file.endswith(".txt"))
+
+    cycles, fits = analyze_scan_rate_series(file_paths, args.potential, cycle = args.cycle, specific_capacitance = args.specific_capacitance,
+        area_electrode = args.area)
+
+    cycles.to_csv(f"{args.output}_Cycles.txt", sep = ";", index = None)
+    fits.to_csv(f"{args.output}_Fits.txt", sep = ";", index = None)
+
+    print(f"{len(cycles)} cycles of {cycles['Sample'].nunique()} files, {len(fits)} electrodes saved in {args.output}_Fits.txt")
+
+
+
+""" update list:
+
+Version 1.0.0 (19.10.2026)
+- capacitive currents (searchsorted over all branches) and charges (cumulative trapezoid) of each cycle of scan rate series,
+  C_dl, ECSA and roughness factor of all electrodes fitted in one pass
+"""
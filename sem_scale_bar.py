@@ -1,5 +1,5 @@
 """ SEM Scale Bar Tool by Pascal Reiß
-    Version 1.1.2
+    Version 1.1.4
 """
 
 from PIL import Image
@@ -18,6 +18,8 @@ from tkinter import filedialog
 import tkinter as tk
 from tkinter import ttk
 
+from instrumentation import stage, save_profile
+
 
 
 
@@ -352,7 +354,8 @@ class SEM_Image_Tool :
                       important data is found in first column)
                     - engine: python since C does not support the keyword on_bad_lines 
                 """
-                df = pd.read_csv(file_path, encoding = "ANSI", on_bad_lines = "skip", engine = "python")
+                with stage("load_metadata", program = self.program_name) :
+                    df = pd.read_csv(file_path, encoding = "ANSI", on_bad_lines = "skip", engine = "python")
 
                 """ get name of first column since all relevant informations are saved in that column 
                 """
@@ -424,9 +427,10 @@ class SEM_Image_Tool :
                     """ open the actual image from file_path and adding it a plt.figure 
                     """
 
-                    image = plt.imread(file_path)
+                    with stage("load_image", program = self.program_name) :
+                        image = plt.imread(file_path)
 
-                    self.ax.imshow(image) # add image to figure
+                        self.ax.imshow(image) # add image to figure
 
                     """ get font and scalbar properties for the determined resolution 
                     """
@@ -463,7 +467,37 @@ class SEM_Image_Tool :
 
                     self.undo_list = [(xlim, ylim)]
 
-                    self.preview_canvas.draw()
+                    with stage("draw", program = self.program_name) :
+                        self.preview_canvas.draw()
+
+
+    def run_headless_evaluation(self, file_path) :
+        """ processes a single image without GUI (used by watch_folder.py)
+            without GUI no tkinter canvas exists, so the figure is drawn on its own canvas
+            the processed image is saved in the evaluation folder
+
+            expected argument datatype:
+            - file_path : string
+
+            returns dict with the sample_name and the program_name
+        """
+        if not hasattr(self, "preview_canvas") :
+            self.preview_canvas = self.fig.canvas
+
+        self.check_for_evaluation_folder()
+
+        file_name = os.path.basename(file_path)
+        sample_name = file_name.split(".tif")[0]
+
+        with stage("process", file = sample_name, program = self.program_name) :
+            self.image_processing_from_path(file_path)
+
+        with stage("save", file = sample_name, program = self.program_name) :
+            self.fig.savefig(f"{self.path_evaluation_folder}\{sample_name}{self.figure_type}", dpi = self.figure_dpi, bbox_inches = "tight", pad_inches = 0)
+
+        save_profile(self.path_evaluation_folder, self.program_name)
+
+        return {"program_name" : self.program_name, "sample_name" : sample_name}
 
 
     def run_image_processing(self) :
@@ -485,10 +519,12 @@ class SEM_Image_Tool :
                 file_name = os.path.basename(file_path)
                 sample_name = file_name.split(".tif")[0]
 
-                self.image_processing_from_path(file_path)
+                with stage("process", file = sample_name, program = self.program_name) :
+                    self.image_processing_from_path(file_path)
 
-                if not self.preview_mode :
-                    self.fig.savefig(f"{self.path_evaluation_folder}\{sample_name}{self.figure_type}", dpi = self.figure_dpi, bbox_inches='tight',pad_inches = 0)
+                with stage("save", file = sample_name, program = self.program_name) :
+                    if not self.preview_mode :
+                        self.fig.savefig(f"{self.path_evaluation_folder}\{sample_name}{self.figure_type}", dpi = self.figure_dpi, bbox_inches='tight',pad_inches = 0)
 
 
 
@@ -503,6 +539,10 @@ class SEM_Image_Tool :
 
             if self.feedback_label != None :
                 self.feedback_label.config(text = "Image Processing Finished")
+
+            """ the recorded stages are saved in the evaluation folder if profiling is enabled (see instrumentation.py)
+            """
+            save_profile(self.path_evaluation_folder, self.program_name)
         
         elif self.feedback_label != None :
             self.feedback_label.config(text = "Please Select Your Raw Images First.")
@@ -1028,6 +1068,12 @@ Version 1.1.2 (04.04.2022) CTRL is important
 - added CTRL + K as shortcut for activating cropout function
 - added CTRL + R as shortcurt for running image processing (all files)
 - added CTRL + O as shortcut for opening files
+
+Version 1.1.3 (19.10.2026)
+- metadata/image loading, drawing and saving of each image are recorded if profiling is enabled (instrumentation.py)
+
+Version 1.1.4 (19.10.2026)
+- added run_headless_evaluation for the evaluation of single files without GUI (used by watch_folder.py)
 """
 
 """
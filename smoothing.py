@@ -0,0 +1,109 @@
+""" Savitzky-Golay Smoothing and Derivatives
+    Version 1.0.0
+
+    smooths data (spectra, sweeps) or calculates its derivatives by a local least squares polynomial fit of order in a moving window:
+    the value (or derivative) of the fitted polynomial at each data point is a fixed linear combination (kernel) of the data in the window
+
+    the kernels only depend on (window, order, derivative), they are calculated once and cached
+    the kernels are applied to the last axis of the data, so a whole batch of spectra or sweeps (e.g. samples x data points) is
+    smoothed at once, the first and last window // 2 data points are evaluated from the polynomial fit of the first and last window
+
+    the data has to be equidistant (delta : distance of the data points, only used for derivatives)
+    NaN values spread over the window around them
+
+    usage:
+        smoothed = savgol_filter(intensities, window = 11, order = 3)
+        derivative = savgol_filter(intensities, window = 11, order = 3, derivative = 1, delta = wave_number_spacing)
+"""
+
+from functools import lru_cache
+from math import factorial
+
+import numpy as np
+
+
+@lru_cache(maxsize = None)
+def get_savgol_kernels(window, order, derivative = 0) :
+    """ returns the Savitzky-Golay kernels (numpy.ndarray, read only) for the data points in the center of the window (window),
+        the first window // 2 data points (window // 2 x window) and the last window // 2 data points (window // 2 x window)
+        for delta = 1
+
+        expected argument datatypes:
+        - window : int (odd, larger than order)
+        - order : int (order of the polynomial)
+        - derivative : int (0 : smoothing, at most order)
+    """
+    if window % 2 != 1 or window <= order :
+        raise ValueError(f"window has to be odd and larger than order (window = {window}, order = {order})")
+
+    if derivative > order :
+        raise ValueError(f"derivative has to be at most order (derivative = {derivative}, order = {order})")
+
+    half = window // 2
+    positions = np.arange(-half, half + 1, dtype = np.float64)
+
+    """ polynomial coefficients of the least squares fit (order + 1 x window) and derivative of the polynomial at each position
+        of the window (window x order + 1), their product gives the kernel of each position (window x window)
+    """
+    fit = np.linalg.pinv(np.vander(positions, order + 1, increasing = True))
+
+    powers = np.arange(order + 1)
+    factors = np.array([factorial(power) / factorial(power - derivative) if power >= derivative else 0 for power in powers])
+
+    evaluation = factors * positions[:, np.newaxis]**np.maximum(powers - derivative, 0)
+
+    kernels = evaluation @ fit
+
+    center, head, tail = kernels[half].copy(), kernels[:half].copy(), kernels[half + 1:].copy()
+
+    for kernel in (center, head, tail) :
+        kernel.setflags(write = False)
+
+    return center, head, tail
+
+
+def savgol_filter(data, window, order, derivative = 0, delta = 1.0) :
+    """ returns the smoothed data or its derivative (numpy.ndarray, same shape as data) along the last axis of data
+        the window is reduced to the number of data points if the data is shorter
+
+        expected argument datatypes:
+        - data : numpy.ndarray/pandas.Series/list (data points or batch x data points)
+        - window : int (odd, number of data points of the moving window)
+        - order : int (order of the polynomial)
+        - derivative : int (0 : smoothing)
+        - delta : float (distance of the data points)
+    """
+    data = np.asarray(data, dtype = np.float64)
+
+    n = data.shape[-1]
+
+    if window > n :
+        window = n if n % 2 == 1 else n - 1
+
+    center, head, tail = get_savgol_kernels(window, order, derivative)
+
+    half = window // 2
+
+    """ center: sum of the shifted data weighted with the kernel (window passes over the whole batch)
+    """
+    result = np.empty_like(data)
+    result[..., half:n - half] = 0
+
+    for shift, weight in enumerate(center) :
+        result[..., half:n - half] += weight * data[..., shift:n - window + 1 + shift]
+
+    result[..., :half] = data[..., :window] @ head.T
+    result[..., n - half:] = data[..., n - window:] @ tail.T
+
+    if derivative > 0 :
+        result /= delta**derivative
+
+    return result
+
+
+
+""" update list:
+
+Version 1.0.0 (19.10.2026)
+- Savitzky-Golay smoothing and derivatives with cached kernels per (window, order, derivative), applied to batches of spectra or sweeps
+"""
@@ -0,0 +1,251 @@
+""" Randomized PCA and Clustering of Infrared Spectra
+    Version 1.0.0
+
+    groups many spectra (e.g. of a synthesis screening) by similarity:
+    - the normalized spectra of a spectral cube (see spectral_cube.py) are centered and reduced to n_components principal components
+      by a randomized truncated SVD (Halko et al., SIAM Review 53, 2011, 217-288)
+    - the scores of the spectra are clustered by mini-batch k-means (Sculley, WWW 2010, 1177-1178)
+
+    the cube is streamed in blocks of rows (block_size spectra), so the spectral matrix is never loaded into memory as a whole,
+    only the sketch (spectra x (n_components + n_oversamples)) and the scores are kept in memory
+    each power iteration reads the cube twice, in total the cube is read 3 + 2 n_power_iterations times
+    wave numbers outside the measured range of a spectrum (NaN) are set to the mean spectrum
+
+    usage:
+        cube = Spectral_Cube(f"{path_evaluation_folder}\Spectral_Cube_0")
+        pca = get_randomized_pca(cube, n_components = 10)
+        labels, centers = minibatch_kmeans(pca["scores"], n_clusters = 5)
+
+    usage (from the folder of CS_Analysis_Tool.py):
+        python spectral_clustering.py "D:\\OPUS\\Spectral_Cube" --components 10 --clusters 5 --output "D:\\OPUS\\Spectral_Clustering"
+"""
+
+import argparse
+import numpy as np
+import pandas as pd
+
+from spectral_cube import Spectral_Cube
+
+
+block_size = 4096 # number of spectra read from the cube at once
+
+
+def get_blocks(n_rows) :
+    return [slice(start, min(start + block_size, n_rows)) for start in range(0, n_rows, block_size)]
+
+
+def get_centered_block(cube, rows, mean) :
+    """ returns the normalized intensities of the rows minus the mean spectrum (numpy.ndarray, float32), NaN are set to 0
+    """
+    block = cube.get_normalized_intensities(rows)
+    block -= mean
+
+    return np.nan_to_num(block, copy = False)
+
+
+def get_randomized_pca(cube, n_components = 10, n_oversamples = 10, n_power_iterations = 2, seed = 0) :
+    """ returns the principal components of the normalized spectra of the cube by a randomized truncated SVD
+        of the centered matrix X (spectra x wave numbers):
+        - sketch Y = X Ω with a gaussian random matrix Ω (wave numbers x (n_components + n_oversamples))
+        - power iterations Y = X (Xᵀ Q) with the orthonormal basis Q of Y (for slowly decaying singular values)
+        - B = Qᵀ X is small ((n_components + n_oversamples) x wave numbers), its SVD gives the scores Q U S and the loadings Vᵀ
+
+        expected argument datatypes:
+        - cube : Spectral_Cube
+        - n_components : int
+        - n_oversamples : int (additional dimensions of the sketch, improve the accuracy)
+        - n_power_iterations : int
+        - seed : int
+
+        returns dict with
+        - "mean" : numpy.ndarray (mean normalized spectrum, wave numbers)
+        - "scores" : numpy.ndarray (spectra x n_components)
+        - "loadings" : numpy.ndarray (n_components x wave numbers)
+        - "explained_variance_ratio" : numpy.ndarray (n_components, fraction of the total variance of each component)
+    """
+    n_rows, n_columns = len(cube), len(cube.wave_numbers)
+    blocks = get_blocks(n_rows)
+
+    n_components = min(n_components, n_rows, n_columns)
+    n_sketch = min(n_components + n_oversamples, n_rows, n_columns)
+
+    """ mean normalized spectrum (NaN are ignored)
+    """
+    total = np.zeros(n_columns)
+    count = np.zeros(n_columns)
+
+    for rows in blocks :
+        block = cube.get_normalized_intensities(rows)
+        total += np.nansum(block, axis = 0, dtype = np.float64)
+        count += np.sum(~np.isnan(block), axis = 0)
+
+    mean = (total / np.maximum(count, 1)).astype(np.float32)
+
+    """ sketch of the range of X and total sum of squares of the centered spectra
+    """
+    rng = np.random.default_rng(seed)
+    omega = rng.standard_normal((n_columns, n_sketch)).astype(np.float32)
+
+    sketch = np.empty((n_rows, n_sketch), dtype = np.float64)
+    total_sum_of_squares = 0
+
+    for rows in blocks :
+        block = get_centered_block(cube, rows, mean)
+        sketch[rows] = block @ omega
+        total_sum_of_squares += np.sum(block.astype(np.float64)**2)
+
+    for iteration in range(n_power_iterations) :
+        basis, _ = np.linalg.qr(sketch)
+
+        projection = np.zeros((n_columns, n_sketch))
+        for rows in blocks :
+            projection += get_centered_block(cube, rows, mean).T @ basis[rows].astype(np.float32)
+
+        projection, _ = np.linalg.qr(projection)
+        projection = projection.astype(np.float32)
+
+        for rows in blocks :
+            sketch[rows] = get_centered_block(cube, rows, mean) @ projection
+
+    basis, _ = np.linalg.qr(sketch)
+
+    small_matrix = np.zeros((n_sketch, n_columns))
+    for rows in blocks :
+        small_matrix += basis[rows].T.astype(np.float32) @ get_centered_block(cube, rows, mean)
+
+    U, singular_values, loadings = np.linalg.svd(small_matrix, full_matrices = False)
+
+    scores = basis @ (U[:, :n_components] * singular_values[:n_components])
+
+    return {"mean" : mean.astype(np.float64),
+            "scores" : scores,
+            "loadings" : loadings[:n_components],
+            "explained_variance_ratio" : singular_values[:n_components]**2 / max(total_sum_of_squares, np.finfo(float).tiny)}
+
+
+def get_nearest_centers(points, centers) :
+    """ returns the index of the nearest center (numpy.ndarray, int) and the squared distance to it for each point
+    """
+    distances = (np.sum(points**2, axis = 1)[:, np.newaxis] - 2 * points @ centers.T + np.sum(centers**2, axis = 1)[np.newaxis, :])
+    labels = np.argmin(distances, axis = 1)
+
+    return labels, np.maximum(distances[np.arange(len(points)), labels], 0)
+
+
+def minibatch_kmeans(points, n_clusters = 5, batch_size = 1024, n_iterations = 100, seed = 0) :
+    """ clusters the points by mini-batch k-means: each iteration assigns a random batch of points to the nearest centers and moves
+        each center towards the mean of its assigned points with the learning rate 1 / (number of points assigned to it so far)
+        the centers are initialized by k-means++ on a sample of the points
+
+        expected argument datatypes:
+        - points : numpy.ndarray (points x dimensions, e.g. the scores of the randomized PCA)
+        - n_clusters : int
+        - batch_size : int
+        - n_iterations : int
+        - seed : int
+
+        returns the cluster labels (numpy.ndarray, points) and the centers (numpy.ndarray, n_clusters x dimensions)
+    """
+    points = np.asarray(points, dtype = np.float64)
+    n_points = len(points)
+    n_clusters = min(n_clusters, n_points)
+
+    rng = np.random.default_rng(seed)
+
+    """ k-means++ initialization: the next center is drawn with a probability proportional to the squared distance to the nearest center
+    """
+    sample = points[rng.choice(n_points, min(n_points, 10 * batch_size), replace = False)]
+
+    centers = [sample[rng.integers(len(sample))]]
+    distances = np.sum((sample - centers[0])**2, axis = 1)
+
+    for k in range(1, n_clusters) :
+        probabilities = distances / distances.sum() if distances.sum() > 0 else None
+        centers.append(sample[rng.choice(len(sample), p = probabilities)])
+        distances = np.minimum(distances, np.sum((sample - centers[-1])**2, axis = 1))
+
+    centers = np.array(centers)
+    counts = np.zeros(n_clusters)
+
+    for iteration in range(n_iterations) :
+        batch = points[rng.integers(0, n_points, min(batch_size, n_points))]
+        labels, _ = get_nearest_centers(batch, centers)
+
+        batch_counts = np.bincount(labels, minlength = n_clusters)
+        batch_sums = np.zeros_like(centers)
+        np.add.at(batch_sums, labels, batch)
+
+        counts += batch_counts
+
+        assigned = batch_counts > 0
+        centers[assigned] += (batch_sums[assigned] - batch_counts[assigned, np.newaxis] * centers[assigned]) / counts[assigned, np.newaxis]
+
+    labels = np.empty(n_points, dtype = np.int64)
+
+    for rows in get_blocks(n_points) :
+        labels[rows], _ = get_nearest_centers(points[rows], centers)
+
+    return labels, centers
+
+
+def cluster_spectra(cube, n_components = 10, n_clusters = 5, **settings) :
+    """ randomized PCA of the normalized spectra of the cube and mini-batch k-means of the scores
+
+        expected argument datatypes:
+        - cube : Spectral_Cube
+        - n_components, n_clusters : int
+        - settings : n_oversamples, n_power_iterations and seed (see function get_randomized_pca)
+
+        returns the scores (pandas.DataFrame: Sample, PC1, ..., Cluster), the loadings (pandas.DataFrame: Wave Number, PC1, ...)
+        and the explained variance ratio (pandas.DataFrame: Component, Explained Variance Ratio)
+    """
+    pca = get_randomized_pca(cube, n_components, **settings)
+
+    labels, centers = minibatch_kmeans(pca["scores"], n_clusters, seed = settings.get("seed", 0))
+
+    components = [f"PC{k + 1}" for k in range(pca["scores"].shape[1])]
+
+    scores = pd.DataFrame(pca["scores"], columns = components)
+    scores.insert(0, "Sample", cube.sample_names)
+    scores["Cluster"] = labels + 1
+
+    loadings = pd.DataFrame(pca["loadings"].T, columns = components)
+    loadings.insert(0, "Wave Number (cm^-1)", cube.wave_numbers)
+
+    explained_variance = pd.DataFrame({"Component" : components, "Explained Variance Ratio" : pca["explained_variance_ratio"]})
+
+    return scores, loadings, explained_variance
+
+
+def save_clustering(path, scores, loadings, explained_variance) :
+    """ saves the results of cluster_spectra as {path}_Scores.txt, {path}_Loadings.txt and {path}_Explained_Variance.txt
+    """
+    scores.to_csv(f"{path}_Scores.txt", sep = ";", index = None)
+    loadings.to_csv(f"{path}_Loadings.txt", sep = ";", index = None)
+    explained_variance.to_csv(f"{path}_Explained_Variance.txt", sep = ";", index = None)
+
+
+
+if __name__ == "__main__" :
+    parser = argparse.ArgumentParser(description = "randomized PCA and mini-batch k-means of the spectra of a spectral cube")
+    parser.add_argument("cube", help = "path of the spectral cube without file ending (see spectral_cube.py)")
+    parser.add_argument("--output", required = True, help = "beginning of the paths of the result files")
+    parser.add_argument("--components", type = int, default = 10, help = "number of principal components (default 10)")
+    parser.add_argument("--clusters", type = int, default = 5, help = "number of clusters (default 5)")
+
+    args = parser.parse_args()
+
+    cube = Spectral_Cube(args.cube)
+
+    scores, loadings, explained_variance = cluster_spectra(cube, args.components, args.clusters)
+    save_clustering(args.output, scores, loadings, explained_variance)
+
+    print(f"{len(cube)} spectra in {scores['Cluster'].nunique()} clusters, explained variance {explained_variance['Explained Variance Ratio'].sum():.3f}")
+
+
+
+""" update list:
+
+Version 1.0.0 (19.10.2026)
+- randomized truncated SVD of the normalized spectra streamed in blocks of a spectral cube and mini-batch k-means of the scores
+"""
@@ -0,0 +1,241 @@
+""" Spectral Cube of Infrared Spectra
+    Version 1.0.2
+
+    stores many infrared spectra (.dpt) as one float32 matrix (spectra x wave numbers) on a shared wave number grid
+    the matrix is saved as raw binary file ({name}.f32) and opened as numpy.memmap, so only the rows in use are read from the disk
+    the sidecar index ({name}.json) contains the wave number grid, the sample_names and the file_paths of the rows
+
+    each spectrum is parsed once when it is added and resampled (linear interpolation) onto the grid,
+    wave numbers outside the measured range of a spectrum are NaN
+    normalization and local minima of all spectra are then calculated as whole-matrix operations without parsing the files again
+
+    usage:
+        cube = Spectral_Cube.create(f"{path_evaluation_folder}\Spectral_Cube_0", file_paths)
+        cube = Spectral_Cube(f"{path_evaluation_folder}\Spectral_Cube_0")
+        cube.add_spectra(new_file_paths)
+        normalized_intensities = cube.get_normalized_intensities()
+        local_minima = cube.get_local_minima(0.4)
+
+    usage (from the folder of CS_Analysis_Tool.py):
+        python spectral_cube.py "D:\\OPUS" --output "D:\\OPUS\\Spectral_Cube"
+"""
+
+import os
+import json
+import argparse
+import numpy as np
+
+from dpt_reader import read_dpt, get_sample_name
+
+
+dtype = np.float32
+
+
+def load_spectrum(file_path) :
+    """ returns the wave numbers and intensities (numpy.ndarray, sorted by ascending wave number) of a .dpt file
+        (tab separated columns wave number and intensity as exported by OPUS)
+    """
+    return read_dpt(file_path, ascending = True)
+
+
+def get_default_grid(file_path) :
+    """ returns the wave number grid (numpy.ndarray) of the first spectrum: equidistant between its lowest and highest wave number
+        with the same number of points (spectra of the same instrument and method share this grid)
+    """
+    wave_numbers, _ = load_spectrum(file_path)
+
+    return np.linspace(wave_numbers[0], wave_numbers[-1], len(wave_numbers))
+
+
+class Spectral_Cube :
+
+    def __init__(self, path) :
+        """ initiate Spectral_Cube class object of an existing cube with the following attributes:
+            - self.path
+                (string: path of the cube without file ending, the matrix is saved as {path}.f32 and the index as {path}.json)
+            - self.wave_numbers
+                (numpy.ndarray: ascending wave number grid of all spectra in cm^-1)
+            - self.sample_names and self.file_paths
+                (list: contains the sample_name and file_path of each row of the matrix)
+            - self.rows
+                (dict: contains the row of each spectrum as value and the sample_name as key)
+            - self.intensities
+                (numpy.memmap: float32 matrix (spectra x wave numbers) of the intensities, read only, None if the cube is empty)
+
+            expected argument datatype:
+            - path : string
+        """
+        self.path = path
+
+        with open(f"{path}.json", encoding = "utf-8") as file :
+            index = json.load(file)
+
+        self.wave_numbers = np.array(index["wave_numbers"], dtype = np.float64)
+        self.sample_names = index["sample_names"]
+        self.file_paths = index["file_paths"]
+
+        self.rows = {sample_name : row for row, sample_name in enumerate(self.sample_names)}
+
+        self.open_intensities()
+
+
+    @classmethod
+    def create(cls, path, file_paths, wave_numbers = None) :
+        """ creates a new cube (an existing cube at path is overwritten) and adds the spectra of file_paths
+            the grid of the first spectrum is used if no wave_numbers are given (see function get_default_grid)
+
+            expected argument datatypes:
+            - path : string (without file ending)
+            - file_paths : list/tuple
+            - wave_numbers : numpy.ndarray/list/None (cm^-1)
+
+            returns Spectral_Cube
+        """
+        if wave_numbers is None :
+            wave_numbers = get_default_grid(file_paths[0])
+
+        wave_numbers = np.sort(np.asarray(wave_numbers, dtype = np.float64))
+
+        open(f"{path}.f32", "wb").close()
+
+        with open(f"{path}.json", "w", encoding = "utf-8") as file :
+            json.dump({"wave_numbers" : wave_numbers.tolist(), "sample_names" : [], "file_paths" : []}, file)
+
+        cube = cls(path)
+        cube.add_spectra(file_paths)
+
+        return cube
+
+
+    def __len__(self) :
+        return len(self.sample_names)
+
+
+    def open_intensities(self) :
+        """ opens the matrix file as numpy.memmap (shape: spectra x wave numbers)
+        """
+        if len(self.sample_names) == 0 :
+            self.intensities = None
+        else :
+            self.intensities = np.memmap(f"{self.path}.f32", dtype = dtype, mode = "r", shape = (len(self.sample_names), len(self.wave_numbers)))
+
+
+    def save_index(self) :
+        with open(f"{self.path}.json", "w", encoding = "utf-8") as file :
+            json.dump({"wave_numbers" : self.wave_numbers.tolist(), "sample_names" : self.sample_names, "file_paths" : self.file_paths}, file)
+
+
+    def add_spectra(self, file_paths) :
+        """ parses the spectra, resamples them onto the wave number grid and appends them as rows to the matrix file
+            spectra already in the cube (same sample_name) are skipped, the index is saved after all spectra were added
+
+            expected argument datatype:
+            - file_paths : list/tuple
+
+            returns the number of added spectra
+        """
+        """ close the memmap before the file is extended
+        """
+        self.intensities = None
+
+        added = 0
+
+        with open(f"{self.path}.f32", "ab") as file :
+            for file_path in file_paths :
+                sample_name = get_sample_name(file_path)
+
+                if sample_name in self.rows :
+                    continue
+
+                wave_numbers, intensities = load_spectrum(file_path)
+
+                row = np.interp(self.wave_numbers, wave_numbers, intensities, left = np.nan, right = np.nan)
+                file.write(row.astype(dtype).tobytes())
+
+                self.rows[sample_name] = len(self.sample_names)
+                self.sample_names.append(sample_name)
+                self.file_paths.append(os.path.abspath(file_path))
+                added += 1
+
+        self.save_index()
+        self.open_intensities()
+
+        return added
+
+
+    def get_spectrum(self, sample_name) :
+        """ returns the intensities (numpy.ndarray, float32) of a sample on the wave number grid
+        """
+        return np.array(self.intensities[self.rows[sample_name]])
+
+
+    def get_normalized_intensities(self, rows = slice(None)) :
+        """ returns the intensities of the rows normalized between 0 and 1 (numpy.ndarray, float32, rows x wave numbers)
+            by intensity = (intensity - min-intensity) / (max-intensity - min-intensity) of each spectrum (NaN are ignored)
+            same normalization as Infrared_Analysis.get_normalized_intensity for all spectra at once
+
+            expected argument datatype:
+            - rows : slice/list/numpy.ndarray (rows of the matrix, e.g. slice(0, 1000) to limit the memory for large cubes)
+        """
+        intensities = np.array(self.intensities[rows], dtype = dtype, ndmin = 2)
+
+        minimum = np.nanmin(intensities, axis = 1, keepdims = True)
+        maximum = np.nanmax(intensities, axis = 1, keepdims = True)
+
+        intensities -= minimum
+        intensities /= maximum - minimum
+
+        return intensities
+
+
+    def get_local_minima(self, local_min_threshold, rows = slice(None)) :
+        """ returns a boolean matrix (rows x wave numbers), which is True at the local minima of the normalized intensities
+            a local minimum is at most local_min_threshold and not higher than both neighbors
+            (same criterion as Infrared_Analysis.get_local_min_pos for all spectra at once)
+
+            expected argument datatypes:
+            - local_min_threshold : float (between 0 and 1)
+            - rows : slice/list/numpy.ndarray
+        """
+        intensities = self.get_normalized_intensities(rows)
+
+        center = intensities[:, 1:-1]
+
+        local_minima = np.zeros(intensities.shape, dtype = bool)
+        local_minima[:, 1:-1] = (center <= local_min_threshold) & (center <= intensities[:, :-2]) & (center <= intensities[:, 2:])
+
+        return local_minima
+
+
+
+if __name__ == "__main__" :
+    parser = argparse.ArgumentParser(description = "resamples all .dpt spectra of a folder onto a shared wave number grid and saves them as spectral cube")
+    parser.add_argument("folder", help = "folder with .dpt files (including subfolders)")
+    parser.add_argument("--output", required = True, help = "path of the cube without file ending, an existing cube is extended")
+
+    args = parser.parse_args()
+
+    file_paths = sorted(os.path.join(root, file) for root, _, files in os.walk(args.folder) for file in files if file.endswith(".dpt"))
+
+    if os.path.exists(f"{args.output}.json") :
+        cube = Spectral_Cube(args.output)
+        added = cube.add_spectra(file_paths)
+    else :
+        cube = Spectral_Cube.create(args.output, file_paths)
+        added = len(cube)
+
+    print(f"{added} spectra added, {len(cube)} spectra x {len(cube.wave_numbers)} wave numbers in {args.output}.f32")
+
+
+
+""" update list:
+
+Version 1.0.0 (19.10.2026)
+- float32 matrix of infrared spectra on a shared wave number grid saved as memory-mapped file with sidecar index
+
+Version 1.0.1 (19.10.2026)
+- load_spectrum uses read_dpt (see dpt_reader.py)
+
+Version 1.0.2 (19.10.2026)
+- get_sample_name imported from dpt_reader.py instead of a copy of the function
+"""
\ No newline at end of file
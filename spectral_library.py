@@ -0,0 +1,312 @@
+""" Spectral Library Search of Infrared Spectra
+    Version 1.0.0
+
+    identifies measured spectra by their similarity to reference spectra (e.g. carbonates, hydroxides, oxides)
+    the reference spectra are resampled onto a shared wave number grid (see spectral_cube.py) and saved as one contiguous float32
+    matrix of L2-normalized feature vectors ({name}.npy), the sidecar index ({name}.json) contains the reference names and settings
+
+    metrics:
+    - cosine : cosine similarity of the normalized intensities (see Infrared_Analysis.get_normalized_intensity)
+    - derivative : correlation of the first derivatives of the normalized intensities (insensitive to baseline offsets)
+
+    the feature vectors can be compressed to n_components dimensions by PCA or a gaussian random projection
+    the similarities of a batch of query spectra to all references are a single matrix multiply (queries x references),
+    queries are processed in chunks to limit the memory for large libraries
+
+    usage:
+        library = Spectral_Library.build(f"{path}\Reference_Library", reference_file_paths, metric = "derivative", compression = "pca")
+        library = Spectral_Library(f"{path}\Reference_Library")
+        results = library.search_files(file_paths, k = 5)
+
+    usage (from the folder of CS_Analysis_Tool.py):
+        python spectral_library.py build "D:\\References" --output "D:\\References\\Reference_Library" --metric derivative --compression pca
+        python spectral_library.py search "D:\\References\\Reference_Library" sample_1.dpt sample_2.dpt --k 5
+"""
+
+import os
+import json
+import argparse
+import numpy as np
+import pandas as pd
+
+from spectral_cube import Spectral_Cube, load_spectrum, get_sample_name
+
+
+metrics = ["cosine", "derivative"]
+compressions = [None, "pca", "random"]
+
+chunk_size = 4096 # number of spectra preprocessed at once
+max_similarities = 5 * 10**7 # maximum number of similarities (queries x references) in memory at once
+
+
+def get_feature_vectors(intensities, metric) :
+    """ returns the L2-normalized feature vectors (numpy.ndarray, float32, spectra x features) of intensities on the wave number grid
+        wave numbers outside the measured range (NaN) do not contribute to the similarity
+
+        expected argument datatypes:
+        - intensities : numpy.ndarray (spectra x wave numbers)
+        - metric : string ("cosine" or "derivative")
+    """
+    if metric not in metrics :
+        raise ValueError(f"unknown metric {metric}, expected one of {metrics}")
+
+    intensities = np.array(intensities, dtype = np.float32, ndmin = 2)
+
+    minimum = np.nanmin(intensities, axis = 1, keepdims = True)
+    maximum = np.nanmax(intensities, axis = 1, keepdims = True)
+
+    with np.errstate(divide = "ignore", invalid = "ignore") :
+        intensities = (intensities - minimum) / (maximum - minimum)
+
+    if metric == "derivative" :
+        intensities = np.diff(intensities, axis = 1)
+        intensities -= np.nanmean(intensities, axis = 1, keepdims = True)
+
+    intensities = np.nan_to_num(intensities, nan = 0, posinf = 0, neginf = 0)
+
+    return get_unit_vectors(intensities)
+
+
+def get_unit_vectors(vectors) :
+    """ returns the vectors divided by their L2 norm (zero vectors are kept)
+    """
+    norms = np.linalg.norm(vectors, axis = 1, keepdims = True)
+    norms[norms == 0] = 1
+
+    return vectors / norms
+
+
+class Spectral_Library :
+
+    def __init__(self, path, in_memory = True) :
+        """ initiate Spectral_Library class object of an existing library with the following attributes:
+            - self.path
+                (string: path of the library without file ending)
+            - self.wave_numbers
+                (numpy.ndarray: wave number grid of the references in cm^-1)
+            - self.sample_names and self.file_paths
+                (list: contains the name and file_path of the reference of each row of self.vectors)
+            - self.metric and self.compression
+                (string/None: settings of the library, see module docstring)
+            - self.mean and self.components
+                (numpy.ndarray/None: mean feature vector and projection matrix (features x n_components) of a compressed library)
+            - self.vectors
+                (numpy.ndarray: float32 matrix (references x features) of the L2-normalized feature vectors)
+
+            expected argument datatypes:
+            - path : string
+            - in_memory : boolean (load the vectors into memory, otherwise they are memory-mapped)
+        """
+        self.path = path
+
+        with open(f"{path}.json", encoding = "utf-8") as file :
+            index = json.load(file)
+
+        self.wave_numbers = np.array(index["wave_numbers"], dtype = np.float64)
+        self.sample_names = index["sample_names"]
+        self.file_paths = index["file_paths"]
+        self.metric = index["metric"]
+        self.compression = index["compression"]
+
+        self.mean, self.components = None, None
+
+        if self.compression != None :
+            projection = np.load(f"{path}_projection.npz")
+            self.mean, self.components = projection["mean"], projection["components"]
+
+        self.vectors = np.load(f"{path}.npy", mmap_mode = None if in_memory else "r")
+
+
+    @classmethod
+    def build(cls, path, references, metric = "cosine", compression = None, n_components = 64, wave_numbers = None, seed = 0) :
+        """ builds a new library from reference spectra (an existing library at path is overwritten)
+            .dpt files are first resampled onto the wave number grid and saved as spectral cube ({path}_cube, see spectral_cube.py),
+            so each file is parsed once, the feature vectors are calculated in chunks of the memory-mapped cube
+
+            expected argument datatypes:
+            - path : string (without file ending)
+            - references : list/tuple (file_paths of the reference .dpt files) or Spectral_Cube
+            - metric : string ("cosine" or "derivative")
+            - compression : string/None ("pca", "random" or None)
+            - n_components : int (dimensions of a compressed library)
+            - wave_numbers : numpy.ndarray/None (grid of the cube, default: grid of the first reference)
+            - seed : int (seed of the random projection)
+
+            returns Spectral_Library
+        """
+        if compression not in compressions :
+            raise ValueError(f"unknown compression {compression}, expected one of {compressions}")
+
+        if isinstance(references, Spectral_Cube) :
+            cube = references
+        else :
+            cube = Spectral_Cube.create(f"{path}_cube", references, wave_numbers)
+
+        n_references = len(cube)
+        chunks = [slice(start, min(start + chunk_size, n_references)) for start in range(0, n_references, chunk_size)]
+
+        n_features = len(cube.wave_numbers) - (1 if metric == "derivative" else 0)
+
+        mean, components = None, None
+
+        if compression == "pca" :
+            """ principal components from the covariance matrix (features x features) summed over the chunks
+            """
+            mean = np.zeros(n_features)
+            for chunk in chunks :
+                mean += get_feature_vectors(cube.intensities[chunk], metric).sum(axis = 0, dtype = np.float64)
+            mean /= n_references
+
+            covariance = np.zeros((n_features, n_features))
+            for chunk in chunks :
+                vectors = get_feature_vectors(cube.intensities[chunk], metric) - mean.astype(np.float32)
+                covariance += vectors.T.astype(np.float64) @ vectors
+
+            eigenvalues, eigenvectors = np.linalg.eigh(covariance)
+            components = eigenvectors[:, ::-1][:, :min(n_components, n_features)]
+
+        elif compression == "random" :
+            rng = np.random.default_rng(seed)
+
+            mean = np.zeros(n_features)
+            components = rng.standard_normal((n_features, n_components)) / np.sqrt(n_components)
+
+        n_dimensions = n_features if components is None else components.shape[1]
+
+        vectors = np.lib.format.open_memmap(f"{path}.npy", mode = "w+", dtype = np.float32, shape = (n_references, n_dimensions))
+
+        for chunk in chunks :
+            chunk_vectors = get_feature_vectors(cube.intensities[chunk], metric)
+
+            if components is not None :
+                chunk_vectors = get_unit_vectors((chunk_vectors - mean.astype(np.float32)) @ components.astype(np.float32))
+
+            vectors[chunk] = chunk_vectors
+
+        vectors.flush()
+        del vectors
+
+        if components is not None :
+            np.savez(f"{path}_projection.npz", mean = mean.astype(np.float32), components = components.astype(np.float32))
+
+        with open(f"{path}.json", "w", encoding = "utf-8") as file :
+            json.dump({"wave_numbers" : cube.wave_numbers.tolist(), "sample_names" : cube.sample_names, "file_paths" : cube.file_paths,
+                       "metric" : metric, "compression" : compression}, file)
+
+        return cls(path)
+
+
+    def __len__(self) :
+        return len(self.sample_names)
+
+
+    def get_query_vectors(self, intensities) :
+        """ returns the (compressed) feature vectors of query intensities on the wave number grid of the library
+        """
+        vectors = get_feature_vectors(intensities, self.metric)
+
+        if self.components is not None :
+            vectors = get_unit_vectors((vectors - self.mean) @ self.components)
+
+        return vectors
+
+
+    def search(self, intensities, k = 5) :
+        """ returns the indices of the k most similar references (numpy.ndarray, queries x k, most similar first) and their similarities
+            (cosine of the feature vectors, between -1 and 1) for each query spectrum
+
+            expected argument datatypes:
+            - intensities : numpy.ndarray (queries x wave numbers, on the grid self.wave_numbers)
+            - k : int
+        """
+        vectors = self.get_query_vectors(intensities)
+
+        k = min(k, len(self))
+        n_queries = len(vectors)
+
+        indices = np.empty((n_queries, k), dtype = np.int64)
+        similarities = np.empty((n_queries, k), dtype = np.float32)
+
+        query_chunk_size = max(1, max_similarities // max(len(self), 1))
+
+        for start in range(0, n_queries, query_chunk_size) :
+            stop = min(start + query_chunk_size, n_queries)
+
+            chunk_similarities = vectors[start:stop] @ self.vectors.T
+
+            """ k largest similarities of each query (unsorted), sorted afterwards
+            """
+            top = np.argpartition(chunk_similarities, len(self) - k, axis = 1)[:, -k:]
+            top_similarities = np.take_along_axis(chunk_similarities, top, axis = 1)
+
+            order = np.argsort(-top_similarities, axis = 1)
+
+            indices[start:stop] = np.take_along_axis(top, order, axis = 1)
+            similarities[start:stop] = np.take_along_axis(top_similarities, order, axis = 1)
+
+        return indices, similarities
+
+
+    def search_files(self, file_paths, k = 5) :
+        """ resamples the query spectra onto the grid of the library and searches the k most similar references of each spectrum
+
+            expected argument datatypes:
+            - file_paths : list/tuple (.dpt files)
+            - k : int
+
+            returns pandas.DataFrame with the columns sample_name, rank (1 = most similar), reference and similarity
+        """
+        intensities = np.empty((len(file_paths), len(self.wave_numbers)), dtype = np.float32)
+
+        for row, file_path in enumerate(file_paths) :
+            wave_numbers, intensity = load_spectrum(file_path)
+            intensities[row] = np.interp(self.wave_numbers, wave_numbers, intensity, left = np.nan, right = np.nan)
+
+        indices, similarities = self.search(intensities, k)
+
+        k = indices.shape[1]
+
+        return pd.DataFrame({"sample_name" : np.repeat([get_sample_name(file_path) for file_path in file_paths], k),
+                             "rank" : np.tile(np.arange(1, k + 1), len(file_paths)),
+                             "reference" : np.array(self.sample_names, dtype = object)[indices.ravel()],
+                             "similarity" : similarities.ravel()})
+
+
+
+if __name__ == "__main__" :
+    parser = argparse.ArgumentParser(description = "builds a reference library of infrared spectra or searches spectra in it")
+    subparsers = parser.add_subparsers(dest = "command", required = True)
+
+    build_parser = subparsers.add_parser("build", help = "build a library from all .dpt files of a folder (including subfolders)")
+    build_parser.add_argument("folder")
+    build_parser.add_argument("--output", required = True, help = "path of the library without file ending")
+    build_parser.add_argument("--metric", choices = metrics, default = "cosine")
+    build_parser.add_argument("--compression", choices = ["pca", "random"], default = None)
+    build_parser.add_argument("--components", type = int, default = 64, help = "dimensions of a compressed library (default 64)")
+
+    search_parser = subparsers.add_parser("search", help = "search the most similar references of .dpt files")
+    search_parser.add_argument("library", help = "path of the library without file ending")
+    search_parser.add_argument("file_paths", nargs = "+")
+    search_parser.add_argument("--k", type = int, default = 5)
+
+    args = parser.parse_args()
+
+    if args.command == "build" :
+        file_paths = sorted(os.path.join(root, file) for root, _, files in os.walk(args.folder) for file in files if file.endswith(".dpt"))
+
+        library = Spectral_Library.build(args.output, file_paths, metric = args.metric, compression = args.compression, n_components = args.components)
+
+        print(f"{len(library)} references with {library.vectors.shape[1]} features saved in {args.output}.npy")
+    else :
+        library = Spectral_Library(args.library)
+
+        print(library.search_files(args.file_paths, k = args.k).to_string(index = False))
+
+
+
+""" update list:
+
+Version 1.0.0 (19.10.2026)
+- reference library of L2-normalized feature vectors (optionally compressed by PCA or random projection) with top-k search of
+  a batch of spectra in a single matrix multiply
+"""
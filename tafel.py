@@ -1,5 +1,5 @@
 """ Tafel Analysis Tool by Pascal Reiß
-    Version 1.0.3
+    Version 1.0.21
 """
 
 import os
@@ -12,6 +12,17 @@ import matplotlib.pyplot as plt
 from matplotlib.widgets import SpanSelector
 from datetime import datetime
 
+from plot_decimation import scatter_decimated
+from instrumentation import stage, save_profile
+from results_store import store_results
+from results_table import Results_Table
+from bootstrap import bootstrap_linear_fit, get_confidence_interval
+from robust_fit import theil_sen_fit
+from dataflow import Dataflow_Graph
+from replay_fits import save_fit_windows
+from batch_table import Batch_Table
+from smoothing import savgol_filter
+
 
 
 class Tafel_Analysis :
@@ -38,6 +49,15 @@ class Tafel_Analysis :
             - self.active_frames: 
                 (list: contains all active tkinter.Frames created during the evaluation process (like frame which contains
                 all results for each sample) so those can be closed if new files are selected)
+            - self.sample_graphs
+                (dict: contains the dataflow graphs (see function self.get_sample_graph) of all samples of the current evaluation
+                as values with the file_paths as keys, changed parameters are passed on to those by self.update_sample_graphs)
+            - self.save_changed_samples
+                (function/None: saves the samples of the current evaluation, which were changed by self.update_sample_graphs,
+                and adds them to the batch table again (see function self.run_evaluation), default setting: None)
+            - self.save_batch_table
+                (function/None: writes the batch table of the current evaluation, which is only written after all samples were
+                evaluated and if the User saves it in the GUI (see function self.run_evaluation), default setting: None)
             - self.program_frame
                 (tkinter.Frame: contains all widgets/function necassary for the evaluation with the GUI interface (tkinter.Tk))
             - self.feedback_label
@@ -46,6 +66,11 @@ class Tafel_Analysis :
                 (boolean: contains state if figures shall be saved or not
                 state can be changed by User in the GUI
                 default setting: False)
+            - self.save_sample_files
+                (boolean: contains state if the evaluated data of each sample shall be saved as separate txt file in addition to the
+                batch table of the evaluation (see batch_table.py)
+                state can be changed by User in the GUI
+                default setting: False)
         """
 
         self.program_name = "Tafel Analysis"
@@ -60,6 +85,8 @@ class Tafel_Analysis :
 
         self.save_figures = False
 
+        self.save_sample_files = False
+
         """ create evalution folder if it does not exist yet
         path_evalutation_folder: */Evaluation/Tafel Analysis/**
          * path of this program
@@ -96,6 +123,16 @@ class Tafel_Analysis :
         self.water_splitting_potential = 1.229 # in V
         self.CD_treshold = 10 # in mA/cm²
 
+        """ columns of the processed data, which are calculated by the dataflow graph of a sample (see function self.get_sample_graph)
+        """
+        self.data_columns = ["E_vs_Ag", "E_vs_SHE", "current_density", "log_current_density", "overpotential"]
+
+        """ columns of the saved data, which contain single results in their first rows (see function self.get_data_save),
+            they are written in the table of the results of the batch table without x (see batch_table.py)
+        """
+        self.result_columns = ["Overpotential at Treshold (V)", "Tafel Slope", "Tafel Intersect", "Tafel Slope CI", "Tafel Intersect CI",
+                               "Tafel Slope Theil-Sen", "Tafel Intersect Theil-Sen"]
+
 
     def reset_attributes(self) :
         """ resets all attributes for Tafel_Analysis class object if desired by User or required for opening new files
@@ -109,6 +146,9 @@ class Tafel_Analysis :
         self.start_evaluation = False
         self.failed_entries = []
         self.active_frames = []
+        self.sample_graphs = {}
+        self.save_changed_samples = None
+        self.save_batch_table = None
 
 
     def reset_parameters(self) :
@@ -121,6 +161,26 @@ class Tafel_Analysis :
         self.pH = 13
         self.number_of_exchanged_electrons = 1
         self.temperature = 298 # in K
+        self.default_resistance = 0 # in Ω, used by self.run_headless_evaluation if no resistance was entered for the file
+        self.smoothing_window = 0 # in data points (odd), Savitzky-Golay smoothing of log_current_density, 0 : no smoothing
+        self.smoothing_order = 3
+
+
+    def get_parameters(self, resistance = None) :
+        """ returns the parameters of the evaluation as dict (saved with the results in the results store)
+            the resistance is added if given, since it is set for each sample individually
+        """
+        parameters = {"area_electrode" : self.area_electrode,
+                      "pH" : self.pH,
+                      "number_of_exchanged_electrons" : self.number_of_exchanged_electrons,
+                      "temperature" : self.temperature,
+                      "CD_treshold" : self.CD_treshold,
+                      "smoothing_window" : self.smoothing_window}
+
+        if resistance != None :
+            parameters["resistance"] = resistance
+
+        return parameters
 
 
     def get_potential_correction(self, potential, current, resistance) :
@@ -137,28 +197,628 @@ class Tafel_Analysis :
         return potential - current * resistance
 
 
-    def get_SHE_potential(self, potential) :
+    def get_SHE_potential(self, potential, pH = None) :
         """ returns the potential of the standard hydrogen electrode (SHE) by the formular
             potential = potential + 0.059 * pH * E0(KCl-electrode)
 
             expected argument datatypes:
             - potential : pandas.Series (V)
+            - pH : int/float/None (default: self.pH)
 
             returns SHE potential : pandas.Series (V) 
         """
-        return potential + 0.059 * self.pH + self.standard_potential_KCl
+        if pH == None :
+            pH = self.pH
+
+        return potential + 0.059 * pH + self.standard_potential_KCl
 
 
-    def get_current_density(self, current) :
+    def get_current_density(self, current, area_electrode = None) :
         """ returns the current density of the data set by the formular
             current_density = current / area_electrode
             
             expected argument datatypes:
             - current : pandas.Series (A)
+            - area_electrode : int/float/None (cm², default: self.area_electrode)
 
             returns current density : pandas.Series (mA/cm²)
         """
-        return current * 1000 / self.area_electrode
+        if area_electrode == None :
+            area_electrode = self.area_electrode
+
+        return current * 1000 / area_electrode
+
+
+    def get_log_current_density(self, current_density, smoothing_window = 0) :
+        """ returns the decadic logarithm of the current density, smoothed by a Savitzky-Golay filter of order self.smoothing_order
+            (see smoothing.py) if smoothing_window > 0, so noise does not destabilize the Tafel Fit
+            the logarithm of negative current densities (NaN) spreads over the window around them
+
+            expected argument datatypes:
+            - current_density : pandas.Series
+            - smoothing_window : int (odd number of data points, 0 : no smoothing)
+        """
+        log_current_density = np.log10(current_density)
+
+        if smoothing_window > 0 :
+            log_current_density = pd.Series(savgol_filter(log_current_density, smoothing_window, self.smoothing_order),
+                index = log_current_density.index)
+
+        return log_current_density
+
+
+    def load_file(self, file_path) :
+        """ opens the raw data file
+
+            expected argument datatype:
+            - file_path : string
+
+            returns sample_name : string, data : pandas.DataFrame
+        """
+        file_name = os.path.basename(file_path)
+        sample_name = file_name.split(".txt")[0]
+
+        """ opening raw data """
+        with stage("load", file = sample_name, program = self.program_name) :
+            data = pd.read_csv(file_path, delimiter = ";")
+
+        return sample_name, data
+
+
+    def get_sample_graph(self, data, resistance, sample_name = None) :
+        """ returns the dataflow graph (see dataflow.py) of the derived quantities of a sample
+
+            parameters of the graph:
+            - potential, current (raw data)
+            - resistance, pH, area_electrode, smoothing_window
+            - fit_range (tuple: range of the overpotential selected for the Tafel Fit, None if no range was selected yet)
+
+            nodes of the graph (inputs in brackets):
+            - E_vs_Ag (potential, current, resistance) : potential vs Ag|AgCl corrected with its current and resistance (in V)
+            - E_vs_SHE (E_vs_Ag, pH) : corrected potential vs SHE by Ec = Ei + 0.059 * pH + standard_potential_KCl (in V)
+            - overpotential (E_vs_SHE)
+            - current_density (current, area_electrode) : current divided by the area_electrode (in mA/cm²)
+            - log_current_density (current_density, smoothing_window) : see function self.get_log_current_density
+            - idx_treshold_CD (current_density) : index of the datapoint at which the current density threshold is reached
+            - idx_water_splitting (E_vs_SHE) : index of the datapoint at which the water splitting potential is reached
+            - overpotential_Ag (E_vs_Ag, idx_treshold_CD, idx_water_splitting), overpotential_SHE (E_vs_SHE, idx_treshold_CD)
+            - tafel_fit (overpotential, log_current_density, fit_range) : results of the Tafel Fit (see function self.get_tafel_fit)
+
+            a changed parameter only invalidates the nodes downstream of it, e.g. the area_electrode only current_density,
+            log_current_density, idx_treshold_CD, the overpotentials and tafel_fit, but not the potentials
+
+            expected argument datatypes:
+            - data : pandas.DataFrame (raw data, see function self.load_file)
+            - resistance : int/float (Ω)
+            - sample_name : string/None (used for the recorded stages of the Tafel Fit)
+        """
+        def get_idx_treshold_CD(current_density) :
+            return current_density[current_density >= self.CD_treshold].index.tolist()[0]
+
+        def get_idx_water_splitting(E_vs_SHE) :
+            return E_vs_SHE[E_vs_SHE >= self.water_splitting_potential].index.tolist()[0]
+
+        def get_overpotential_Ag(E_vs_Ag, idx_treshold_CD, idx_water_splitting) :
+            return round(E_vs_Ag.at[idx_treshold_CD] - E_vs_Ag.at[idx_water_splitting], 3)
+
+        def get_overpotential_SHE(E_vs_SHE, idx_treshold_CD) :
+            return round(E_vs_SHE.at[idx_treshold_CD] - self.water_splitting_potential, 3)
+
+        def get_tafel_fit(overpotential, log_current_density, fit_range) :
+            return self.get_tafel_fit(overpotential, log_current_density, fit_range, sample_name)
+
+        graph = Dataflow_Graph()
+
+        graph.add_parameter("potential", data["WE(1).Potential (V)"])
+        graph.add_parameter("current", data["WE(1).Current (A)"])
+        graph.add_parameter("resistance", resistance)
+        graph.add_parameter("pH", self.pH)
+        graph.add_parameter("area_electrode", self.area_electrode)
+        graph.add_parameter("smoothing_window", self.smoothing_window)
+        graph.add_parameter("fit_range", None)
+
+        graph.add_node("E_vs_Ag", self.get_potential_correction, ["potential", "current", "resistance"])
+        graph.add_node("E_vs_SHE", self.get_SHE_potential, ["E_vs_Ag", "pH"])
+        graph.add_node("overpotential", lambda E_vs_SHE : E_vs_SHE - self.water_splitting_potential, ["E_vs_SHE"])
+        graph.add_node("current_density", self.get_current_density, ["current", "area_electrode"])
+        graph.add_node("log_current_density", self.get_log_current_density, ["current_density", "smoothing_window"])
+        graph.add_node("idx_treshold_CD", get_idx_treshold_CD, ["current_density"])
+        graph.add_node("idx_water_splitting", get_idx_water_splitting, ["E_vs_SHE"])
+        graph.add_node("overpotential_Ag", get_overpotential_Ag, ["E_vs_Ag", "idx_treshold_CD", "idx_water_splitting"])
+        graph.add_node("overpotential_SHE", get_overpotential_SHE, ["E_vs_SHE", "idx_treshold_CD"])
+        graph.add_node("tafel_fit", get_tafel_fit, ["overpotential", "log_current_density", "fit_range"])
+
+        return graph
+
+
+    def get_sample_results(self, graph, data) :
+        """ calculates the nodes of the dataflow graph of a sample (see function self.get_sample_graph) and adds the columns
+            self.data_columns to data
+
+            returns idx_treshold_CD : int, idx_water_splitting : int, overpotential_Ag : float, overpotential_SHE : float
+        """
+        for column in self.data_columns :
+            data[column] = graph.get(column)
+
+        return graph.get("idx_treshold_CD"), graph.get("idx_water_splitting"), graph.get("overpotential_Ag"), graph.get("overpotential_SHE")
+
+
+    def process_file(self, file_path, resistance, fit_range = None) :
+        """ opens the raw data file and calculates the corrected potentials, current densities and overpotentials
+            used by self.run_headless_evaluation
+
+            expected argument datatypes:
+            - file_path : string
+            - resistance : int/float (Ω)
+            - fit_range : tuple/list/None (xmin, xmax of the overpotential in V, set in the graph for the Tafel Fit)
+
+            returns sample_name : string, data : pandas.DataFrame, graph : Dataflow_Graph (see function self.get_sample_graph),
+            idx_treshold_CD : int, idx_water_splitting : int, overpotential_Ag : float, overpotential_SHE : float
+        """
+        sample_name, data = self.load_file(file_path)
+
+        graph = self.get_sample_graph(data, resistance, sample_name)
+
+        if fit_range != None :
+            graph.set_parameter("fit_range", tuple(fit_range))
+
+        with stage("compute", file = sample_name, program = self.program_name) :
+            idx_treshold_CD, idx_water_splitting, overpotential_Ag, overpotential_SHE = self.get_sample_results(graph, data)
+
+        return sample_name, data, graph, idx_treshold_CD, idx_water_splitting, overpotential_Ag, overpotential_SHE
+
+
+    def get_tafel_fit(self, overpotential, log_current_density, fit_range, sample_name = None) :
+        """ fits the data in the selected range linear to get the tafel_slope and tafel_intersect
+            get exchange current density by 10**tafel_intersect 
+            get the confidence intervals of the slope, intersect and exchange current density by bootstrap replicates of the
+            selected range (see bootstrap.py)
+            get the Theil-Sen slope and intersect (median of the pairwise slopes, see robust_fit.py), which are not disturbed by
+            spikes from gas bubbles in the selected range
+
+            expected argument datatypes:
+            - overpotential, log_current_density : pandas.Series
+            - fit_range : tuple/None (xmin, xmax of the overpotential in V)
+            - sample_name : string/None
+
+            returns dict with tafel_slope, tafel_intersect, exchange_current_density, tafel_slope_robust, tafel_intersect_robust and
+            the confidence intervals (tuple) tafel_slope_ci, tafel_intersect_ci, exchange_current_density_ci
+            or None if no range was selected
+        """
+        if fit_range == None :
+            return None
+
+        xmin, xmax = fit_range
+
+        in_fit_range = (overpotential >= xmin) & (overpotential <= xmax)
+        overpotential_fit, log_current_density_fit = overpotential[in_fit_range], log_current_density[in_fit_range]
+
+        """ linear fit"""
+        with stage("fit", file = sample_name, program = self.program_name) :
+            fit = np.polyfit(overpotential_fit, log_current_density_fit, 1)
+
+        tafel_slope, tafel_intersect = fit[0], fit[1]
+
+        with stage("bootstrap", file = sample_name, program = self.program_name) :
+            slopes, intersects = bootstrap_linear_fit(overpotential_fit, log_current_density_fit)
+
+            tafel_slope_ci = get_confidence_interval(slopes)
+            tafel_intersect_ci = get_confidence_interval(intersects)
+
+        with stage("robust_fit", file = sample_name, program = self.program_name) :
+            try :
+                tafel_slope_robust, tafel_intersect_robust = theil_sen_fit(overpotential_fit, log_current_density_fit)
+            except ValueError :
+                """ less than two finite data points in the selected range (e.g. log10 of current densities <= 0),
+                    NaN as returned by np.polyfit
+                """
+                tafel_slope_robust, tafel_intersect_robust = np.nan, np.nan
+
+        return {"tafel_slope" : tafel_slope, "tafel_intersect" : tafel_intersect, "exchange_current_density" : 10**tafel_intersect,
+                "tafel_slope_robust" : tafel_slope_robust, "tafel_intersect_robust" : tafel_intersect_robust,
+                "tafel_slope_ci" : tafel_slope_ci, "tafel_intersect_ci" : tafel_intersect_ci,
+                "exchange_current_density_ci" : (10**tafel_intersect_ci[0], 10**tafel_intersect_ci[1])}
+
+
+    def get_fit_results(self, tafel_fit) :
+        """ returns the results of the Tafel Fit (see function self.get_tafel_fit) as dict of single values for the results_for_gui
+            DataFrame and the results store, the confidence intervals are split into _ci_low and _ci_high
+        """
+        results = {}
+
+        for result in ["exchange_current_density", "tafel_slope", "tafel_intersect", "tafel_slope_robust", "tafel_intersect_robust"] :
+            results[result] = tafel_fit[result]
+
+        for result in ["exchange_current_density", "tafel_slope", "tafel_intersect"] :
+            results[f"{result}_ci_low"], results[f"{result}_ci_high"] = tafel_fit[f"{result}_ci"]
+
+        return results
+
+
+    def get_fit_label(self, tafel_slope, tafel_intersect) :
+        """ returns the Tafel equation depending on the value of the intersect for display as plot label
+        """
+        if tafel_intersect > 0 :
+            fit_label = f"lg(j) = {round(tafel_slope, 3)} η + {round(tafel_intersect, 3)}"
+        elif tafel_intersect < 0 :
+            fit_label = f"lg(j) = {round(tafel_slope, 3)} η - {round(abs(tafel_intersect), 3)}"
+        else :
+            fit_label = f"lg(j) = {round(tafel_slope, 3)} η"
+
+        return fit_label
+
+
+    def get_sample_figure(self, file_name, data, idx_treshold_CD, artists = None) :
+        """ returns the figure of a single sample and its axis (fig, ax)
+            used by self.run_evaluation and self.run_headless_evaluation
+
+            create the figure with two axis
+            - ax[0] (left axis) : current density vs potential SHE (regular axis) or potential Ag (twiny axis)
+            - ax[1] (right axis) : log(current density) vs overpotential
+
+            ax[0] has a twiny axis (enables displaying Ag and SHE potential as x-axis simultaneously)
+
+            all scatter plots are decimated for the axis width (min/max per pixel), the saved data keeps the full resolution
+
+            if a dict is given as artists, the artists which depend on the data are added to it (used by self.run_evaluation to update
+            the figure if a parameter is changed): E_vs_SHE, E_vs_Ag, log_current_density (Decimated_Plot), CD_treshold_line (Line2D)
+        """
+        fig, ax = plt.subplots(2)
+        ax_twiny = ax[0].twiny()
+        plot_SHE = scatter_decimated(ax[0], data["E_vs_SHE"], data["current_density"], label = f"{file_name} SHE", marker = "x")
+        plot_Ag = scatter_decimated(ax_twiny, data["E_vs_Ag"], data["current_density"], label = f"{file_name} Ag", marker = "+")
+
+        """ add vertical and horizontal lines indicating the positions of the current density threshold and
+            water splitting potential
+        """
+        ax[0].axvline(self.water_splitting_potential, ls = "--", lw = 0.8, c = "grey")
+        ax[0].axhline(self.CD_treshold, ls = "--", lw = 0.8, c = "grey")
+
+        """ add vertical line up to ymax (given as a vector between 0 and 1) representing the value of 
+            self.CD_treshold to indicate reached potential for the sample when the current density threshold is reached
+        """
+        ylim = ax[0].get_ylim()
+        ymax = (self.CD_treshold - ylim[0]) / (ylim[1] - ylim[0])
+
+        CD_treshold_line = ax[0].axvline(data.at[idx_treshold_CD, "E_vs_SHE"], ymax = ymax, ls = "--", lw = 0.8)
+
+        """ add legend and x and y axis label for ax[0] and ax[1]
+            plot data as scatter plot: log(current density) vs overpotential
+        """
+        ax[0].legend(loc = "upper left")
+        ax[0].set_xlabel("$E_{WE}$ vs SHE -iR [V]")
+        ax_twiny.set_xlabel("$E_{WE}$ vs Ag|AgCl -iR [V]")
+        ax[0].set_ylabel("j [mA/cm²]")
+
+        plot_tafel = scatter_decimated(ax[1], data["overpotential"], data["log_current_density"], label = file_name, marker = "x")
+
+        ax[1].legend(loc = "lower right")
+        ax[1].set_xlabel("η [V]")
+        ax[1].set_ylabel("lg(j) [mA/cm²]")
+
+        """ set size of figure, so when figure is saved automatically the right format is used
+            default would save as in small window instead of full screen format"""
+        fig.set_size_inches(10,10)
+
+        if artists != None :
+            artists.update({"E_vs_SHE" : plot_SHE, "E_vs_Ag" : plot_Ag, "log_current_density" : plot_tafel, "CD_treshold_line" : CD_treshold_line})
+
+        return fig, ax
+
+
+    def get_data_save(self, data, overpotential_SHE, tafel_fit = None) :
+        """ returns a new DataFrame, which contains all relevant data from the evaluation of a single sample for saving
+            the results of the Tafel Fit (see function self.get_tafel_fit) are added if tafel_fit is given
+        """
+        data_save = pd.DataFrame()
+        data_save["Current Density (mA/cm²)"] = data["current_density"]
+        data_save["log Current Density"] = data["log_current_density"]
+        data_save["Potential Ag-E (V)"] = data["E_vs_Ag"]
+        data_save["Potential SHE (V)"] = data["E_vs_SHE"]
+        data_save["Overpotential (V)"] = data["overpotential"]
+        data_save["Overpotential at Treshold (V)"] = [overpotential_SHE] + [np.nan] * (len(data_save) - 1)
+
+        if tafel_fit != None :
+            data_save["Tafel Fit"] = tafel_fit["tafel_slope"] * data["overpotential"] + tafel_fit["tafel_intersect"]
+            data_save["Tafel Slope"] = [tafel_fit["tafel_slope"]] + [np.nan] * (len(data_save) - 1)
+            data_save["Tafel Intersect"] = [tafel_fit["tafel_intersect"]] + [np.nan] * (len(data_save) - 1)
+            data_save["Tafel Slope CI"] = list(tafel_fit["tafel_slope_ci"]) + [np.nan] * (len(data_save) - 2)
+            data_save["Tafel Intersect CI"] = list(tafel_fit["tafel_intersect_ci"]) + [np.nan] * (len(data_save) - 2)
+            data_save["Tafel Slope Theil-Sen"] = [tafel_fit["tafel_slope_robust"]] + [np.nan] * (len(data_save) - 1)
+            data_save["Tafel Intersect Theil-Sen"] = [tafel_fit["tafel_intersect_robust"]] + [np.nan] * (len(data_save) - 1)
+
+        return data_save
+
+
+    def run_headless_evaluation(self, file_path, fit_range = None, resistance = None) :
+        """ evaluates a single file without GUI and without showing a figure (used by watch_folder.py and replay_fits.py)
+            the resistance entered for the file is used if no resistance is given, otherwise self.default_resistance
+            the Tafel Fit is only calculated if a fit_range is given (e.g. the range selected in the GUI saved in the sidecar of the sample)
+            the processed data is saved in the evaluation folder, the figure only if self.save_figures is True
+
+            expected argument datatype:
+            - file_path : string
+            - fit_range : tuple/list/None (xmin, xmax of the overpotential in V)
+            - resistance : int/float/None (Ω)
+
+            returns dict with the sample_name, the program_name, the overpotentials (V) at the current density threshold and
+            the Tafel slope (if a fit_range is given)
+        """
+        if resistance == None :
+            resistance = self.resistances.get(file_path, self.default_resistance)
+
+        sample_name, data, graph, idx_treshold_CD, idx_water_splitting, overpotential_Ag, overpotential_SHE = self.process_file(file_path,
+            resistance, fit_range)
+
+        tafel_fit = graph.get("tafel_fit")
+
+        if self.save_figures :
+            with stage("plot", file = sample_name, program = self.program_name) :
+                fig, ax = self.get_sample_figure(os.path.basename(file_path), data, idx_treshold_CD)
+
+                if tafel_fit != None :
+                    ax[1].plot(data["overpotential"], tafel_fit["tafel_slope"] * data["overpotential"] + tafel_fit["tafel_intersect"], ls = "--",
+                        label = self.get_fit_label(tafel_fit["tafel_slope"], tafel_fit["tafel_intersect"]))
+                    ax[1].legend(loc = "lower right", fontsize = 8)
+
+            with stage("save_figure", file = sample_name, program = self.program_name) :
+                fig.savefig(f"{self.path_evaluation_folder}\{sample_name}.jpg")
+
+            plt.close(fig)
+
+        with stage("save", file = sample_name, program = self.program_name) :
+            data_save = self.get_data_save(data, overpotential_SHE, tafel_fit)
+            data_save.to_csv(f"{self.path_evaluation_folder}\{sample_name}.txt", header = data_save.columns, index = None, sep = ";")
+
+        results = {"overpotential_Ag" : overpotential_Ag, "overpotential_SHE" : overpotential_SHE}
+
+        if tafel_fit != None :
+            results.update(self.get_fit_results(tafel_fit))
+
+            save_fit_windows(self, sample_name, [file_path], {"fit_range" : list(fit_range), "resistance" : resistance}, self.get_parameters())
+
+        with stage("store", file = sample_name, program = self.program_name) :
+            store_results(self, sample_name, results, file_paths = [file_path], parameters = self.get_parameters(resistance))
+
+        save_profile(self.path_evaluation_folder, self.program_name)
+
+        headless_results = {"program_name" : self.program_name, "sample_name" : sample_name,
+                            "overpotential_Ag" : float(overpotential_Ag), "overpotential_SHE" : float(overpotential_SHE)}
+
+        if tafel_fit != None :
+            headless_results["tafel_slope"] = float(tafel_fit["tafel_slope"])
+
+        return headless_results
+
+
+    def run_headless_fits(self, file_paths, fit_windows) :
+        """ evaluates the sample of a sidecar (see replay_fits.py) again without GUI with the saved range of the Tafel Fit and resistance
+
+            expected argument datatypes:
+            - file_paths : list (one file, the sidecar of a Tafel sample contains a single file)
+            - fit_windows : dict (fit_range : list, resistance : int/float)
+
+            returns the dict of self.run_headless_evaluation
+        """
+        return self.run_headless_evaluation(file_paths[0], fit_range = fit_windows.get("fit_range"), resistance = fit_windows.get("resistance"))
+
+
+    def get_sweep_arrays(self, file_paths) :
+        """ returns the sample_names (list) and the potentials and currents of all files as matrices (numpy.ndarray, samples x data points)
+            files with less data points are filled up with NaN, which never reach a threshold or fit window
+        """
+        sample_names, potentials, currents = [], [], []
+
+        for file_path in file_paths :
+            sample_names.append(os.path.basename(file_path).split(".txt")[0])
+
+            with stage("load", file = sample_names[-1], program = self.program_name) :
+                data = pd.read_csv(file_path, delimiter = ";", usecols = ["WE(1).Potential (V)", "WE(1).Current (A)"])
+
+            potentials.append(data["WE(1).Potential (V)"].to_numpy(dtype = np.float64))
+            currents.append(data["WE(1).Current (A)"].to_numpy(dtype = np.float64))
+
+        n_points = max(len(potential) for potential in potentials)
+
+        potential_matrix = np.full((len(file_paths), n_points), np.nan)
+        current_matrix = np.full((len(file_paths), n_points), np.nan)
+
+        for i, (potential, current) in enumerate(zip(potentials, currents)) :
+            potential_matrix[i, :len(potential)] = potential
+            current_matrix[i, :len(current)] = current
+
+        return sample_names, potential_matrix, current_matrix
+
+
+    def get_parameter_sweep(self, file_paths = None, resistances = None, pHs = None, areas_electrode = None, temperatures = None, fit_range = 0.1) :
+        """ calculates the overpotential at the current density threshold and the Tafel slope for all combinations of the given
+            resistances, pH values, electrode areas and temperatures for all files at once (sensitivity of the results to the parameters)
+
+            the corrections are separable, so every parameter is only applied to the axis it changes and numpy broadcasts the rest:
+            - resistance : E_vs_Ag = E - I * R (samples x resistances x data points)
+            - area_electrode : current density and therefore the data point at which the threshold is reached (samples x areas)
+            - pH and temperature : constant offset of E_vs_SHE by 0.059 V * T / 298 K * pH + E0(KCl-electrode) (pH x temperatures)
+              (at 298 K identical to self.get_SHE_potential)
+
+            the Tafel slope is the least squares slope of lg(j) vs η in the range fit_range (V) below the overpotential at the
+            threshold (a fixed range instead of the range selected by the User in the GUI), it only depends on the resistance and area
+
+            expected argument datatypes:
+            - file_paths : list/tuple/None (default: self.file_paths)
+            - resistances : float/list/numpy.ndarray/None (Ω, scalar or 1-D : the same resistances for all samples,
+              2-D : one row of resistances per sample (samples x resistances), default: the resistance entered for each file or
+              self.default_resistance), raises ValueError for other shapes
+            - pHs, areas_electrode, temperatures : list/numpy.ndarray/None (default: the current parameter)
+            - fit_range : float (V)
+
+            returns dict with
+            - "sample_names" : list
+            - "resistance" : numpy.ndarray (samples x resistances)
+            - "pH", "area_electrode", "temperature" : numpy.ndarray
+            - "overpotential_SHE", "tafel_slope" : numpy.ndarray (samples x resistances x pH x areas x temperatures, NaN if the
+              threshold is not reached or less than two data points are in the fit range), the Tafel slope in dec/V
+        """
+        file_paths = list(file_paths if file_paths is not None else self.file_paths)
+
+        """ resistances as samples x resistances, checked before the files are read
+        """
+        if resistances is None :
+            resistances = np.array([[self.resistances.get(file_path, self.default_resistance)] for file_path in file_paths], dtype = np.float64)
+        else :
+            resistances = np.asarray(resistances, dtype = np.float64)
+
+            if resistances.ndim <= 1 :
+                resistances = np.broadcast_to(np.atleast_1d(resistances), (len(file_paths), resistances.size))
+            elif resistances.ndim != 2 or resistances.shape[0] != len(file_paths) :
+                raise ValueError(f"resistances have to be a scalar, 1-D (the same resistances for all samples) or 2-D with one row per "
+                                 f"sample ({len(file_paths)} x resistances), got shape {resistances.shape}")
+
+        sample_names, potential, current = self.get_sweep_arrays(file_paths)
+
+        with stage("sweep", program = self.program_name) :
+
+            pHs = np.atleast_1d(np.asarray(pHs if pHs is not None else self.pH, dtype = np.float64))
+            areas_electrode = np.atleast_1d(np.asarray(areas_electrode if areas_electrode is not None else self.area_electrode, dtype = np.float64))
+            temperatures = np.atleast_1d(np.asarray(temperatures if temperatures is not None else self.temperature, dtype = np.float64))
+
+            """ iR corrected potential (samples x resistances x data points)
+                the mean potential of each sample is subtracted, so the sums of the least squares fit stay numerically stable
+            """
+            potential_mean = np.nanmean(potential, axis = 1)[:, np.newaxis]
+            E_vs_Ag = (potential - potential_mean)[:, np.newaxis, :] - current[:, np.newaxis, :] * resistances[:, :, np.newaxis]
+
+            """ first data point at which the current density (samples x areas x data points) reaches self.CD_treshold
+            """
+            over_CD_threshold = current[:, np.newaxis, :] * 1000 / areas_electrode[np.newaxis, :, np.newaxis] >= self.CD_treshold
+
+            idx_treshold_CD = np.argmax(over_CD_threshold, axis = 2)
+            treshold_reached = over_CD_threshold.any(axis = 2)
+
+            """ E_vs_Ag at the threshold (samples x resistances x areas)
+            """
+            E_treshold = np.take_along_axis(E_vs_Ag, idx_treshold_CD[:, np.newaxis, :], axis = 2)
+            E_treshold = np.where(treshold_reached[:, np.newaxis, :], E_treshold, np.nan)
+
+            """ overpotential at the threshold (samples x resistances x pH x areas x temperatures)
+            """
+            SHE_offset = 0.059 * (temperatures[np.newaxis, :] / 298) * pHs[:, np.newaxis] + self.standard_potential_KCl
+
+            overpotential_SHE = (E_treshold[:, :, np.newaxis, :, np.newaxis] + potential_mean[:, :, np.newaxis, np.newaxis, np.newaxis]
+                                 + SHE_offset[np.newaxis, np.newaxis, :, np.newaxis, :] - self.water_splitting_potential)
+
+            """ Tafel slope of every fit range (samples x resistances x areas)
+                lg(j) = lg(I * 1000) - lg(area), the area only shifts lg(j) and does not change the slope
+            """
+            with np.errstate(divide = "ignore", invalid = "ignore") :
+                log_current = np.log10(current * 1000)
+
+            """ lg(j) of all samples smoothed at once if self.smoothing_window > 0 (same as self.get_log_current_density)
+            """
+            if self.smoothing_window > 0 :
+                log_current = savgol_filter(np.where(np.isfinite(log_current), log_current, np.nan), self.smoothing_window, self.smoothing_order)
+
+            valid = np.isfinite(log_current)
+            log_current = np.where(valid, log_current, 0)
+
+            x = E_vs_Ag[:, :, np.newaxis, :]
+            in_fit_range = ((x >= E_treshold[..., np.newaxis] - fit_range) & (x <= E_treshold[..., np.newaxis])
+                            & valid[:, np.newaxis, np.newaxis, :])
+
+            weights = in_fit_range.astype(np.float64)
+            x = np.where(np.isnan(E_vs_Ag), 0, E_vs_Ag)
+
+            n = weights.sum(axis = 3)
+            sum_x = np.einsum("sram,srm->sra", weights, x)
+            sum_y = np.einsum("sram,sm->sra", weights, log_current)
+            sum_xx = np.einsum("sram,srm->sra", weights, x * x)
+            sum_xy = np.einsum("sram,srm->sra", weights, x * log_current[:, np.newaxis, :])
+
+            with np.errstate(divide = "ignore", invalid = "ignore") :
+                denominator = n * sum_xx - sum_x**2
+                tafel_slope = np.where((n >= 2) & (denominator > 0), (n * sum_xy - sum_x * sum_y) / denominator, np.nan)
+
+            tafel_slope = np.broadcast_to(tafel_slope[:, :, np.newaxis, :, np.newaxis], overpotential_SHE.shape)
+
+        return {"sample_names" : sample_names, "resistance" : resistances, "pH" : pHs, "area_electrode" : areas_electrode,
+                "temperature" : temperatures, "overpotential_SHE" : overpotential_SHE, "tafel_slope" : tafel_slope}
+
+
+    def get_parameter_sweep_data_frame(self, sweep) :
+        """ returns the results of self.get_parameter_sweep as pandas.DataFrame in long format (one row per sample and parameter combination)
+            with the columns sample_name, resistance, pH, area_electrode, temperature, overpotential_SHE, tafel_slope
+        """
+        shape = sweep["overpotential_SHE"].shape
+
+        indices = np.indices(shape).reshape(len(shape), -1)
+
+        return pd.DataFrame({"sample_name" : np.asarray(sweep["sample_names"])[indices[0]],
+                             "resistance" : sweep["resistance"][indices[0], indices[1]],
+                             "pH" : sweep["pH"][indices[2]],
+                             "area_electrode" : sweep["area_electrode"][indices[3]],
+                             "temperature" : sweep["temperature"][indices[4]],
+                             "overpotential_SHE" : sweep["overpotential_SHE"].reshape(-1),
+                             "tafel_slope" : sweep["tafel_slope"].reshape(-1)})
+
+
+    def save_parameter_sweep(self, sweep) :
+        """ saves the results of self.get_parameter_sweep (long format) as txt file in the evaluation folder
+            the file is saved with the count of the existing Parameter_Sweep files at the end of the file_name
+
+            returns the path of the saved file
+        """
+        files_in_directory = os.listdir(self.path_evaluation_folder)
+
+        count = 0
+
+        for file in files_in_directory :
+            if "Parameter_Sweep" in file and ".txt" in file :
+                count += 1
+
+        path = f"{self.path_evaluation_folder}\Parameter_Sweep_{count}.txt"
+
+        self.get_parameter_sweep_data_frame(sweep).to_csv(path, sep = ";", index = None,
+            header = ["Sample", "Resistance (Ω)", "pH", "Area Electrode (cm²)", "Temperature (K)", "Overpotential at Treshold (V)",
+                      "Tafel Slope (dec/V)"])
+
+        return path
+
+
+    def update_sample_graphs(self, parameters, file_paths = None) :
+        """ changes parameters in the dataflow graphs (see function self.get_sample_graph) of the samples of the current evaluation
+            the files are not read again, only the derived quantities downstream of the changed parameters are recalculated and only
+            the data, artists and results depending on those are updated (see listeners in function self.run_evaluation)
+
+            expected argument datatypes:
+            - parameters : dict (name of the parameter in the graph as key, e.g. {"pH" : 14})
+            - file_paths : list/None (default: all samples of the current evaluation)
+
+            returns the number of updated samples
+            errors of the recalculation, fits or saving except IndexError (thresholds not reached) are raised to the caller
+        """
+        file_paths = file_paths if file_paths != None else list(self.sample_graphs)
+
+        count = 0
+
+        try :
+            for file_path in file_paths :
+                graph = self.sample_graphs[file_path]
+
+                for name, value in parameters.items() :
+                    graph.set_parameter(name, value)
+
+                try :
+                    if graph.update() > 0 :
+                        count += 1
+                except IndexError :
+                    self.feedback_label.config(text = f"Thresholds not reached for {os.path.basename(file_path)} with the changed parameters.")
+        finally :
+            """ the changed samples are saved after all graphs were updated (also the samples updated before an error),
+                so the batch table is written only once
+            """
+            if self.save_changed_samples != None :
+                self.save_changed_samples()
+
+        return count
 
 
     def run_evaluation(self) :
@@ -175,88 +835,189 @@ class Tafel_Analysis :
         if len(self.file_paths) > 0 and len(self.resistances) == len(self.file_paths) and self.start_evaluation == True :
             self.feedback_label.config(text = "Evaluation in progress.")
 
+            """ dataflow graphs of all samples of this evaluation (see function self.get_sample_graph)
+                a parameter changed in the GUI during the evaluation (see function self.update_sample_graphs) only recalculates the
+                derived quantities downstream of this parameter and only the listeners of those update the data, artists and results
+            """
+            self.sample_graphs = {}
+
             def tafel_onselect(xmin, xmax) :
                 """ function behind the SpanSelector object in ax[1] (right plot in figure of a single sample plot)
                     accepts a horizont range selection by the User for fitting data with Tafel Fit
-                """
 
-                """ clear ax[1] to remove title informing User to select a range for the Tafel Fit
-                    scatter data set in ax[1]
+                    the selected range is set as fit_range of the dataflow graph of the sample, so only the Tafel Fit is calculated
+                    (see function self.get_tafel_fit) and its listeners update the fit lines in ax[1] and the results (see function add_sample_listeners)
                 """
-                ax[1].clear() 
+                graph.set_parameter("fit_range", (xmin, xmax))
+                graph.update()
 
-                ax[1].scatter(data["overpotential"], data["log_current_density"], marker = "x", label = sample_name)
+                save_changed_samples()
 
-                """ get data from selected range and fit those linear to get the tafel_slope and tafel_intersect
-                    get exchange current density by 10**tafel_intersect 
+            def set_results(sample_name, graph) :
+                """ add the overpotentials and the results of the Tafel Fit (if a range was selected) of a sample to the results_for_gui
+                    DataFrame and update the row of the sample in the results_table
                 """
-                data_fit = data[data["overpotential"] >= xmin]
-                data_fit = data_fit[data_fit["overpotential"] <= xmax]
+                results_for_gui.at["overpotential_Ag", sample_name] = graph.get("overpotential_Ag")
+                results_for_gui.at["overpotential_SHE", sample_name] = graph.get("overpotential_SHE")
 
-                """ linear fit"""
-                fit = np.polyfit(data_fit["overpotential"], data_fit["log_current_density"], 1)
+                tafel_fit = graph.get("tafel_fit")
 
-                tafel_slope, tafel_intersect = fit[0], fit[1]
+                if tafel_fit != None :
+                    for result, value in self.get_fit_results(tafel_fit).items() :
+                        results_for_gui.at[result, sample_name] = value
 
-                exchange_current_density = 10**tafel_intersect
+                results_table.set_row(sample_name, results_for_gui[sample_name].tolist())
 
-                """ calculate values for displaying the fit in a plot in the graph
+            def save_sample(sample_name, file_path, graph) :
+                """ add the evaluated data of a sample (see function self.get_data_save) to the batch table (written after all samples
+                    and if the User saves it in the GUI)
+                    and save it as txt file if self.save_sample_files is True
+                    save the results of the sample (including the Tafel Fit, if a range was selected) in the results store
+                    the selected range of the Tafel Fit and the resistance are saved as sidecar of the sample (see replay_fits.py),
+                    so the fit can be replayed without GUI
                 """
-                data["tafel_fit"] = tafel_slope * data["overpotential"] + tafel_intersect
+                with stage("save", file = sample_name, program = self.program_name) :
+                    data_save = self.get_data_save(datas[sample_name], graph.get("overpotential_SHE"), graph.get("tafel_fit"))
+                    batch_table.add_sample(sample_name, data_save, "Overpotential (V)", self.result_columns)
+
+                    if self.save_sample_files :
+                        data_save.to_csv(f"{self.path_evaluation_folder}\{sample_name}.txt", header = data_save.columns, index = None, sep = ";")
+
+                with stage("store", file = sample_name, program = self.program_name) :
+                    store_results(self, sample_name, results_for_gui[sample_name].to_dict(),
+                        file_paths = [file_path], parameters = self.get_parameters(graph.get("resistance")))
+
+                if graph.get("fit_range") != None :
+                    save_fit_windows(self, sample_name, [file_path],
+                        {"fit_range" : list(graph.get("fit_range")), "resistance" : graph.get("resistance")}, self.get_parameters())
+
+            """ samples changed after they were saved (sample_name as key, file_path and graph as value), marked by a listener
+                of the graph and saved together by save_changed_samples
+            """
+            changed_samples = {}
 
-                """ generate Tafel equation depending on the value of the intersect for display in ax[1] 
-                Tafel equation is displayed as plot label in ax[1] for the calculated fit data"""
-                if tafel_intersect > 0 :
-                    fit_label = f"lg(j) = {round(tafel_slope, 3)} η + {round(tafel_intersect, 3)}"
-                elif tafel_intersect < 0 :
-                    fit_label = f"lg(j) = {round(tafel_slope, 3)} η - {round(abs(tafel_intersect), 3)}"
-                elif tafel_intersect == 0 :
-                    fit_label = f"lg(j) = {round(tafel_slope, 3)} η"
+            def save_changed_samples() :
+                """ save the changed samples again (txt file, results store and sidecar once per sample) and add them to the batch table
+                    again, the batch table is not written on each change of a parameter (see save_batch_table)
+                """
+                if len(changed_samples) == 0 :
+                    return
 
-                ax[1].plot(data["overpotential"], data["tafel_fit"], ls = "--", label = fit_label)
+                for sample_name, (file_path, graph) in changed_samples.items() :
+                    save_sample(sample_name, file_path, graph)
 
-                """ set axis label and add legend to ax[1] """
-                ax[1].set_xlabel("η [V]")
-                ax[1].set_ylabel("lg(j) [mA/cm²]")
+                changed_samples.clear()
 
-                ax[1].legend(loc = "lower right", fontsize = 8)
+            self.save_changed_samples = save_changed_samples
 
-                """ add calculated fit values to existing DataFrame for saving the evaluated data
-                    add calculated fit values to result_frame"""
-                data_save["Tafel Fit"] = data["tafel_fit"]
-                data_save["Tafel Slope"] = [tafel_slope] + [np.nan] * (len(data_save) - 1)
-                data_save["Tafel Intersect"] = [tafel_intersect] + [np.nan] * (len(data_save) - 1)
+            def save_batch_table() :
+                """ write the batch table, only the samples added since the last save are appended (see batch_table.py)
+                    returns the path of the batch table or None if no sample was added
+                """
+                with stage("save_batch", program = self.program_name) :
+                    return batch_table.save()
 
-                results_for_gui.at["exchange_current_density", sample_name] = exchange_current_density
-                results_for_gui.at["tafel_slope", sample_name] = tafel_slope
-                results_for_gui.at["tafel_intersect", sample_name] = tafel_intersect
+            self.save_batch_table = save_batch_table
 
-                """ add fit_label as value to fit_labels dictionary use the sample_name as key
+            def add_sample_listeners(graph, sample_name, data, fig, ax, artists) :
+                """ add the listeners to the dataflow graph of a sample, which update
+                    - the columns of data, each column only if its node changed
+                    - the artists of the figure of the sample (see function self.get_sample_figure) and the fit lines in ax[1]
+                    - the results of the sample in results_for_gui and the results_table
+                    the listeners are defined in this function, so each listener keeps the data and figure of its own sample
                 """
-                fit_labels[sample_name] = fit_label
+                for column in self.data_columns :
+                    graph.add_listener([column], lambda graph, column = column : data.__setitem__(column, graph.get(column)))
 
-            """ create lists containing the index and values of datapoints at specific threshold values
-                this is necassary to mark those tresholds correctly in the collective figure
-            """
-            idx_CDs, idx_water_splittings = [], []
-            overpotential_Ags, overpotential_SHEs = [], []
-            potential_CD_treshold_Ags, potential_CD_treshold_SHEs = [], []
+                graph.add_listener(["E_vs_SHE", "current_density"],
+                    lambda graph : artists["E_vs_SHE"].set_data(graph.get("E_vs_SHE"), graph.get("current_density")))
+                graph.add_listener(["E_vs_Ag", "current_density"],
+                    lambda graph : artists["E_vs_Ag"].set_data(graph.get("E_vs_Ag"), graph.get("current_density")))
+                graph.add_listener(["overpotential", "log_current_density"],
+                    lambda graph : artists["log_current_density"].set_data(graph.get("overpotential"), graph.get("log_current_density")))
+
+                fit_lines = []
+
+                def update_fit_lines(graph) :
+                    """ remove the title informing User to select a range for the Tafel Fit and the lines of the previous fit
+                        plot the Tafel Fit with the Tafel equation as label and the Theil-Sen fit in ax[1]
+                    """
+                    tafel_fit = graph.get("tafel_fit")
+
+                    for line in fit_lines :
+                        line.remove()
+                    fit_lines.clear()
+
+                    if tafel_fit == None :
+                        return
+
+                    ax[1].set_title(label = "")
+
+                    overpotential = graph.get("overpotential")
+
+                    fit_lines.append(ax[1].plot(overpotential, tafel_fit["tafel_slope"] * overpotential + tafel_fit["tafel_intersect"], ls = "--",
+                        label = self.get_fit_label(tafel_fit["tafel_slope"], tafel_fit["tafel_intersect"]))[0])
+                    fit_lines.append(ax[1].plot(overpotential, tafel_fit["tafel_slope_robust"] * overpotential + tafel_fit["tafel_intersect_robust"], ls = ":",
+                        label = f"Theil-Sen: {self.get_fit_label(tafel_fit['tafel_slope_robust'], tafel_fit['tafel_intersect_robust'])}")[0])
+
+                    ax[1].legend(loc = "lower right", fontsize = 8)
+
+                graph.add_listener(["overpotential", "tafel_fit"], update_fit_lines)
+
+                def redraw(graph) :
+                    """ rescale the axis to the changed data, move the line of the current density threshold and redraw the figure
+                    """
+                    for axis in [ax[0], artists["E_vs_Ag"].ax, ax[1]] :
+                        axis.autoscale_view()
+
+                    ylim = ax[0].get_ylim()
+                    ymax = (self.CD_treshold - ylim[0]) / (ylim[1] - ylim[0])
 
-            """ fit_labels dictionary
-                contains the fit_label´s of the Tafel fit as values whereas the sample_name is used as key
+                    E_vs_SHE_treshold = graph.get("E_vs_SHE").at[graph.get("idx_treshold_CD")]
+                    artists["CD_treshold_line"].set_data([E_vs_SHE_treshold, E_vs_SHE_treshold], [0, ymax])
 
-                datas dictionary
+                    if plt.fignum_exists(fig.number) :
+                        fig.canvas.draw_idle()
+
+                graph.add_listener(["E_vs_Ag", "E_vs_SHE", "current_density", "log_current_density", "overpotential", "idx_treshold_CD", "tafel_fit"], redraw)
+
+                graph.add_listener(["overpotential_Ag", "overpotential_SHE", "tafel_fit"], lambda graph : set_results(sample_name, graph))
+
+            """ datas dictionary
                 contains the dataset´s of each sample as value whereas the sample_name is used as key
-            """
-            fit_labels = {}
 
+                sample_names dictionary
+                contains the sample_name of each sample as value whereas the file_path is used as key
+            """
             datas = {}
+            sample_names = {}
+
+            """ create the batch table, which collects the evaluated data of all samples in one file (see batch_table.py)
+            """
+            batch_table = Batch_Table(self.path_evaluation_folder, "Tafel")
 
             """ create a DataFrame containing all obtained results for each sample (sample_name as columns) for the result_frame
                 in the GUI
             """
             results_for_gui = pd.DataFrame(\
-                index = ["overpotential_Ag", "overpotential_SHE", "exchange_current_density", "tafel_slope", "tafel_intersect"])
+                index = ["overpotential_Ag", "overpotential_SHE", "exchange_current_density", "tafel_slope", "tafel_intersect",
+                         "tafel_slope_robust", "tafel_intersect_robust", "exchange_current_density_ci_low", "exchange_current_density_ci_high",
+                         "tafel_slope_ci_low", "tafel_slope_ci_high", "tafel_intersect_ci_low", "tafel_intersect_ci_high"])
+
+            """ create the results_table (see results_table.py) which is set into the self.program_frame grid
+                it displays all obtained results from the Tafel Analysis, the row of a sample is added as soon as the sample is evaluated
+                table is set up as follows:
+                    - rows: samples
+                    - columns: results
+                add results_table to self.active_frames so that at a later point if new files were selected the results_table can be disabled
+            """
+            results_table = Results_Table(self.program_frame, "Sample", ["Overpotential Ag|AgCl (V)", "Overpotential SHE (V)",
+                "Exchange Current Density (mA/cm²)", "Tafel Slope (dec/V)", "Tafel Intersect (mA/cm²)",
+                "Tafel Slope Theil-Sen (dec/V)", "Tafel Intersect Theil-Sen (mA/cm²)", "Exchange Current Density CI Low",
+                "Exchange Current Density CI High", "Tafel Slope CI Low", "Tafel Slope CI High", "Tafel Intersect CI Low", "Tafel Intersect CI High"])
+            results_table.grid(row = 2, column = 0, pady = 5, padx = 5)
+
+            self.active_frames.append(results_table)
 
             """ loop through each file indivdually
             """
@@ -266,133 +1027,56 @@ class Tafel_Analysis :
                 """
                 resistance = self.resistances[file_path]
                 file_name = os.path.basename(file_path)
-                sample_name = file_name.split(".txt")[0]
-                
-                """ opening raw data """
-                data = pd.read_csv(file_path, delimiter = ";")
-
-                """ calculate potentials vs Ag|AgCl by correction with its current and resistance (in V)
-                calculate corrected potentials vs SHE by Ec = Ei + 0.059 * pH + standard_potential_KCl (in V)
-                calculate current density by division with the area_electrode (in mA/cm²) 
-                """
-                
-                data["E_vs_Ag"] = self.get_potential_correction(data["WE(1).Potential (V)"], data["WE(1).Current (A)"], resistance) # correction of potential
-                data["E_vs_SHE"] = self.get_SHE_potential(data["E_vs_Ag"]) # correction of potential vs SHE
-
-                data["current_density"] = self.get_current_density(data["WE(1).Current (A)"])  # current density in mA/cm²
 
-                """ calculate log10 of current density and overpotential of each data point
+                """ open the raw data and create the dataflow graph of the sample (see functions self.load_file and self.get_sample_graph)
+                    correct the potentials and calculate current densities and overpotentials (see function self.get_sample_results)
                 """
-                data["log_current_density"] = np.log10(data["current_density"])
-                data["overpotential"] = data["E_vs_SHE"] - self.water_splitting_potential
-
-                """ determine datapoint/index of datapoint where the 
-                    - current density threshold 
-                    - water splitting potential
-                    are reached
-                    
-                    calculate the overpotentials for the Ag and SHE electrode
-                    append these values to the respective lists
-                """
-                data_over_CD_threshold = data[data["current_density"] >= self.CD_treshold]
-                data_over_water_splitting_potential = data[data["E_vs_SHE"] >= self.water_splitting_potential]
-
-                idx_treshold_CD = data_over_CD_threshold.index.tolist()[0]
-                idx_CDs.append(idx_treshold_CD)
-
-                idx_water_splitting = data_over_water_splitting_potential.index.tolist()[0]
-                idx_water_splittings.append(idx_water_splitting)
-
-                overpotential_Ag = data.at[idx_treshold_CD, "E_vs_Ag"] - data.at[idx_water_splitting, "E_vs_Ag"]
-                overpotential_Ag = round(overpotential_Ag, 3)
-                overpotential_Ags.append(overpotential_Ag)
-
-                overpotential_SHE = data.at[idx_treshold_CD, "E_vs_SHE"] - self.water_splitting_potential
-                overpotential_SHE = round(overpotential_SHE, 3)
-                overpotential_SHEs.append(overpotential_SHE)
+                sample_name, data = self.load_file(file_path)
 
-                potential_CD_treshold_Ags.append(data.at[idx_treshold_CD, "E_vs_Ag"])
-                potential_CD_treshold_SHEs.append(data.at[idx_treshold_CD, "E_vs_SHE"])
+                graph = self.get_sample_graph(data, resistance, sample_name)
+                self.sample_graphs[file_path] = graph
 
-                """ create the figure with two axis
-                    - ax[0] (left axis) : current density vs potential SHE (regular axis) or potential Ag (twiny axis)
-                    - ax[1] (right axis) : log(current density) vs overpotential
+                with stage("compute", file = sample_name, program = self.program_name) :
+                    idx_treshold_CD, idx_water_splitting, overpotential_Ag, overpotential_SHE = self.get_sample_results(graph, data)
 
-                    ax[0] has a twiny axis (enables displaying Ag and SHE potential as x-axis simultaneously)
-                """
-
-                fig, ax = plt.subplots(2)
-                ax_twiny = ax[0].twiny()
-                ax[0].scatter(data["E_vs_SHE"], data["current_density"], label = f"{file_name} SHE", marker = "x")
-                ax_twiny.scatter(data["E_vs_Ag"], data["current_density"], label = f"{file_name} Ag", marker = "+")
-
-                """ add vertical and horizontal lines indicating the positions of the current density threshold and
-                    water splitting potential
-                """
-                ax[0].axvline(self.water_splitting_potential, ls = "--", lw = 0.8, c = "grey")
-                ax[0].axhline(self.CD_treshold, ls = "--", lw = 0.8, c = "grey")
-
-                """ add vertical line up to ymax (given as a vector between 0 and 1) representing the value of 
-                    self.CD_treshold to indicate reached potential for the sample when the current density threshold is reached
-                """
-                ylim = ax[0].get_ylim()
-                ymax = (self.CD_treshold - ylim[0]) / (ylim[1] - ylim[0])
-
-                ax[0].axvline(data.at[idx_treshold_CD, "E_vs_SHE"], ymax = ymax, ls = "--", lw = 0.8)
+                datas[sample_name] = data
+                sample_names[file_path] = sample_name
 
-                """ add legend and x and y axis label for ax[0] and ax[1]
-                    plot data as scatter plot: log(current density) vs overpotential
+                """ create the figure of the sample with two axis (see function self.get_sample_figure)
                 """
-                ax[0].legend(loc = "upper left")
-                ax[0].set_xlabel("$E_{WE}$ vs SHE -iR [V]")
-                ax_twiny.set_xlabel("$E_{WE}$ vs Ag|AgCl -iR [V]")
-                ax[0].set_ylabel("j [mA/cm²]")
-
-                ax[1].scatter(data["overpotential"], data["log_current_density"], label = file_name, marker = "x")
+                with stage("plot", file = sample_name, program = self.program_name) :
+                    artists = {}
+                    fig, ax = self.get_sample_figure(file_name, data, idx_treshold_CD, artists)
 
-                """ set title for ax[1], which informs User to select a range in ax[1] to calculate the Tafel Fit for
-                the dataset
-                """
-                ax[1].set_title(label = "Please select the range in the plot below, which shall be fitted.")
-                
-                ax[1].legend(loc = "lower right")
-                ax[1].set_xlabel("η [V]")
-                ax[1].set_ylabel("lg(j) [mA/cm²]")
-
-                """ create the tafel_spanner object
-                    enables User to select a horizontal range in ax[1] and executes the function tafel_onselect
-                    tafel_onselect accepts two arguments (xmin : int/float, xmax : int/float) and calculates
-                    the Tafel Fit
-                    lower range of selected range is set as xmin, whereas the higher range is set as xmax
-                    keyword useblit: no clue what it does but it works
-                        in the official documentation the following is stated:
-                        'If True, use the backend-dependent blitting features for faster canvas updates.' 
-                        (https://matplotlib.org/stable/api/widgets_api.html#matplotlib.widgets.SpanSelector, 01.02.22)
-                        don´t know what to do with that information
-                """
+                    """ set title for ax[1], which informs User to select a range in ax[1] to calculate the Tafel Fit for
+                    the dataset
+                    """
+                    ax[1].set_title(label = "Please select the range in the plot below, which shall be fitted.")
+
+                    """ create the tafel_spanner object
+                        enables User to select a horizontal range in ax[1] and executes the function tafel_onselect
+                        tafel_onselect accepts two arguments (xmin : int/float, xmax : int/float) and calculates
+                        the Tafel Fit
+                        lower range of selected range is set as xmin, whereas the higher range is set as xmax
+                        keyword useblit: no clue what it does but it works
+                            in the official documentation the following is stated:
+                            'If True, use the backend-dependent blitting features for faster canvas updates.' 
+                            (https://matplotlib.org/stable/api/widgets_api.html#matplotlib.widgets.SpanSelector, 01.02.22)
+                            don´t know what to do with that information
+                    """
                 
-                tafel_spanner = SpanSelector(ax[1], tafel_onselect, "horizontal", useblit = True)
+                    tafel_spanner = SpanSelector(ax[1], tafel_onselect, "horizontal", useblit = True)
 
-                """ set size of figure, so when figure is saved automatically the right format is used
-                    default would save as in small window instead of full screen format"""
-                fig.set_size_inches(10,10)
+                    """ set size of figure, so when figure is saved automatically the right format is used
+                        default would save as in small window instead of full screen format"""
+                    fig.set_size_inches(10,10)
 
-                """ create a new DataFrame, which contains all relevant data from the evaluation
-                    data obtained by Tafel Fit is added later in function tafel_onselect
-                """
-                data_save = pd.DataFrame()
-                data_save["Current Density (mA/cm²)"] = data["current_density"]
-                data_save["log Current Density"] = data["log_current_density"]
-                data_save["Potential Ag-E (V)"] = data["E_vs_Ag"]
-                data_save["Potential SHE (V)"] = data["E_vs_SHE"]
-                data_save["Overpotential (V)"] = data["overpotential"]
-                data_save["Overpotential at Treshold (V)"] = [overpotential_SHE] + [np.nan] * (len(data_save) - 1)
+                add_sample_listeners(graph, sample_name, data, fig, ax, artists)
 
                 """ add results to results_for_gui DataFrame
-                    results and data obtained by Tafel Fit is added later in function tafel_onselect
+                    results and data obtained by Tafel Fit are added by the listeners of the graph
                 """
-                results_for_gui.at["overpotential_Ag", sample_name] = overpotential_Ag
-                results_for_gui.at["overpotential_SHE", sample_name] = overpotential_SHE
+                set_results(sample_name, graph)
                 
                 """ show figure so User can fit data by selecting range in ax[1] (right image)
                 """
@@ -401,15 +1085,20 @@ class Tafel_Analysis :
                 if self.save_figures == True :
                     """ save figure as jpg file if self.save_figures True
                     """
-                    path = f"{self.path_evaluation_folder}\{sample_name}.jpg"
-                    fig.savefig(path)
+                    with stage("save_figure", file = sample_name, program = self.program_name) :
+                        path = f"{self.path_evaluation_folder}\{sample_name}.jpg"
+                        fig.savefig(path)
 
-                """ save data_save DataFrame as txt file 
-                    add data DataFrame to datas dictionary as value and sample_name as key
+                """ save the data and results of the sample
+                    if a parameter is changed later on, the sample is marked as changed and saved again with the updated data and results
+                    after all samples were updated (see function self.update_sample_graphs)
                 """
-                data_save.to_csv(f"{self.path_evaluation_folder}\{sample_name}.txt", header = data_save.columns, index = None, sep = ";")
+                save_sample(sample_name, file_path, graph)
 
-                datas[sample_name] = data
+                graph.add_listener(self.data_columns + ["overpotential_Ag", "overpotential_SHE", "tafel_fit"],
+                    lambda graph, sample_name = sample_name, file_path = file_path : changed_samples.__setitem__(sample_name, (file_path, graph)))
+
+            save_batch_table()
 
             """ create collective plot with four axis (2 rows and 2 columns, contains all samples)
                 - ax[0,0] (upper left axis) : current density vs contains potential SHE (regular axis) or potential Ag (twiny axis) 
@@ -418,118 +1107,161 @@ class Tafel_Analysis :
                 - ax[1,1] (lower right axis) : log(current density) vs overpotential + Tafel-Fit of each sample
 
             """
-            fig, ax = plt.subplots(2,2)
+            def set_summary_fit_line(graph, line) :
+                """ set the data and the Tafel equation (as label) of the line of the Tafel Fit of a sample in the collective figure
+                    nothing is set if no range was selected for the Tafel Fit of the sample
+                """
+                tafel_fit = graph.get("tafel_fit")
 
-            ax_twiny = ax[0,0].twiny()
+                if tafel_fit != None :
+                    overpotential = graph.get("overpotential")
+                    tafel_fit_data = tafel_fit["tafel_slope"] * overpotential + tafel_fit["tafel_intersect"]
 
-            """ add vertical and horizontal lines to indicate the current density thresholds and water splitting potential 
-                in ax[0,0], ax[0,1] and ax[1,0] """
+                    line.set_data(overpotential, tafel_fit_data)
+                    line.set_label(self.get_fit_label(tafel_fit["tafel_slope"], tafel_fit["tafel_intersect"]))
 
-            ax[0,0].axvline(self.water_splitting_potential, ls = "--", lw = 0.8, c = "grey")
-            ax[0,0].axhline(self.CD_treshold, ls = "--", lw = 0.8, c = "grey")
+                    line.axes.update_datalim(np.column_stack((overpotential, tafel_fit_data))[np.isfinite(tafel_fit_data)])
 
+            def add_summary_listeners(graph, fig, ax, ax_twiny, artists) :
+                """ add the listeners to the dataflow graph of a sample, which update the artists of the sample in the collective figure
+                """
+                def set_SHE(graph) :
+                    for artist in artists["E_vs_SHE"] :
+                        artist.set_data(graph.get("E_vs_SHE"), graph.get("current_density"))
 
-            ax[0,1].axvline(self.water_splitting_potential, ls = "--", lw = 0.8, c = "grey")
-            ax[0,1].axhline(self.CD_treshold, ls = "--", lw = 0.8, c = "grey")
+                def set_Ag(graph) :
+                    for artist in artists["E_vs_Ag"] :
+                        artist.set_data(graph.get("E_vs_Ag"), graph.get("current_density"))
 
+                def set_lines(graph) :
+                    E_vs_SHE, E_vs_Ag = graph.get("E_vs_SHE"), graph.get("E_vs_Ag")
+                    idx_treshold_CD, idx_water_splitting = graph.get("idx_treshold_CD"), graph.get("idx_water_splitting")
 
-            ax[1,0].axhline(self.CD_treshold, ls = "--", lw = 0.8, c = "grey")
+                    artists["water_splitting_line"].set_xdata([E_vs_Ag.at[idx_water_splitting]] * 2)
+                    artists["CD_treshold_line_SHE"].set_xdata([E_vs_SHE.at[idx_treshold_CD]] * 2)
+                    artists["CD_treshold_line_Ag"].set_xdata([E_vs_Ag.at[idx_treshold_CD]] * 2)
 
-            """ loop through each key and value of the datas dictionary and plot (scatter) the data for each sample
-                get for each repetion of the loop an individual color from the matplotlib color pool and save these colors
-                in the colors list --> all plots of the same sample have the same color
+                def redraw(graph) :
+                    for axis in [ax[0,0], ax_twiny, ax[0,1], ax[1,0], ax[1,1]] :
+                        axis.autoscale_view()
 
-                matplotlib color pool: https://matplotlib.org/stable/gallery/color/named_colors.html, 01.02.2022
-                selected color pool from Tableau Palette
-            """
-            n = 0
-            colors = []
-            for sample_name, data in datas.items() :
-                color = next(ax[0,0]._get_lines.prop_cycler)['color']
-                colors.append(color)
-                ax[0,0].scatter(data["E_vs_SHE"], data["current_density"], label = sample_name, marker  = "x", s = 10, c = color)
-                ax_twiny.scatter(data["E_vs_Ag"], data["current_density"], marker = "x", s = 10, c = color)
-                
-                ax[0,1].scatter(data["E_vs_SHE"], data["current_density"], label = sample_name, marker = "x", s = 10, c = color)
-                ax[1,0].scatter(data["E_vs_Ag"], data["current_density"], label = sample_name, marker  = "x", s = 10, c = color)
+                    ax[1,1].legend(loc = "upper left", fontsize = 8)
 
-                ax[1,1].scatter(data["overpotential"], data["log_current_density"], label = sample_name, marker = "x", s = 10, c = color)
+                    if plt.fignum_exists(fig.number) :
+                        fig.canvas.draw_idle()
 
-                try :
-                    ax[1,1].plot(data["overpotential"], data["tafel_fit"], label = fit_labels[sample_name], ls = "--", c = color)
-                except KeyError :
-                    self.feedback_label.config(text = f"Tafel Fit for {sample_name} has not been determined.")
-                
-                ax[1,0].axvline(data.at[idx_water_splittings[n], "E_vs_Ag"], ls = "--", lw = 0.8, c = "grey")
+                graph.add_listener(["E_vs_SHE", "current_density"], set_SHE)
+                graph.add_listener(["E_vs_Ag", "current_density"], set_Ag)
+                graph.add_listener(["overpotential", "log_current_density"],
+                    lambda graph : artists["log_current_density"].set_data(graph.get("overpotential"), graph.get("log_current_density")))
+                graph.add_listener(["overpotential", "tafel_fit"], lambda graph : set_summary_fit_line(graph, artists["tafel_fit"]))
+                graph.add_listener(["E_vs_SHE", "E_vs_Ag", "idx_treshold_CD", "idx_water_splitting"], set_lines)
+                graph.add_listener(self.data_columns + ["idx_treshold_CD", "idx_water_splitting", "tafel_fit"], redraw)
 
-                n += 1
+            with stage("plot_summary", program = self.program_name) :
+                fig, ax = plt.subplots(2,2)
 
-            """ add x and y axis label and legend to all axis
-            """
-            ax[0,0].set_xlabel("$E_{WE}$ vs SHE -iR [V]")
-            ax[0,0].set_ylabel("j [mA/cm²]")
-            ax[0,0].legend(loc = "upper left", fontsize = 8)
+                ax_twiny = ax[0,0].twiny()
 
-            ax_twiny.set_xlabel("$E_{WE}$ vs Ag|AgCl -iR [V]")
+                """ add vertical and horizontal lines to indicate the current density thresholds and water splitting potential 
+                    in ax[0,0], ax[0,1] and ax[1,0] """
 
-            ax[0,1].set_xlabel("$E_{WE}$ vs SHE -iR [V]")
-            ax[0,1].set_ylabel("j [mA/cm²]")
-            ax[0,1].legend(loc = "upper left", fontsize = 8)
+                ax[0,0].axvline(self.water_splitting_potential, ls = "--", lw = 0.8, c = "grey")
+                ax[0,0].axhline(self.CD_treshold, ls = "--", lw = 0.8, c = "grey")
 
-            ax[1,0].set_xlabel("$E_{WE}$ vs Ag|AgCl -iR [V]")
-            ax[1,0].set_ylabel("j [mA/cm²]")
-            ax[1,0].legend(loc = "upper left", fontsize = 8)
 
-            ax[1,1].set_xlabel("η [V]")
-            ax[1,1].set_ylabel("lg(j) [mA/cm²]")
-            ax[1,1].legend(loc = "upper left", fontsize = 8)
+                ax[0,1].axvline(self.water_splitting_potential, ls = "--", lw = 0.8, c = "grey")
+                ax[0,1].axhline(self.CD_treshold, ls = "--", lw = 0.8, c = "grey")
 
-            """ get the ylim of ax[0,1] 
-                calculate the value of the set current density threshold as a vector between 0 and 1
-                add a vertical line indicating the reached threshold for each sample by looping through each data_set individauly
-                the respective sample colors are chosen from the colors list
-            """
-            ylim = ax[0,1].get_ylim()
-            ymax = (self.CD_treshold - ylim[0]) / (ylim[1] - ylim[0])
 
-            for n, data in enumerate(datas.values()) :
-                ax[0,1].axvline(data.at[idx_CDs[n], "E_vs_SHE"], ymax = ymax, ls  = "--", c = colors[n])
-                ax[1,0].axvline(data.at[idx_CDs[n], "E_vs_Ag"], ymax = ymax, ls  = "--", c = colors[n])
+                ax[1,0].axhline(self.CD_treshold, ls = "--", lw = 0.8, c = "grey")
+
+                """ loop through each dataflow graph and plot (scatter) the data for each sample
+                    get for each repetion of the loop an individual color from the matplotlib color pool and save these colors
+                    in the colors list --> all plots of the same sample have the same color
 
+                    matplotlib color pool: https://matplotlib.org/stable/gallery/color/named_colors.html, 01.02.2022
+                    selected color pool from Tableau Palette
 
-            """ create a tkinter.Frame which is set into the self.program_frame grid
-                this frame contains a table, which displays all obtained results from the Tafel Analysis
+                    the artists of each sample are collected in summary_artists, so the listeners of the graph can update them
+                """
+                colors = []
+                summary_artists = {}
+                for file_path, graph in self.sample_graphs.items() :
+                    sample_name = sample_names[file_path]
+                    data = datas[sample_name]
+
+                    color = next(ax[0,0]._get_lines.prop_cycler)['color']
+                    colors.append(color)
+
+                    artists = {"E_vs_SHE" : [], "E_vs_Ag" : []}
+                    artists["E_vs_SHE"].append(scatter_decimated(ax[0,0], data["E_vs_SHE"], data["current_density"], label = sample_name, marker  = "x", s = 10, c = color))
+                    artists["E_vs_Ag"].append(scatter_decimated(ax_twiny, data["E_vs_Ag"], data["current_density"], marker = "x", s = 10, c = color))
                 
-                loop through all obtained results from the results_for_gui DataFrame and add those in tkinter.Labels 
-                in the results frame in form of a table
-                table is set up as follows:
-                    - rows: samples
-                    - columns: results (results labels are added in a later loop)
-            """
-            results_frame = tk.Frame(master = self.program_frame, relief = "groove", borderwidth = 2)
-            results_frame.grid(row = 2, column = 0, pady = 5, padx = 5)
+                    artists["E_vs_SHE"].append(scatter_decimated(ax[0,1], data["E_vs_SHE"], data["current_density"], label = sample_name, marker = "x", s = 10, c = color))
+                    artists["E_vs_Ag"].append(scatter_decimated(ax[1,0], data["E_vs_Ag"], data["current_density"], label = sample_name, marker  = "x", s = 10, c = color))
+
+                    artists["log_current_density"] = scatter_decimated(ax[1,1], data["overpotential"], data["log_current_density"], label = sample_name, marker = "x", s = 10, c = color)
+
+                    """ the line of the Tafel Fit is created without data if no range was selected, so it can be set by a later fit
+                        lines with a label starting with _ are not shown in the legend
+                    """
+                    artists["tafel_fit"] = ax[1,1].plot([], [], label = f"_{sample_name}", ls = "--", c = color)[0]
+
+                    set_summary_fit_line(graph, artists["tafel_fit"])
+
+                    if graph.get("tafel_fit") == None :
+                        self.feedback_label.config(text = f"Tafel Fit for {sample_name} has not been determined.")
+                
+                    artists["water_splitting_line"] = ax[1,0].axvline(data.at[graph.get("idx_water_splitting"), "E_vs_Ag"], ls = "--", lw = 0.8, c = "grey")
+
+                    summary_artists[file_path] = artists
+
+                """ add x and y axis label and legend to all axis
+                """
+                ax[0,0].set_xlabel("$E_{WE}$ vs SHE -iR [V]")
+                ax[0,0].set_ylabel("j [mA/cm²]")
+                ax[0,0].legend(loc = "upper left", fontsize = 8)
+
+                ax_twiny.set_xlabel("$E_{WE}$ vs Ag|AgCl -iR [V]")
+
+                ax[0,1].set_xlabel("$E_{WE}$ vs SHE -iR [V]")
+                ax[0,1].set_ylabel("j [mA/cm²]")
+                ax[0,1].legend(loc = "upper left", fontsize = 8)
+
+                ax[1,0].set_xlabel("$E_{WE}$ vs Ag|AgCl -iR [V]")
+                ax[1,0].set_ylabel("j [mA/cm²]")
+                ax[1,0].legend(loc = "upper left", fontsize = 8)
 
-            for n, sample_name in enumerate(results_for_gui) :
-                label = tk.Label(master = results_frame, text = f"{sample_name}")
-                label.grid(row = n + 1, column = 0, padx = 3, pady = 3)
+                ax[1,1].set_xlabel("η [V]")
+                ax[1,1].set_ylabel("lg(j) [mA/cm²]")
 
-                for m, result in enumerate(results_for_gui.index) :
-                    label = tk.Label(master = results_frame, text = f"{round(results_for_gui.at[result, sample_name], 3)}")
-                    label.grid(row = n + 1, column = m + 1, padx = 3, pady = 3)
+                """ get the ylim of ax[0,1] 
+                    calculate the value of the set current density threshold as a vector between 0 and 1
+                    add a vertical line indicating the reached threshold for each sample by looping through each dataflow graph individauly
+                    the respective sample colors are chosen from the colors list
+                    add the listeners, which update the artists of the sample in the collective figure
+                """
+                ylim = ax[0,1].get_ylim()
+                ymax = (self.CD_treshold - ylim[0]) / (ylim[1] - ylim[0])
+
+                for n, (file_path, graph) in enumerate(self.sample_graphs.items()) :
+                    E_vs_SHE, E_vs_Ag, idx_treshold_CD = graph.get("E_vs_SHE"), graph.get("E_vs_Ag"), graph.get("idx_treshold_CD")
+
+                    summary_artists[file_path]["CD_treshold_line_SHE"] = ax[0,1].axvline(E_vs_SHE.at[idx_treshold_CD], ymax = ymax, ls  = "--", c = colors[n])
+                    summary_artists[file_path]["CD_treshold_line_Ag"] = ax[1,0].axvline(E_vs_Ag.at[idx_treshold_CD], ymax = ymax, ls  = "--", c = colors[n])
+
+                    add_summary_listeners(graph, fig, ax, ax_twiny, summary_artists[file_path])
+
+                ax[1,1].autoscale_view()
+                ax[1,1].legend(loc = "upper left", fontsize = 8)
 
-            for n, result in enumerate(["Overpotential Ag|AgCl (V)", "Overpotential SHE (V)", \
-                "Exchange Current Density (mA/cm²)", "Tafel Slope (V/dec)", "Tafel Intersect (mA/cm²)"]) :
-                label = tk.Label(master = results_frame, text = f"{result}")
-                label.grid(row = 0, column = n + 1, padx = 3, pady = 3)
 
             """ evaluation finished
-                add results_frame to self.active_frames so that at a later point if new files were selected the results_frame can be disabled
                 show collective figure to User
             """
             self.feedback_label.config(text = "Evaluation finished.")
 
-            self.active_frames.append(results_frame)
-
             plt.show()
 
             if self.save_figures :
@@ -543,7 +1275,12 @@ class Tafel_Analysis :
                 for file in files_in_directory :
                     if ".jpg" in file :
                         count += 1
-                fig.savefig(f"{self.path_evaluation_folder}\Tafel_{count}.jpg")
+                with stage("save_figure", program = self.program_name) :
+                    fig.savefig(f"{self.path_evaluation_folder}\Tafel_{count}.jpg")
+
+            """ the recorded stages are saved in the evaluation folder if profiling is enabled (see instrumentation.py)
+            """
+            save_profile(self.path_evaluation_folder, self.program_name)
 
         elif len(self.resistances) < len(self.file_paths) or len(self.failed_entries) > 0 :
             self.feedback_label.config(text = "Please enter all resistances first.")
@@ -625,21 +1362,36 @@ class Tafel_Analysis :
         if len(self.file_paths) > 0 and len(self.resistance_entries) == len(self.file_paths) :
            
             failed_entries = []
+            failed_updates = []
             for n, resistance_entry in enumerate(self.resistance_entries) :
                 entry = resistance_entry.get()
 
                 try :
                     entry = float(entry)
-                    self.resistances[self.file_paths[n]] = entry
-                    self.resistance_labels[n].config(text = f"{entry}")
                 except ValueError :
                     self.feedback_label.config(text = f"Could not enter {entry} as a valid resistance.")
                     failed_entries.append(entry)
                     self.resistance_labels[n].config(text = "Failed entering input")
+                    continue
+
+                self.resistances[self.file_paths[n]] = entry
+                self.resistance_labels[n].config(text = f"{entry}")
+
+                """ update the sample of a running evaluation with the new resistance
+                """
+                if self.file_paths[n] in self.sample_graphs :
+                    try :
+                        self.update_sample_graphs({"resistance" : entry}, [self.file_paths[n]])
+                    except Exception as error :
+                        failed_updates.append(f"{os.path.basename(self.file_paths[n])}: {error!r}")
+
             if len(failed_entries) == 0 :
                 self.feedback_label.config(text = "Evaluation can now be started.")
                 self.start_evaluation = True
 
+            if len(failed_updates) > 0 :
+                self.feedback_label.config(text = f"Resistances entered, update of the evaluated samples failed ({'; '.join(failed_updates)})")
+
             self.failed_entries = failed_entries
 
         else :
@@ -707,6 +1459,18 @@ class Tafel_Analysis :
             parameter_feedback_label = tk.Label(master = root, text = "Please Change Parameters for Tafel Analysis.", font = ("Arial", 10))
             parameter_feedback_label.grid(row = 0, column = 0, columnspan = 2, padx = 5, pady = 5)
 
+            def update_samples(parameters, success_text) :
+                """ passes the changed parameters on to the samples of a running evaluation (see function self.update_sample_graphs)
+                    errors of the update are reported separately from the conversion of the entry (the parameter is changed anyway)
+                """
+                try :
+                    self.update_sample_graphs(parameters)
+                except Exception as error :
+                    parameter_feedback_label.config(text = f"{success_text}, but the update of the evaluated samples failed: {error!r}")
+                    return
+
+                parameter_feedback_label.config(text = success_text)
+
             def reset_parameters() :
                 """ resets all parameters """
                 self.reset_parameters()
@@ -715,8 +1479,10 @@ class Tafel_Analysis :
                 pH_label.config(text = f"{self.pH}")
                 electrons_label.config(text = f"{self.number_of_exchanged_electrons}")
                 temperature_label.config(text = f"{self.temperature} K")
+                smoothing_window_label.config(text = f"{self.smoothing_window}")
 
-                parameter_feedback_label.config(text = "Parameters have been changed to Default.")
+                update_samples({"area_electrode" : self.area_electrode, "pH" : self.pH, "smoothing_window" : self.smoothing_window},
+                    "Parameters have been changed to Default.")
 
             """ create a tkinter.Button, which can access the function reset_parameters in order to reset all parameters at once and changes the displayed 
                 tkinter.Label textes of each parameter
@@ -743,8 +1509,10 @@ class Tafel_Analysis :
                 - self.pH
                 - self.number_of_exchanged_electrons
                 - self.temperature
+                - self.smoothing_window (odd int or 0)
 
                 all parameters accept a int/float as an input
+                changed parameters are passed on to the samples of a running evaluation (see function self.update_sample_graphs)
 
             """
 
@@ -755,11 +1523,13 @@ class Tafel_Analysis :
 
                 try :
                     entry = float(entry)
-                    self.area_electrode = entry
-                    parameter_feedback_label.config(text = "Successful conversion of Area Electrode")
-                    area_electrode_label.config(text = f"{self.area_electrode} cm²")
-                except :
+                except ValueError :
                     parameter_feedback_label.config(text = "Failed conversion of Area Electrode")
+                    return
+
+                self.area_electrode = entry
+                area_electrode_label.config(text = f"{self.area_electrode} cm²")
+                update_samples({"area_electrode" : self.area_electrode}, "Successful conversion of Area Electrode")
 
             area_electrode_label = tk.Label(master = root, text = "Area Electrode")
             area_electrode_label.grid(row = 1, column =  0, padx = 5, pady = 5)
@@ -780,11 +1550,13 @@ class Tafel_Analysis :
 
                 try :
                     entry = float(entry)
-                    self.pH = entry
-                    parameter_feedback_label.config(text = "Successful conversion of pH")
-                    pH_label.config(text = f"{self.pH}")
-                except :
+                except ValueError :
                     parameter_feedback_label.config(text = "Failed conversion of pH")
+                    return
+
+                self.pH = entry
+                pH_label.config(text = f"{self.pH}")
+                update_samples({"pH" : self.pH}, "Successful conversion of pH")
 
             pH_label = tk.Label(master = root, text = "pH")
             pH_label.grid(row = 2, column =  0, padx = 5, pady = 5)
@@ -803,11 +1575,13 @@ class Tafel_Analysis :
 
                 try :
                     entry = int(entry)
-                    self.number_of_exchanged_electrons = entry
-                    parameter_feedback_label.config(text = "Successful conversion of Number of Exchanged Electrons")
-                    electrons_label.config(text = f"{self.number_of_exchanged_electrons}")
-                except :
+                except ValueError :
                     parameter_feedback_label.config(text = "Failed conversion of Number of Exchanged Electrons")
+                    return
+
+                self.number_of_exchanged_electrons = entry
+                parameter_feedback_label.config(text = "Successful conversion of Number of Exchanged Electrons")
+                electrons_label.config(text = f"{self.number_of_exchanged_electrons}")
 
             electrons_label = tk.Label(master = root, text = "Number of Exchanged Electrons")
             electrons_label.grid(row = 3, column =  0, padx = 5, pady = 5)
@@ -828,11 +1602,13 @@ class Tafel_Analysis :
 
                 try :
                     entry = float(entry)
-                    self.temperature = entry
-                    parameter_feedback_label.config(text = "Successful conversion of Temperature")
-                    temperature_label.config(text = f"{self.temperature} K")
-                except :
+                except ValueError :
                     parameter_feedback_label.config(text = "Failed conversion of Temperature")
+                    return
+
+                self.temperature = entry
+                parameter_feedback_label.config(text = "Successful conversion of Temperature")
+                temperature_label.config(text = f"{self.temperature} K")
 
             temperature_label = tk.Label(master = root, text = "Temperature")
             temperature_label.grid(row = 4, column =  0, padx = 5, pady = 5)
@@ -845,6 +1621,33 @@ class Tafel_Analysis :
             
             temperature_button = tk.Button(master = root, text = "Change Temperature", command = change_temperature)
             temperature_button.grid(row = 4, column = 3, pady = 5, padx = 5)
+
+            def change_smoothing_window() :
+                entry = smoothing_window_entry.get()
+
+                try :
+                    entry = int(entry)
+                    if entry != 0 and (entry <= self.smoothing_order or entry % 2 == 0) :
+                        raise ValueError
+                except ValueError :
+                    parameter_feedback_label.config(text = f"Failed conversion of Smoothing Window (0 or odd and larger than {self.smoothing_order})")
+                    return
+
+                self.smoothing_window = entry
+                smoothing_window_label.config(text = f"{self.smoothing_window}")
+                update_samples({"smoothing_window" : self.smoothing_window}, "Successful conversion of Smoothing Window")
+
+            smoothing_window_label = tk.Label(master = root, text = "Smoothing Window (Data Points)")
+            smoothing_window_label.grid(row = 5, column =  0, padx = 5, pady = 5)
+
+            smoothing_window_label = tk.Label(master = root, text = f"{self.smoothing_window}")
+            smoothing_window_label.grid(row = 5, column = 1, padx = 5, pady = 5)
+
+            smoothing_window_entry = tk.Entry(master = root)
+            smoothing_window_entry.grid(row = 5, column = 2, padx = 5, pady = 5)
+
+            smoothing_window_button = tk.Button(master = root, text = "Change Smoothing Window", command = change_smoothing_window)
+            smoothing_window_button.grid(row = 5, column = 3, pady = 5, padx = 5)
         
         change_parameters_button = tk.Button(master = control_frame, text = "Change Parameters", command = open_change_paramter_window)
         change_parameters_button.grid(row = 1, column = 0, pady = 5, padx = 5)
@@ -871,6 +1674,35 @@ class Tafel_Analysis :
             variable = save_figures_variable, command = change_figure_saving_settings, onvalue = True, offvalue = False)
         save_figures_checkbox.grid(row = 2, column = 0, padx = 5, pady = 5)
 
+        """ create a tkinter.StringVar, which contains the setting of the tkinter.tkk.Checkbutton
+            this checkbutton act as a checkbox for saving the evaluated data of each sample as separate txt file
+            default is set to False
+        """
+        def change_sample_file_settings() :
+            self.save_sample_files = save_sample_files_variable.get() == "1"
+
+        save_sample_files_variable = tk.StringVar(value = "0")
+        save_sample_files_checkbox = ttk.Checkbutton(control_frame, text = "save each sample as separate file",
+            variable = save_sample_files_variable, command = change_sample_file_settings)
+        save_sample_files_checkbox.grid(row = 3, column = 0, padx = 5, pady = 5)
+
+        """ create a tkinter.Button, which writes the batch table of the current evaluation
+            the batch table is written after all samples were evaluated, samples changed later on (e.g. by a changed parameter
+            or Tafel Fit) are only written by this button
+        """
+        def save_batch_table() :
+            if self.save_batch_table == None :
+                self.feedback_label.config(text = "Please start the evaluation first.")
+                return
+
+            path = self.save_batch_table()
+
+            if path != None :
+                self.feedback_label.config(text = f"Batch table saved as {os.path.basename(path)}.")
+
+        save_batch_table_button = tk.Button(master = control_frame, text = "Save Batch Table", command = save_batch_table)
+        save_batch_table_button.grid(row = 2, column = 2, padx = 5, pady = 5)
+
         return self.program_frame
 
 
@@ -903,4 +1735,72 @@ Version 1.0.2 (28.03.2022)
 
 Version 1.0.3 (06.04.2022)
 - fixed bug were tkinter.StringVar values werent saved if the program was imported
+
+Version 1.0.4 (19.10.2026)
+- plotted data is decimated (min/max per pixel) for the axis width and re-decimated on zoom, saved data keeps the full resolution
+
+Version 1.0.5 (19.10.2026)
+- load, compute, fit, plot and save stages of each file are recorded if profiling is enabled (instrumentation.py)
+
+Version 1.0.6 (19.10.2026)
+- added run_headless_evaluation for the evaluation of single files without GUI (used by watch_folder.py)
+- loading and processing of a file moved to process_file, figure of a sample to get_sample_figure and saved data to get_data_save
+- added default_resistance for files without entered resistance in headless evaluations
+
+Version 1.0.7 (19.10.2026)
+- overpotentials and Tafel Fit results of each sample saved in the results store (see results_store.py)
+
+Version 1.0.8 (19.10.2026)
+- results displayed in a Results_Table (see results_table.py), the row of each sample is added after its evaluation
+
+Version 1.0.9 (19.10.2026)
+- 95 % bootstrap confidence intervals of the Tafel slope, Tafel intersect and exchange current density (see bootstrap.py)
+
+Version 1.0.10 (19.10.2026)
+- Theil-Sen slope and intersect of the Tafel Fit next to the least squares fit (see robust_fit.py)
+
+Version 1.0.11 (19.10.2026)
+- parameter sweep: overpotential at the threshold and Tafel slope for vectors of resistances, pH values, electrode areas and
+  temperatures of all files in one broadcasted numpy calculation (get_parameter_sweep, save_parameter_sweep)
+
+Version 1.0.12 (19.10.2026)
+- derived quantities of each sample calculated by a dataflow graph (see dataflow.py), a changed pH, area or resistance only
+  recalculates the nodes downstream of it and only updates the depending data, artists, results and saved files
+- Tafel Fit moved to get_tafel_fit, loading of the raw data to load_file
+
+Version 1.0.13 (19.10.2026)
+- range of the Tafel Fit and resistance of each sample saved as sidecar json keyed by the hash of the raw data file
+  (see replay_fits.py), run_headless_evaluation calculates the Tafel Fit for a given fit_range, added run_headless_fits
+
+Version 1.0.14 (19.10.2026)
+- evaluated data of all samples saved in one long-format batch table (see batch_table.py), separate txt files per sample
+  only if "save each sample as separate file" is checked (headless evaluations still save the txt file of the sample)
+
+Version 1.0.15 (19.10.2026)
+- optional Savitzky-Golay smoothing (see smoothing.py) of log_current_density before the Tafel Fit (parameter smoothing_window
+  of the dataflow graph), also applied to all samples at once in get_parameter_sweep
+
+Version 1.0.16 (19.10.2026)
+- samples changed by update_sample_graphs are only marked by the listener and saved once after all graphs were updated
+  (one results store row per sample, batch table written once instead of once per sample)
+
+Version 1.0.17 (19.10.2026)
+- Theil-Sen slope and intersect are NaN (as the linear fit) if the selected range contains less than two finite data points
+
+Version 1.0.18 (19.10.2026)
+- entries of the parameters and resistances are converted in try/except ValueError, errors of the update of the evaluated samples
+  are reported separately instead of as failed conversion, changed samples are saved even if the update of a later sample failed
+
+Version 1.0.19 (19.10.2026)
+- run_headless_evaluation uses process_file (with the optional fit_range) instead of a copy of its loading and processing
+
+Version 1.0.20 (19.10.2026)
+- single results (overpotential at treshold, Tafel slope, intersect and CI) written in the table of the results of the batch
+  table without x, the batch table is no longer written on each change of a parameter or Tafel Fit, but after all samples
+  and by the button "Save Batch Table" (only the changed samples are written again)
+
+Version 1.0.21 (19.10.2026)
+- get_parameter_sweep accepts resistances per sample as 2-D array (samples x resistances) and raises ValueError for other
+  shapes (2-D arrays were broadcast wrongly before)
+- Tafel slope labelled dec/V in the results table as in the parameter sweep (slope of lg(j) vs η, was labelled V/dec)
 """
\ No newline at end of file
@@ -1,5 +1,5 @@
 """ TEM Scale Bar Tool by Pascal Reiß
-    Version 1.1.3
+    Version 1.1.5
 """
 
 
@@ -21,6 +21,8 @@ from datetime import datetime
 
 import dm3_lib as dm3
 
+from instrumentation import stage, save_profile
+
 
 
 
@@ -298,7 +300,8 @@ class TEM_Image_Tool :
     
         """ open the dm3 file
         """
-        file = dm3.DM3(file_path)
+        with stage("load", program = self.program_name) :
+            file = dm3.DM3(file_path)
 
         """ get pixel_size, pixel_unit, resolution and contrast of image from image meta data 
             meta data can be accessed via a dictonary (dm3_lib.DM3.tags) where the data is saved as value and the tag as key
@@ -365,7 +368,37 @@ class TEM_Image_Tool :
 
         self.undo_list = [(xlim, ylim)]
 
-        self.preview_canvas.draw()
+        with stage("draw", program = self.program_name) :
+            self.preview_canvas.draw()
+
+
+    def run_headless_evaluation(self, file_path) :
+        """ processes a single image without GUI (used by watch_folder.py)
+            without GUI no tkinter canvas exists, so the figure is drawn on its own canvas
+            the processed image is saved in the evaluation folder
+
+            expected argument datatype:
+            - file_path : string
+
+            returns dict with the sample_name and the program_name
+        """
+        if not hasattr(self, "preview_canvas") :
+            self.preview_canvas = self.fig.canvas
+
+        self.check_for_evaluation_folder()
+
+        file_name = os.path.basename(file_path)
+        sample_name = file_name.split(".dm3")[0]
+
+        with stage("process", file = sample_name, program = self.program_name) :
+            self.image_processing_from_path(file_path)
+
+        with stage("save", file = sample_name, program = self.program_name) :
+            self.fig.savefig(f"{self.path_evaluation_folder}\{sample_name}{self.figure_type}", dpi = self.figure_dpi, bbox_inches = "tight", pad_inches = 0)
+
+        save_profile(self.path_evaluation_folder, self.program_name)
+
+        return {"program_name" : self.program_name, "sample_name" : sample_name}
 
 
     def run_image_processing(self) :
@@ -386,13 +419,19 @@ class TEM_Image_Tool :
                 file_name = os.path.basename(file_path)
                 sample_name = file_name.split(".dm3")[0]
 
-                self.image_processing_from_path(file_path)
+                with stage("process", file = sample_name, program = self.program_name) :
+                    self.image_processing_from_path(file_path)
 
-                self.fig.savefig(f"{self.path_evaluation_folder}\{sample_name}{self.figure_type}", dpi = self.figure_dpi, bbox_inches = "tight", pad_inches = 0)
+                with stage("save", file = sample_name, program = self.program_name) :
+                    self.fig.savefig(f"{self.path_evaluation_folder}\{sample_name}{self.figure_type}", dpi = self.figure_dpi, bbox_inches = "tight", pad_inches = 0)
 
             if self.feedback_label != None :
                 self.feedback_label.config(text = "Image Processing Finished.")
 
+            """ the recorded stages are saved in the evaluation folder if profiling is enabled (see instrumentation.py)
+            """
+            save_profile(self.path_evaluation_folder, self.program_name)
+
         elif self.feedback_label != None :
             self.feedback_label.config(text = "Please Select Your Raw Images First.")
 
@@ -975,4 +1014,10 @@ Version 1.1.3 (04.04.2022) CTRL is important
 - added CTRL + K as shortcut for activating cropout function
 - added CTRL + R as shortcurt for running image processing (all files)
 - added CTRL + O as shortcut for opening files
+
+Version 1.1.4 (19.10.2026)
+- loading, drawing and saving of each image are recorded if profiling is enabled (instrumentation.py)
+
+Version 1.1.5 (19.10.2026)
+- added run_headless_evaluation for the evaluation of single files without GUI (used by watch_folder.py)
 """
\ No newline at end of file
@@ -0,0 +1,538 @@
+""" Watch Folder Daemon for the Analysis Tools
+    Version 1.0.1
+
+    watches the folders, in which the potentiostats, the FTIR and the electron microscopes save their exports, and evaluates
+    each new file headlessly with the matching tool (tool.run_headless_evaluation) as soon as the file is written completely
+    the results are saved in the evaluation folder of the respective tool (Evaluation/<program_name>/<YYYY-MM-DD>) as in the GUI
+
+    - the folders are polled every interval seconds (os.scandir, works for local and shared network folders on every system)
+    - a file is evaluated once its size and modification time did not change for settle_time seconds (debounce for files,
+      which are still being written by the instrument software)
+    - the files are evaluated on a pool of worker processes, one matplotlib figure per worker at once
+    - the queue is saved as json file after every change, so pending files are evaluated after a restart and already
+      evaluated files are not evaluated twice (a file is evaluated again if it was changed afterwards)
+    - files which can not be routed to a tool are remembered as ignored (checked again only if they are changed)
+    - the files of a rpm series (Levich Analysis) are grouped by the beginning of their names (e.g. NiFe_1 for NiFe_1_100rpm.txt) and
+      the whole series is evaluated by tool.run_headless_fits (Levich and Koutecky-Levich fits at the potentials of "fit_windows")
+      as soon as it contains two files and again with each further file of the series
+
+    routing of the files to the tools (can be overwritten with the key "tool" for each folder in the config file):
+    - .dpt : Infrared Analysis
+    - .tif : SEM Scale Bar Tool
+    - .dm3 : TEM Scale Bar Tool (requires dm3_lib)
+    - .txt : by the header of the NOVA export
+        Scan and Q+ : Cyclovoltammetry Analysis
+        Corrected time (s) : Electrodeposition Analysis
+        *_100rpm.txt : Levich Analysis
+        Potential applied (V) and Time (s) : Tafel Analysis
+
+    usage (from the folder of CS_Analysis_Tool.py):
+        python watch_folder.py "D:\\Potentiostat" "D:\\SEM"
+        python watch_folder.py --config watch_config.json
+
+    config file (json):
+        {"folders" : [{"path" : "D:\\Potentiostat", "parameters" : {"area_electrode" : 0.196, "save_figures" : true},
+                       "fit_windows" : {"levich_potentials" : [0.8], "koutecky_potentials" : [0.8]}},
+                      {"path" : "D:\\ESEM", "tool" : "ESEM Scale Bar Tool"}],
+         "interval" : 1, "settle_time" : 2, "workers" : 2, "recursive" : false, "queue_file" : "watch_queue.json"}
+
+        parameters are set as attributes of the tool before the evaluation (e.g. area_electrode, pH, default_resistance, local_min_setting)
+        fit_windows are passed on to tool.run_headless_fits of rpm series (without fit_windows the files of a series are processed and
+        the sidecar is saved, the fits can be replayed later with replay_fits.py)
+"""
+
+import os
+import json
+import time
+import argparse
+import importlib
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, CancelledError
+from concurrent.futures.process import BrokenProcessPool
+
+
+""" program_name of each tool with the module and class name of the tool
+    the tools are imported in the worker processes only when required (e.g. dm3_lib only for TEM images)
+"""
+tool_classes = {"Tafel Analysis" : ("tafel", "Tafel_Analysis"),
+                "Levich Analysis" : ("levich", "Levich_Analysis"),
+                "Cyclovoltammetry Analysis" : ("cyclovoltammetry", "Cyclovoltammetry_Analysis"),
+                "Electrodeposition Analysis" : ("electrodeposition", "Electrodeposition_Analysis"),
+                "Infrared Analysis" : ("infrared", "Infrared_Analysis"),
+                "SEM Scale Bar Tool" : ("sem_scale_bar", "SEM_Image_Tool"),
+                "ESEM Scale Bar Tool" : ("esem_scale_bar", "ESEM_Image_Tool"),
+                "TEM Scale Bar Tool" : ("tem_scale_bar", "TEM_Image_Tool"),
+                }
+
+file_types = {".dpt" : "Infrared Analysis",
+              ".tif" : "SEM Scale Bar Tool",
+              ".dm3" : "TEM Scale Bar Tool",
+              }
+
+
+def get_program_name_for_file(file_path) :
+    """ returns the program_name of the tool, which evaluates the file, or None if the file is not supported
+        .txt files are assigned by the column names in the first line of the NOVA export
+
+        expected argument datatype:
+        - file_path : string
+    """
+    file_name = os.path.basename(file_path)
+    extension = os.path.splitext(file_name)[1].lower()
+
+    if extension in file_types :
+        return file_types[extension]
+
+    if extension != ".txt" :
+        return None
+
+    with open(file_path, encoding = "utf-8", errors = "ignore") as file :
+        header = file.readline()
+
+    if "Scan" in header and "Q+" in header :
+        return "Cyclovoltammetry Analysis"
+
+    if "Corrected time (s)" in header :
+        return "Electrodeposition Analysis"
+
+    if "rpm" in file_name.split("_")[-1].lower() :
+        return "Levich Analysis"
+
+    if "Potential applied (V)" in header and "Time (s)" in header :
+        return "Tafel Analysis"
+
+    return None
+
+
+""" tools, whose files are evaluated together as series (tool.run_headless_fits) instead of one by one
+"""
+series_programs = ["Levich Analysis"]
+
+
+def get_series_key(file_path) :
+    """ returns the key of the series of the file: folder and file name without the last fragment (e.g. D:\\Potentiostat\\NiFe_1
+        for D:\\Potentiostat\\NiFe_1_100rpm.txt)
+    """
+    sample_name = os.path.splitext(os.path.basename(file_path))[0]
+
+    series_name = "_".join(sample_name.split("_")[:-1]) or sample_name
+
+    return os.path.join(os.path.dirname(file_path), series_name)
+
+
+def get_file_signature(file_path) :
+    """ returns [size, modification time (ns)] of the file, changes as long as the file is written
+    """
+    stat = os.stat(file_path)
+
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+
+""" tool objects of a worker process
+    key: (program_name, date, parameters as json string), a new tool object is created each day, so the results are saved
+    in the evaluation folder of the current day
+"""
+worker_tools = {}
+
+
+def init_worker() :
+    """ initializer of the worker processes: headless matplotlib backend (no window is opened by the tools)
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+
+
+def get_worker_tool(program_name, parameters) :
+    """ returns the tool object of the worker process for the program_name and parameters (created if not existing yet)
+    """
+    today = datetime.today().strftime("%Y-%m-%d")
+    key = (program_name, today, json.dumps(parameters, sort_keys = True))
+
+    if key not in worker_tools :
+        module_name, class_name = tool_classes[program_name]
+        module = importlib.import_module(module_name)
+
+        tool = getattr(module, class_name)()
+
+        for attribute, value in parameters.items() :
+            setattr(tool, attribute, value)
+
+        worker_tools[key] = tool
+
+    return worker_tools[key]
+
+
+def evaluate_file(file_path, program_name, parameters) :
+    """ evaluates a single file with the tool of program_name in a worker process
+        returns the dict returned by tool.run_headless_evaluation
+    """
+    tool = get_worker_tool(program_name, parameters)
+
+    return tool.run_headless_evaluation(file_path)
+
+
+def evaluate_series(file_paths, program_name, parameters, fit_windows) :
+    """ evaluates all files of a series with the tool of program_name in a worker process
+        returns the dict returned by tool.run_headless_fits
+    """
+    tool = get_worker_tool(program_name, parameters)
+
+    return tool.run_headless_fits(file_paths, fit_windows)
+
+
+
+class Watch_Queue :
+
+    def __init__(self, queue_file) :
+        """ initiate Watch_Queue class object with the following attributes:
+            - self.queue_file
+                (string: path of the json file, in which the queue is saved)
+            - self.pending
+                (list: contains a dict (file_path, program_name, parameters, signature) for each file waiting for its evaluation,
+                jobs of a series contain the series key as file_path and additionally file_paths, signatures and fit_windows)
+            - self.done
+                (dict: contains the signature of each evaluated file as value and the file_path as key)
+            - self.failed
+                (dict: contains the signature and error message of each failed evaluation as value and the file_path as key)
+            - self.ignored
+                (dict: contains the signature of each file, which could not be routed to a tool, as value and the file_path as key)
+            - self.series
+                (dict: contains the signatures of the settled files of a series (dict, file_path as key) as value and the series key as key)
+
+            an existing queue_file is loaded, so pending files of the last run are evaluated first
+        """
+        self.queue_file = queue_file
+
+        self.pending = []
+        self.done = {}
+        self.failed = {}
+        self.ignored = {}
+        self.series = {}
+
+        if os.path.exists(queue_file) :
+            with open(queue_file, encoding = "utf-8") as file :
+                queue = json.load(file)
+
+            self.pending = queue.get("pending", [])
+            self.done = queue.get("done", {})
+            self.failed = queue.get("failed", {})
+            self.ignored = queue.get("ignored", {})
+            self.series = queue.get("series", {})
+
+
+    def save(self) :
+        """ saves the queue as json file
+            the file is written to a temporary file first and replaced afterwards, so an interruption never leaves a broken queue_file
+        """
+        temporary_file = f"{self.queue_file}.tmp"
+
+        with open(temporary_file, "w", encoding = "utf-8") as file :
+            json.dump({"pending" : self.pending, "done" : self.done, "failed" : self.failed, "ignored" : self.ignored, "series" : self.series},
+                file, indent = 1)
+
+        os.replace(temporary_file, self.queue_file)
+
+
+    def is_known(self, file_path, signature) :
+        """ returns True if the file is already pending, was evaluated (or failed), was ignored or belongs to a series with the same signature
+        """
+        for job in self.pending :
+            if job["file_path"] == file_path :
+                return True
+
+        if self.done.get(file_path) == signature or self.ignored.get(file_path) == signature :
+            return True
+
+        for members in self.series.values() :
+            if members.get(file_path) == signature :
+                return True
+
+        if file_path in self.failed and self.failed[file_path]["signature"] == signature :
+            return True
+
+        return False
+
+
+    def add(self, file_path, program_name, parameters, signature) :
+        self.pending.append({"file_path" : file_path, "program_name" : program_name, "parameters" : parameters, "signature" : signature})
+        self.save()
+
+
+    def ignore(self, file_path, signature) :
+        self.ignored[file_path] = signature
+        self.save()
+
+
+    def add_to_series(self, series_key, file_path, program_name, parameters, fit_windows, signature) :
+        """ adds the file to its series and queues the evaluation of the whole series if it contains at least two files
+            a pending (not started) job of the same series is replaced by the job with all files
+
+            returns the number of files of the series
+        """
+        members = self.series.setdefault(series_key, {})
+        members[file_path] = signature
+
+        if len(members) >= 2 :
+            self.pending = [job for job in self.pending if job["file_path"] != series_key]
+            self.pending.append({"file_path" : series_key, "file_paths" : sorted(members), "signatures" : dict(members),
+                "program_name" : program_name, "parameters" : parameters, "fit_windows" : fit_windows, "signature" : None})
+
+        self.save()
+
+        return len(members)
+
+
+    def finish(self, job, error = None) :
+        """ removes the job from the pending list and adds it to self.done or self.failed (if an error message is given)
+            the files of a series job are added to self.done one by one
+        """
+        self.pending = [pending_job for pending_job in self.pending if pending_job != job]
+
+        if error == None :
+            for file_path, signature in job.get("signatures", {job["file_path"] : job["signature"]}).items() :
+                self.done[file_path] = signature
+
+            self.failed.pop(job["file_path"], None)
+        else :
+            self.failed[job["file_path"]] = {"signature" : job.get("signatures", job["signature"]), "error" : error}
+
+        self.save()
+
+
+
+class Folder_Watcher :
+
+    def __init__(self, folders, interval = 1, settle_time = 2, workers = 2, recursive = False, queue_file = "watch_queue.json") :
+        """ initiate Folder_Watcher class object with the following attributes:
+            - self.folders
+                (list: contains a dict for each watched folder with the keys path, tool (program_name or None for automatic routing),
+                parameters (dict: attributes set for the tool) and fit_windows (dict: fit windows of the series, see tool.run_headless_fits))
+            - self.interval
+                (int/float: time between two scans of the folders in s)
+            - self.settle_time
+                (int/float: time in s the size and modification time of a file have to stay constant before it is evaluated)
+            - self.workers
+                (int: number of worker processes)
+            - self.recursive
+                (boolean: state if subfolders are watched as well)
+            - self.queue
+                (Watch_Queue: persistent queue of the pending, evaluated and failed files)
+            - self.candidates
+                (dict: contains [signature, time of the last change] of each new file, which is not settled yet, as value and the file_path as key)
+            - self.running
+                (dict: contains the job of each running evaluation as value and its concurrent.futures.Future as key)
+
+            expected argument datatypes:
+            - folders : list of strings (paths) or dicts (see above)
+            - interval, settle_time : int/float
+            - workers : int
+            - recursive : boolean
+            - queue_file : string
+        """
+        self.folders = []
+
+        for folder in folders :
+            if isinstance(folder, str) :
+                folder = {"path" : folder}
+
+            self.folders.append({"path" : os.path.abspath(folder["path"]),
+                                 "tool" : folder.get("tool"),
+                                 "parameters" : folder.get("parameters", {}),
+                                 "fit_windows" : folder.get("fit_windows", {})})
+
+        self.interval = interval
+        self.settle_time = settle_time
+        self.workers = workers
+        self.recursive = recursive
+
+        self.queue = Watch_Queue(queue_file)
+
+        self.candidates = {}
+        self.running = {}
+
+
+    def get_files(self, path) :
+        """ returns the paths of all files with a supported extension in the folder path (and its subfolders if self.recursive)
+            the evaluation folder of the tools is skipped
+        """
+        file_paths = []
+
+        try :
+            entries = list(os.scandir(path))
+        except OSError : # folder not available (e.g. network drive disconnected)
+            return file_paths
+
+        for entry in entries :
+            if entry.is_dir() :
+                if self.recursive and entry.name != "Evaluation" :
+                    file_paths += self.get_files(entry.path)
+
+            elif os.path.splitext(entry.name)[1].lower() in [".txt", ".dpt", ".tif", ".dm3"] :
+                file_paths.append(entry.path)
+
+        return file_paths
+
+
+    def is_readable(self, file_path) :
+        """ returns False if the file is still locked by the instrument software (Windows locks files during writing)
+        """
+        try :
+            with open(file_path, "rb") :
+                return True
+        except OSError :
+            return False
+
+
+    def scan(self) :
+        """ scans all folders once and adds each settled new or changed file to the queue
+            a file is settled if its signature (size, modification time) did not change for self.settle_time seconds
+        """
+        now = time.monotonic()
+
+        for folder in self.folders :
+            for file_path in self.get_files(folder["path"]) :
+                try :
+                    signature = get_file_signature(file_path)
+                except OSError : # file was removed in the meantime
+                    self.candidates.pop(file_path, None)
+                    continue
+
+                if self.queue.is_known(file_path, signature) :
+                    continue
+
+                if file_path not in self.candidates or self.candidates[file_path][0] != signature :
+                    self.candidates[file_path] = [signature, now]
+                    continue
+
+                if signature[0] == 0 or now - self.candidates[file_path][1] < self.settle_time or not self.is_readable(file_path) :
+                    continue
+
+                del self.candidates[file_path]
+
+                program_name = folder["tool"] or get_program_name_for_file(file_path)
+
+                if program_name == None :
+                    self.queue.ignore(file_path, signature)
+                    continue
+
+                if program_name in series_programs :
+                    series_key = get_series_key(file_path)
+                    n_files = self.queue.add_to_series(series_key, file_path, program_name, folder["parameters"], folder["fit_windows"], signature)
+
+                    print(f"{datetime.now():%H:%M:%S} series    {program_name:<28} {series_key} ({n_files} files)")
+                    continue
+
+                self.queue.add(file_path, program_name, folder["parameters"], signature)
+
+                print(f"{datetime.now():%H:%M:%S} queued    {program_name:<28} {file_path}")
+
+
+    def submit_pending(self, executor) :
+        """ submits each pending job, which is not running yet, to the worker pool
+        """
+        running_file_paths = [job["file_path"] for job in self.running.values()]
+
+        for job in self.queue.pending :
+            if job["file_path"] not in running_file_paths :
+                if "file_paths" in job :
+                    future = executor.submit(evaluate_series, job["file_paths"], job["program_name"], job["parameters"], job["fit_windows"])
+                else :
+                    future = executor.submit(evaluate_file, job["file_path"], job["program_name"], job["parameters"])
+
+                self.running[future] = job
+                running_file_paths.append(job["file_path"])
+
+
+    def collect_finished(self) :
+        """ removes finished evaluations from self.running and marks them as done or failed in the queue
+        """
+        for future in [future for future in self.running if future.done()] :
+            job = self.running.pop(future)
+
+            try :
+                result = future.result()
+            except (CancelledError, BrokenProcessPool, KeyboardInterrupt) : # interrupted, the job stays in the queue
+                continue
+            except BaseException as error :
+                self.queue.finish(job, error = repr(error))
+                print(f"{datetime.now():%H:%M:%S} failed    {job['program_name']:<28} {job['file_path']} ({error!r})")
+                continue
+
+            self.queue.finish(job)
+            print(f"{datetime.now():%H:%M:%S} evaluated {job['program_name']:<28} {job['file_path']} {result}")
+
+
+    def run(self) :
+        """ watches the folders until the program is interrupted (CTRL + C)
+            running evaluations are finished before the program ends, not started jobs stay in the queue
+        """
+        for folder in self.folders :
+            print(f"watching {folder['path']} ({folder['tool'] or 'automatic routing'})")
+
+        with ProcessPoolExecutor(max_workers = self.workers, initializer = init_worker) as executor :
+            try :
+                while True :
+                    self.scan()
+                    self.submit_pending(executor)
+                    self.collect_finished()
+
+                    time.sleep(self.interval)
+
+            except KeyboardInterrupt :
+                print("stopping, waiting for running evaluations")
+
+                for future in list(self.running) :
+                    future.cancel()
+
+                executor.shutdown(wait = True)
+
+                self.collect_finished()
+
+
+
+if __name__ == "__main__" :
+    parser = argparse.ArgumentParser(description = "evaluates new instrument exports in the watched folders automatically")
+    parser.add_argument("folders", nargs = "*", help = "folders to watch (automatic routing of the files to the tools)")
+    parser.add_argument("--config", help = "json file with the folders, tools, parameters and settings (see watch_folder.py)")
+    parser.add_argument("--interval", type = float, default = None, help = "time between two scans in s (default 1)")
+    parser.add_argument("--settle-time", type = float, default = None, help = "time a file has to stay unchanged before its evaluation in s (default 2)")
+    parser.add_argument("--workers", type = int, default = None, help = "number of worker processes (default 2)")
+    parser.add_argument("--recursive", action = "store_true", help = "watch subfolders as well")
+    parser.add_argument("--queue-file", default = None, help = "json file of the persistent queue (default watch_queue.json)")
+
+    args = parser.parse_args()
+
+    config = {}
+    if args.config != None :
+        with open(args.config, encoding = "utf-8") as file :
+            config = json.load(file)
+
+    folders = config.get("folders", []) + args.folders
+
+    if len(folders) == 0 :
+        parser.error("no folders to watch given")
+
+    """ command line arguments overwrite the settings of the config file
+    """
+    watcher = Folder_Watcher(folders,
+        interval = args.interval if args.interval != None else config.get("interval", 1),
+        settle_time = args.settle_time if args.settle_time != None else config.get("settle_time", 2),
+        workers = args.workers if args.workers != None else config.get("workers", 2),
+        recursive = args.recursive or config.get("recursive", False),
+        queue_file = args.queue_file if args.queue_file != None else config.get("queue_file", "watch_queue.json"))
+
+    watcher.run()
+
+
+
+""" update list:
+
+Version 1.0.0 (19.10.2026)
+- polling folder watcher with debounce, persistent json queue and worker processes for the headless evaluation of new files
+
+Version 1.0.1 (19.10.2026)
+- files of a rpm series are grouped by series and evaluated together by tool.run_headless_fits (Levich and Koutecky-Levich fits
+  at the potentials of the folder setting fit_windows), single rpm files were processed without any fit before
+- files which can not be routed to a tool are remembered as ignored instead of being read again at every scan
+"""
\ No newline at end of file